@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Executa os benchmarks do PyRequestMan e compara os resultados com uma execução anterior
+
+Exemplos:
+    python benchmark.py --output resultados.json
+    python benchmark.py --scale full --baseline resultados.json --threshold 0.15
+    python benchmark.py --filter storage --filter curl
+"""
+
+import argparse
+import sys
+
+from src.benchmarks.cases import BenchmarkSuite, SCALES
+from src.benchmarks.harness import (
+    run_benchmark, save_results, load_results, compare_results, format_duration
+)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Lê os argumentos da linha de comando"""
+    parser = argparse.ArgumentParser(description="Benchmarks do PyRequestMan")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="quick",
+                        help="Volume de dados gerados (padrão: quick)")
+    parser.add_argument("--filter", action="append", dest="filters", default=[],
+                        help="Executa apenas os casos cujo nome contém o trecho (pode repetir)")
+    parser.add_argument("--output", help="Grava os resultados neste arquivo JSON")
+    parser.add_argument("--baseline", help="Compara com os resultados deste arquivo JSON")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="Piora tolerada em relação à referência (padrão: 0.1 = 10%%)")
+    parser.add_argument("--list", action="store_true", help="Lista os casos e sai")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Função principal; retorna 1 se algum caso piorou além da tolerância"""
+    args = parse_args(argv)
+    suite = BenchmarkSuite(args.scale)
+
+    try:
+        benchmarks = suite.select(args.filters)
+        if args.list:
+            for benchmark in benchmarks:
+                print(f"{benchmark.name:40} {benchmark.description}")
+            return 0
+
+        baseline = load_results(args.baseline) if args.baseline else {}
+
+        results = []
+        for benchmark in benchmarks:
+            print(f"Executando {benchmark.name}...", end=" ", flush=True)
+            result = run_benchmark(benchmark)
+            results.append(result)
+
+            line = (
+                f"{format_duration(result.median)} por chamada (± {format_duration(result.stdev)}), "
+                f"{result.items_per_second:,.0f} {benchmark.unit}/s"
+            )
+            reference = baseline.get(result.name)
+            if reference is not None and reference.items == result.items:
+                line += f" [{(result.median / reference.median - 1) * 100:+.1f}% vs referência]"
+            print(line)
+    finally:
+        suite.cleanup()
+
+    if args.output:
+        save_results(results, args.output)
+        print(f"Resultados gravados em {args.output}")
+
+    if baseline:
+        regressions = compare_results(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} caso(s) mais lento(s) que a referência:")
+            for regression in regressions:
+                print(
+                    f"  {regression.name}: {format_duration(regression.baseline)} -> "
+                    f"{format_duration(regression.current)} ({regression.change * 100:+.1f}%)"
+                )
+            return 1
+        print("\nNenhuma piora além da tolerância em relação à referência")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,3 @@
+"""
+Módulo benchmarks - Medições de desempenho do cliente, do armazenamento e dos conversores
+"""
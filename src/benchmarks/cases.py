@@ -0,0 +1,280 @@
+"""
+Casos de benchmark: envio de requisições, variáveis, armazenamento e conversores
+"""
+
+import os
+import shutil
+import tempfile
+from typing import Dict, List, Optional, Any
+
+from src.models.request import Request, BodyMode
+from src.models.collection import Collection, Folder
+from src.models.mock_response import MockResponse
+from src.core.http_client import HttpClient
+from src.core.latency_histogram import LatencyHistogram
+from src.core.mock_server import MockServer
+from src.core.storage import Storage
+from src.core.variable_processor import VariableProcessor
+from src.utils.collection_converter import import_collection, export_collection
+from src.utils.curl_converter import curl_to_request
+from src.benchmarks.harness import Benchmark
+
+
+# Volume de dados de cada escala
+SCALES: Dict[str, Dict[str, int]] = {
+    "quick": {"requests": 10_000, "folders": 100, "curl_commands": 2_000, "http_requests": 200},
+    "full": {"requests": 100_000, "folders": 1_000, "curl_commands": 10_000, "http_requests": 1_000},
+}
+
+_CURL_TEMPLATES = [
+    'curl https://api.example.com/users/{i}',
+    'curl -X POST -H "Content-Type: application/json" -H "Authorization: Bearer token-{i}" '
+    '-d \'{{"name": "user {i}", "value": {i}}}\' https://api.example.com/users',
+    'curl --request PUT --url "https://api.example.org/v1/items/{i}?expand=true&page={i}" '
+    '--header "X-API-Key: key-{i}" --header "Accept: application/json" --data-raw \'{{"id": {i}}}\'',
+    'curl -X DELETE -H Authorization: token-{i} "https://api.example.net/sessions/{i}"',
+    'curl -F name=file-{i} -F upload=@/tmp/file-{i}.bin;type=application/octet-stream https://upload.example.com/files',
+]
+
+
+class _Dataset:
+    """
+    Coleção grande salva em um armazenamento temporário e seus arquivos exportados,
+    criados na primeira vez em que um caso precisa deles e compartilhados pelos demais
+    """
+    def __init__(self, workdir: str, requests: int, folders: int):
+        self.workdir = workdir
+        self.request_count = requests
+        self.folder_count = max(1, folders)
+        self.storage: Optional[Storage] = None
+        self.collection: Optional[Collection] = None
+        self.exports: Dict[str, str] = {}
+
+    def ensure(self) -> '_Dataset':
+        if self.storage is not None:
+            return self
+
+        self.storage = Storage(os.path.join(self.workdir, "dataset"))
+        self.collection = Collection("Benchmark", description="Coleção gerada para benchmarks")
+        folders = [Folder(f"Pasta {index}") for index in range(self.folder_count)]
+        for folder in folders:
+            self.collection.add_folder(folder)
+
+        for index in range(self.request_count):
+            request = _sample_request(index)
+            self.storage.save_request(request)
+            folders[index % len(folders)].requests.append(request.id)
+        self.storage.save_collection(self.collection)
+
+        for export_format in ("postman", "insomnia"):
+            path = os.path.join(self.workdir, f"collection.{export_format}.json")
+            success, message = export_collection(self.collection, path, export_format, self.storage)
+            if not success:
+                raise RuntimeError(message)
+            self.exports[export_format] = path
+        return self
+
+
+def _sample_request(index: int) -> Request:
+    """Requisição variada (métodos, cabeçalhos, parâmetros e corpos) usada nos dados gerados"""
+    method = ("GET", "POST", "PUT", "DELETE")[index % 4]
+    body = None
+    body_mode = None
+    if method in ("POST", "PUT"):
+        body = f'{{"id": {index}, "name": "{{{{user_name}}}}", "tags": ["a", "b"]}}'
+        body_mode = BodyMode.JSON
+    return Request(
+        name=f"Requisição {index}",
+        url=f"{{{{base_url}}}}/api/v1/resources/{index}",
+        method=method,
+        headers={"Accept": "application/json", "Authorization": "Bearer {{token}}", "X-Request": str(index)},
+        params={"page": str(index % 10), "limit": "50"},
+        body=body,
+        body_mode=body_mode
+    )
+
+
+def _http_cases(scale: Dict[str, int]) -> List[Benchmark]:
+    count = scale["http_requests"]
+
+    def setup() -> Dict[str, Any]:
+        request = Request(
+            "Benchmark", "{{base_url}}/items/{{id}}",
+            mock_response=MockResponse(200, body={"id": 1, "name": "item", "tags": ["a", "b", "c"]})
+        )
+        server = MockServer.from_requests([request])
+        base_url = server.start()
+        variables = {"base_url": base_url, "id": "42"}
+        # Abrir a conexão persistente antes das medições
+        HttpClient.send_request(request, variables)
+        return {"server": server, "request": request, "variables": variables}
+
+    def send_sequential(context: Dict[str, Any]) -> Dict[str, Any]:
+        latencies = LatencyHistogram()
+        overhead = LatencyHistogram()
+        for _ in range(count):
+            response, error = HttpClient.send_request(context["request"], context["variables"])
+            if error:
+                raise RuntimeError(error)
+            latencies.record(response.elapsed_time)
+            overhead.record(response.timings.client_overhead)
+        return {
+            "latency_p50": latencies.percentile(50),
+            "latency_p99": latencies.percentile(99),
+            "client_overhead_p50": overhead.percentile(50),
+        }
+
+    def teardown(context: Dict[str, Any]) -> None:
+        context["server"].stop()
+
+    return [
+        Benchmark(
+            "http.send_request", send_sequential, setup, teardown, group="http", unit="request",
+            items=count, rounds=5, min_round_time=0.0,
+            description="HttpClient.send_request sequencial contra o servidor de mocks local"
+        ),
+    ]
+
+
+def _variable_cases() -> List[Benchmark]:
+    variables = {f"var{index}": f"valor-{index}" for index in range(50)}
+    variables.update({"base_url": "https://api.example.com", "token": "abc123", "user_name": "Maria"})
+    text = "{{base_url}}/users/{{var1}}/orders/{{var2}}?token={{token}}&missing={{nao_definida}}"
+    payload = {
+        "user": {"name": "{{user_name}}", "tags": [f"{{{{var{index}}}}}" for index in range(20)]},
+        "items": [{"id": index, "label": f"item {{{{var{index % 50}}}}}"} for index in range(50)],
+    }
+
+    return [
+        Benchmark(
+            "variables.process_string", lambda _: VariableProcessor.process_string(text, variables),
+            group="variables", unit="string",
+            description="Substituição em uma URL com cinco referências"
+        ),
+        Benchmark(
+            "variables.process_dict", lambda _: VariableProcessor.process_dict(payload, variables),
+            group="variables", unit="body",
+            description="Substituição em um corpo JSON com 71 referências"
+        ),
+    ]
+
+
+def _storage_cases(dataset: _Dataset) -> List[Benchmark]:
+    def load_requests(data: _Dataset) -> None:
+        for collection in data.storage.get_all_collections():
+            for folder in collection.folders:
+                for request_id in folder.requests:
+                    data.storage.get_request(request_id)
+
+    return [
+        Benchmark(
+            "storage.get_all_collections", lambda data: data.storage.get_all_collections(),
+            setup=dataset.ensure, group="storage", unit="collection",
+            description=f"Coleção com {dataset.request_count} requisições em {dataset.folder_count} pastas"
+        ),
+        Benchmark(
+            "storage.load_collection_requests", load_requests,
+            setup=dataset.ensure, group="storage", unit="request", items=dataset.request_count,
+            rounds=3, min_round_time=0.0,
+            description="Carrega a coleção e cada uma das suas requisições"
+        ),
+    ]
+
+
+def _converter_cases(dataset: _Dataset, curl_count: int) -> List[Benchmark]:
+    counter = iter(range(1_000_000))
+
+    def import_operation(export_format: str):
+        def run(data: _Dataset) -> None:
+            storage = Storage(os.path.join(data.workdir, f"import-{export_format}-{next(counter)}"))
+            success, message, _ = import_collection(data.exports[export_format], storage)
+            if not success:
+                raise RuntimeError(message)
+        return run
+
+    def export_operation(export_format: str):
+        def run(data: _Dataset) -> None:
+            path = os.path.join(data.workdir, f"export.{export_format}.json")
+            success, message = export_collection(data.collection, path, export_format, data.storage)
+            if not success:
+                raise RuntimeError(message)
+        return run
+
+    commands = [
+        _CURL_TEMPLATES[index % len(_CURL_TEMPLATES)].format(i=index)
+        for index in range(curl_count)
+    ]
+
+    def parse_commands(_: Any) -> None:
+        for command in commands:
+            curl_to_request(command)
+
+    cases = []
+    for export_format in ("postman", "insomnia"):
+        cases.append(Benchmark(
+            f"converter.import_{export_format}", import_operation(export_format),
+            setup=dataset.ensure, group="converters", unit="request", items=dataset.request_count,
+            rounds=3, min_round_time=0.0,
+            description=f"import_collection de um arquivo {export_format} com {dataset.request_count} requisições"
+        ))
+        cases.append(Benchmark(
+            f"converter.export_{export_format}", export_operation(export_format),
+            setup=dataset.ensure, group="converters", unit="request", items=dataset.request_count,
+            rounds=3, min_round_time=0.0,
+            description=f"export_collection para {export_format} com {dataset.request_count} requisições"
+        ))
+    cases.append(Benchmark(
+        "converter.curl_to_request", parse_commands, group="converters", unit="command",
+        items=len(commands), rounds=5, min_round_time=0.0,
+        description=f"curl_to_request sobre {len(commands)} comandos variados"
+    ))
+    return cases
+
+
+class BenchmarkSuite:
+    """
+    Conjunto de casos de uma escala, com o diretório temporário dos dados gerados
+    """
+    def __init__(self, scale: str = "quick", workdir: Optional[str] = None):
+        """
+        Args:
+            scale (str): Escala dos dados (ver SCALES)
+            workdir (Optional[str]): Diretório dos dados gerados (padrão: um diretório temporário)
+        """
+        if scale not in SCALES:
+            raise ValueError(f"Escala desconhecida: {scale}")
+
+        self.scale = scale
+        self._owns_workdir = workdir is None
+        self.workdir = workdir or tempfile.mkdtemp(prefix="pyrequestman-bench-")
+        sizes = SCALES[scale]
+        dataset = _Dataset(self.workdir, sizes["requests"], sizes["folders"])
+
+        self.benchmarks: List[Benchmark] = (
+            _http_cases(sizes)
+            + _variable_cases()
+            + _storage_cases(dataset)
+            + _converter_cases(dataset, sizes["curl_commands"])
+        )
+
+    def select(self, patterns: Optional[List[str]] = None) -> List[Benchmark]:
+        """
+        Filtra os casos pelo nome
+
+        Args:
+            patterns (Optional[List[str]]): Trechos do nome (ex: "storage", "import"); todos se vazio
+
+        Returns:
+            List[Benchmark]: Casos cujo nome contém algum dos trechos
+        """
+        if not patterns:
+            return list(self.benchmarks)
+        return [
+            benchmark for benchmark in self.benchmarks
+            if any(pattern in benchmark.name for pattern in patterns)
+        ]
+
+    def cleanup(self) -> None:
+        """Remove os dados gerados"""
+        if self._owns_workdir:
+            shutil.rmtree(self.workdir, ignore_errors=True)
@@ -0,0 +1,265 @@
+"""
+Execução de benchmarks, resultados em JSON e comparação com uma execução de referência
+"""
+
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Callable
+
+from src import __version__
+
+
+class Benchmark:
+    """
+    Caso de benchmark: uma operação medida repetidas vezes
+
+    `setup` prepara os dados (fora da medição) e retorna o contexto passado
+    à operação; `teardown` o descarta ao final.
+    """
+    def __init__(
+        self,
+        name: str,
+        operation: Callable[[Any], Any],
+        setup: Optional[Callable[[], Any]] = None,
+        teardown: Optional[Callable[[Any], None]] = None,
+        group: str = "",
+        unit: str = "op",
+        items: int = 1,
+        rounds: int = 5,
+        min_round_time: float = 0.2,
+        description: str = ""
+    ):
+        """
+        Args:
+            name (str): Identificador único (usado na comparação entre execuções)
+            operation (Callable[[Any], Any]): Operação medida; recebe o contexto do setup e
+                pode retornar um dicionário de métricas extras (ex: overhead do cliente)
+            setup (Optional[Callable[[], Any]]): Preparação executada uma vez antes das rodadas
+            teardown (Optional[Callable[[Any], None]]): Limpeza executada ao final
+            group (str): Grupo do caso (ex: "http", "storage")
+            unit (str): O que cada item processado representa (ex: "request", "command")
+            items (int): Itens processados por chamada da operação (para calcular a vazão)
+            rounds (int): Rodadas medidas
+            min_round_time (float): Duração mínima de cada rodada; operações rápidas são
+                repetidas dentro da rodada até atingi-la
+            description (str): Descrição do caso
+        """
+        self.name = name
+        self.operation = operation
+        self.setup = setup
+        self.teardown = teardown
+        self.group = group
+        self.unit = unit
+        self.items = max(1, items)
+        self.rounds = max(1, rounds)
+        self.min_round_time = min_round_time
+        self.description = description
+
+
+class BenchmarkResult:
+    """
+    Resultado de um caso: tempo por chamada da operação em cada rodada
+    """
+    def __init__(self, name: str, group: str, unit: str, items: int, round_times: List[float],
+                 calls_per_round: int, extra: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.group = group
+        self.unit = unit
+        self.items = items
+        # Segundos por chamada da operação, um valor por rodada
+        self.round_times = round_times
+        self.calls_per_round = calls_per_round
+        self.extra = extra or {}
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.round_times)
+
+    @property
+    def best(self) -> float:
+        return min(self.round_times)
+
+    @property
+    def stdev(self) -> float:
+        return statistics.stdev(self.round_times) if len(self.round_times) > 1 else 0.0
+
+    @property
+    def items_per_second(self) -> float:
+        """Vazão calculada pela mediana das rodadas"""
+        return self.items / self.median if self.median > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte o objeto para um dicionário"""
+        return {
+            "name": self.name,
+            "group": self.group,
+            "unit": self.unit,
+            "items": self.items,
+            "median": self.median,
+            "best": self.best,
+            "stdev": self.stdev,
+            "items_per_second": self.items_per_second,
+            "rounds": self.round_times,
+            "calls_per_round": self.calls_per_round,
+            "extra": self.extra,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BenchmarkResult':
+        """Cria um objeto a partir de um dicionário"""
+        return cls(
+            name=data["name"],
+            group=data.get("group", ""),
+            unit=data.get("unit", "op"),
+            items=data.get("items", 1),
+            round_times=data["rounds"],
+            calls_per_round=data.get("calls_per_round", 1),
+            extra=data.get("extra", {})
+        )
+
+
+class Regression:
+    """
+    Diferença de um caso em relação à execução de referência
+    """
+    def __init__(self, name: str, baseline: float, current: float):
+        self.name = name
+        self.baseline = baseline
+        self.current = current
+
+    @property
+    def change(self) -> float:
+        """Variação relativa do tempo mediano (0.25 = 25% mais lento)"""
+        return self.current / self.baseline - 1.0 if self.baseline > 0 else 0.0
+
+
+def run_benchmark(benchmark: Benchmark) -> BenchmarkResult:
+    """
+    Executa um caso
+
+    Uma chamada de aquecimento estima a duração da operação e define quantas
+    chamadas cabem em cada rodada; o coletor de lixo fica desativado durante
+    as medições para não distribuir pausas ao acaso entre as rodadas.
+
+    Args:
+        benchmark (Benchmark): Caso a executar
+
+    Returns:
+        BenchmarkResult: Tempos por chamada de cada rodada e métricas extras
+    """
+    context = benchmark.setup() if benchmark.setup else None
+    extra: Dict[str, Any] = {}
+    try:
+        start = time.perf_counter()
+        benchmark.operation(context)
+        warmup_time = time.perf_counter() - start
+        calls = max(1, int(benchmark.min_round_time / warmup_time)) if warmup_time > 0 else 1000
+
+        round_times = []
+        for _ in range(benchmark.rounds):
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                for _ in range(calls):
+                    metrics = benchmark.operation(context)
+                elapsed = time.perf_counter() - start
+            finally:
+                gc.enable()
+            round_times.append(elapsed / calls)
+            if isinstance(metrics, dict):
+                extra.update(metrics)
+    finally:
+        if benchmark.teardown:
+            benchmark.teardown(context)
+
+    return BenchmarkResult(
+        benchmark.name, benchmark.group, benchmark.unit, benchmark.items, round_times, calls, extra
+    )
+
+
+def environment_info() -> Dict[str, Any]:
+    """Identifica a máquina e a versão em que os resultados foram obtidos"""
+    return {
+        "version": __version__,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+def save_results(results: List[BenchmarkResult], path: str) -> None:
+    """
+    Grava os resultados em JSON
+
+    Args:
+        results (List[BenchmarkResult]): Resultados da execução
+        path (str): Arquivo de destino
+    """
+    data = {
+        "environment": environment_info(),
+        "results": [result.to_dict() for result in results],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def load_results(path: str) -> Dict[str, BenchmarkResult]:
+    """
+    Lê resultados gravados por save_results
+
+    Args:
+        path (str): Arquivo JSON
+
+    Returns:
+        Dict[str, BenchmarkResult]: Resultados por nome do caso
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {item["name"]: BenchmarkResult.from_dict(item) for item in data.get("results", [])}
+
+
+def compare_results(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, BenchmarkResult],
+    threshold: float = 0.1
+) -> List[Regression]:
+    """
+    Compara os tempos medianos com os de uma execução de referência
+
+    Args:
+        results (List[BenchmarkResult]): Resultados atuais
+        baseline (Dict[str, BenchmarkResult]): Resultados de referência por nome
+        threshold (float): Piora relativa tolerada (0.1 = 10%)
+
+    Returns:
+        List[Regression]: Casos mais lentos que a referência além da tolerância
+    """
+    regressions = []
+    for result in results:
+        reference = baseline.get(result.name)
+        if reference is None or reference.items != result.items:
+            # Casos novos ou com outro volume de dados não são comparáveis
+            continue
+        regression = Regression(result.name, reference.median, result.median)
+        if regression.change > threshold:
+            regressions.append(regression)
+    return regressions
+
+
+def format_duration(seconds: float) -> str:
+    """Formata uma duração com a unidade adequada (ns, µs, ms ou s)"""
+    if seconds < 1e-6:
+        return f"{seconds * 1e9:.0f}ns"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f}ms"
+    return f"{seconds:.2f}s"
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes da execução e da comparação de benchmarks
+"""
+
+import sys
+import os
+import json
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.benchmarks.cases import BenchmarkSuite
+from src.benchmarks.harness import (
+    Benchmark, BenchmarkResult, run_benchmark, save_results, load_results, compare_results, format_duration
+)
+
+
+def _result(name, median, items=1):
+    return BenchmarkResult(name, "group", "op", items, [median], 1)
+
+
+def test_run_benchmark_measures_rounds_and_cleans_up():
+    events = []
+
+    def operation(context):
+        context.append(1)
+        return {"calls": len(context)}
+
+    benchmark = Benchmark(
+        "list.append", operation,
+        setup=lambda: events.append("setup") or [],
+        teardown=lambda context: events.append("teardown"),
+        items=10, rounds=3, min_round_time=0.01
+    )
+    result = run_benchmark(benchmark)
+
+    assert events == ["setup", "teardown"]
+    assert len(result.round_times) == 3
+    assert result.calls_per_round >= 1
+    assert result.extra["calls"] == 1 + 3 * result.calls_per_round
+    assert result.items_per_second == 10 / result.median
+
+
+def test_results_round_trip_through_json(tmp_path):
+    path = str(tmp_path / "results.json")
+    save_results([_result("a", 0.5), BenchmarkResult("b", "g", "request", 5, [0.1, 0.3], 2, {"x": 1})], path)
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    assert data["environment"]["python"]
+
+    loaded = load_results(path)
+    assert loaded["b"].to_dict() == BenchmarkResult("b", "g", "request", 5, [0.1, 0.3], 2, {"x": 1}).to_dict()
+    assert loaded["b"].stdev > 0 and loaded["a"].stdev == 0.0
+
+
+def test_only_comparable_slowdowns_are_regressions():
+    baseline = {"same": _result("same", 1.0), "slower": _result("slower", 1.0), "resized": _result("resized", 1.0)}
+    current = [
+        _result("same", 1.05), _result("slower", 1.5), _result("resized", 9.0, items=2), _result("new", 9.0)
+    ]
+    regressions = compare_results(current, baseline, threshold=0.1)
+    assert [regression.name for regression in regressions] == ["slower"]
+    assert abs(regressions[0].change - 0.5) < 1e-9
+
+
+def test_format_duration_picks_the_unit():
+    assert format_duration(5e-9) == "5ns"
+    assert format_duration(2.5e-6) == "2.5µs"
+    assert format_duration(0.0125) == "12.5ms"
+    assert format_duration(3) == "3.00s"
+
+
+def test_suite_selects_cases_and_removes_its_data():
+    suite = BenchmarkSuite("quick")
+    try:
+        names = [benchmark.name for benchmark in suite.select(["variables."])]
+        assert names == ["variables.process_string", "variables.process_dict"]
+        assert len(suite.select()) == len(suite.benchmarks)
+    finally:
+        suite.cleanup()
+    assert not os.path.exists(suite.workdir)
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Fixtures compartilhadas pelos testes
+"""
+
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+
+@pytest.fixture
+def http_server():
+    """
+    Inicia servidores HTTP locais em threads; todos são encerrados ao fim do teste
+
+    Uso: server = http_server(Handler) ou http_server(Handler, host="0.0.0.0").
+    O servidor recebe o atributo url (ex: "http://127.0.0.1:8123").
+    """
+    servers = []
+
+    def start(handler, host="127.0.0.1"):
+        server = ThreadingHTTPServer((host, 0), handler)
+        # Handlers bloqueados (ex: testes de cancelamento) não impedem o encerramento
+        server.daemon_threads = True
+        server.url = f"http://127.0.0.1:{server.server_address[1]}"
+        servers.append(server)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+    try:
+        yield start
+    finally:
+        for server in servers:
+            server.shutdown()
+            server.server_close()
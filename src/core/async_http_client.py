@@ -0,0 +1,382 @@
+"""
+Cliente HTTP assíncrono (asyncio) para realizar muitas requisições simultâneas
+"""
+
+import asyncio
+import ssl
+import time
+from collections import deque
+from typing import Dict, Any, Optional, List, Tuple, Deque, Iterable, Iterator
+from urllib.parse import urlsplit
+
+from src import __version__
+from src.models.request import Request, Response
+from src.models.retry_policy import IDEMPOTENT_METHODS
+from src.core.http_client import HttpClient
+from src.core.prepared_cache import PreparedSend
+from src.utils.compression import available_encodings, decode_content, CompressedStream
+
+
+# Chave que identifica um destino: (esquema, host, porta)
+OriginKey = Tuple[str, str, int]
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Códigos de status que nunca possuem corpo
+NO_BODY_STATUS = {204, 304}
+
+
+class HttpProtocolError(Exception):
+    """Erro ao interpretar a resposta HTTP recebida"""
+
+
+class _ChunkedBody:
+    """Corpo de tamanho desconhecido enviado com Transfer-Encoding: chunked"""
+    def __init__(self, source: Iterable[bytes]):
+        self.source = source
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self.source:
+            if chunk:
+                yield b"%x\r\n%s\r\n" % (len(chunk), chunk)
+        yield b"0\r\n\r\n"
+
+
+class _Connection:
+    """Conexão TCP (ou TLS) aberta com um destino"""
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.reused = False
+        # Marcado quando chega o primeiro byte da resposta da troca atual
+        self.response_started = False
+
+    def close(self) -> None:
+        """Fecha a conexão"""
+        try:
+            self.writer.close()
+        except Exception:
+            pass
+
+
+class _OriginPool:
+    """Conexões ociosas e limite de conexões de um destino"""
+    def __init__(self, max_connections: int):
+        self.idle: Deque[_Connection] = deque()
+        self.slots = asyncio.Semaphore(max_connections)
+
+
+class AsyncHttpClient:
+    """
+    Cliente HTTP/1.1 assíncrono com conexões persistentes por destino
+
+    Mantém o mesmo contrato de HttpClient.send_request, retornando uma tupla
+    (Response, erro), e a mesma substituição de variáveis. Milhares de
+    requisições podem ficar em andamento em um único loop de eventos.
+    """
+    def __init__(
+        self,
+        max_concurrency: int = 1000,
+        max_connections_per_host: int = 100,
+        timeout: float = 30.0,
+        ssl_context: Optional[ssl.SSLContext] = None
+    ):
+        """
+        Args:
+            max_concurrency (int): Máximo de requisições em andamento ao mesmo tempo
+            max_connections_per_host (int): Máximo de conexões abertas por destino
+            timeout (float): Tempo limite, em segundos, de cada requisição
+            ssl_context (Optional[ssl.SSLContext]): Contexto TLS para destinos HTTPS
+        """
+        self.max_concurrency = max_concurrency
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self.ssl_context = ssl_context or ssl.create_default_context()
+        self._pools: Dict[OriginKey, _OriginPool] = {}
+        self._in_flight: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> 'AsyncHttpClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def send_request(self, request: Request, variables: Optional[Dict[str, str]] = None) -> Tuple[Response, Optional[str]]:
+        """
+        Envia uma requisição HTTP de forma assíncrona
+
+        Args:
+            request (Request): Objeto de requisição
+            variables (Optional[Dict[str, str]]): Variáveis para substituição
+
+        Returns:
+            Tuple[Response, Optional[str]]: Resposta e mensagem de erro (se houver)
+        """
+        if self._in_flight is None:
+            self._in_flight = asyncio.Semaphore(self.max_concurrency)
+
+        start_time = time.perf_counter()
+
+        try:
+            # Substituir variáveis e serializar o corpo (reaproveitado entre envios iguais)
+            prepared = HttpClient.prepare_request(request, variables)
+            start_time = time.perf_counter()
+
+            # O tempo total da requisição, se definido, substitui o do cliente
+            timeout = request.timeouts.total if request.timeouts and request.timeouts.total else self.timeout
+            async with self._in_flight:
+                status_code, headers, content, wire_size = await asyncio.wait_for(
+                    self._perform(prepared),
+                    timeout=timeout
+                )
+
+            response = Response(
+                status_code=status_code,
+                headers=headers,
+                content=content,
+                elapsed_time=time.perf_counter() - start_time
+            )
+            response.wire_size = wire_size
+            return response, None
+
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, HttpProtocolError, ValueError) as e:
+            error_message = f"Erro ao realizar requisição: {str(e) or e.__class__.__name__}"
+        except Exception as e:
+            error_message = f"Erro inesperado: {str(e)}"
+
+        response = Response(
+            status_code=0,
+            headers={},
+            content=b"",
+            elapsed_time=time.perf_counter() - start_time
+        )
+        return response, error_message
+
+    async def send_many(
+        self,
+        requests: Iterable[Request],
+        variables: Optional[Dict[str, str]] = None
+    ) -> List[Tuple[Response, Optional[str]]]:
+        """
+        Envia várias requisições simultaneamente
+
+        Args:
+            requests (Iterable[Request]): Requisições a enviar
+            variables (Optional[Dict[str, str]]): Variáveis para substituição
+
+        Returns:
+            List[Tuple[Response, Optional[str]]]: Resultados na mesma ordem das requisições
+        """
+        return await asyncio.gather(*(self.send_request(request, variables) for request in requests))
+
+    async def close(self) -> None:
+        """Fecha todas as conexões ociosas"""
+        for pool in self._pools.values():
+            while pool.idle:
+                pool.idle.popleft().close()
+        self._pools.clear()
+
+    async def _perform(self, prepared: PreparedSend) -> Tuple[int, Dict[str, str], bytes, int]:
+        """Realiza a troca HTTP usando uma conexão do pool do destino"""
+        method = prepared.request.method.upper()
+        parts = urlsplit(prepared.url)
+        scheme = (parts.scheme or "http").lower()
+        if scheme not in DEFAULT_PORTS:
+            raise ValueError(f"Esquema de URL não suportado: {prepared.url}")
+        if not parts.hostname:
+            raise ValueError(f"URL inválida: {prepared.url}")
+
+        host = parts.hostname
+        port = parts.port or DEFAULT_PORTS[scheme]
+        origin = (scheme, host.lower(), port)
+
+        payload, body_stream = self._build_request_bytes(prepared, method, parts, host, port)
+
+        pool = self._pools.get(origin)
+        if pool is None:
+            pool = self._pools[origin] = _OriginPool(self.max_connections_per_host)
+
+        async with pool.slots:
+            connection = await self._acquire(pool, origin)
+            try:
+                status_code, headers, content, wire_size, keep_alive = await self._exchange(connection, payload, method, body_stream)
+            except (OSError, asyncio.IncompleteReadError, HttpProtocolError):
+                connection.close()
+                # A conexão reaproveitada pode ter sido fechada pelo servidor; tentar em uma nova.
+                # Se a resposta já começou a chegar, o servidor processou a requisição:
+                # só métodos idempotentes podem ser enviados de novo
+                if not connection.reused or (connection.response_started and method not in IDEMPOTENT_METHODS):
+                    raise
+                connection = await self._open(origin)
+                try:
+                    status_code, headers, content, wire_size, keep_alive = await self._exchange(connection, payload, method, body_stream)
+                except BaseException:
+                    connection.close()
+                    raise
+            except BaseException:
+                connection.close()
+                raise
+
+            if keep_alive:
+                connection.reused = True
+                pool.idle.append(connection)
+            else:
+                connection.close()
+
+        return status_code, headers, content, wire_size
+
+    async def _acquire(self, pool: _OriginPool, origin: OriginKey) -> _Connection:
+        """Obtém uma conexão ociosa do pool ou abre uma nova"""
+        while pool.idle:
+            connection = pool.idle.pop()
+            if not connection.reader.at_eof() and not connection.writer.is_closing():
+                return connection
+            connection.close()
+        return await self._open(origin)
+
+    async def _open(self, origin: OriginKey) -> _Connection:
+        """Abre uma nova conexão com o destino"""
+        scheme, host, port = origin
+        reader, writer = await asyncio.open_connection(
+            host,
+            port,
+            ssl=self.ssl_context if scheme == "https" else None,
+            limit=2 ** 20
+        )
+        return _Connection(reader, writer)
+
+    @staticmethod
+    def _build_request_bytes(prepared: PreparedSend, method: str, parts, host: str, port: int) -> Tuple[bytes, Any]:
+        """
+        Monta a requisição HTTP/1.1 em bytes
+
+        Returns:
+            Tuple[bytes, Any]: Linha inicial e cabeçalhos (mais o corpo, se estiver em
+            memória) e o corpo a ser lido do disco em blocos (ou None)
+        """
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+
+        headers = {key.lower(): (key, value) for key, value in prepared.headers.items()}
+        body = prepared.body or b""
+
+        host_text = f"[{host}]" if ":" in host else host
+        host_header = host_text if port == DEFAULT_PORTS[parts.scheme.lower()] else f"{host_text}:{port}"
+
+        headers.setdefault("host", ("Host", host_header))
+        headers.setdefault("user-agent", ("User-Agent", f"PyRequestMan/{__version__}"))
+        headers.setdefault("accept-encoding", ("Accept-Encoding", ", ".join(available_encodings())))
+        headers.setdefault("accept", ("Accept", "*/*"))
+        headers.setdefault("connection", ("Connection", "keep-alive"))
+        if isinstance(body, CompressedStream):
+            # Tamanho desconhecido até o fim da compressão
+            headers.pop("content-length", None)
+            headers["transfer-encoding"] = ("Transfer-Encoding", "chunked")
+            body = _ChunkedBody(body)
+        elif body or method in ("POST", "PUT", "PATCH"):
+            headers["content-length"] = ("Content-Length", str(len(body)))
+
+        lines = [f"{method} {target} HTTP/1.1"]
+        lines.extend(f"{key}: {value}" for key, value in headers.values())
+        head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+        if isinstance(body, bytes):
+            return head + body, None
+        return head, body
+
+    @staticmethod
+    async def _exchange(
+        connection: _Connection,
+        payload: bytes,
+        method: str,
+        body_stream: Optional[Iterable[bytes]] = None
+    ) -> Tuple[int, Dict[str, str], bytes, int, bool]:
+        """Envia a requisição e lê a resposta completa"""
+        connection.response_started = False
+        connection.writer.write(payload)
+        await connection.writer.drain()
+        if body_stream is not None:
+            # Arquivos são enviados em blocos, aguardando o esvaziamento do buffer a cada um;
+            # a leitura do disco (e a compressão) roda fora do loop para não bloquear os demais envios
+            loop = asyncio.get_running_loop()
+            chunks = iter(body_stream)
+            try:
+                while True:
+                    chunk = await loop.run_in_executor(None, next, chunks, None)
+                    if chunk is None:
+                        break
+                    connection.writer.write(chunk)
+                    await connection.writer.drain()
+            finally:
+                close = getattr(chunks, "close", None)
+                if close is not None:
+                    close()
+
+        reader = connection.reader
+
+        # Ignorar respostas informativas (1xx)
+        while True:
+            status_line = await reader.readline()
+            if not status_line:
+                raise HttpProtocolError("Conexão encerrada antes da resposta")
+            connection.response_started = True
+
+            try:
+                version, status, *_ = status_line.decode("latin-1").split(" ", 2)
+                status_code = int(status)
+            except ValueError:
+                raise HttpProtocolError(f"Linha de status inválida: {status_line!r}")
+
+            headers: Dict[str, str] = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n"):
+                    break
+                if not line:
+                    raise HttpProtocolError("Conexão encerrada durante os cabeçalhos")
+                name, _, value = line.decode("latin-1").partition(":")
+                name = name.strip()
+                value = value.strip()
+                if name in headers:
+                    headers[name] = f"{headers[name]}, {value}"
+                else:
+                    headers[name] = value
+
+            if status_code >= 200 or status_code == 101:
+                break
+
+        lowered = {key.lower(): value for key, value in headers.items()}
+        connection_header = lowered.get("connection", "").lower()
+        keep_alive = version.strip().upper() == "HTTP/1.1"
+        if "close" in connection_header:
+            keep_alive = False
+        elif "keep-alive" in connection_header:
+            keep_alive = True
+
+        if method == "HEAD" or status_code in NO_BODY_STATUS or status_code < 200:
+            content = b""
+        elif "chunked" in lowered.get("transfer-encoding", "").lower():
+            chunks = []
+            while True:
+                size_line = await reader.readline()
+                size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+                if size == 0:
+                    # Ler possíveis trailers até a linha em branco
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            content = b"".join(chunks)
+        elif "content-length" in lowered:
+            content = await reader.readexactly(int(lowered["content-length"]))
+        else:
+            content = await reader.read()
+            keep_alive = False
+
+        wire_size = len(content)
+        encoding = lowered.get("content-encoding", "")
+        if content and encoding:
+            content = decode_content(content, encoding)
+
+        return status_code, headers, content, wire_size, keep_alive
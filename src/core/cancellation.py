@@ -0,0 +1,269 @@
+"""
+Cancelamento de envios e prazos totais (deadlines)
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Callable, Iterable, Iterator
+
+from requests.exceptions import RequestException, Timeout as RequestsTimeout
+
+
+_local = threading.local()
+
+# Motivos de interrupção de um envio
+REASON_CANCELLED = "cancelled"
+REASON_DEADLINE = "deadline"
+
+
+class RequestCancelled(RequestException):
+    """Envio interrompido por um pedido de cancelamento"""
+
+
+class DeadlineExceeded(RequestsTimeout):
+    """Envio interrompido por ter esgotado o tempo total"""
+
+
+class _Watchdog:
+    """
+    Thread única que executa ações agendadas para instantes futuros (os prazos
+    de todos os envios), evitando criar um temporizador por envio
+    """
+    def __init__(self):
+        self._heap: List[list] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, when: float, callback: Callable[[], None]) -> list:
+        """
+        Agenda uma ação
+
+        Args:
+            when (float): Instante, em time.monotonic(), em que a ação deve ser executada
+            callback (Callable[[], None]): Ação
+
+        Returns:
+            list: Entrada agendada (usada para desmarcar)
+        """
+        entry = [when, next(self._counter), callback]
+        with self._condition:
+            heapq.heappush(self._heap, entry)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="deadline-watchdog", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return entry
+
+    def unschedule(self, entry: list) -> None:
+        """Desmarca uma ação agendada (a entrada é descartada quando chegar a vez dela)"""
+        with self._condition:
+            entry[2] = None
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._heap or self._heap[0][0] > time.monotonic():
+                    timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+                    self._condition.wait(timeout)
+                _, _, callback = heapq.heappop(self._heap)
+
+            if callback is not None:
+                try:
+                    callback()
+                except Exception as e:
+                    print(f"Erro ao interromper envio: {str(e)}")
+
+
+_watchdog = _Watchdog()
+
+
+def schedule(delay: float, callback: Callable[[], None]) -> list:
+    """
+    Agenda uma ação rápida na thread de prazos (ex: iniciar uma cópia de um envio)
+
+    Args:
+        delay (float): Segundos até a execução
+        callback (Callable[[], None]): Ação (não deve bloquear)
+
+    Returns:
+        list: Entrada agendada (ver unschedule)
+    """
+    return _watchdog.schedule(time.monotonic() + max(delay, 0.0), callback)
+
+
+def unschedule(entry: list) -> None:
+    """Desmarca uma ação agendada com schedule"""
+    _watchdog.unschedule(entry)
+
+
+class CancellationToken:
+    """
+    Sinal de cancelamento compartilhado entre quem inicia um envio (interface,
+    executor de coleções) e as conexões que o realizam
+
+    Ao cancelar, todas as ações registradas são executadas (ex: fechar o socket
+    em uso), interrompendo o envio mesmo que ele esteja bloqueado esperando dados.
+    Um token pode ter um prazo, após o qual é cancelado automaticamente, e um
+    token pai, cujo cancelamento se propaga para ele.
+    """
+    def __init__(self, parent: Optional['CancellationToken'] = None, timeout: Optional[float] = None):
+        """
+        Args:
+            parent (Optional[CancellationToken]): Token cujo cancelamento se propaga para este
+            timeout (Optional[float]): Segundos até o cancelamento automático por prazo
+        """
+        self.reason: Optional[str] = None
+        self.deadline: Optional[float] = None
+        self._event = threading.Event()
+        self._callbacks: Dict[int, Callable[[], None]] = {}
+        self._handles = itertools.count()
+        self._lock = threading.Lock()
+        self._parent = parent
+        self._parent_handle: Optional[int] = None
+        self._watchdog_entry: Optional[list] = None
+
+        if timeout is not None:
+            self.set_deadline(timeout)
+        if parent is not None:
+            self._parent_handle = parent.register(lambda: self.cancel(parent.reason or REASON_CANCELLED))
+
+    @property
+    def cancelled(self) -> bool:
+        """Indica se o token foi cancelado"""
+        return self._event.is_set()
+
+    def cancel(self, reason: str = REASON_CANCELLED) -> None:
+        """
+        Cancela o token, executando as ações registradas
+
+        Args:
+            reason (str): Motivo (REASON_CANCELLED ou REASON_DEADLINE)
+        """
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks = list(self._callbacks.values())
+            self._callbacks.clear()
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Erro ao interromper envio: {str(e)}")
+
+    def set_deadline(self, timeout: float) -> None:
+        """
+        Define o prazo do token
+
+        Args:
+            timeout (float): Segundos, a partir de agora, até o cancelamento automático
+        """
+        deadline = time.monotonic() + max(timeout, 0.0)
+        with self._lock:
+            if self._watchdog_entry is not None:
+                _watchdog.unschedule(self._watchdog_entry)
+            self.deadline = deadline
+        self._watchdog_entry = _watchdog.schedule(deadline, lambda: self.cancel(REASON_DEADLINE))
+
+    def remaining(self) -> Optional[float]:
+        """
+        Retorna os segundos até o prazo mais próximo (deste token ou dos pais)
+
+        Returns:
+            Optional[float]: Segundos restantes (podem ser negativos), ou None se não houver prazo
+        """
+        remaining = None
+        if self.deadline is not None:
+            remaining = self.deadline - time.monotonic()
+        if self._parent is not None:
+            parent_remaining = self._parent.remaining()
+            if parent_remaining is not None and (remaining is None or parent_remaining < remaining):
+                remaining = parent_remaining
+        return remaining
+
+    def register(self, callback: Callable[[], None]) -> Optional[int]:
+        """
+        Registra uma ação executada no cancelamento (imediatamente, se já foi cancelado)
+
+        Args:
+            callback (Callable[[], None]): Ação
+
+        Returns:
+            Optional[int]: Identificador para remover o registro (None se já foi executada)
+        """
+        with self._lock:
+            if not self._event.is_set():
+                handle = next(self._handles)
+                self._callbacks[handle] = callback
+                return handle
+        callback()
+        return None
+
+    def unregister(self, handle: Optional[int]) -> None:
+        """Remove uma ação registrada"""
+        if handle is None:
+            return
+        with self._lock:
+            self._callbacks.pop(handle, None)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Aguarda o cancelamento
+
+        Args:
+            timeout (Optional[float]): Espera máxima em segundos
+
+        Returns:
+            bool: True se o token foi cancelado
+        """
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self) -> None:
+        """
+        Raises:
+            DeadlineExceeded: Se o prazo foi esgotado
+            RequestCancelled: Se o token foi cancelado
+        """
+        if not self._event.is_set():
+            return
+        if self.reason == REASON_DEADLINE:
+            raise DeadlineExceeded("Tempo total da requisição esgotado")
+        raise RequestCancelled("Requisição cancelada")
+
+    def guard(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Repassa os blocos verificando o cancelamento entre eles"""
+        for chunk in chunks:
+            self.raise_if_cancelled()
+            yield chunk
+
+    def close(self) -> None:
+        """Desfaz o vínculo com o token pai e o prazo agendado, descartando as ações registradas"""
+        if self._parent is not None:
+            self._parent.unregister(self._parent_handle)
+            self._parent_handle = None
+        with self._lock:
+            if self._watchdog_entry is not None:
+                _watchdog.unschedule(self._watchdog_entry)
+                self._watchdog_entry = None
+            self._callbacks.clear()
+
+    @staticmethod
+    def current() -> Optional['CancellationToken']:
+        """Retorna o token ativo na thread atual"""
+        return getattr(_local, "token", None)
+
+    @contextmanager
+    def activate(self) -> Iterator['CancellationToken']:
+        """Torna este token o ativo na thread atual durante o bloco"""
+        previous = getattr(_local, "token", None)
+        _local.token = self
+        try:
+            yield self
+        finally:
+            _local.token = previous
@@ -0,0 +1,507 @@
+"""
+Execução de coleções e pastas de requisições com concorrência controlada
+"""
+
+import itertools
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Callable, Iterable, Iterator, Tuple, Union
+
+from src.models.request import Request, Response
+from src.models.collection import Collection, Folder
+from src.models.retry_policy import RetryPolicy, HedgePolicy
+from src.models.timeouts import Timeouts
+from src.models.rate_limit import RateLimitPolicy
+from src.core.http_client import HttpClient
+from src.core.cancellation import CancellationToken
+from src.core.rate_limiter import RateLimiter
+from src.core.storage import Storage
+from src.core.variable_scope import VariableScope, ScopeChain, COLLECTION, FOLDER, ENVIRONMENT, RUN, ITERATION
+
+
+# Requisição a executar: (nomes das pastas no caminho, IDs das pastas no caminho, id da requisição);
+# os nomes servem só para exibição (pastas irmãs podem ter o mesmo nome)
+RunItem = Tuple[List[str], Tuple[str, ...], str]
+
+# Tarefa numerada: (posição na árvore, nomes e IDs das pastas, id da requisição) de cada requisição
+Task = List[Tuple[int, List[str], Tuple[str, ...], str]]
+
+# Linhas de dados de uma execução (ex: um DataSource); cada uma é uma iteração
+DataRows = Iterable[Dict[str, str]]
+
+# Função usada para enviar cada requisição (mesmo contrato de HttpClient.send_request;
+# recebe também cancel_token e, quando a execução os define, retry_policy, hedge_policy,
+# resolve_overrides, timeouts e rate_limiter)
+SendFunction = Callable[[Request, Dict[str, str]], Tuple[Response, Optional[str]]]
+
+
+class RunOrder:
+    """
+    Estratégias de ordenação de uma execução
+    """
+    # Uma requisição por vez, na ordem da árvore
+    SEQUENTIAL = "sequential"
+    # Pastas em paralelo; dentro de cada pasta, as requisições seguem em ordem
+    FOLDER_PARALLEL = "folder_parallel"
+    # Todas as requisições em paralelo, limitadas pela concorrência
+    PARALLEL = "parallel"
+
+    ALL = (SEQUENTIAL, FOLDER_PARALLEL, PARALLEL)
+
+
+class RunResult:
+    """
+    Resultado da execução de uma requisição da coleção
+    """
+    def __init__(
+        self,
+        index: int,
+        request_id: str,
+        folder_path: List[str],
+        request: Optional[Request] = None,
+        response: Optional[Response] = None,
+        error: Optional[str] = None,
+        iteration: int = 0
+    ):
+        self.index = index
+        # Iteração (linha de dados) em que a requisição foi executada
+        self.iteration = iteration
+        self.request_id = request_id
+        self.folder_path = folder_path
+        self.request = request
+        self.response = response
+        self.error = error
+
+    @property
+    def request_name(self) -> str:
+        """Nome da requisição executada"""
+        return self.request.name if self.request else self.request_id
+
+    @property
+    def success(self) -> bool:
+        """Indica se a requisição foi enviada e recebeu uma resposta"""
+        return self.error is None and self.response is not None and self.response.status_code > 0
+
+
+class CollectionRunner:
+    """
+    Percorre a árvore de uma coleção (ou pasta) e envia suas requisições
+    por meio de um pool limitado de threads, entregando os resultados
+    à medida que cada requisição termina
+    """
+    def __init__(
+        self,
+        storage: Storage,
+        concurrency: int = 4,
+        order: str = RunOrder.SEQUENTIAL,
+        send_function: Optional[SendFunction] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        resolve_overrides: Optional[Dict[str, str]] = None,
+        timeouts: Optional[Timeouts] = None,
+        run_timeout: Optional[float] = None,
+        rate_limit: Optional[RateLimitPolicy] = None
+    ):
+        """
+        Args:
+            storage (Storage): Armazenamento de onde as requisições são carregadas
+            concurrency (int): Máximo de requisições enviadas ao mesmo tempo
+            order (str): Estratégia de ordenação (ver RunOrder)
+            send_function (Optional[SendFunction]): Função de envio; por padrão HttpClient.send_request
+            retry_policy (Optional[RetryPolicy]): Política de novas tentativas padrão
+                (se omitida, usa a da coleção executada)
+            hedge_policy (Optional[HedgePolicy]): Política de duplicação padrão
+                (se omitida, usa a da coleção executada)
+            resolve_overrides (Optional[Dict[str, str]]): Endereços fixos por host
+                (ex: Environment.resolve_overrides)
+            timeouts (Optional[Timeouts]): Tempos limite padrão das requisições
+                (se omitidos, usa os da coleção executada)
+            run_timeout (Optional[float]): Segundos para a execução inteira; ao se esgotarem,
+                as requisições em andamento são interrompidas e as restantes descartadas
+            rate_limit (Optional[RateLimitPolicy]): Limites de taxa por host (ex: Environment.rate_limit);
+                se omitidos, usa os da coleção executada
+        """
+        if order not in RunOrder.ALL:
+            raise ValueError(f"Ordem de execução inválida: {order}")
+
+        self.storage = storage
+        self.concurrency = max(1, concurrency)
+        self.order = order
+        self.send_function = send_function or HttpClient.send_request
+        self.retry_policy = retry_policy
+        self.hedge_policy = hedge_policy
+        self.resolve_overrides = resolve_overrides
+        self.timeouts = timeouts
+        self.run_timeout = run_timeout
+        self.rate_limit = rate_limit
+        # Limitador da última execução, compartilhado por todos os seus workers
+        self.rate_limiter: Optional[RateLimiter] = None
+        # Variáveis da última execução (ScopeChain.scope(RUN)), visíveis para todas as suas requisições
+        self.run_scope: Optional[VariableScope] = None
+        self._stop_event = threading.Event()
+        self._cancel_token = CancellationToken()
+
+    def stop(self) -> None:
+        """
+        Interrompe a execução: requisições em andamento são canceladas e as
+        ainda não iniciadas, descartadas
+        """
+        self._stop_event.set()
+        self._cancel_token.cancel()
+
+    @staticmethod
+    def collect_groups(node: Union[Collection, Folder], folder_path: Optional[List[str]] = None) -> List[List[RunItem]]:
+        """
+        Agrupa as requisições da árvore por pasta, em ordem de profundidade
+
+        Args:
+            node (Union[Collection, Folder]): Coleção ou pasta de origem
+            folder_path (Optional[List[str]]): Caminho de pastas até o nó
+
+        Returns:
+            List[List[RunItem]]: Um grupo por pasta (a raiz inclusive), na ordem da árvore
+        """
+        folder_path = folder_path or []
+        groups: List[List[RunItem]] = []
+
+        pending = [(node, folder_path, ())]
+        while pending:
+            current, path, folder_ids = pending.pop()
+            if current.requests:
+                groups.append([(path, folder_ids, request_id) for request_id in current.requests])
+
+            children = current.folders if isinstance(current, Collection) else current.subfolders
+            # Empilhar em ordem reversa para visitar as pastas na ordem original
+            for child in reversed(children):
+                pending.append((child, path + [child.name], folder_ids + (child.id,)))
+
+        return groups
+
+    @staticmethod
+    def build_scopes(
+        node: Union[Collection, Folder],
+        variables: Optional[Union[Dict[str, str], ScopeChain]] = None
+    ) -> Tuple[ScopeChain, Dict[Tuple[str, ...], ScopeChain]]:
+        """
+        Monta as camadas de variáveis de uma execução
+
+        Args:
+            node (Union[Collection, Folder]): Coleção ou pasta executada
+            variables (Optional[Union[Dict[str, str], ScopeChain]]): Variáveis do ambiente, ou uma
+                cadeia já montada (suas camadas são compartilhadas)
+
+        Returns:
+            Tuple[ScopeChain, Dict[Tuple[str, ...], ScopeChain]]: Cadeia da raiz (com uma camada
+                de execução) e as cadeias das pastas que definem variáveis, pelos IDs das pastas
+                no caminho (ver RunItem)
+        """
+        if isinstance(variables, ScopeChain):
+            chain = variables
+        else:
+            chain = ScopeChain.from_values({ENVIRONMENT: variables})
+        if isinstance(node, Collection) and node.variables:
+            chain = chain.with_values(COLLECTION, node.variables)
+        if chain.scope(RUN) is None:
+            chain = chain.with_values(RUN, None)
+
+        # Variáveis das pastas mescladas ao longo do caminho (a subpasta prevalece);
+        # pastas sem variáveis próprias usam a cadeia da pasta acima
+        folder_chains: Dict[Tuple[str, ...], ScopeChain] = {}
+        pending = [(node, (), {}, chain)]
+        while pending:
+            current, path, inherited, current_chain = pending.pop()
+            if isinstance(current, Folder) and current.variables:
+                inherited = {**inherited, **current.variables}
+                current_chain = chain.with_values(FOLDER, inherited)
+            if current_chain is not chain:
+                folder_chains[path] = current_chain
+
+            children = current.folders if isinstance(current, Collection) else current.subfolders
+            for child in children:
+                pending.append((child, path + (child.id,), inherited, current_chain))
+
+        return chain, folder_chains
+
+    def missing_variables(
+        self,
+        node: Union[Collection, Folder],
+        variables: Optional[Union[Dict[str, str], ScopeChain]] = None,
+        data: Optional[DataRows] = None
+    ) -> Dict[str, List[str]]:
+        """
+        Verifica, antes de uma execução, quais variáveis usadas pelas requisições não estão definidas
+
+        Consulta o índice de variáveis do armazenamento, sem carregar as requisições.
+
+        Args:
+            node (Union[Collection, Folder]): Coleção ou pasta a executar
+            variables (Optional[Union[Dict[str, str], ScopeChain]]): Variáveis do ambiente (ver build_scopes)
+            data (Optional[DataRows]): Linhas de dados da execução (só a primeira é lida)
+
+        Returns:
+            Dict[str, List[str]]: IDs das requisições que usam cada variável não definida
+        """
+        chain, folder_chains = self.build_scopes(node, variables)
+        index = self.storage.variable_index
+        if data is not None:
+            row = next(iter(data), None)
+            if row:
+                chain = chain.with_values(ITERATION, row)
+                folder_chains = {
+                    path: folder_chain.with_scope(chain.scope(ITERATION))
+                    for path, folder_chain in folder_chains.items()
+                }
+
+        missing: Dict[str, List[str]] = {}
+        for group in self.collect_groups(node):
+            for _, folder_ids, request_id in group:
+                scopes = folder_chains.get(folder_ids, chain)
+                for name, request_ids in index.missing_variables([request_id], scopes).items():
+                    missing.setdefault(name, []).extend(request_ids)
+        return missing
+
+    def _build_tasks(self, node: Union[Collection, Folder]) -> List[Task]:
+        """Divide as requisições em tarefas conforme a estratégia de ordenação"""
+        groups = self.collect_groups(node)
+
+        tasks = []
+        index = 0
+        for group in groups:
+            numbered = []
+            for path, folder_ids, request_id in group:
+                numbered.append((index, path, folder_ids, request_id))
+                index += 1
+            tasks.append(numbered)
+
+        if self.order == RunOrder.SEQUENTIAL:
+            return [[item for task in tasks for item in task]] if tasks else []
+        if self.order == RunOrder.PARALLEL:
+            return [[item] for task in tasks for item in task]
+        return tasks
+
+    def run(
+        self,
+        node: Union[Collection, Folder],
+        variables: Optional[Union[Dict[str, str], ScopeChain]] = None,
+        on_result: Optional[Callable[[RunResult], None]] = None,
+        data: Optional[DataRows] = None,
+        iterations: Optional[int] = None
+    ) -> Iterator[RunResult]:
+        """
+        Executa as requisições da coleção ou pasta
+
+        Com linhas de dados (ou mais de uma iteração), a coleção é executada uma vez
+        por linha, com os valores da linha em uma camada ITERATION. As linhas são
+        lidas à medida que os workers ficam livres, sem carregar o arquivo: cada
+        worker pega a próxima tarefa da próxima iteração. Iterações diferentes
+        são executadas em paralelo; dentro de cada uma, a estratégia de ordenação
+        é respeitada.
+
+        Args:
+            node (Union[Collection, Folder]): Coleção ou pasta a executar
+            variables (Optional[Union[Dict[str, str], ScopeChain]]): Variáveis do ambiente
+                (ver build_scopes); as da coleção e das pastas são acrescentadas em camadas
+            on_result (Optional[Callable[[RunResult], None]]): Chamado a cada resultado
+            data (Optional[DataRows]): Linhas de dados (ex: DataSource), uma por iteração
+            iterations (Optional[int]): Quantidade de iterações (com dados, o máximo de linhas lidas)
+
+        Yields:
+            RunResult: Resultado de cada requisição, na ordem em que terminam
+        """
+        self._stop_event.clear()
+        chain, folder_chains = self.build_scopes(node, variables)
+        self.run_scope = chain.scope(RUN)
+        tasks = self._build_tasks(node)
+        if not tasks:
+            return
+        # Cada requisição é lida do disco uma vez por execução, não a cada linha de dados
+        loaded = self._load_requests(tasks)
+
+        # Políticas padrão das requisições que não definem as suas e substituições de endereço
+        send_options = {}
+        retry_policy = self.retry_policy or getattr(node, "retry_policy", None)
+        if retry_policy is not None:
+            send_options["retry_policy"] = retry_policy
+        hedge_policy = self.hedge_policy or getattr(node, "hedge_policy", None)
+        if hedge_policy is not None:
+            send_options["hedge_policy"] = hedge_policy
+        if self.resolve_overrides:
+            send_options["resolve_overrides"] = self.resolve_overrides
+        timeouts = self.timeouts or getattr(node, "timeouts", None)
+        if timeouts is not None:
+            send_options["timeouts"] = timeouts
+        rate_limit = self.rate_limit or getattr(node, "rate_limit", None)
+        self.rate_limiter = RateLimiter(rate_limit) if rate_limit is not None else None
+        if self.rate_limiter is not None:
+            send_options["rate_limiter"] = self.rate_limiter
+
+        if data is not None:
+            rows: Iterable[Optional[Dict[str, str]]] = data if iterations is None else itertools.islice(data, iterations)
+            workers = self.concurrency
+        else:
+            rows = itertools.repeat(None, iterations or 1)
+            workers = min(self.concurrency, len(tasks) * (iterations or 1))
+
+        def generate_work() -> Iterator[Tuple[int, Optional[VariableScope], Task]]:
+            for iteration, row in enumerate(rows):
+                iteration_scope = VariableScope(ITERATION, row) if row is not None else None
+                for task in tasks:
+                    yield iteration, iteration_scope, task
+
+        # Fila de trabalho compartilhada: a linha seguinte só é lida quando algum worker a pede
+        work = generate_work()
+        work_lock = threading.Lock()
+        failures: List[Exception] = []
+
+        # Fila limitada: workers esperam o consumidor em vez de acumular resultados
+        results: "queue.Queue[Optional[RunResult]]" = queue.Queue(maxsize=workers * 4)
+        # Marcado quando o consumidor deixa de ler a fila
+        closed = threading.Event()
+
+        def put(result: Optional[RunResult]) -> None:
+            while not closed.is_set():
+                try:
+                    results.put(result, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+
+        def run_worker() -> None:
+            try:
+                while not (self._stop_event.is_set() or self._cancel_token.cancelled):
+                    try:
+                        with work_lock:
+                            iteration, iteration_scope, task = next(work)
+                    except StopIteration:
+                        break
+                    except Exception as e:
+                        # Arquivo de dados ilegível ou linha inválida: interromper a execução
+                        failures.append(e)
+                        self.stop()
+                        break
+
+                    for index, path, folder_ids, request_id in task:
+                        if self._stop_event.is_set() or self._cancel_token.cancelled:
+                            break
+                        scopes = folder_chains.get(folder_ids, chain) if folder_chains else chain
+                        if iteration_scope is not None:
+                            scopes = scopes.with_scope(iteration_scope)
+                        request, load_error = loaded[request_id]
+                        result = self._run_item(index, path, request_id, request, load_error, scopes, send_options)
+                        result.iteration = iteration
+                        put(result)
+            finally:
+                # Marca o fim do worker
+                put(None)
+
+        # O prazo da execução só é agendado quando há o que executar (e é desmarcado no finally abaixo)
+        self._cancel_token = CancellationToken(timeout=self.run_timeout)
+        send_options["cancel_token"] = self._cancel_token
+        executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="collection-runner"
+        )
+        remaining = workers
+        futures = []
+        try:
+            for _ in range(workers):
+                futures.append(executor.submit(run_worker))
+
+            while remaining:
+                result = results.get()
+                if result is None:
+                    remaining -= 1
+                    continue
+
+                if on_result:
+                    on_result(result)
+                yield result
+
+            if failures:
+                raise failures[0]
+        finally:
+            closed.set()
+            # Se o consumidor parar de iterar, descartar o que ainda não começou
+            if remaining:
+                self._stop_event.set()
+                self._cancel_token.cancel()
+            # shutdown(cancel_futures=True) requer Python 3.9
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+            # Desmarcar o prazo da execução
+            self._cancel_token.close()
+
+    def run_all(
+        self,
+        node: Union[Collection, Folder],
+        variables: Optional[Union[Dict[str, str], ScopeChain]] = None,
+        data: Optional[DataRows] = None,
+        iterations: Optional[int] = None
+    ) -> List[RunResult]:
+        """
+        Executa a coleção ou pasta e retorna os resultados na ordem da árvore
+
+        Args:
+            node (Union[Collection, Folder]): Coleção ou pasta a executar
+            variables (Optional[Union[Dict[str, str], ScopeChain]]): Variáveis do ambiente
+            data (Optional[DataRows]): Linhas de dados, uma por iteração (ver run)
+            iterations (Optional[int]): Quantidade de iterações
+
+        Returns:
+            List[RunResult]: Resultados ordenados pela iteração e pela posição da requisição na árvore
+        """
+        results = self.run(node, variables, data=data, iterations=iterations)
+        return sorted(results, key=lambda result: (result.iteration, result.index))
+
+    def _load_requests(self, tasks: List[Task]) -> Dict[str, Tuple[Optional[Request], Optional[str]]]:
+        """
+        Carrega as requisições de uma execução
+
+        Args:
+            tasks (List[Task]): Tarefas da execução
+
+        Returns:
+            Dict[str, Tuple[Optional[Request], Optional[str]]]: Requisição (ou mensagem de erro) por ID
+        """
+        loaded: Dict[str, Tuple[Optional[Request], Optional[str]]] = {}
+        for task in tasks:
+            for _, _, _, request_id in task:
+                if request_id in loaded:
+                    continue
+                try:
+                    request = self.storage.get_request(request_id)
+                except Exception as e:
+                    loaded[request_id] = (None, f"Erro ao carregar requisição: {str(e)}")
+                    continue
+                if request is None:
+                    loaded[request_id] = (None, f"Requisição não encontrada: {request_id}")
+                else:
+                    loaded[request_id] = (request, None)
+        return loaded
+
+    def _run_item(
+        self,
+        index: int,
+        folder_path: List[str],
+        request_id: str,
+        request: Optional[Request],
+        load_error: Optional[str],
+        variables: ScopeChain,
+        send_options: Optional[Dict[str, Any]] = None
+    ) -> RunResult:
+        """Envia uma única requisição já carregada (ver _load_requests)"""
+        result = RunResult(index=index, request_id=request_id, folder_path=folder_path)
+
+        if request is None:
+            result.error = load_error
+            return result
+
+        result.request = request
+        try:
+            result.response, result.error = self.send_function(request, variables, **(send_options or {}))
+        except Exception as e:
+            result.error = f"Erro inesperado: {str(e)}"
+
+        return result
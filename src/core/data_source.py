@@ -0,0 +1,226 @@
+"""
+Arquivos de dados (CSV, JSON e JSON Lines) lidos em fluxo, uma linha por iteração de uma execução
+"""
+
+import csv
+import json
+import os
+from typing import Dict, Optional, Any, Iterator, IO
+
+
+# Formatos suportados
+CSV = "csv"
+JSON = "json"
+JSONL = "jsonl"
+
+FORMATS = (CSV, JSON, JSONL)
+
+_EXTENSIONS = {
+    ".csv": CSV,
+    ".json": JSON,
+    ".jsonl": JSONL,
+    ".ndjson": JSONL,
+}
+
+# Tamanho dos blocos lidos de arquivos JSON
+_CHUNK_SIZE = 64 * 1024
+
+
+class DataSourceError(ValueError):
+    """Arquivo de dados inválido (formato desconhecido, linha malformada...)"""
+
+
+def detect_format(path: str) -> str:
+    """
+    Identifica o formato pela extensão do arquivo
+
+    Args:
+        path (str): Caminho do arquivo
+
+    Returns:
+        str: CSV, JSON ou JSONL
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in _EXTENSIONS:
+        raise DataSourceError(f"Formato de dados não reconhecido: {path}")
+    return _EXTENSIONS[extension]
+
+
+def _to_variables(row: Any, number: int) -> Dict[str, str]:
+    """Converte uma linha em variáveis (valores que não são texto viram JSON)"""
+    if not isinstance(row, dict):
+        raise DataSourceError(f"Linha {number}: esperado um objeto, encontrado {type(row).__name__}")
+    return {
+        str(key): value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+        for key, value in row.items()
+    }
+
+
+def _iter_json_array(f: IO[str]) -> Iterator[Any]:
+    """
+    Percorre os elementos de um array JSON sem carregar o arquivo inteiro
+
+    O texto é lido em blocos; cada elemento é decodificado assim que estiver
+    completo no buffer, que então é descartado até ele.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    eof = False
+
+    def fill() -> bool:
+        nonlocal buffer, position, eof
+        if eof:
+            return False
+        chunk = f.read(_CHUNK_SIZE)
+        if not chunk:
+            eof = True
+            return False
+        buffer = buffer[position:] + chunk
+        position = 0
+        return True
+
+    def next_char() -> str:
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position].isspace():
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if not fill():
+                return ""
+
+    if next_char() != "[":
+        raise DataSourceError("O arquivo JSON deve conter um array de objetos")
+    position += 1
+
+    expect_value = True
+    while True:
+        char = next_char()
+        if char == "]":
+            return
+        if char == "":
+            raise DataSourceError("Array JSON incompleto")
+        if not expect_value:
+            if char != ",":
+                raise DataSourceError(f"Esperado ',' ou ']' no array JSON, encontrado {char!r}")
+            position += 1
+            expect_value = True
+            continue
+
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError as e:
+                if fill():
+                    continue
+                raise DataSourceError(f"JSON inválido: {str(e)}")
+            if end == len(buffer) and fill():
+                # O valor pode continuar no próximo bloco (ex: um número dividido)
+                continue
+            break
+        position = end
+        expect_value = False
+        yield value
+
+
+class DataSource:
+    """
+    Arquivo de dados de uma execução: cada linha (ou objeto) vira as variáveis de uma iteração
+
+    O arquivo é lido em fluxo a cada percurso, com memória constante. Partes
+    (shard) permitem dividir as linhas entre processos ou máquinas.
+    """
+    def __init__(
+        self,
+        path: str,
+        data_format: Optional[str] = None,
+        encoding: str = "utf-8",
+        shard_index: int = 0,
+        shard_count: int = 1
+    ):
+        """
+        Args:
+            path (str): Caminho do arquivo
+            data_format (Optional[str]): CSV, JSON ou JSONL (padrão: pela extensão)
+            encoding (str): Codificação do arquivo
+            shard_index (int): Parte lida (de 0 a shard_count - 1)
+            shard_count (int): Quantidade de partes em que as linhas são divididas
+        """
+        data_format = data_format or detect_format(path)
+        if data_format not in FORMATS:
+            raise DataSourceError(f"Formato de dados inválido: {data_format}")
+        if shard_count < 1 or not 0 <= shard_index < shard_count:
+            raise DataSourceError(f"Parte inválida: {shard_index} de {shard_count}")
+
+        self.path = path
+        self.data_format = data_format
+        self.encoding = encoding
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+
+    def shard(self, index: int, count: int) -> 'DataSource':
+        """
+        Retorna uma parte das linhas
+
+        Arquivos JSON Lines são divididos por faixas de bytes (cada parte lê só a
+        sua faixa); CSV e JSON são percorridos por inteiro e cada parte fica com
+        uma a cada `count` linhas.
+
+        Args:
+            index (int): Parte (de 0 a count - 1)
+            count (int): Quantidade de partes
+
+        Returns:
+            DataSource: Fonte com as linhas da parte
+        """
+        return DataSource(self.path, self.data_format, self.encoding, index, count)
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        if self.data_format == JSONL:
+            return self._iter_jsonl()
+        rows = self._iter_csv() if self.data_format == CSV else self._iter_json()
+        if self.shard_count == 1:
+            return rows
+        return (row for number, row in enumerate(rows) if number % self.shard_count == self.shard_index)
+
+    def _iter_csv(self) -> Iterator[Dict[str, str]]:
+        with open(self.path, "r", encoding=self.encoding, newline="") as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                # Colunas a mais ficam sob a chave None; valores ausentes, como None
+                yield {key: value if value is not None else "" for key, value in row.items() if key is not None}
+
+    def _iter_json(self) -> Iterator[Dict[str, str]]:
+        with open(self.path, "r", encoding=self.encoding) as f:
+            for number, row in enumerate(_iter_json_array(f), start=1):
+                yield _to_variables(row, number)
+
+    def _iter_jsonl(self) -> Iterator[Dict[str, str]]:
+        with open(self.path, "rb") as f:
+            start, end = 0, None
+            if self.shard_count > 1:
+                size = os.fstat(f.fileno()).st_size
+                start = size * self.shard_index // self.shard_count
+                end = size * (self.shard_index + 1) // self.shard_count
+
+            position = start
+            if start > 0:
+                # Uma linha pertence à parte em que começa: descartar o restante da anterior
+                f.seek(start - 1)
+                position = start - 1 + len(f.readline())
+
+            number = 0
+            for line in f:
+                if end is not None and position >= end:
+                    break
+                position += len(line)
+                number += 1
+                text = line.decode(self.encoding).strip()
+                if not text:
+                    continue
+                try:
+                    row = json.loads(text)
+                except ValueError as e:
+                    raise DataSourceError(f"Linha {number}: JSON inválido: {str(e)}")
+                yield _to_variables(row, number)
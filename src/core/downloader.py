@@ -0,0 +1,486 @@
+"""
+Download de respostas diretamente para arquivo, com retomada e segmentos paralelos
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+from typing import Dict, List, Optional, Any, Tuple
+
+from requests.exceptions import RequestException
+from urllib3.exceptions import HTTPError as Urllib3Error
+
+from src.models.request import Response
+from src.models.timeouts import Timeouts, DEFAULT_TIMEOUTS
+from src.core.session_pool import SessionPool
+from src.core.prepared_cache import PreparedSend
+from src.core.cancellation import CancellationToken
+from src.core.resolver import HostResolver
+from src.core.multipart import ProgressCallback, FileBody, MultipartEncoder
+from src.core.response_body import DEFAULT_CHUNK_SIZE
+from src.utils.compression import CompressedStream
+
+
+# Segmentos baixados em paralelo quando o servidor aceita intervalos (Range)
+DEFAULT_SEGMENTS = 4
+
+# Arquivos menores que este tamanho por segmento são baixados com menos segmentos
+DEFAULT_MIN_SEGMENT_SIZE = 8 * 1024 * 1024
+
+# Intervalo, em segundos, entre as gravações do estado usado na retomada
+_STATE_SAVE_INTERVAL = 1.0
+
+_CONTENT_RANGE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)")
+
+# Corpos que podem ser enviados de novo em cada segmento e nova tentativa
+# (os lidos do disco abrem o arquivo outra vez a cada passagem)
+_REPLAYABLE_BODIES = (bytes, bytearray, str, FileBody, MultipartEncoder, CompressedStream)
+
+
+class DownloadError(RequestException):
+    """Falha no download de uma resposta para arquivo"""
+
+
+class _RangeIgnored(DownloadError):
+    """O servidor respondeu com o corpo inteiro a um pedido de intervalo (arquivo mudou ou sem suporte)"""
+
+
+class _Segment:
+    """Intervalo do arquivo (início e fim inclusivos) e quantos bytes dele já foram gravados"""
+    __slots__ = ("start", "end", "written")
+
+    def __init__(self, start: int, end: Optional[int], written: int = 0):
+        self.start = start
+        # None quando o tamanho total é desconhecido (lido até o fim da conexão)
+        self.end = end
+        self.written = written
+
+    @property
+    def offset(self) -> int:
+        """Próxima posição a gravar"""
+        return self.start + self.written
+
+    @property
+    def done(self) -> bool:
+        return self.end is not None and self.offset > self.end
+
+    @property
+    def remaining(self) -> Optional[int]:
+        return None if self.end is None else self.end - self.offset + 1
+
+
+class _DownloadState:
+    """
+    Estado de um download em andamento, gravado ao lado do arquivo parcial
+    para permitir a retomada
+    """
+    def __init__(
+        self,
+        url: str,
+        total: Optional[int],
+        validator: Optional[str],
+        segments: List[_Segment],
+        headers: Optional[Dict[str, str]] = None
+    ):
+        self.url = url
+        self.total = total
+        # ETag forte ou Last-Modified, enviado em If-Range para detectar mudanças do arquivo
+        self.validator = validator
+        self.segments = segments
+        self.headers = headers or {}
+
+    @property
+    def downloaded(self) -> int:
+        return sum(segment.written for segment in self.segments)
+
+    def save(self, path: str) -> None:
+        """Grava o estado (substituindo o anterior de forma atômica)"""
+        data = {
+            "url": self.url,
+            "total": self.total,
+            "validator": self.validator,
+            "segments": [[segment.start, segment.end, segment.written] for segment in self.segments],
+            "headers": self.headers,
+        }
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as state_file:
+            json.dump(data, state_file)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['_DownloadState']:
+        """Lê o estado gravado (None se não existir ou estiver corrompido)"""
+        try:
+            with open(path, "r", encoding="utf-8") as state_file:
+                data = json.load(state_file)
+            return cls(
+                url=data["url"],
+                total=data.get("total"),
+                validator=data.get("validator"),
+                segments=[_Segment(start, end, written) for start, end, written in data["segments"]],
+                headers=data.get("headers", {})
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+
+class FileDownloader:
+    """
+    Baixa o corpo de uma resposta diretamente para um arquivo, sem mantê-lo em memória
+
+    O arquivo é gravado como "<destino>.part", junto com o estado do download em
+    "<destino>.part.json"; uma nova chamada após uma falha continua de onde parou
+    usando requisições Range (com If-Range, para recomeçar se o arquivo mudou).
+    Quando o servidor aceita intervalos, arquivos grandes são divididos em segmentos
+    baixados em paralelo por conexões do pool.
+    """
+    def __init__(
+        self,
+        session_pool: SessionPool,
+        segments: int = DEFAULT_SEGMENTS,
+        min_segment_size: int = DEFAULT_MIN_SEGMENT_SIZE,
+        max_retries: int = 3,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        """
+        Args:
+            session_pool (SessionPool): Sessão cujas conexões são usadas nos downloads
+            segments (int): Máximo de segmentos baixados em paralelo
+            min_segment_size (int): Tamanho mínimo de cada segmento, em bytes
+            max_retries (int): Novas tentativas de cada segmento após falhas de rede
+                (cada uma continua de onde a anterior parou)
+            chunk_size (int): Tamanho dos blocos lidos da conexão
+        """
+        self.session_pool = session_pool
+        self.segments = max(1, segments)
+        self.min_segment_size = max(1, min_segment_size)
+        self.max_retries = max_retries
+        self.chunk_size = chunk_size
+
+    def download(
+        self,
+        prepared: PreparedSend,
+        target_path: str,
+        resume: bool = True,
+        timeouts: Timeouts = DEFAULT_TIMEOUTS,
+        token: Optional[CancellationToken] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        resolve_overrides: Optional[Dict[str, str]] = None
+    ) -> Response:
+        """
+        Baixa a resposta da requisição para o arquivo de destino
+
+        Args:
+            prepared (PreparedSend): A requisição pronta para o envio
+            target_path (str): Arquivo de destino (criado ou substituído ao final)
+            resume (bool): Continua um download interrompido do mesmo endereço
+            timeouts (Timeouts): Tempos limite de conexão e de leitura
+            token (Optional[CancellationToken]): Token de cancelamento do download
+            on_progress (Optional[ProgressCallback]): Chamado com (bytes gravados, total; 0 se desconhecido)
+            resolve_overrides (Optional[Dict[str, str]]): Endereços fixos por host
+
+        Returns:
+            Response: Resposta cujo corpo é o arquivo de destino (ou, se o servidor
+            responder com erro, o corpo do erro em memória)
+
+        Raises:
+            DownloadError: Se o corpo da requisição só puder ser lido uma vez
+            RequestException: Em falhas de rede após esgotar as novas tentativas
+        """
+        if prepared.body is not None and not isinstance(prepared.body, _REPLAYABLE_BODIES):
+            # O corpo é reenviado em cada segmento e nova tentativa
+            raise DownloadError(f"Corpo não pode ser reenviado no download: {type(prepared.body).__name__}")
+
+        token = token or CancellationToken()
+        part_path = f"{target_path}.part"
+        state_path = f"{part_path}.json"
+        start_time = time.perf_counter()
+
+        job = _DownloadJob(self, prepared, part_path, state_path, timeouts, token, on_progress, resolve_overrides)
+
+        state = _DownloadState.load(state_path) if resume and os.path.exists(part_path) else None
+        if state is not None and state.url == prepared.url:
+            try:
+                job.run(state)
+            except _RangeIgnored:
+                # O arquivo mudou no servidor: recomeçar do zero
+                state = None
+        else:
+            state = None
+
+        if state is None:
+            state, error_response = job.start()
+            if error_response is not None:
+                error_response.elapsed_time = time.perf_counter() - start_time
+                return error_response
+
+        os.replace(part_path, target_path)
+        try:
+            os.remove(state_path)
+        except OSError:
+            pass
+
+        response = Response(
+            status_code=200,
+            headers=state.headers,
+            content=b"",
+            elapsed_time=time.perf_counter() - start_time,
+            body_path=target_path,
+            owns_body_file=False
+        )
+        # Bytes efetivamente transferidos nesta chamada (menos que o total ao retomar)
+        response.wire_size = job.transferred
+        return response
+
+
+class _DownloadJob:
+    """Execução de um download: requisições, gravação dos segmentos e estado"""
+    def __init__(
+        self,
+        downloader: FileDownloader,
+        prepared: PreparedSend,
+        part_path: str,
+        state_path: str,
+        timeouts: Timeouts,
+        token: CancellationToken,
+        on_progress: Optional[ProgressCallback],
+        resolve_overrides: Optional[Dict[str, str]]
+    ):
+        self.downloader = downloader
+        self.prepared = prepared
+        self.part_path = part_path
+        self.state_path = state_path
+        self.timeouts = timeouts
+        self.token = token
+        self.on_progress = on_progress
+        self.resolve_overrides = resolve_overrides
+        self.transferred = 0
+        self.state: Optional[_DownloadState] = None
+        self._lock = threading.Lock()
+        self._last_save = 0.0
+
+    def start(self) -> Tuple[Optional[_DownloadState], Optional[Response]]:
+        """
+        Inicia o download do zero
+
+        Returns:
+            Tuple[Optional[_DownloadState], Optional[Response]]: Estado final, ou a
+            resposta de erro do servidor
+        """
+        with HostResolver.overrides(self.resolve_overrides), self.token.activate():
+            http_response = self._request("bytes=0-", self.token)
+
+        status = http_response.status_code
+        headers = dict(http_response.headers)
+
+        if status == 206:
+            total = _parse_content_range(headers.get("Content-Range", ""))
+        elif status == 200:
+            # Sem suporte a intervalos: um único segmento, lido até o fim
+            length = headers.get("Content-Length")
+            total = int(length) if length and length.isdigit() else None
+        else:
+            try:
+                content = http_response.content
+            finally:
+                http_response.close()
+            return None, Response(status_code=status, headers=headers, content=content, elapsed_time=0.0)
+
+        if status == 206 and total is not None:
+            count = min(self.downloader.segments, max(1, total // self.downloader.min_segment_size))
+            size = -(-total // count)
+            segments = [_Segment(start, min(start + size, total) - 1) for start in range(0, total, size)]
+        else:
+            segments = [_Segment(0, total - 1 if total is not None else None)]
+
+        self.state = _DownloadState(self.prepared.url, total, _validator(headers), segments, headers)
+        with open(self.part_path, "wb") as part_file:
+            if total is not None:
+                part_file.truncate(total)
+        self._save_state(force=True)
+
+        self._run_segments(first_response=http_response)
+        return self.state, None
+
+    def run(self, state: _DownloadState) -> None:
+        """Continua um download a partir do estado gravado"""
+        self.state = state
+        self._report_progress()
+        self._run_segments()
+
+    def _run_segments(self, first_response: Any = None) -> None:
+        """Baixa os segmentos pendentes em paralelo (o primeiro reaproveita a resposta inicial)"""
+        pending = [segment for segment in self.state.segments if not segment.done]
+        # Token dos segmentos: a falha de um deles interrompe os demais sem cancelar o download
+        segment_token = CancellationToken(parent=self.token)
+        try:
+            if len(pending) <= 1:
+                for segment in pending:
+                    self._fetch_segment(segment, segment_token, first_response)
+                    first_response = None
+                return
+
+            with ThreadPoolExecutor(max_workers=len(pending), thread_name_prefix="download-segment") as executor:
+                futures = [
+                    executor.submit(
+                        self._fetch_segment, segment, segment_token, first_response if index == 0 else None
+                    )
+                    for index, segment in enumerate(pending)
+                ]
+                first_response = None
+                done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+                failed = next((future for future in done if future.exception() is not None), None)
+                if failed is not None:
+                    # O progresso dos demais fica salvo para a retomada
+                    segment_token.cancel()
+                    raise failed.exception()
+        finally:
+            segment_token.close()
+            if first_response is not None:
+                first_response.close()
+            self._save_state(force=True)
+
+    def _fetch_segment(self, segment: _Segment, token: CancellationToken, http_response: Any = None) -> None:
+        """Baixa um segmento, continuando de onde parou após falhas de rede"""
+        with HostResolver.overrides(self.resolve_overrides), token.activate():
+            attempt = 0
+            while not segment.done:
+                try:
+                    if http_response is None:
+                        end = "" if segment.end is None else str(segment.end)
+                        http_response = self._request(f"bytes={segment.offset}-{end}", token, if_range=True)
+                        if http_response.status_code == 200 and segment.offset > 0:
+                            if not self._restart_single(segment, http_response):
+                                raise _RangeIgnored("O servidor ignorou o intervalo solicitado (status 200)")
+                        if http_response.status_code not in (200, 206):
+                            raise DownloadError(f"Status inesperado ao baixar o intervalo: {http_response.status_code}")
+                    self._write(segment, http_response, token)
+                    if segment.end is None:
+                        return
+                    if not segment.done:
+                        raise DownloadError("Conexão encerrada antes do fim do intervalo")
+                except _RangeIgnored:
+                    # Repetir não adianta: o download recomeça do zero
+                    raise
+                except (RequestException, Urllib3Error, OSError):
+                    token.raise_if_cancelled()
+                    if attempt >= self.downloader.max_retries:
+                        raise
+                    attempt += 1
+                finally:
+                    if http_response is not None:
+                        http_response.close()
+                        http_response = None
+
+    def _restart_single(self, segment: _Segment, http_response: Any) -> bool:
+        """
+        Recomeça do zero, com a resposta 200 recebida, um download de segmento único
+
+        Servidores sem suporte a intervalos (ou cujo arquivo mudou) respondem a um
+        pedido de intervalo com o corpo inteiro; com um só segmento, ele é gravado
+        desde o início em vez de interromper o download.
+
+        Args:
+            segment (_Segment): Segmento que pediu o intervalo
+            http_response (Any): Resposta 200 ao pedido
+
+        Returns:
+            bool: False se o download tem vários segmentos (precisa recomeçar do zero)
+        """
+        if len(self.state.segments) != 1 or segment.start != 0:
+            return False
+
+        headers = dict(http_response.headers)
+        length = headers.get("Content-Length")
+        total = int(length) if length and length.isdigit() else None
+        with self._lock:
+            segment.written = 0
+            segment.end = total - 1 if total is not None else None
+            self.state.total = total
+            self.state.validator = _validator(headers)
+            self.state.headers = headers
+        with open(self.part_path, "r+b") as part_file:
+            part_file.truncate(total or 0)
+        self._save_state(force=True)
+        self._report_progress()
+        return True
+
+    def _request(self, byte_range: str, token: CancellationToken, if_range: bool = False) -> Any:
+        """Envia a requisição pedindo um intervalo do corpo"""
+        token.raise_if_cancelled()
+        headers = {
+            key: value for key, value in self.prepared.headers.items()
+            if key.lower() not in ("range", "if-range", "accept-encoding")
+        }
+        headers["Range"] = byte_range
+        # Intervalos se referem ao corpo como transmitido; pedir sem compressão
+        headers["Accept-Encoding"] = "identity"
+        if if_range and self.state is not None and self.state.validator:
+            headers["If-Range"] = self.state.validator
+
+        return self.session_pool.request(
+            method=self.prepared.request.method.upper(),
+            url=self.prepared.url,
+            headers=headers,
+            data=self.prepared.body,
+            timeout=self.timeouts.for_attempt(token.remaining()),
+            stream=True
+        )
+
+    @property
+    def session_pool(self) -> SessionPool:
+        return self.downloader.session_pool
+
+    def _write(self, segment: _Segment, http_response: Any, token: CancellationToken) -> None:
+        """Grava o corpo da resposta na posição do segmento"""
+        with open(self.part_path, "r+b") as part_file:
+            part_file.seek(segment.offset)
+            for chunk in http_response.raw.stream(self.downloader.chunk_size, decode_content=False):
+                token.raise_if_cancelled()
+                remaining = segment.remaining
+                if remaining is not None and len(chunk) > remaining:
+                    # A resposta inicial (bytes=0-) continua além do primeiro segmento
+                    chunk = chunk[:remaining]
+                part_file.write(chunk)
+                with self._lock:
+                    segment.written += len(chunk)
+                    self.transferred += len(chunk)
+                self._report_progress()
+                self._save_state()
+                if segment.done:
+                    break
+
+    def _report_progress(self) -> None:
+        if self.on_progress is not None:
+            self.on_progress(self.state.downloaded, self.state.total or 0)
+
+    def _save_state(self, force: bool = False) -> None:
+        """Grava o estado periodicamente (os dados gravados antes dele nunca são perdidos)"""
+        now = time.monotonic()
+        if not force and now - self._last_save < _STATE_SAVE_INTERVAL:
+            return
+        with self._lock:
+            if not force and now - self._last_save < _STATE_SAVE_INTERVAL:
+                return
+            self._last_save = now
+            self.state.save(self.state_path)
+
+
+def _parse_content_range(value: str) -> Optional[int]:
+    """Extrai o tamanho total de um cabeçalho Content-Range (None se desconhecido)"""
+    match = _CONTENT_RANGE.match(value.strip())
+    if not match or match.group(3) == "*":
+        return None
+    return int(match.group(3))
+
+
+def _validator(headers: Dict[str, str]) -> Optional[str]:
+    """Retorna o validador usável em If-Range: ETag forte ou Last-Modified"""
+    lowered = {key.lower(): value for key, value in headers.items()}
+    etag = lowered.get("etag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return lowered.get("last-modified")
@@ -0,0 +1,222 @@
+"""
+Requisições duplicadas (hedging) para reduzir a latência de cauda
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Any, Callable, Tuple
+
+from src.models.request import Response
+from src.models.retry_policy import HedgePolicy
+from src.core.cancellation import CancellationToken, schedule, unschedule
+from src.core.latency_histogram import LatencyHistogram
+
+
+# Resultado de um envio: (resposta, mensagem de erro, falha de conexão)
+AttemptResult = Tuple[Response, Optional[str], bool]
+
+
+class LatencyTracker:
+    """
+    Mantém as latências recentes por endpoint para calcular o momento de duplicar
+    uma requisição
+
+    Cada endpoint usa dois histogramas: ao completar a janela, o atual passa a ser
+    o anterior e um novo começa, de modo que os percentis acompanhem mudanças de
+    comportamento do servidor sem guardar todas as amostras.
+    """
+    def __init__(self, window: int = 1000):
+        """
+        Args:
+            window (int): Amostras por histograma antes da rotação
+        """
+        self.window = window
+        self._histograms: Dict[str, Tuple[LatencyHistogram, Optional[LatencyHistogram]]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, seconds: float) -> None:
+        """Registra a latência de uma resposta do endpoint"""
+        with self._lock:
+            current, previous = self._histograms.get(key, (None, None))
+            if current is None:
+                current = LatencyHistogram(significant_digits=2)
+            elif current.count >= self.window:
+                current, previous = LatencyHistogram(significant_digits=2), current
+            self._histograms[key] = (current, previous)
+        current.record(seconds)
+
+    def percentile(self, key: str, percentile: float, min_samples: int = 1) -> Optional[float]:
+        """
+        Retorna o percentil das latências recentes do endpoint
+
+        Args:
+            key (str): Endpoint
+            percentile (float): Percentil entre 0 e 100
+            min_samples (int): Amostras necessárias para haver resultado
+
+        Returns:
+            Optional[float]: Latência em segundos, ou None se não houver amostras suficientes
+        """
+        with self._lock:
+            current, previous = self._histograms.get(key, (None, None))
+        if current is None:
+            return None
+
+        histogram = current
+        if previous is not None:
+            histogram = LatencyHistogram(significant_digits=2)
+            histogram.merge(previous)
+            histogram.merge(current)
+
+        if histogram.count < min_samples:
+            return None
+        return histogram.percentile(percentile)
+
+
+def send_hedged(
+    send: Callable[[CancellationToken], AttemptResult],
+    policy: HedgePolicy,
+    delay: float,
+    executor: ThreadPoolExecutor,
+    token: Optional[CancellationToken] = None,
+    before_hedge: Optional[Callable[[CancellationToken], Any]] = None
+) -> AttemptResult:
+    """
+    Envia a requisição e, se a resposta demorar mais que o atraso, envia cópias,
+    retornando o primeiro resultado bem-sucedido
+
+    O envio original roda na thread de quem chama; só as cópias vão para o
+    executor, iniciadas pela thread de prazos (ver cancellation.schedule) a cada
+    atraso sem resposta. Assim, um executor cheio atrasa apenas as cópias, e a
+    espera na fila não conta como latência do envio original. Cada envio recebe
+    um token filho de `token`; escolhido o resultado, os envios que perderam a
+    corrida são cancelados, liberando suas threads e conexões.
+
+    Args:
+        send (Callable[[CancellationToken], AttemptResult]): Realiza um envio com o token recebido
+        policy (HedgePolicy): Política de duplicação
+        delay (float): Espera, em segundos, antes de cada cópia
+        executor (ThreadPoolExecutor): Executor onde as cópias são realizadas
+        token (Optional[CancellationToken]): Token de cancelamento do envio como um todo
+        before_hedge (Optional[Callable[[CancellationToken], Any]]): Chamado na thread de cada
+            cópia antes do envio (ex: aguardar o limitador de taxa); uma exceção desiste da cópia
+
+    Returns:
+        AttemptResult: Resultado escolhido (response.hedged indica se veio de uma cópia;
+        nesse caso, elapsed_time conta desde o envio original)
+    """
+    delay = max(delay, policy.min_delay)
+    start_time = time.perf_counter()
+    condition = threading.Condition()
+    original = CancellationToken(parent=token)
+    # Tokens dos envios em andamento (para cancelar os perdedores)
+    running = [original]
+    state: Dict[str, Any] = {
+        "winner": None,       # (resultado, é uma cópia)
+        "settled": False,     # resultado escolhido: nenhuma cópia nova é iniciada
+        "hedges_sent": 0,
+        "hedges_pending": 0,
+        "last": None,         # último resultado (ou exceção) de um envio que falhou
+        "timer": None,
+    }
+
+    def cancel_others(winner_token: Optional[CancellationToken]) -> None:
+        for other in list(running):
+            if other is not winner_token:
+                other.cancel()
+
+    def offer(outcome: Any, is_hedge: bool, send_token: CancellationToken) -> None:
+        """Registra o resultado (ou a exceção) de um envio"""
+        won = False
+        with condition:
+            running.remove(send_token)
+            if is_hedge:
+                state["hedges_pending"] -= 1
+            if isinstance(outcome, tuple) and outcome[0].status_code > 0 and not state["settled"]:
+                state["winner"] = (outcome, is_hedge)
+                state["settled"] = won = True
+            elif isinstance(outcome, tuple) and state["settled"]:
+                # Chegou depois do resultado escolhido
+                outcome[0].close()
+            else:
+                if isinstance(state["last"], tuple):
+                    state["last"][0].close()
+                state["last"] = outcome
+            condition.notify_all()
+        if won:
+            cancel_others(send_token)
+
+    def run_hedge(child: CancellationToken) -> None:
+        outcome: Any
+        try:
+            if child.cancelled:
+                # Resultado escolhido enquanto a cópia esperava na fila do executor
+                child.raise_if_cancelled()
+            if before_hedge is not None:
+                try:
+                    before_hedge(child)
+                except Exception as e:
+                    failed = Response(status_code=0, headers={}, content=b"", elapsed_time=0.0)
+                    outcome = failed, f"Cópia não enviada: {str(e)}", False
+                    return
+            outcome = send(child)
+        except Exception as e:
+            outcome = e
+        finally:
+            child.close()
+            offer(outcome, True, child)
+
+    def launch_hedge() -> None:
+        """Executado pela thread de prazos: inicia uma cópia e agenda a seguinte"""
+        with condition:
+            state["timer"] = None
+            if state["settled"] or state["hedges_sent"] >= policy.max_hedges:
+                return
+            # Todos os envios falharam antes do atraso: não insistir
+            if not running:
+                return
+            child = CancellationToken(parent=token)
+            running.append(child)
+            state["hedges_sent"] += 1
+            state["hedges_pending"] += 1
+            if state["hedges_sent"] < policy.max_hedges:
+                state["timer"] = schedule(delay, launch_hedge)
+        try:
+            executor.submit(run_hedge, child)
+        except RuntimeError as e:
+            # Executor encerrado
+            offer(e, True, child)
+
+    state["timer"] = schedule(delay, launch_hedge)
+    outcome: Any
+    try:
+        outcome = send(original)
+    except Exception as e:
+        outcome = e
+    finally:
+        original.close()
+    offer(outcome, False, original)
+
+    with condition:
+        # O original falhou (ou perdeu): aguardar as cópias em andamento
+        while state["winner"] is None and state["hedges_pending"]:
+            condition.wait()
+        state["settled"] = True
+        if state["timer"] is not None:
+            unschedule(state["timer"])
+            state["timer"] = None
+        winner = state["winner"]
+        last = state["last"]
+
+    if winner is None:
+        if isinstance(last, Exception):
+            raise last
+        return last
+
+    result, is_hedge = winner
+    result[0].hedged = is_hedge
+    if is_hedge:
+        # O tempo percebido inclui a espera pela requisição original
+        result[0].elapsed_time = time.perf_counter() - start_time
+    return result
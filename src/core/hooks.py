@@ -0,0 +1,162 @@
+"""
+Ganchos (hooks) chamados nas etapas de cada envio do HttpClient
+"""
+
+import itertools
+import threading
+import time
+from typing import Dict, Optional, Callable, Tuple
+from urllib.parse import urlsplit
+
+from src.models.request import Request, Response, ResponseTimings
+
+
+# Etapas de um envio
+# Antes da substituição das variáveis e da preparação da requisição (uma vez por envio)
+BEFORE_RESOLVE = "before_resolve"
+# Antes de cada tentativa, com a URL e os cabeçalhos finais
+BEFORE_SEND = "before_send"
+# Ao final do envio, quando houve resposta
+AFTER_RESPONSE = "after_response"
+# Ao final do envio, quando houve erro (falha de rede, cancelamento, prazo esgotado...)
+ON_ERROR = "on_error"
+
+STAGES = (BEFORE_RESOLVE, BEFORE_SEND, AFTER_RESPONSE, ON_ERROR)
+
+
+class HookEvent:
+    """
+    Dados entregues aos ganchos: a requisição, a etapa e, ao final do envio,
+    a resposta, o erro e os tempos de cada fase
+    """
+    __slots__ = (
+        "stage", "request", "variables", "method", "url", "headers", "attempt",
+        "response", "error", "started_at", "elapsed", "timestamp"
+    )
+
+    def __init__(
+        self,
+        stage: str,
+        request: Request,
+        variables: Optional[Dict[str, str]] = None,
+        method: str = "",
+        url: str = "",
+        headers: Optional[Dict[str, str]] = None,
+        attempt: int = 0,
+        response: Optional[Response] = None,
+        error: Optional[str] = None,
+        started_at: float = 0.0
+    ):
+        self.stage = stage
+        # Requisição como foi salva (variáveis ainda não substituídas)
+        self.request = request
+        self.variables = variables or {}
+        self.method = method or request.method.upper()
+        # URL e cabeçalhos finais (disponíveis a partir de before_send)
+        self.url = url or request.url
+        self.headers = headers or {}
+        self.attempt = attempt
+        self.response = response
+        self.error = error
+        # Instante, em time.perf_counter(), em que o envio começou
+        self.started_at = started_at
+        # Segundos desde o início do envio, incluindo novas tentativas e esperas
+        self.elapsed = time.perf_counter() - started_at if started_at else 0.0
+        self.timestamp = time.time()
+
+    @property
+    def host(self) -> str:
+        """Host de destino (vazio se a URL ainda tiver variáveis no lugar do host)"""
+        return (urlsplit(self.url).hostname or "").lower()
+
+    @property
+    def status_code(self) -> int:
+        """Status da resposta (0 se não houve resposta)"""
+        return self.response.status_code if self.response is not None else 0
+
+    @property
+    def timings(self) -> ResponseTimings:
+        """Tempos de cada fase da última tentativa"""
+        return self.response.timings if self.response is not None else ResponseTimings()
+
+
+# Função chamada em uma etapa do envio
+Hook = Callable[[HookEvent], None]
+
+
+class HookRegistry:
+    """
+    Ganchos registrados por etapa
+
+    A lista de cada etapa é substituída (e não alterada) a cada registro, de forma
+    que os envios a percorrem sem bloqueio; envios sem ganchos não criam eventos.
+    """
+    def __init__(self):
+        self._hooks: Dict[str, Tuple[Tuple[int, Hook], ...]] = {stage: () for stage in STAGES}
+        self._handles = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def register(self, stage: str, hook: Hook) -> int:
+        """
+        Registra um gancho
+
+        Args:
+            stage (str): Etapa (BEFORE_RESOLVE, BEFORE_SEND, AFTER_RESPONSE ou ON_ERROR)
+            hook (Hook): Função chamada com o HookEvent da etapa
+
+        Returns:
+            int: Identificador para remover o registro
+        """
+        if stage not in STAGES:
+            raise ValueError(f"Etapa desconhecida: {stage}")
+
+        with self._lock:
+            handle = next(self._handles)
+            self._hooks[stage] = self._hooks[stage] + ((handle, hook),)
+        return handle
+
+    def unregister(self, handle: int) -> bool:
+        """
+        Remove um gancho registrado
+
+        Args:
+            handle (int): Identificador retornado por register
+
+        Returns:
+            bool: True se o gancho foi encontrado
+        """
+        with self._lock:
+            for stage, hooks in self._hooks.items():
+                remaining = tuple(item for item in hooks if item[0] != handle)
+                if len(remaining) != len(hooks):
+                    self._hooks[stage] = remaining
+                    return True
+        return False
+
+    def clear(self) -> None:
+        """Remove todos os ganchos"""
+        with self._lock:
+            self._hooks = {stage: () for stage in STAGES}
+
+    def has(self, stage: str) -> bool:
+        """Indica se há ganchos registrados para a etapa"""
+        return bool(self._hooks[stage])
+
+    def emit(self, stage: str, event_factory: Callable[[], HookEvent]) -> None:
+        """
+        Chama os ganchos da etapa; erros nos ganchos são exibidos e não interrompem o envio
+
+        Args:
+            stage (str): Etapa
+            event_factory (Callable[[], HookEvent]): Cria o evento (só chamada se houver ganchos)
+        """
+        hooks = self._hooks[stage]
+        if not hooks:
+            return
+
+        event = event_factory()
+        for _, hook in hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                print(f"Erro no gancho {stage}: {str(e)}")
@@ -0,0 +1,211 @@
+"""
+Transporte HTTP/2 com conexões multiplexadas (requer o pacote opcional httpx[http2])
+"""
+
+import time
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Dict, Any, Optional, Iterator, Tuple, Union
+
+from requests.exceptions import (
+    RequestException, ConnectionError as RequestsConnectionError, Timeout as RequestsTimeout
+)
+
+from src.core.timing import PhaseTimer
+from src.core.resolver import HostResolver
+
+try:
+    import httpx
+    import h2  # noqa: F401 - necessário para o httpx negociar HTTP/2
+except ImportError:  # Dependência opcional
+    httpx = None
+
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Eventos de trace do httpcore e a fase correspondente no PhaseTimer
+_TRACE_PHASES = {
+    "connection.connect_tcp": "connect",
+    "connection.start_tls": "tls",
+    "http11.send_request_headers": "send",
+    "http11.send_request_body": "send",
+    "http11.receive_response_headers": "ttfb",
+    "http2.send_request_headers": "send",
+    "http2.send_request_body": "send",
+    "http2.receive_response_headers": "ttfb",
+}
+
+
+def is_http2_available() -> bool:
+    """Indica se as dependências do transporte HTTP/2 estão instaladas"""
+    return httpx is not None
+
+
+class Http2Error(RequestException):
+    """Falha no envio de uma requisição pelo transporte HTTP/2"""
+
+
+class Http2ConnectError(Http2Error, RequestsConnectionError):
+    """Falha ao estabelecer a conexão pelo transporte HTTP/2"""
+
+
+class Http2Timeout(Http2Error, RequestsTimeout):
+    """Tempo limite esgotado no transporte HTTP/2"""
+
+
+class _PhaseTrace:
+    """Converte os eventos de trace do httpcore em fases do PhaseTimer"""
+    def __init__(self, timer: Optional[PhaseTimer]):
+        self.timer = timer
+        self._started: Dict[str, float] = {}
+
+    def __call__(self, event_name: str, info: Dict[str, Any]) -> None:
+        if self.timer is None:
+            return
+
+        name, _, stage = event_name.rpartition(".")
+        phase = _TRACE_PHASES.get(name)
+        if phase is None:
+            return
+
+        if stage == "started":
+            self._started[name] = time.perf_counter()
+            if phase == "connect":
+                self.timer.connection_reused = False
+        elif stage in ("complete", "failed"):
+            start = self._started.pop(name, None)
+            if start is not None:
+                self.timer.add(phase, time.perf_counter() - start)
+
+
+class Http2Response:
+    """
+    Resposta recebida pelo transporte HTTP/2, com a mesma interface usada
+    pelo HttpClient para as respostas do requests
+    """
+    def __init__(self, response: 'httpx.Response'):
+        self._response = response
+        self.status_code = response.status_code
+        self.headers = dict(response.headers)
+        self.http_version = response.http_version
+
+    @property
+    def content(self) -> bytes:
+        """Corpo completo (decodificado)"""
+        try:
+            return self._response.read()
+        except httpx.HTTPError as e:
+            raise Http2Error(str(e)) from e
+        finally:
+            self._response.close()
+
+    @property
+    def wire_size(self) -> int:
+        """Bytes recebidos antes da descompressão"""
+        return self._response.num_bytes_downloaded
+
+    def iter_content(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        """
+        Itera sobre o corpo (decodificado) em blocos de até chunk_size bytes, entregues
+        assim que chegam (sem esperar completar o bloco, para que o cancelamento
+        possa ser verificado entre eles)
+        """
+        try:
+            for chunk in self._response.iter_bytes():
+                for start in range(0, len(chunk), chunk_size):
+                    yield chunk[start:start + chunk_size]
+        except httpx.HTTPError as e:
+            raise Http2Error(str(e)) from e
+
+    def close(self) -> None:
+        """Libera o stream da resposta"""
+        self._response.close()
+
+
+class Http2Transport:
+    """
+    Cliente HTTP/2 compartilhado: requisições simultâneas para a mesma origem
+    são multiplexadas em uma única conexão em vez de abrir um socket por envio
+
+    Origens que não negociam HTTP/2 (ALPN) continuam sendo atendidas em HTTP/1.1.
+    """
+    def __init__(self, max_connections: int = 100, max_keepalive_connections: int = 20, idle_timeout: float = 60.0):
+        """
+        Args:
+            max_connections (int): Máximo de conexões abertas simultaneamente
+            max_keepalive_connections (int): Máximo de conexões ociosas mantidas
+            idle_timeout (float): Segundos sem uso após os quais uma conexão é fechada
+        """
+        if httpx is None:
+            raise RuntimeError("O transporte HTTP/2 requer o pacote 'httpx[http2]'")
+
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=idle_timeout
+        )
+        # Não guardar cookies entre envios, como no SessionPool
+        cookies = CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+        self.client = httpx.Client(http2=True, limits=limits, cookies=cookies)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, str]] = None,
+        data: Optional[Any] = None,
+        json: Optional[Any] = None,
+        timeout: Union[float, Tuple[Optional[float], Optional[float]]] = 30
+    ) -> Http2Response:
+        """
+        Envia uma requisição e retorna a resposta com o corpo ainda não lido
+
+        Args:
+            method (str): Método HTTP
+            url (str): URL de destino
+            headers (Optional[Dict[str, str]]): Cabeçalhos
+            params (Optional[Dict[str, str]]): Parâmetros de consulta
+            data (Optional[Any]): Corpo bruto (str ou bytes)
+            json (Optional[Any]): Corpo JSON
+            timeout (Union[float, Tuple[Optional[float], Optional[float]]]): Tempo limite em
+                segundos, ou tempos de conexão e de leitura (como no requests)
+
+        Returns:
+            Http2Response: Resposta recebida
+        """
+        extensions = {"trace": _PhaseTrace(PhaseTimer.current())}
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        try:
+            target = httpx.URL(url)
+            override = HostResolver.lookup_override(target.host, target.port or DEFAULT_PORTS.get(target.scheme, 80))
+            if override:
+                # Conectar ao endereço substituto mantendo Host e SNI do nome original
+                headers = dict(headers or {})
+                if not any(key.lower() == "host" for key in headers):
+                    headers["Host"] = target.netloc.decode("ascii")
+                extensions["sni_hostname"] = target.host
+                target = target.copy_with(host=override[0])
+
+            http_request = self.client.build_request(
+                method,
+                target,
+                headers=headers,
+                params=params or None,
+                content=data,
+                json=json,
+                timeout=timeout,
+                extensions=extensions
+            )
+            return Http2Response(self.client.send(http_request, stream=True))
+        except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+            raise Http2ConnectError(str(e)) from e
+        except httpx.TimeoutException as e:
+            raise Http2Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise Http2Error(str(e)) from e
+
+    def close(self) -> None:
+        """Fecha todas as conexões"""
+        self.client.close()
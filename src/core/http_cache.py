@@ -0,0 +1,554 @@
+"""
+Cache HTTP em disco que respeita ETag, Last-Modified e Cache-Control
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, List
+
+
+# Status de resposta que podem ser armazenados
+CACHEABLE_STATUS = {200, 203, 300, 301, 308, 404, 410}
+
+# Cabeçalhos de credenciais: sempre distinguem as respostas armazenadas, mesmo que
+# o servidor não os liste em Vary (ex: o token de outro ambiente)
+IMPLICIT_VARY = ("authorization", "cookie")
+
+# Cabeçalhos que descrevem o corpo recebido, e não o armazenado (já descomprimido)
+_BODY_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+# Validadores definidos pelo próprio usuário na requisição
+_VALIDATOR_HEADERS = ("if-none-match", "if-modified-since")
+
+
+def _parse_cache_control(value: str) -> Dict[str, Optional[str]]:
+    """Interpreta um cabeçalho Cache-Control em um dicionário de diretivas"""
+    directives: Dict[str, Optional[str]] = {}
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, argument = part.partition("=")
+        directives[name.strip().lower()] = argument.strip().strip('"') if argument else None
+    return directives
+
+
+def _parse_http_date(value: Optional[str]) -> Optional[float]:
+    """Converte uma data HTTP em timestamp (None se inválida)"""
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _get_header(headers: Dict[str, str], name: str) -> Optional[str]:
+    """Obtém um cabeçalho ignorando maiúsculas e minúsculas"""
+    lowered = name.lower()
+    for key, value in headers.items():
+        if key.lower() == lowered:
+            return value
+    return None
+
+
+def _vary_names(response_headers: Dict[str, str]) -> Optional[List[str]]:
+    """
+    Cabeçalhos da requisição que selecionam a resposta (Vary mais as credenciais)
+
+    Returns:
+        Optional[List[str]]: Nomes em minúsculas, ou None se a resposta varia
+        com qualquer cabeçalho (Vary: *)
+    """
+    names = [name.strip().lower() for name in (_get_header(response_headers, "Vary") or "").split(",")]
+    if "*" in names:
+        return None
+    return list(dict.fromkeys(name for name in names + list(IMPLICIT_VARY) if name))
+
+
+def _vary_value(request_headers: Dict[str, str], name: str) -> Optional[str]:
+    """Resumo do valor de um cabeçalho da requisição (credenciais não são gravadas em disco)"""
+    value = _get_header(request_headers, name)
+    if value is None:
+        return None
+    return hashlib.sha256(" ".join(value.split()).encode("utf-8")).hexdigest()
+
+
+class CacheEntry:
+    """
+    Resposta armazenada no cache
+    """
+    def __init__(
+        self,
+        key: str,
+        url: str,
+        status_code: int,
+        headers: Dict[str, str],
+        body_path: Path,
+        size: int,
+        stored_at: float,
+        last_access: float,
+        vary: Optional[Dict[str, Optional[str]]] = None
+    ):
+        self.key = key
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.body_path = body_path
+        self.size = size
+        self.stored_at = stored_at
+        self.last_access = last_access
+        # Resumo dos cabeçalhos da requisição que selecionam esta resposta (ver _vary_names)
+        self.vary = vary or {}
+
+    @property
+    def etag(self) -> Optional[str]:
+        """Validador ETag da resposta"""
+        return _get_header(self.headers, "ETag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        """Validador Last-Modified da resposta"""
+        return _get_header(self.headers, "Last-Modified")
+
+    @property
+    def has_validators(self) -> bool:
+        """Verifica se a entrada pode ser revalidada com uma requisição condicional"""
+        return bool(self.etag or self.last_modified)
+
+    @property
+    def is_public(self) -> bool:
+        """Verifica se a resposta pode ser servida a requisições com Authorization"""
+        return "public" in _parse_cache_control(_get_header(self.headers, "Cache-Control") or "")
+
+    def matches(self, request_headers: Dict[str, str]) -> bool:
+        """Verifica se a requisição tem os mesmos valores nos cabeçalhos que selecionam a resposta"""
+        return all(
+            _vary_value(request_headers, name) == value
+            for name, value in self.vary.items()
+        )
+
+    def freshness_lifetime(self) -> float:
+        """Tempo, em segundos, durante o qual a resposta é considerada atual"""
+        cache_control = _parse_cache_control(_get_header(self.headers, "Cache-Control") or "")
+        if "no-cache" in cache_control:
+            return 0.0
+
+        max_age = cache_control.get("max-age")
+        if max_age is not None:
+            try:
+                return max(float(max_age), 0.0)
+            except ValueError:
+                return 0.0
+
+        expires = _parse_http_date(_get_header(self.headers, "Expires"))
+        if expires is not None:
+            date = _parse_http_date(_get_header(self.headers, "Date")) or self.stored_at
+            return max(expires - date, 0.0)
+
+        return 0.0
+
+    def current_age(self, now: Optional[float] = None) -> float:
+        """Idade da resposta, em segundos, considerando o cabeçalho Age"""
+        now = now if now is not None else time.time()
+        try:
+            initial_age = float(_get_header(self.headers, "Age") or 0)
+        except ValueError:
+            initial_age = 0.0
+        return initial_age + max(now - self.stored_at, 0.0)
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """Verifica se a resposta pode ser servida sem consultar o servidor"""
+        return self.current_age(now) < self.freshness_lifetime()
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Cabeçalhos para revalidar a entrada com o servidor"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def read_content(self) -> bytes:
+        """Lê o corpo armazenado"""
+        with open(self.body_path, "rb") as f:
+            return f.read()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte o objeto para um dicionário"""
+        return {
+            "key": self.key,
+            "url": self.url,
+            "status_code": self.status_code,
+            "headers": self.headers,
+            "size": self.size,
+            "stored_at": self.stored_at,
+            "last_access": self.last_access,
+            "vary": self.vary,
+        }
+
+
+class HttpCache:
+    """
+    Cache HTTP privado em disco
+
+    Entradas atuais são servidas diretamente; entradas vencidas com
+    validadores viram requisições condicionais (If-None-Match /
+    If-Modified-Since) e são renovadas quando o servidor responde 304.
+    O cache é limitado pelo tamanho total e pela idade das entradas.
+    """
+    # Intervalo mínimo, em segundos, entre varreduras de entradas expiradas por idade
+    AGE_SWEEP_INTERVAL = 60.0
+    # Idade mínima, em segundos, do último acesso gravado para que uma leitura o regrave
+    ACCESS_WRITE_INTERVAL = 300.0
+
+    def __init__(self, cache_dir: Path, max_size: int = 256 * 1024 * 1024, max_age: float = 7 * 24 * 3600):
+        """
+        Args:
+            cache_dir (Path): Diretório onde as entradas são gravadas
+            max_size (int): Tamanho total máximo dos corpos armazenados, em bytes
+            max_age (float): Idade máxima de uma entrada, em segundos, antes de ser removida
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._total_size: Optional[int] = None
+        self._last_age_sweep = 0.0
+        # Últimos acessos ainda não gravados, gravados na próxima varredura
+        self._access_times: Dict[str, float] = {}
+
+    @staticmethod
+    def make_key(method: str, url: str) -> str:
+        """Gera a chave de uma requisição a partir do método e da URL completa"""
+        return hashlib.sha256(f"{method.upper()} {url}".encode("utf-8")).hexdigest()
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _body_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.body"
+
+    def _write_meta(self, entry: CacheEntry) -> None:
+        """Grava os metadados de uma entrada de forma atômica"""
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry.to_dict(), f, ensure_ascii=False)
+        os.replace(temp_path, self._meta_path(entry.key))
+
+    def _load_entry(self, key: str) -> Optional[CacheEntry]:
+        """Carrega uma entrada do disco"""
+        meta_path = self._meta_path(key)
+        body_path = self._body_path(key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not body_path.exists():
+            return None
+
+        return CacheEntry(
+            key=key,
+            url=data["url"],
+            status_code=data["status_code"],
+            headers=data["headers"],
+            body_path=body_path,
+            size=data["size"],
+            stored_at=data["stored_at"],
+            last_access=data.get("last_access", data["stored_at"]),
+            vary=data.get("vary")
+        )
+
+    @staticmethod
+    def is_request_cacheable(method: str, headers: Dict[str, str]) -> bool:
+        """Verifica se a requisição pode usar o cache"""
+        if method.upper() != "GET":
+            return False
+        if any(_get_header(headers, name) is not None for name in _VALIDATOR_HEADERS):
+            # Com validadores do usuário, um 304 responde à requisição dele, não à entrada do cache
+            return False
+        cache_control = _parse_cache_control(_get_header(headers, "Cache-Control") or "")
+        return "no-store" not in cache_control
+
+    @staticmethod
+    def requires_revalidation(headers: Dict[str, str]) -> bool:
+        """
+        Verifica se a requisição pede que a entrada seja revalidada mesmo se estiver atual
+        (Cache-Control: no-cache ou max-age=0, Pragma: no-cache)
+        """
+        cache_control = _parse_cache_control(_get_header(headers, "Cache-Control") or "")
+        if "no-cache" in cache_control or cache_control.get("max-age") == "0":
+            return True
+        return "no-cache" in (_get_header(headers, "Pragma") or "").lower()
+
+    def lookup(self, method: str, url: str, headers: Dict[str, str]) -> Optional[CacheEntry]:
+        """
+        Procura uma resposta armazenada para a requisição
+
+        Args:
+            method (str): Método HTTP
+            url (str): URL completa, incluindo os parâmetros de consulta
+            headers (Dict[str, str]): Cabeçalhos da requisição
+
+        Returns:
+            Optional[CacheEntry]: A entrada encontrada (atual ou não), ou None
+        """
+        if not self.is_request_cacheable(method, headers):
+            return None
+
+        key = self.make_key(method, url)
+        # Os arquivos são substituídos de forma atômica: a leitura dispensa o lock
+        entry = self._load_entry(key)
+        if entry is None:
+            return None
+
+        if not entry.matches(headers):
+            # Outra variante (ex: outro Accept ou outras credenciais); a resposta nova a substitui
+            return None
+        if _get_header(headers, "Authorization") is not None and not entry.is_public:
+            return None
+
+        now = time.time()
+        with self._lock:
+            if self.max_age and now - entry.stored_at > self.max_age:
+                self._remove(key)
+                return None
+
+            # O último acesso é guardado em memória; o arquivo só é regravado se estiver desatualizado
+            self._access_times[key] = now
+            if now - entry.last_access > self.ACCESS_WRITE_INTERVAL:
+                entry.last_access = now
+                self._write_meta(entry)
+            else:
+                entry.last_access = now
+        return entry
+
+    @staticmethod
+    def is_response_storable(
+        status_code: int,
+        headers: Dict[str, str],
+        request_headers: Optional[Dict[str, str]] = None
+    ) -> bool:
+        """Verifica se a resposta pode ser armazenada"""
+        if status_code not in CACHEABLE_STATUS:
+            return False
+
+        cache_control = _parse_cache_control(_get_header(headers, "Cache-Control") or "")
+        if "no-store" in cache_control:
+            return False
+        if _vary_names(headers) is None:
+            return False
+        if request_headers and _get_header(request_headers, "Authorization") is not None and "public" not in cache_control:
+            return False
+
+        has_freshness = "max-age" in cache_control or _get_header(headers, "Expires") is not None
+        has_validators = bool(_get_header(headers, "ETag") or _get_header(headers, "Last-Modified"))
+        return has_freshness or has_validators
+
+    def store(
+        self,
+        method: str,
+        url: str,
+        status_code: int,
+        headers: Dict[str, str],
+        content: bytes = b"",
+        body_path: Optional[str] = None,
+        request_headers: Optional[Dict[str, str]] = None
+    ) -> Optional[CacheEntry]:
+        """
+        Armazena uma resposta
+
+        Args:
+            method (str): Método HTTP
+            url (str): URL completa, incluindo os parâmetros de consulta
+            status_code (int): Status da resposta
+            headers (Dict[str, str]): Cabeçalhos da resposta
+            content (bytes): Corpo em memória (já descomprimido)
+            body_path (Optional[str]): Arquivo com o corpo, quando ele não está em memória
+            request_headers (Optional[Dict[str, str]]): Cabeçalhos da requisição (para Vary e
+                Authorization)
+
+        Returns:
+            Optional[CacheEntry]: A entrada criada, ou None se a resposta não puder ser armazenada
+        """
+        request_headers = request_headers or {}
+        if method.upper() != "GET" or not self.is_response_storable(status_code, headers, request_headers):
+            return None
+
+        key = self.make_key(method, url)
+        fd, temp_body = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if body_path is not None:
+                    with open(body_path, "rb") as source:
+                        shutil.copyfileobj(source, f, 1024 * 1024)
+                else:
+                    f.write(content)
+            size = os.path.getsize(temp_body)
+
+            if self.max_size and size > self.max_size:
+                os.remove(temp_body)
+                return None
+
+            now = time.time()
+            entry = CacheEntry(
+                key=key,
+                url=url,
+                status_code=status_code,
+                # O corpo gravado já está descomprimido: Content-Encoding e Content-Length não valem mais
+                headers={name: value for name, value in headers.items() if name.lower() not in _BODY_HEADERS},
+                body_path=self._body_path(key),
+                size=size,
+                stored_at=now,
+                last_access=now,
+                vary={name: _vary_value(request_headers, name) for name in _vary_names(headers)}
+            )
+
+            with self._lock:
+                previous = self._load_entry(key)
+                os.replace(temp_body, entry.body_path)
+                self._write_meta(entry)
+                if self._total_size is not None:
+                    self._total_size += size - (previous.size if previous else 0)
+        except OSError:
+            try:
+                os.remove(temp_body)
+            except OSError:
+                pass
+            return None
+
+        self.evict()
+        return entry
+
+    def refresh(self, entry: CacheEntry, headers: Dict[str, str]) -> CacheEntry:
+        """
+        Renova uma entrada após uma resposta 304, atualizando seus cabeçalhos
+
+        Args:
+            entry (CacheEntry): A entrada revalidada
+            headers (Dict[str, str]): Cabeçalhos da resposta 304
+
+        Returns:
+            CacheEntry: A entrada atualizada
+        """
+        merged = dict(entry.headers)
+        for name, value in headers.items():
+            if name.lower() in _BODY_HEADERS:
+                continue
+            existing = next((key for key in merged if key.lower() == name.lower()), None)
+            if existing is not None:
+                del merged[existing]
+            merged[name] = value
+
+        now = time.time()
+        entry.headers = merged
+        entry.stored_at = now
+        entry.last_access = now
+
+        with self._lock:
+            self._write_meta(entry)
+        return entry
+
+    def _remove(self, key: str) -> None:
+        """Remove uma entrada (o lock deve estar adquirido)"""
+        entry = self._load_entry(key)
+        self._access_times.pop(key, None)
+        for path in (self._meta_path(key), self._body_path(key)):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        if entry is not None and self._total_size is not None:
+            self._total_size -= entry.size
+
+    def _all_entries(self) -> List[CacheEntry]:
+        """Carrega todas as entradas do disco"""
+        entries = []
+        for meta_path in self.cache_dir.glob("*.json"):
+            entry = self._load_entry(meta_path.stem)
+            if entry is not None:
+                entries.append(entry)
+        return entries
+
+    @property
+    def total_size(self) -> int:
+        """Tamanho total dos corpos armazenados, em bytes"""
+        with self._lock:
+            if self._total_size is None:
+                self._total_size = sum(entry.size for entry in self._all_entries())
+            return self._total_size
+
+    def evict(self) -> int:
+        """
+        Remove as entradas mais antigas que max_age e, se o tamanho total
+        exceder max_size, as menos usadas recentemente
+
+        Returns:
+            int: Quantidade de entradas removidas
+        """
+        now = time.time()
+        over_size = bool(self.max_size) and self.total_size > self.max_size
+        sweep_due = bool(self.max_age) and now - self._last_age_sweep >= self.AGE_SWEEP_INTERVAL
+        if not over_size and not sweep_due:
+            return 0
+
+        removed = 0
+        with self._lock:
+            entries = self._all_entries()
+            self._total_size = sum(entry.size for entry in entries)
+            self._last_age_sweep = now
+            for entry in entries:
+                entry.last_access = max(entry.last_access, self._access_times.get(entry.key, 0.0))
+
+            remaining = []
+            for entry in entries:
+                if self.max_age and now - entry.stored_at > self.max_age:
+                    self._remove(entry.key)
+                    removed += 1
+                else:
+                    remaining.append(entry)
+
+            if self.max_size and self._total_size > self.max_size:
+                remaining.sort(key=lambda entry: entry.last_access)
+                for entry in remaining:
+                    if self._total_size <= self.max_size:
+                        break
+                    self._remove(entry.key)
+                    removed += 1
+
+            self._flush_access_times(entries)
+
+        return removed
+
+    def _flush_access_times(self, entries: List[CacheEntry]) -> None:
+        """Grava os últimos acessos guardados em memória (o lock deve estar adquirido)"""
+        for entry in entries:
+            accessed = self._access_times.pop(entry.key, None)
+            if accessed is not None and entry.last_access <= accessed:
+                try:
+                    self._write_meta(entry)
+                except OSError:
+                    pass
+
+    def clear(self) -> None:
+        """Remove todas as entradas"""
+        with self._lock:
+            for path in self.cache_dir.iterdir():
+                if path.suffix in (".json", ".body", ".tmp"):
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+            self._total_size = 0
+            self._access_times.clear()
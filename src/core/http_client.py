@@ -3,119 +3,866 @@ Cliente HTTP para realizar requisições
 """
 
 import time
+import threading
 import json as json_lib
 from typing import Dict, Any, Optional, Union, Tuple
 
-import requests
-from requests.exceptions import RequestException
+from requests.exceptions import RequestException, ConnectionError as RequestsConnectionError
+from requests.models import PreparedRequest
 
-from src.models.request import Request, Response
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, urlencode
+
+from src.models.request import Request, Response, BodyMode
+from src.models.retry_policy import RetryPolicy, HedgePolicy
+from src.models.timeouts import Timeouts, DEFAULT_TIMEOUTS
 from src.core.variable_processor import VariableProcessor
+from src.core.variable_resolver import VariableResolver
+from src.core.session_pool import SessionPool
+from src.core.http2_transport import Http2Transport
+from src.core.response_body import SpooledBody, DEFAULT_SPILL_THRESHOLD, DEFAULT_CHUNK_SIZE
+from src.core.timing import PhaseTimer
+from src.core.http_cache import HttpCache, CacheEntry
+from src.core.storage import Storage
+from src.core.hedging import LatencyTracker, AttemptResult, send_hedged
+from src.core.resolver import HostResolver, get_resolver, set_resolver
+from src.core.prepared_cache import PreparedRequestCache, PreparedSend
+from src.core.multipart import MultipartEncoder, FileBody, ProgressBody, ProgressCallback
+from src.core.cancellation import CancellationToken, REASON_DEADLINE
+from src.core.rate_limiter import RateLimiter
+from src.core.hooks import HookRegistry, HookEvent, Hook, BEFORE_RESOLVE, BEFORE_SEND, AFTER_RESPONSE, ON_ERROR
+from src.core.downloader import FileDownloader, DEFAULT_SEGMENTS, DEFAULT_MIN_SEGMENT_SIZE
+from src.utils.compression import compress, CompressedStream
+
+
+# Transportes disponíveis para os envios
+TRANSPORT_HTTP1 = "http1"
+TRANSPORT_HTTP2 = "http2"
+
+# Versões do protocolo informadas pelo urllib3 (HTTPResponse.version)
+_HTTP_VERSIONS = {9: "HTTP/0.9", 10: "HTTP/1.0", 11: "HTTP/1.1", 20: "HTTP/2"}
 
 
 class HttpClient:
     """
     Cliente HTTP para realizar requisições
     """
+    # Sessão com pools de conexões compartilhada por todos os envios
+    _session_pool: Optional[SessionPool] = None
+    _session_pool_lock = threading.Lock()
+    # Cache HTTP opcional consultado antes de cada envio
+    _http_cache: Optional[HttpCache] = None
+    # Transporte usado nos envios (HTTP/1.1 via requests ou HTTP/2 via httpx)
+    _transport = TRANSPORT_HTTP1
+    _http2_transport: Optional[Http2Transport] = None
+    # Latências recentes por endpoint e executor das cópias das requisições duplicadas (hedging);
+    # o envio original roda na thread de quem chama, então o limite de workers só atrasa cópias
+    _latency_tracker = LatencyTracker()
+    _hedge_executor: Optional[ThreadPoolExecutor] = None
+    # Requisições já preparadas (variáveis substituídas e corpo serializado)
+    _prepared_cache = PreparedRequestCache()
+    # Variáveis que referenciam outras variáveis, resolvidas uma vez por conjunto de valores
+    _variable_resolver = VariableResolver()
+    # Ganchos chamados nas etapas de cada envio
+    _hooks = HookRegistry()
+    
+    @classmethod
+    def get_session_pool(cls) -> SessionPool:
+        """
+        Retorna a sessão compartilhada, criando-a com a configuração padrão se necessário
+        
+        Returns:
+            SessionPool: Sessão com pools de conexões persistentes
+        """
+        if cls._session_pool is None:
+            with cls._session_pool_lock:
+                if cls._session_pool is None:
+                    cls._session_pool = SessionPool()
+        return cls._session_pool
+    
+    @classmethod
+    def configure_pool(cls, pool_connections: int = 10, pool_maxsize: int = 10, idle_timeout: float = 60.0) -> SessionPool:
+        """
+        Substitui a sessão compartilhada por uma nova com a configuração informada
+        
+        Args:
+            pool_connections (int): Quantidade de hosts com pool mantido simultaneamente
+            pool_maxsize (int): Máximo de conexões ociosas mantidas por host
+            idle_timeout (float): Segundos sem uso após os quais o pool de um host é fechado
+            
+        Returns:
+            SessionPool: A nova sessão compartilhada
+        """
+        with cls._session_pool_lock:
+            old_pool = cls._session_pool
+            cls._session_pool = SessionPool(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                idle_timeout=idle_timeout
+            )
+        
+        if old_pool is not None:
+            old_pool.close()
+        
+        return cls._session_pool
+    
+    @classmethod
+    def get_pool_stats(cls) -> Dict[str, Any]:
+        """
+        Retorna as estatísticas de conexões abertas e reutilizadas pela sessão compartilhada
+        
+        Returns:
+            Dict[str, Any]: Estatísticas totais e por host
+        """
+        return cls.get_session_pool().get_stats()
+    
+    @classmethod
+    def configure_transport(cls, transport: str = TRANSPORT_HTTP1, max_connections: int = 100) -> None:
+        """
+        Seleciona o transporte usado pelos envios
+        
+        Com HTTP/2, envios simultâneos para a mesma origem compartilham uma única
+        conexão multiplexada. Origens sem suporte a HTTP/2 continuam em HTTP/1.1.
+        
+        Args:
+            transport (str): TRANSPORT_HTTP1 ou TRANSPORT_HTTP2
+            max_connections (int): Máximo de conexões abertas pelo transporte HTTP/2
+        """
+        if transport not in (TRANSPORT_HTTP1, TRANSPORT_HTTP2):
+            raise ValueError(f"Transporte desconhecido: {transport}")
+        
+        with cls._session_pool_lock:
+            old_transport = cls._http2_transport
+            cls._http2_transport = Http2Transport(max_connections=max_connections) if transport == TRANSPORT_HTTP2 else None
+            cls._transport = transport
+        
+        if old_transport is not None:
+            old_transport.close()
+    
+    @classmethod
+    def get_transport(cls) -> str:
+        """Retorna o transporte selecionado"""
+        return cls._transport
+    
+    @classmethod
+    def configure_resolver(cls, ttl: float = 60.0, negative_ttl: float = 5.0, max_entries: int = 1024) -> HostResolver:
+        """
+        Substitui o cache de resolução de nomes compartilhado pelas conexões
+        
+        Args:
+            ttl (float): Segundos durante os quais uma resposta de DNS é reutilizada
+            negative_ttl (float): Segundos durante os quais uma falha de resolução é reutilizada
+            max_entries (int): Quantidade máxima de nomes mantidos no cache
+            
+        Returns:
+            HostResolver: O novo resolvedor
+        """
+        resolver = HostResolver(ttl=ttl, negative_ttl=negative_ttl, max_entries=max_entries)
+        set_resolver(resolver)
+        return resolver
+    
+    @classmethod
+    def get_resolver_stats(cls) -> Dict[str, Any]:
+        """
+        Retorna as consultas de DNS atendidas pelo cache e pelo resolvedor do sistema
+        
+        Returns:
+            Dict[str, Any]: Acertos, consultas e nomes guardados
+        """
+        return get_resolver().get_stats()
+    
+    @classmethod
+    def configure_cache(cls, storage: Storage, max_size: int = 256 * 1024 * 1024, max_age: float = 7 * 24 * 3600) -> HttpCache:
+        """
+        Ativa o cache HTTP em disco dentro do diretório do armazenamento
+        
+        Args:
+            storage (Storage): Armazenamento cujo diretório de cache será usado
+            max_size (int): Tamanho total máximo dos corpos armazenados, em bytes
+            max_age (float): Idade máxima de uma entrada, em segundos
+            
+        Returns:
+            HttpCache: O cache ativado
+        """
+        cls._http_cache = HttpCache(storage.cache_dir, max_size=max_size, max_age=max_age)
+        return cls._http_cache
+    
+    @classmethod
+    def disable_cache(cls) -> None:
+        """Desativa o cache HTTP (as entradas em disco são mantidas)"""
+        cls._http_cache = None
+    
+    @classmethod
+    def add_hook(cls, stage: str, hook: Hook) -> int:
+        """
+        Registra um gancho chamado em uma etapa de todos os envios
+        
+        Args:
+            stage (str): BEFORE_RESOLVE, BEFORE_SEND, AFTER_RESPONSE ou ON_ERROR (ver src.core.hooks)
+            hook (Hook): Função chamada com o HookEvent da etapa, na thread do envio
+            
+        Returns:
+            int: Identificador para remover o gancho
+        """
+        return cls._hooks.register(stage, hook)
+    
+    @classmethod
+    def remove_hook(cls, handle: int) -> bool:
+        """Remove um gancho registrado por add_hook"""
+        return cls._hooks.unregister(handle)
     
     @staticmethod
-    def send_request(request: Request, variables: Optional[Dict[str, str]] = None) -> Tuple[Response, Optional[str]]:
+    def send_request(
+        request: Request,
+        variables: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+        spill_threshold: int = DEFAULT_SPILL_THRESHOLD,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        resolve_overrides: Optional[Dict[str, str]] = None,
+        on_upload_progress: Optional[ProgressCallback] = None,
+        timeouts: Optional[Timeouts] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        rate_limiter: Optional[RateLimiter] = None
+    ) -> Tuple[Response, Optional[str]]:
         """
         Envia uma requisição HTTP
         
         Args:
             request (Request): Objeto de requisição
             variables (Optional[Dict[str, str]]): Variáveis para substituição
+            stream (bool): Lê o corpo em blocos, gravando em arquivo temporário
+                o que exceder spill_threshold em vez de mantê-lo em memória
+            spill_threshold (int): Tamanho máximo, em bytes, do corpo mantido em memória no modo stream
+            retry_policy (Optional[RetryPolicy]): Política de novas tentativas usada quando
+                a requisição não define a sua (ex: a da coleção)
+            hedge_policy (Optional[HedgePolicy]): Política de duplicação usada quando
+                a requisição não define a sua
+            resolve_overrides (Optional[Dict[str, str]]): Endereços fixos por "host" ou
+                "host:porta", como o --resolve do curl (ex: Environment.resolve_overrides)
+            on_upload_progress (Optional[ProgressCallback]): Chamado durante o envio do corpo
+                com (bytes enviados, total de bytes)
+            timeouts (Optional[Timeouts]): Tempos limite usados quando a requisição não define
+                os seus (ex: os da coleção); o padrão é DEFAULT_TIMEOUTS
+            cancel_token (Optional[CancellationToken]): Token que, ao ser cancelado, interrompe
+                o envio (inclusive novas tentativas e a espera entre elas)
+            rate_limiter (Optional[RateLimiter]): Limitador consultado antes de cada tentativa;
+                a espera fica em Response.rate_limit_wait, fora de elapsed_time
             
         Returns:
             Tuple[Response, Optional[str]]: Resposta e mensagem de erro (se houver)
         """
-        start_time = time.time()
-        error_message = None
+        started_at = time.perf_counter()
+        HttpClient._hooks.emit(BEFORE_RESOLVE, lambda: HookEvent(
+            BEFORE_RESOLVE, request, variables, started_at=started_at
+        ))
         
-        # Clonar a requisição para não modificar a original
-        processed_request = HttpClient._process_request_variables(request, variables or {})
+        try:
+            prepared = HttpClient.prepare_request(request, variables)
+        except RequestException as e:
+            return HttpClient._finish(request, variables, None, Response(
+                status_code=0, headers={}, content=b"", elapsed_time=0.0
+            ), f"Erro ao realizar requisição: {str(e)}", started_at)
+        except Exception as e:
+            return HttpClient._finish(request, variables, None, Response(
+                status_code=0, headers={}, content=b"", elapsed_time=0.0
+            ), f"Erro inesperado: {str(e)}", started_at)
+        
+        method = request.method.upper()
+        retry_policy = request.retry_policy or retry_policy
+        if retry_policy is not None and not retry_policy.allows_method(method):
+            retry_policy = None
+        hedge_policy = request.hedge_policy or hedge_policy
+        if hedge_policy is not None and not hedge_policy.allows_method(method):
+            hedge_policy = None
         
+        timeouts = request.timeouts or timeouts or DEFAULT_TIMEOUTS
+        # Token deste envio: recebe o cancelamento de quem o iniciou e controla o prazo total
+        token = CancellationToken(parent=cancel_token, timeout=timeouts.total)
+        
+        rate_limit_wait = 0.0
         try:
-            # Preparar os dados da requisição
-            url = processed_request.url
-            method = processed_request.method.upper()
-            headers = processed_request.headers
-            params = processed_request.params
-            
-            # Determinar o tipo de corpo da requisição
-            data = None
-            json_data = None
-            files = None
-            
-            if processed_request.body:
-                if isinstance(processed_request.body, dict):
-                    # Se for um dicionário, assume que é JSON
-                    json_data = processed_request.body
-                elif isinstance(processed_request.body, str):
-                    # Se for uma string, tenta verificar se é JSON
+            attempt = 0
+            while True:
+                if rate_limiter is not None:
                     try:
-                        json_data = json_lib.loads(processed_request.body)
-                    except (ValueError, TypeError):
-                        # Se não for JSON, assume que é um formulário ou dados brutos
-                        data = processed_request.body
+                        rate_limit_wait += rate_limiter.acquire(method, prepared.url, token)
+                    except RequestException:
+                        response = Response(status_code=0, headers={}, content=b"", elapsed_time=0.0)
+                        error_message = HttpClient._interruption_message(token)
+                        break
+                
+                HttpClient._hooks.emit(BEFORE_SEND, lambda: HookEvent(
+                    BEFORE_SEND, request, variables, method, prepared.url, prepared.headers,
+                    attempt=attempt, started_at=started_at
+                ))
+                response, error_message, connect_error = HttpClient._send_attempt(
+                    prepared, stream, spill_threshold, hedge_policy, resolve_overrides,
+                    on_upload_progress, timeouts, token, rate_limiter
+                )
+                if rate_limiter is not None:
+                    rate_limiter.observe(method, prepared.url, response.status_code, response.headers)
                 
-            # Enviar a requisição
-            http_response = requests.request(
-                method=method,
-                url=url,
-                headers=headers,
-                params=params,
-                data=data,
-                json=json_data,
-                files=files,
-                timeout=30  # Timeout de 30 segundos
+                delay = None
+                if retry_policy is not None and not token.cancelled:
+                    delay = retry_policy.retry_delay(attempt, response.status_code, response.headers, connect_error)
+                    remaining = token.remaining()
+                    if delay is not None and remaining is not None and delay >= remaining:
+                        # A espera esgotaria o prazo: ficar com a resposta atual
+                        delay = None
+                if delay is None or token.wait(delay):
+                    break
+                
+                response.close()
+                attempt += 1
+        finally:
+            token.close()
+        
+        response.attempts = attempt + 1
+        response.rate_limit_wait = rate_limit_wait
+        return HttpClient._finish(request, variables, prepared, response, error_message, started_at)
+    
+    @staticmethod
+    def _finish(
+        request: Request,
+        variables: Optional[Dict[str, str]],
+        prepared: Optional[PreparedSend],
+        response: Response,
+        error_message: Optional[str],
+        started_at: float
+    ) -> Tuple[Response, Optional[str]]:
+        """Chama os ganchos de fim de envio (AFTER_RESPONSE ou ON_ERROR) e retorna o resultado"""
+        stage = ON_ERROR if error_message else AFTER_RESPONSE
+        HttpClient._hooks.emit(stage, lambda: HookEvent(
+            stage, request, variables,
+            url=prepared.url if prepared is not None else "",
+            headers=prepared.headers if prepared is not None else None,
+            attempt=response.attempts - 1, response=response, error=error_message, started_at=started_at
+        ))
+        return response, error_message
+    
+    @staticmethod
+    def download(
+        request: Request,
+        target_path: str,
+        variables: Optional[Dict[str, str]] = None,
+        segments: int = DEFAULT_SEGMENTS,
+        min_segment_size: int = DEFAULT_MIN_SEGMENT_SIZE,
+        resume: bool = True,
+        resolve_overrides: Optional[Dict[str, str]] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        timeouts: Optional[Timeouts] = None,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Tuple[Response, Optional[str]]:
+        """
+        Envia uma requisição gravando o corpo da resposta diretamente em um arquivo
+        
+        Downloads interrompidos são retomados de onde pararam na próxima chamada com
+        o mesmo destino; quando o servidor aceita intervalos (Range), arquivos grandes
+        são baixados em segmentos paralelos. Usa sempre as conexões HTTP/1.1 do pool.
+        
+        Args:
+            request (Request): Objeto de requisição
+            target_path (str): Arquivo de destino
+            variables (Optional[Dict[str, str]]): Variáveis para substituição
+            segments (int): Máximo de segmentos baixados em paralelo
+            min_segment_size (int): Tamanho mínimo de cada segmento, em bytes
+            resume (bool): Continua um download interrompido para o mesmo destino
+            resolve_overrides (Optional[Dict[str, str]]): Endereços fixos por "host" ou "host:porta"
+            on_progress (Optional[ProgressCallback]): Chamado com (bytes gravados, total; 0 se desconhecido)
+            timeouts (Optional[Timeouts]): Tempos limite usados quando a requisição não define os seus
+            cancel_token (Optional[CancellationToken]): Token que, ao ser cancelado, interrompe o download
+        
+        Returns:
+            Tuple[Response, Optional[str]]: Resposta (com body_path apontando para o destino)
+            e mensagem de erro (se houver)
+        """
+        started_at = time.perf_counter()
+        HttpClient._hooks.emit(BEFORE_RESOLVE, lambda: HookEvent(
+            BEFORE_RESOLVE, request, variables, started_at=started_at
+        ))
+        
+        try:
+            prepared = HttpClient.prepare_request(request, variables)
+        except RequestException as e:
+            return HttpClient._finish(request, variables, None, Response(
+                status_code=0, headers={}, content=b"", elapsed_time=0.0
+            ), f"Erro ao realizar requisição: {str(e)}", started_at)
+        except Exception as e:
+            return HttpClient._finish(request, variables, None, Response(
+                status_code=0, headers={}, content=b"", elapsed_time=0.0
+            ), f"Erro inesperado: {str(e)}", started_at)
+        
+        timeouts = request.timeouts or timeouts or DEFAULT_TIMEOUTS
+        token = CancellationToken(parent=cancel_token, timeout=timeouts.total)
+        downloader = FileDownloader(HttpClient.get_session_pool(), segments, min_segment_size)
+        
+        HttpClient._hooks.emit(BEFORE_SEND, lambda: HookEvent(
+            BEFORE_SEND, request, variables, url=prepared.url, headers=prepared.headers, started_at=started_at
+        ))
+        try:
+            response = downloader.download(
+                prepared, target_path, resume, timeouts, token, on_progress, resolve_overrides
             )
+            return HttpClient._finish(request, variables, prepared, response, None, started_at)
+        except RequestException as e:
+            error_message = HttpClient._interruption_message(token) or f"Erro ao realizar requisição: {str(e)}"
+        except Exception as e:
+            error_message = HttpClient._interruption_message(token) or f"Erro inesperado: {str(e)}"
+        finally:
+            token.close()
+        
+        # O arquivo parcial e o estado são mantidos para a retomada
+        return HttpClient._finish(request, variables, prepared, Response(
+            status_code=0, headers={}, content=b"", elapsed_time=0.0
+        ), error_message, started_at)
+    
+    @staticmethod
+    def prepare_request(request: Request, variables: Optional[Dict[str, str]] = None) -> PreparedSend:
+        """
+        Substitui as variáveis e serializa o corpo da requisição, reaproveitando
+        o resultado de envios anteriores quando a requisição e as variáveis não mudaram
+        
+        Args:
+            request (Request): Objeto de requisição
+            variables (Optional[Dict[str, str]]): Variáveis para substituição
+            
+        Returns:
+            PreparedSend: Requisição pronta para o envio (compartilhada; não deve ser alterada)
+        """
+        def prepare() -> PreparedSend:
+            resolved_variables = HttpClient._variable_resolver.resolve(variables)
+            
+            # Clonar a requisição para não modificar a original
+            processed_request = HttpClient._process_request_variables(request, resolved_variables)
+            
+            body, content_type = HttpClient._encode_body(processed_request)
+            headers = processed_request.headers
+            if isinstance(body, MultipartEncoder):
+                # O Content-Type precisa do delimitador gerado para este corpo
+                headers = {key: value for key, value in headers.items() if key.lower() != "content-type"}
+                headers["Content-Type"] = content_type
+            elif content_type and not any(key.lower() == "content-type" for key in headers):
+                headers = dict(headers)
+                headers["Content-Type"] = content_type
+            body, headers = HttpClient._compress_body(processed_request, body, headers)
+            if isinstance(body, CompressedStream):
+                # Tamanho desconhecido até o fim da compressão: envio em chunks
+                headers = {key: value for key, value in headers.items() if key.lower() != "content-length"}
+            elif body is not None and not isinstance(body, bytes):
+                # Corpos lidos do disco têm tamanho conhecido: evitar o envio em chunks
+                headers = {key: value for key, value in headers.items() if key.lower() != "content-length"}
+                headers["Content-Length"] = str(len(body))
+            
+            prepared_url = PreparedRequest()
+            prepared_url.prepare_url(processed_request.url, processed_request.params)
+            
+            return PreparedSend(processed_request, prepared_url.url, headers, body)
+        
+        return HttpClient._prepared_cache.get_or_prepare(request, variables, prepare)
+    
+    @staticmethod
+    def _send_attempt(
+        prepared: PreparedSend,
+        stream: bool,
+        spill_threshold: int,
+        hedge_policy: Optional[HedgePolicy],
+        resolve_overrides: Optional[Dict[str, str]] = None,
+        on_upload_progress: Optional[ProgressCallback] = None,
+        timeouts: Timeouts = DEFAULT_TIMEOUTS,
+        token: Optional[CancellationToken] = None,
+        rate_limiter: Optional[RateLimiter] = None
+    ) -> AttemptResult:
+        """
+        Realiza uma tentativa de envio, duplicando-a se a política de hedging pedir
+        
+        Args:
+            prepared (PreparedSend): A requisição pronta para o envio
+            stream (bool): Lê o corpo em blocos, com transbordo para disco
+            spill_threshold (int): Tamanho máximo, em bytes, do corpo mantido em memória no modo stream
+            hedge_policy (Optional[HedgePolicy]): Política de duplicação
+            resolve_overrides (Optional[Dict[str, str]]): Endereços fixos por host
+            on_upload_progress (Optional[ProgressCallback]): Progresso do envio do corpo
+            timeouts (Timeouts): Tempos limite de conexão e de leitura
+            token (Optional[CancellationToken]): Token de cancelamento do envio
+            rate_limiter (Optional[RateLimiter]): Limitador de taxa (cada cópia também consome uma ficha)
+            
+        Returns:
+            AttemptResult: Resposta, mensagem de erro e se a falha ocorreu ao conectar
+        """
+        token = token or CancellationToken()
+        method = prepared.request.method.upper()
+        parts = urlsplit(prepared.url)
+        endpoint = f"{method} {parts.scheme}://{parts.netloc}{parts.path}"
+        
+        def send(send_token: CancellationToken) -> AttemptResult:
+            # As substituições valem para a thread que realiza o envio
+            with HostResolver.overrides(resolve_overrides), send_token.activate():
+                result = HttpClient._send_once(
+                    prepared, stream, spill_threshold, on_upload_progress, timeouts, send_token
+                )
+            response = result[0]
+            if response.status_code > 0 and response.cache_status is None:
+                HttpClient._latency_tracker.record(endpoint, response.elapsed_time)
+            return result
+        
+        delay = None
+        if hedge_policy is not None:
+            delay = HttpClient._latency_tracker.percentile(
+                endpoint, hedge_policy.percentile, hedge_policy.min_samples
+            )
+        if delay is None:
+            return send(token)
+        
+        if HttpClient._hedge_executor is None:
+            with HttpClient._session_pool_lock:
+                if HttpClient._hedge_executor is None:
+                    HttpClient._hedge_executor = ThreadPoolExecutor(
+                        max_workers=64, thread_name_prefix="http-hedge"
+                    )
+        
+        before_hedge = None
+        if rate_limiter is not None:
+            def before_hedge(hedge_token: CancellationToken) -> None:
+                rate_limiter.acquire(method, prepared.url, hedge_token)
+        
+        return send_hedged(send, hedge_policy, delay, HttpClient._hedge_executor, token, before_hedge)
+    
+    @staticmethod
+    def _send_once(
+        prepared: PreparedSend,
+        stream: bool,
+        spill_threshold: int,
+        on_upload_progress: Optional[ProgressCallback] = None,
+        timeouts: Timeouts = DEFAULT_TIMEOUTS,
+        token: Optional[CancellationToken] = None
+    ) -> AttemptResult:
+        """
+        Envia a requisição uma única vez
+        
+        Args:
+            prepared (PreparedSend): A requisição pronta para o envio
+            stream (bool): Lê o corpo em blocos, com transbordo para disco
+            spill_threshold (int): Tamanho máximo, em bytes, do corpo mantido em memória no modo stream
+            on_upload_progress (Optional[ProgressCallback]): Progresso do envio do corpo
+            timeouts (Timeouts): Tempos limite de conexão e de leitura
+            token (Optional[CancellationToken]): Token de cancelamento do envio
             
-            # Calcular o tempo decorrido
-            elapsed_time = time.time() - start_time
+        Returns:
+            AttemptResult: Resposta, mensagem de erro e se a falha ocorreu ao conectar
+        """
+        error_message = None
+        connect_error = False
+        token = token or CancellationToken()
+        
+        timer = PhaseTimer()
+        start_time = None
+        
+        try:
+            # Dados da requisição (URL já com os parâmetros e corpo já serializado)
+            url = prepared.url
+            method = prepared.request.method.upper()
+            headers = prepared.headers
+            data = prepared.body
+            if data is not None and on_upload_progress is not None:
+                sized = not isinstance(data, CompressedStream)
+                data = ProgressBody(data, on_upload_progress)
+                if not sized:
+                    # Tamanho desconhecido: um gerador é enviado em chunks
+                    data = iter(data)
+                elif not any(key.lower() == "content-length" for key in headers):
+                    headers = dict(headers)
+                    headers["Content-Length"] = str(len(data))
+            
+            with timer.activate():
+                # A medição começa após a substituição de variáveis e o preparo do corpo
+                start_time = time.perf_counter()
+                
+                # Conexão e leitura nunca esperam além do prazo total
+                token.raise_if_cancelled()
+                timeout = timeouts.for_attempt(token.remaining())
+                
+                # Consultar o cache HTTP, se estiver ativo
+                cache = HttpClient._http_cache
+                cache_url = None
+                cache_entry = None
+                if cache is not None and HttpCache.is_request_cacheable(method, headers):
+                    cache_url = url
+                    cache_entry = cache.lookup(method, cache_url, headers)
+                    
+                    if (
+                        cache_entry is not None and cache_entry.is_fresh()
+                        and not HttpCache.requires_revalidation(headers)
+                    ):
+                        elapsed_time = time.perf_counter() - start_time
+                        return HttpClient._response_from_cache(
+                            cache_entry, "hit", elapsed_time, timer, spill_threshold
+                        ), error_message, connect_error
+                    
+                    if cache_entry is not None and cache_entry.has_validators:
+                        # Entrada vencida (ou revalidação pedida): transformar em requisição condicional
+                        conditional_headers = dict(headers)
+                        present = {key.lower() for key in headers}
+                        for key, value in cache_entry.conditional_headers().items():
+                            if key.lower() not in present:
+                                conditional_headers[key] = value
+                        headers = conditional_headers
+                    else:
+                        cache_entry = None
+                
+                # Enviar a requisição reaproveitando as conexões do pool; o corpo
+                # é sempre lido depois, para que o download seja medido separadamente
+                http2_transport = HttpClient._http2_transport
+                if http2_transport is not None:
+                    http_response = http2_transport.request(
+                        method=method,
+                        url=url,
+                        headers=headers,
+                        data=data,
+                        timeout=timeout
+                    )
+                else:
+                    http_response = HttpClient.get_session_pool().request(
+                        method=method,
+                        url=url,
+                        headers=headers,
+                        data=data,
+                        timeout=timeout,
+                        stream=True
+                    )
+                
+                download_start = time.perf_counter()
+                body_path = None
+                if stream:
+                    # Ler o corpo em blocos, transbordando para disco se for grande
+                    spooled_body = SpooledBody(spill_threshold)
+                    try:
+                        spooled_body.consume(token.guard(http_response.iter_content(chunk_size=DEFAULT_CHUNK_SIZE)))
+                    except BaseException:
+                        spooled_body.discard()
+                        raise
+                    finally:
+                        http_response.close()
+                    content, body_path = spooled_body.finish()
+                elif http2_transport is not None:
+                    # O fechamento do socket não alcança as conexões do httpx: verificar
+                    # o cancelamento e o prazo entre os blocos
+                    try:
+                        content = b"".join(token.guard(http_response.iter_content(chunk_size=DEFAULT_CHUNK_SIZE)))
+                    finally:
+                        http_response.close()
+                else:
+                    content = http_response.content
+                timer.add("download", time.perf_counter() - download_start)
+                
+                # Bytes efetivamente recebidos, antes da descompressão
+                wire_size, http_version = HttpClient._wire_info(http_response)
+                
+                # Calcular o tempo decorrido
+                elapsed_time = time.perf_counter() - start_time
+            
+            if cache_entry is not None and http_response.status_code == 304:
+                # A versão armazenada continua válida
+                cache_entry = cache.refresh(cache_entry, dict(http_response.headers))
+                return HttpClient._response_from_cache(
+                    cache_entry, "revalidated", elapsed_time, timer, spill_threshold
+                ), error_message, connect_error
+            
+            if cache_url is not None:
+                cache.store(
+                    method,
+                    cache_url,
+                    http_response.status_code,
+                    dict(http_response.headers),
+                    content=content,
+                    body_path=body_path,
+                    request_headers=headers
+                )
             
             # Criar objeto de resposta
             response = Response(
                 status_code=http_response.status_code,
                 headers=dict(http_response.headers),
-                content=http_response.content,
-                elapsed_time=elapsed_time
+                content=content,
+                elapsed_time=elapsed_time,
+                body_path=body_path,
+                timings=timer.to_timings(elapsed_time)
             )
+            response.wire_size = wire_size
+            response.http_version = http_version
             
-            return response, error_message
+            return response, error_message, connect_error
             
         except RequestException as e:
-            # Calcular o tempo decorrido mesmo em caso de erro
-            elapsed_time = time.time() - start_time
-            
-            # Criar uma resposta vazia
-            response = Response(
-                status_code=0,
-                headers={},
-                content=b"",
-                elapsed_time=elapsed_time
-            )
-            
-            error_message = f"Erro ao realizar requisição: {str(e)}"
+            error_message = HttpClient._interruption_message(token) or f"Erro ao realizar requisição: {str(e)}"
+            # Falhas causadas pelo cancelamento não devem gerar novas tentativas
+            connect_error = isinstance(e, RequestsConnectionError) and not token.cancelled
             
-            return response, error_message
-        
         except Exception as e:
-            # Calcular o tempo decorrido mesmo em caso de erro
-            elapsed_time = time.time() - start_time
+            error_message = HttpClient._interruption_message(token) or f"Erro inesperado: {str(e)}"
+        
+        # Calcular o tempo decorrido mesmo em caso de erro
+        elapsed_time = time.perf_counter() - start_time if start_time is not None else 0.0
+        
+        # Criar uma resposta vazia
+        response = Response(
+            status_code=0,
+            headers={},
+            content=b"",
+            elapsed_time=elapsed_time,
+            timings=timer.to_timings(elapsed_time)
+        )
+        
+        return response, error_message, connect_error
+    
+    @staticmethod
+    def _interruption_message(token: CancellationToken) -> Optional[str]:
+        """Mensagem de erro de um envio interrompido pelo token (None se não foi interrompido)"""
+        if not token.cancelled:
+            return None
+        if token.reason == REASON_DEADLINE:
+            return "Requisição interrompida: tempo total esgotado"
+        return "Requisição cancelada"
+    
+    @staticmethod
+    def _wire_info(http_response: Any) -> Tuple[Optional[int], Optional[str]]:
+        """
+        Obtém os bytes recebidos e a versão do protocolo negociada
+        
+        Args:
+            http_response (Any): Resposta do requests ou do transporte HTTP/2
             
-            # Criar uma resposta vazia
-            response = Response(
-                status_code=0,
-                headers={},
-                content=b"",
-                elapsed_time=elapsed_time
-            )
+        Returns:
+            Tuple[Optional[int], Optional[str]]: Bytes recebidos antes da descompressão
+            e versão do protocolo (ex: "HTTP/1.1" ou "HTTP/2")
+        """
+        if hasattr(http_response, "http_version"):
+            return http_response.wire_size, http_response.http_version
+        
+        raw = getattr(http_response, "raw", None)
+        try:
+            wire_size = raw.tell()
+        except (AttributeError, ValueError):
+            wire_size = None
+        
+        return wire_size, _HTTP_VERSIONS.get(getattr(raw, "version", None))
+    
+    @staticmethod
+    def _response_from_cache(
+        entry: CacheEntry,
+        cache_status: str,
+        elapsed_time: float,
+        timer: PhaseTimer,
+        spill_threshold: int
+    ) -> Response:
+        """Cria uma resposta a partir de uma entrada do cache"""
+        if entry.size > spill_threshold:
+            # Corpos grandes são lidos diretamente do arquivo do cache
+            content, body_path = b"", str(entry.body_path)
+        else:
+            content, body_path = entry.read_content(), None
+        
+        response = Response(
+            status_code=entry.status_code,
+            headers=dict(entry.headers),
+            content=content,
+            elapsed_time=elapsed_time,
+            body_path=body_path,
+            owns_body_file=False,
+            timings=timer.to_timings(elapsed_time)
+        )
+        response.cache_status = cache_status
+        return response
+    
+    @staticmethod
+    def _encode_body(processed_request: Request) -> Tuple[Optional[Union[bytes, FileBody, MultipartEncoder]], Optional[str]]:
+        """
+        Converte o corpo em bytes conforme o modo da requisição, sem reinterpretar
+        textos: o que foi escrito é exatamente o que é enviado
+        
+        Arquivos (modo binário e partes de formulários multipart) não são carregados
+        em memória: o corpo retornado os lê do disco em blocos durante o envio.
+        
+        Args:
+            processed_request (Request): A requisição com as variáveis já substituídas
             
-            error_message = f"Erro inesperado: {str(e)}"
+        Returns:
+            Tuple[Optional[Union[bytes, FileBody, MultipartEncoder]], Optional[str]]: Corpo
+            codificado e Content-Type sugerido (usado apenas se a requisição não definir o seu,
+            exceto no multipart, que precisa do delimitador)
+        """
+        body = processed_request.body
+        mode = processed_request.body_mode
+        
+        if body is None or body == "" or mode == BodyMode.NONE:
+            return None, None
+        
+        if mode == BodyMode.BINARY:
+            if isinstance(body, (bytes, bytearray)):
+                return bytes(body), "application/octet-stream"
+            return FileBody(body), "application/octet-stream"
+        
+        if mode == BodyMode.MULTIPART and isinstance(body, dict):
+            encoder = MultipartEncoder(body)
+            return encoder, encoder.content_type
+        
+        if mode == BodyMode.FORM:
+            if isinstance(body, dict):
+                return urlencode(body, doseq=True).encode("utf-8"), "application/x-www-form-urlencoded"
+            return HttpClient._to_bytes(body), "application/x-www-form-urlencoded"
+        
+        if isinstance(body, (dict, list)):
+            # Objetos são serializados uma única vez (o resultado fica no cache de preparo)
+            return json_lib.dumps(body).encode("utf-8"), "application/json"
+        
+        content_type = None
+        if mode == BodyMode.JSON:
+            content_type = "application/json"
+        elif mode is None and isinstance(body, str) and body.lstrip()[:1] in ("{", "["):
+            # Requisições antigas, sem modo: textos com cara de JSON mantêm o Content-Type,
+            # mas são enviados como foram escritos
+            content_type = "application/json"
+        
+        return HttpClient._to_bytes(body), content_type
+    
+    @staticmethod
+    def _to_bytes(body: Any) -> bytes:
+        """Converte textos em UTF-8, mantendo bytes como estão"""
+        if isinstance(body, (bytes, bytearray)):
+            return bytes(body)
+        return str(body).encode("utf-8")
+    
+    @staticmethod
+    def _compress_body(
+        processed_request: Request,
+        body: Optional[Union[bytes, FileBody, MultipartEncoder]],
+        headers: Dict[str, str]
+    ) -> Tuple[Optional[Union[bytes, FileBody, MultipartEncoder, CompressedStream]], Dict[str, str]]:
+        """
+        Comprime o corpo quando a requisição define body_encoding
+        
+        Args:
+            processed_request (Request): A requisição com as variáveis já substituídas
+            body (Optional[Union[bytes, FileBody, MultipartEncoder]]): Corpo codificado
+            headers (Dict[str, str]): Cabeçalhos da requisição
             
-            return response, error_message
+        Returns:
+            Tuple[Optional[Union[bytes, FileBody, MultipartEncoder, CompressedStream]], Dict[str, str]]:
+            Corpo comprimido (arquivos são comprimidos em blocos durante o envio) e
+            cabeçalhos atualizados
+        """
+        encoding = processed_request.body_encoding
+        if not encoding or body is None or isinstance(body, MultipartEncoder):
+            # Formulários multipart não são comprimidos (os servidores raramente aceitam)
+            return body, headers
+        
+        headers = {key: value for key, value in headers.items() if key.lower() != "content-encoding"}
+        headers["Content-Encoding"] = encoding
+        
+        if isinstance(body, FileBody):
+            # O arquivo continua sendo lido do disco em blocos
+            return CompressedStream(body, encoding), headers
+        return compress(body, encoding), headers
     
     @staticmethod
     def _process_request_variables(request: Request, variables: Dict[str, str]) -> Request:
@@ -137,7 +884,12 @@ class HttpClient:
             headers=request.headers.copy() if request.headers else {},
             params=request.params.copy() if request.params else {},
             body=request.body,
-            description=request.description
+            description=request.description,
+            body_encoding=request.body_encoding,
+            body_mode=request.body_mode,
+            retry_policy=request.retry_policy,
+            hedge_policy=request.hedge_policy,
+            timeouts=request.timeouts
         )
         processed_request.id = request.id
         processed_request.created_at = request.created_at
@@ -0,0 +1,188 @@
+"""
+Histograma de latências com precisão relativa fixa (no estilo HDR Histogram)
+"""
+
+import math
+import threading
+from typing import Dict, List, Any, Optional
+
+
+class LatencyHistogram:
+    """
+    Registra latências em baldes log-lineares, mantendo erro relativo
+    limitado pela quantidade de dígitos significativos, com memória
+    proporcional ao número de faixas de valores usadas (e não ao número de amostras)
+
+    Os valores são armazenados internamente em microssegundos.
+    """
+    # Percentis reportados no resumo
+    SUMMARY_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+    def __init__(self, significant_digits: int = 3):
+        """
+        Args:
+            significant_digits (int): Dígitos significativos preservados (1 a 5)
+        """
+        if not 1 <= significant_digits <= 5:
+            raise ValueError("significant_digits deve estar entre 1 e 5")
+
+        self.significant_digits = significant_digits
+        # Quantidade de sub-baldes lineares por potência de 2
+        self._sub_bucket_bits = math.ceil(math.log2(2 * 10 ** significant_digits))
+        self._sub_bucket_count = 1 << self._sub_bucket_bits
+        self._sub_bucket_half = self._sub_bucket_count // 2
+
+        self._counts: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.count = 0
+        self._total = 0
+        self._min: Optional[int] = None
+        self._max: Optional[int] = None
+
+    def _index_for(self, value: int) -> int:
+        """Calcula o balde de um valor em microssegundos"""
+        if value < self._sub_bucket_count:
+            return value
+        shift = value.bit_length() - self._sub_bucket_bits
+        return self._sub_bucket_count + (shift - 1) * self._sub_bucket_half + ((value >> shift) - self._sub_bucket_half)
+
+    def _highest_value_for(self, index: int) -> int:
+        """Maior valor, em microssegundos, equivalente ao balde"""
+        if index < self._sub_bucket_count:
+            return index
+        offset = index - self._sub_bucket_count
+        shift = offset // self._sub_bucket_half + 1
+        sub_bucket = offset % self._sub_bucket_half + self._sub_bucket_half
+        return ((sub_bucket + 1) << shift) - 1
+
+    def record(self, seconds: float, count: int = 1) -> None:
+        """
+        Registra uma latência
+
+        Args:
+            seconds (float): Latência em segundos
+            count (int): Quantidade de amostras com essa latência
+        """
+        value = max(int(round(seconds * 1_000_000)), 0)
+        index = self._index_for(value)
+
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + count
+            self.count += count
+            self._total += value * count
+            if self._min is None or value < self._min:
+                self._min = value
+            if self._max is None or value > self._max:
+                self._max = value
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """Acrescenta as amostras de outro histograma com a mesma precisão"""
+        if other.significant_digits != self.significant_digits:
+            raise ValueError("Os histogramas devem ter a mesma quantidade de dígitos significativos")
+
+        with other._lock:
+            counts = dict(other._counts)
+            count, total, minimum, maximum = other.count, other._total, other._min, other._max
+
+        with self._lock:
+            for index, bucket_count in counts.items():
+                self._counts[index] = self._counts.get(index, 0) + bucket_count
+            self.count += count
+            self._total += total
+            if minimum is not None and (self._min is None or minimum < self._min):
+                self._min = minimum
+            if maximum is not None and (self._max is None or maximum > self._max):
+                self._max = maximum
+
+    def reset(self) -> None:
+        """Descarta todas as amostras"""
+        with self._lock:
+            self._counts.clear()
+            self.count = 0
+            self._total = 0
+            self._min = None
+            self._max = None
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Retorna a latência, em segundos, abaixo da qual está o percentual de amostras
+
+        Args:
+            percentile (float): Percentil entre 0 e 100
+
+        Returns:
+            float: Latência em segundos (0.0 se não houver amostras)
+        """
+        with self._lock:
+            if not self.count:
+                return 0.0
+
+            target = max(1, math.ceil(self.count * min(max(percentile, 0.0), 100.0) / 100.0))
+            seen = 0
+            for index in sorted(self._counts):
+                seen += self._counts[index]
+                if seen >= target:
+                    return min(self._highest_value_for(index), self._max) / 1_000_000
+
+            return self._max / 1_000_000
+
+    def cumulative_counts(self, bounds: List[float]) -> List[int]:
+        """
+        Conta as amostras menores ou iguais a cada limite (ex: baldes de um histograma do Prometheus)
+
+        Args:
+            bounds (List[float]): Limites em segundos, em ordem crescente
+
+        Returns:
+            List[int]: Quantidade acumulada de amostras até cada limite, com a precisão do histograma
+        """
+        with self._lock:
+            buckets = sorted(self._counts.items())
+
+        counts = []
+        seen = 0
+        position = 0
+        for bound in bounds:
+            limit = int(round(bound * 1_000_000))
+            while position < len(buckets) and self._highest_value_for(buckets[position][0]) <= limit:
+                seen += buckets[position][1]
+                position += 1
+            counts.append(seen)
+        return counts
+
+    @property
+    def total(self) -> float:
+        """Soma das latências registradas, em segundos"""
+        return self._total / 1_000_000
+
+    @property
+    def min(self) -> float:
+        """Menor latência registrada, em segundos"""
+        return (self._min or 0) / 1_000_000
+
+    @property
+    def max(self) -> float:
+        """Maior latência registrada, em segundos"""
+        return (self._max or 0) / 1_000_000
+
+    @property
+    def mean(self) -> float:
+        """Latência média, em segundos"""
+        return self._total / self.count / 1_000_000 if self.count else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Resume a distribuição
+
+        Returns:
+            Dict[str, Any]: Contagem, mínimo, média, máximo e percentis (p50, p90, p99, p99.9), em segundos
+        """
+        result = {
+            "count": self.count,
+            "min": self.min,
+            "mean": self.mean,
+            "max": self.max,
+        }
+        for percentile in self.SUMMARY_PERCENTILES:
+            result[f"p{percentile:g}"] = self.percentile(percentile)
+        return result
@@ -0,0 +1,275 @@
+"""
+Geração de carga com taxa alvo de requisições por segundo e estágios de rampa
+"""
+
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Callable, Iterator, Tuple
+
+from src.models.request import Request, Response
+from src.models.collection import Folder
+from src.core.http_client import HttpClient
+from src.core.latency_histogram import LatencyHistogram
+from src.core.storage import Storage
+
+
+# Função usada para enviar cada requisição (mesmo contrato de HttpClient.send_request)
+SendFunction = Callable[[Request, Dict[str, str]], Tuple[Response, Optional[str]]]
+
+
+class LoadStage:
+    """
+    Estágio de um teste de carga
+
+    Com ramp=True a taxa varia linearmente da taxa final do estágio anterior
+    (0 no primeiro estágio) até target_rps; caso contrário permanece constante.
+    """
+    def __init__(self, duration: float, target_rps: float, ramp: bool = False):
+        if duration <= 0:
+            raise ValueError("A duração do estágio deve ser positiva")
+        if target_rps < 0:
+            raise ValueError("A taxa alvo não pode ser negativa")
+
+        self.duration = duration
+        self.target_rps = target_rps
+        self.ramp = ramp
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte o objeto para um dicionário"""
+        return {
+            "duration": self.duration,
+            "target_rps": self.target_rps,
+            "ramp": self.ramp,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LoadStage':
+        """Cria um objeto a partir de um dicionário"""
+        return cls(
+            duration=data["duration"],
+            target_rps=data["target_rps"],
+            ramp=data.get("ramp", False)
+        )
+
+
+class LoadTestResult:
+    """
+    Resultado agregado de um teste de carga
+    """
+    def __init__(self, significant_digits: int = 3):
+        self.histogram = LatencyHistogram(significant_digits)
+        self.total = 0
+        self.failures = 0
+        self.transport_errors = 0
+        self.dropped = 0
+        self.status_counts: Dict[int, int] = {}
+        self.duration = 0.0
+        self._lock = threading.Lock()
+
+    def add_sample(self, latency: float, response: Optional[Response], error: Optional[str]) -> None:
+        """Registra o resultado de um envio"""
+        self.histogram.record(latency)
+
+        status_code = response.status_code if response else 0
+        with self._lock:
+            self.total += 1
+            self.status_counts[status_code] = self.status_counts.get(status_code, 0) + 1
+            if error:
+                self.transport_errors += 1
+            if error or status_code == 0 or status_code >= 400:
+                self.failures += 1
+
+    @property
+    def throughput(self) -> float:
+        """Requisições concluídas por segundo"""
+        return self.total / self.duration if self.duration else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        """Fração das requisições com erro de transporte ou status >= 400"""
+        return self.failures / self.total if self.total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte o resultado para um dicionário"""
+        return {
+            "total": self.total,
+            "failures": self.failures,
+            "transport_errors": self.transport_errors,
+            "dropped": self.dropped,
+            "duration": self.duration,
+            "throughput": self.throughput,
+            "error_rate": self.error_rate,
+            "status_counts": {str(code): count for code, count in sorted(self.status_counts.items())},
+            "latency": self.histogram.summary(),
+        }
+
+
+class LoadTester:
+    """
+    Dispara requisições salvas em uma taxa alvo por um período,
+    seguindo os estágios configurados
+
+    O agendamento é de modelo aberto: cada envio tem um horário previsto e a
+    latência é medida a partir dele, de forma que atrasos causados pela
+    saturação dos workers aparecem nos percentis em vez de serem omitidos.
+    """
+    def __init__(
+        self,
+        requests: List[Request],
+        stages: List[LoadStage],
+        variables: Optional[Dict[str, str]] = None,
+        max_workers: int = 64,
+        max_queue: Optional[int] = None,
+        send_function: Optional[SendFunction] = None
+    ):
+        """
+        Args:
+            requests (List[Request]): Requisições enviadas em rodízio
+            stages (List[LoadStage]): Estágios do teste, executados em ordem
+            variables (Optional[Dict[str, str]]): Variáveis para substituição
+            max_workers (int): Máximo de requisições em andamento ao mesmo tempo
+            max_queue (Optional[int]): Máximo de envios atrasados aguardando um worker;
+                os excedentes são descartados e contados em `dropped` (padrão: 10x max_workers)
+            send_function (Optional[SendFunction]): Função de envio; por padrão HttpClient.send_request
+        """
+        if not requests:
+            raise ValueError("É necessário ao menos uma requisição")
+        if not stages:
+            raise ValueError("É necessário ao menos um estágio")
+
+        self.requests = requests
+        self.stages = stages
+        self.variables = variables or {}
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max_queue if max_queue is not None else self.max_workers * 10
+        self.send_function = send_function or HttpClient.send_request
+        self._stop_event = threading.Event()
+
+    @classmethod
+    def from_folder(cls, storage: Storage, folder: Folder, stages: List[LoadStage], **kwargs) -> 'LoadTester':
+        """
+        Cria um teste de carga com as requisições de uma pasta (incluindo subpastas)
+
+        Args:
+            storage (Storage): Armazenamento de onde as requisições são carregadas
+            folder (Folder): Pasta de origem
+            stages (List[LoadStage]): Estágios do teste
+
+        Returns:
+            LoadTester: O teste configurado
+        """
+        requests = []
+        pending = [folder]
+        while pending:
+            current = pending.pop(0)
+            for request_id in current.requests:
+                request = storage.get_request(request_id)
+                if request is not None:
+                    requests.append(request)
+            pending.extend(current.subfolders)
+
+        return cls(requests, stages, **kwargs)
+
+    def stop(self) -> None:
+        """Interrompe o teste; os envios em andamento são concluídos"""
+        self._stop_event.set()
+
+    @property
+    def total_duration(self) -> float:
+        """Duração total planejada, em segundos"""
+        return sum(stage.duration for stage in self.stages)
+
+    def _schedule(self) -> Iterator[float]:
+        """Gera os instantes previstos de envio, em segundos a partir do início"""
+        stage_start = 0.0
+        previous_rps = 0.0
+
+        for stage in self.stages:
+            start_rps = previous_rps if stage.ramp else stage.target_rps
+            slope = (stage.target_rps - start_rps) / stage.duration
+
+            # Com taxa r(t) = a + b*t, o k-ésimo envio ocorre quando a*t + b*t²/2 = k
+            k = 0 if start_rps > 0 else 1
+            while True:
+                if slope == 0:
+                    if start_rps <= 0:
+                        break
+                    offset = k / start_rps
+                else:
+                    discriminant = start_rps * start_rps + 2 * slope * k
+                    if discriminant < 0:
+                        break
+                    offset = (math.sqrt(discriminant) - start_rps) / slope
+
+                if offset >= stage.duration:
+                    break
+
+                yield stage_start + offset
+                k += 1
+
+            stage_start += stage.duration
+            previous_rps = stage.target_rps
+
+    def run(self, on_progress: Optional[Callable[[LoadTestResult], None]] = None, progress_interval: float = 1.0) -> LoadTestResult:
+        """
+        Executa o teste de carga
+
+        Args:
+            on_progress (Optional[Callable[[LoadTestResult], None]]): Chamado periodicamente com o resultado parcial
+            progress_interval (float): Intervalo, em segundos, entre chamadas de on_progress
+
+        Returns:
+            LoadTestResult: Latências, vazão e taxa de erro
+        """
+        self._stop_event.clear()
+        result = LoadTestResult()
+        pending = threading.Semaphore(self.max_workers + self.max_queue)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="load-tester")
+
+        def fire(request: Request, scheduled_at: float) -> None:
+            try:
+                response, error = self.send_function(request, self.variables)
+                result.add_sample(time.perf_counter() - scheduled_at, response, error)
+            except Exception as e:
+                result.add_sample(time.perf_counter() - scheduled_at, None, str(e))
+            finally:
+                pending.release()
+
+        start = time.perf_counter()
+        next_progress = start + progress_interval
+        sent = 0
+
+        try:
+            for offset in self._schedule():
+                if self._stop_event.is_set():
+                    break
+
+                scheduled_at = start + offset
+                delay = scheduled_at - time.perf_counter()
+                if delay > 0:
+                    if self._stop_event.wait(delay):
+                        break
+
+                if not pending.acquire(blocking=False):
+                    # Fila cheia: o alvo não é sustentável com os workers disponíveis
+                    result.dropped += 1
+                    continue
+
+                request = self.requests[sent % len(self.requests)]
+                sent += 1
+                executor.submit(fire, request, scheduled_at)
+
+                if on_progress and time.perf_counter() >= next_progress:
+                    result.duration = time.perf_counter() - start
+                    on_progress(result)
+                    next_progress += progress_interval
+        finally:
+            executor.shutdown(wait=True)
+            result.duration = time.perf_counter() - start
+
+        if on_progress:
+            on_progress(result)
+
+        return result
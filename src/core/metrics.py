@@ -0,0 +1,333 @@
+"""
+Métricas agregadas dos envios (contadores e histogramas de latência) exportadas
+no formato de texto OpenMetrics/Prometheus
+"""
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+from src.core.hooks import HookEvent, BEFORE_RESOLVE, AFTER_RESPONSE, ON_ERROR
+from src.core.http_client import HttpClient
+from src.core.latency_histogram import LatencyHistogram
+
+
+# Limites, em segundos, dos baldes dos histogramas exportados
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Content-Type do formato de texto OpenMetrics
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Fases de ResponseTimings somadas em request_phase_seconds
+_PHASES = ("dns", "connect", "tls", "send", "ttfb", "download")
+
+
+def _escape(value: str) -> str:
+    """Escapa o valor de um rótulo"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def error_kind(message: str) -> str:
+    """
+    Classifica uma mensagem de erro do HttpClient para o rótulo `kind` (cardinalidade fixa)
+
+    Args:
+        message (str): Mensagem de erro retornada pelo envio
+
+    Returns:
+        str: "deadline", "cancelled", "timeout", "transport" ou "other"
+    """
+    lowered = message.lower()
+    if "tempo total esgotado" in lowered:
+        return "deadline"
+    if "cancelada" in lowered:
+        return "cancelled"
+    if "timeout" in lowered or "timed out" in lowered:
+        return "timeout"
+    if lowered.startswith("erro ao realizar requisição"):
+        return "transport"
+    return "other"
+
+
+class MetricsSink:
+    """
+    Agrega os resultados dos envios do HttpClient recebidos pelos ganchos
+
+    Contadores de respostas (por método, host e status), de erros (por tipo),
+    de novas tentativas e de bytes recebidos, histogramas de latência por
+    método e host e o número de envios em andamento.
+    """
+    def __init__(self, prefix: str = "pyrequestman", buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Args:
+            prefix (str): Prefixo dos nomes das métricas
+            buckets (Tuple[float, ...]): Limites dos baldes dos histogramas, em segundos
+        """
+        self.prefix = prefix
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._responses: Dict[Tuple[str, str, str], int] = {}
+        self._errors: Dict[Tuple[str, str, str], int] = {}
+        self._retries: Dict[Tuple[str, str], int] = {}
+        self._bytes: Dict[Tuple[str, str], int] = {}
+        self._rate_limit_wait: Dict[Tuple[str], float] = {}
+        self._phases: Dict[Tuple[str], float] = {}
+        self._durations: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._in_flight = 0
+        self._handles: List[int] = []
+
+    def install(self) -> 'MetricsSink':
+        """Registra os ganchos no HttpClient"""
+        if not self._handles:
+            self._handles = [
+                HttpClient.add_hook(BEFORE_RESOLVE, self._on_start),
+                HttpClient.add_hook(AFTER_RESPONSE, self.record),
+                HttpClient.add_hook(ON_ERROR, self.record),
+            ]
+        return self
+
+    def uninstall(self) -> None:
+        """Remove os ganchos registrados por install"""
+        for handle in self._handles:
+            HttpClient.remove_hook(handle)
+        self._handles = []
+
+    def _on_start(self, event: HookEvent) -> None:
+        with self._lock:
+            self._in_flight += 1
+
+    def record(self, event: HookEvent) -> None:
+        """
+        Registra o fim de um envio
+
+        Args:
+            event (HookEvent): Evento AFTER_RESPONSE ou ON_ERROR
+        """
+        method = event.method
+        host = event.host
+        response = event.response
+
+        with self._lock:
+            if self._handles:
+                self._in_flight = max(0, self._in_flight - 1)
+
+            if event.error:
+                key = (method, host, error_kind(event.error))
+                self._errors[key] = self._errors.get(key, 0) + 1
+            elif response is not None:
+                key = (method, host, str(response.status_code))
+                self._responses[key] = self._responses.get(key, 0) + 1
+
+                size = response.wire_size if response.wire_size is not None else response.size
+                self._bytes[(method, host)] = self._bytes.get((method, host), 0) + size
+
+                histogram = self._durations.get((method, host))
+                if histogram is None:
+                    histogram = LatencyHistogram()
+                    self._durations[(method, host)] = histogram
+                histogram.record(response.elapsed_time)
+
+                timings = response.timings
+                for phase in _PHASES:
+                    self._phases[(phase,)] = self._phases.get((phase,), 0.0) + getattr(timings, phase)
+
+            if response is not None:
+                if response.attempts > 1:
+                    self._retries[(method, host)] = self._retries.get((method, host), 0) + response.attempts - 1
+                if response.rate_limit_wait > 0:
+                    self._rate_limit_wait[(host,)] = self._rate_limit_wait.get((host,), 0.0) + response.rate_limit_wait
+
+    def reset(self) -> None:
+        """Descarta os valores agregados (o contador de envios em andamento é mantido)"""
+        with self._lock:
+            for values in (self._responses, self._errors, self._retries, self._bytes,
+                           self._rate_limit_wait, self._phases, self._durations):
+                values.clear()
+
+    def render(self) -> str:
+        """
+        Gera o texto no formato OpenMetrics
+
+        Returns:
+            str: Métricas, terminadas por "# EOF"
+        """
+        lines: List[str] = []
+        prefix = self.prefix
+
+        with self._lock:
+            counters = [
+                ("requests", "Respostas recebidas", ("method", "host", "code"), dict(self._responses)),
+                ("request_errors", "Envios sem resposta", ("method", "host", "kind"), dict(self._errors)),
+                ("request_retries", "Novas tentativas realizadas", ("method", "host"), dict(self._retries)),
+                ("response_bytes", "Bytes de corpo recebidos", ("method", "host"), dict(self._bytes)),
+                ("rate_limit_wait_seconds", "Tempo aguardado no limitador de taxa", ("host",),
+                 dict(self._rate_limit_wait)),
+                ("request_phase_seconds", "Tempo gasto em cada fase dos envios", ("phase",), dict(self._phases)),
+            ]
+            durations = {
+                key: (histogram.cumulative_counts(list(self.buckets)), histogram.count, histogram.total)
+                for key, histogram in self._durations.items()
+            }
+            in_flight = self._in_flight
+
+        for name, help_text, label_names, values in counters:
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            for label_values, value in sorted(values.items()):
+                lines.append(f"{prefix}_{name}_total{_labels(label_names, label_values)} {_format_number(value)}")
+
+        name = f"{prefix}_request_duration_seconds"
+        lines.append(f"# TYPE {name} histogram")
+        lines.append(f"# HELP {name} Latência das respostas (por tentativa, sem a espera do limitador)")
+        label_names = ("method", "host")
+        for label_values, (bucket_counts, count, total) in sorted(durations.items()):
+            for bound, bucket_count in zip(self.buckets, bucket_counts):
+                le = f'le="{float(bound)!r}"'
+                lines.append(f"{name}_bucket{_labels(label_names, label_values, le)} {bucket_count}")
+            inf = 'le="+Inf"'
+            lines.append(f"{name}_bucket{_labels(label_names, label_values, inf)} {count}")
+            lines.append(f"{name}_count{_labels(label_names, label_values)} {count}")
+            lines.append(f"{name}_sum{_labels(label_names, label_values)} {_format_number(total)}")
+
+        lines.append(f"# TYPE {prefix}_requests_in_flight gauge")
+        lines.append(f"# HELP {prefix}_requests_in_flight Envios em andamento")
+        lines.append(f"{prefix}_requests_in_flight {in_flight}")
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str) -> None:
+        """
+        Grava as métricas em um arquivo, substituindo-o de forma atômica (ex: para o
+        coletor textfile do node_exporter)
+
+        Args:
+            path (str): Arquivo de destino
+        """
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(temp_path, path)
+
+
+class MetricsFileExporter:
+    """
+    Grava as métricas em um arquivo periodicamente, em uma thread própria
+    """
+    def __init__(self, sink: MetricsSink, path: str, interval: float = 15.0):
+        """
+        Args:
+            sink (MetricsSink): Métricas exportadas
+            path (str): Arquivo de destino
+            interval (float): Segundos entre gravações
+        """
+        self.sink = sink
+        self.path = path
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Inicia as gravações periódicas"""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="metrics-file-exporter", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.sink.write(self.path)
+            except OSError as e:
+                print(f"Erro ao gravar métricas: {str(e)}")
+
+    def stop(self) -> None:
+        """Interrompe as gravações, gravando uma última vez"""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self.sink.write(self.path)
+
+
+class MetricsServer:
+    """
+    Endpoint HTTP local (GET /metrics) consultado pelo Prometheus
+    """
+    def __init__(self, sink: MetricsSink, host: str = "127.0.0.1", port: int = 9464):
+        """
+        Args:
+            sink (MetricsSink): Métricas exportadas
+            host (str): Endereço em que o servidor escuta
+            port (int): Porta (0 escolhe uma livre)
+        """
+        self.sink = sink
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Endereço do endpoint"""
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def start(self) -> str:
+        """
+        Inicia o servidor em uma thread própria
+
+        Returns:
+            str: Endereço do endpoint
+        """
+        if self._server is not None:
+            return self.url
+
+        sink = self.sink
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = sink.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-server", daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self) -> None:
+        """Encerra o servidor"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
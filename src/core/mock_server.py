@@ -0,0 +1,476 @@
+"""
+Servidor local que responde às requisições salvas de uma coleção com respostas simuladas
+"""
+
+import asyncio
+import re
+import threading
+from http import HTTPStatus
+from typing import Dict, List, Optional, Any, Tuple, Union
+from urllib.parse import urlsplit
+
+from src import __version__
+from src.models.request import Request
+from src.models.collection import Collection, Folder
+from src.models.mock_response import MockResponse
+from src.core.variable_processor import VariableProcessor
+from src.core.storage import Storage
+
+try:
+    import uvloop
+except ImportError:  # Dependência opcional
+    uvloop = None
+
+
+# Tamanho máximo da linha de requisição e dos cabeçalhos
+MAX_HEAD_SIZE = 64 * 1024
+
+# Segmentos de caminho que aceitam qualquer valor: {{variavel}}, :parametro ou {parametro}
+_SEGMENT_PARAMETER = re.compile(r"^(?:\{\{[^{}]+\}\}|:\w+|\{\w+\})$")
+_LEADING_VARIABLE = re.compile(r"^\{\{[^{}]+\}\}")
+_CONTENT_LENGTH = re.compile(rb"(?:^|\r\n)content-length:[ \t]*(\d+)")
+_TRANSFER_CHUNKED = re.compile(rb"(?:^|\r\n)transfer-encoding:[^\r\n]*chunked")
+
+_REASONS = {status.value: status.phrase for status in HTTPStatus}
+
+
+def path_template(url: str, variables: Optional[Dict[str, str]] = None) -> str:
+    """
+    Extrai o caminho de uma URL salva, mantendo as variáveis não substituídas como parâmetros
+
+    Args:
+        url (str): URL da requisição (ex: "{{base_url}}/users/{{id}}?x=1")
+        variables (Optional[Dict[str, str]]): Variáveis substituídas antes da extração
+
+    Returns:
+        str: Caminho normalizado (ex: "/users/{{id}}")
+    """
+    if variables:
+        url = VariableProcessor.process_string(url, variables)
+    # Um prefixo variável não substituído ({{base_url}}) representa o esquema e o host
+    url = _LEADING_VARIABLE.sub("", url.strip())
+
+    if "://" in url:
+        path = urlsplit(url).path
+    else:
+        path = url.split("?", 1)[0].split("#", 1)[0]
+        if not path.startswith("/"):
+            # "host/caminho" sem esquema
+            path = "/" + path.partition("/")[2]
+    return _normalize_path(path)
+
+
+def _normalize_path(path: str) -> str:
+    """Padroniza as barras das pontas do caminho ("users/" -> "/users")"""
+    return "/" + path.strip("/")
+
+
+class MockRoute:
+    """
+    Rota do servidor de mocks: método, caminho (com parâmetros) e a resposta já serializada
+    """
+    def __init__(self, method: str, path: str, response: Optional[MockResponse] = None, name: str = ""):
+        """
+        Args:
+            method (str): Método HTTP
+            path (str): Caminho; segmentos {{variavel}}, :parametro ou {parametro} aceitam qualquer valor
+            response (Optional[MockResponse]): Resposta servida (padrão: 200 sem corpo)
+            name (str): Nome da requisição de origem
+        """
+        self.method = method.upper()
+        self.path = _normalize_path(path)
+        self.name = name
+        self.response = response or MockResponse()
+        self.delay = self.response.delay
+
+        segments = self.path.split("/")
+        self.is_template = any(_SEGMENT_PARAMETER.match(segment) for segment in segments)
+        self.pattern = None
+        if self.is_template:
+            self.pattern = re.compile("^" + "/".join(
+                "[^/]+" if _SEGMENT_PARAMETER.match(segment) else re.escape(segment)
+                for segment in segments
+            ) + "$")
+
+        # Respostas serializadas uma única vez: cada envio é uma única escrita no socket
+        self.head, self.body = _encode_response(self.response)
+        self.payload = self.head + b"\r\n" + self.body
+
+    @classmethod
+    def from_request(cls, request: Request, variables: Optional[Dict[str, str]] = None) -> 'MockRoute':
+        """Cria a rota de uma requisição salva"""
+        return cls(request.method, path_template(request.url, variables), request.mock_response, request.name)
+
+    def matches(self, path: str) -> bool:
+        """Verifica se o caminho corresponde à rota"""
+        if self.pattern is not None:
+            return self.pattern.match(path) is not None
+        return path == self.path
+
+
+def _encode_response(response: MockResponse) -> Tuple[bytes, bytes]:
+    """Serializa a linha de status e os cabeçalhos (sem a linha em branco final) e o corpo"""
+    body, content_type = response.encode_body()
+    reason = _REASONS.get(response.status_code, "")
+
+    lines = [f"HTTP/1.1 {response.status_code} {reason}"]
+    lowered = {key.lower() for key in response.headers}
+    for key, value in response.headers.items():
+        if key.lower() in ("content-length", "transfer-encoding", "connection"):
+            continue
+        lines.append(f"{key}: {value}")
+    if content_type and "content-type" not in lowered:
+        lines.append(f"Content-Type: {content_type}")
+    if "server" not in lowered:
+        lines.append(f"Server: PyRequestMan-mock/{__version__}")
+    lines.append(f"Content-Length: {len(body)}")
+
+    return ("\r\n".join(lines) + "\r\n").encode("latin-1"), body
+
+
+class MockRouter:
+    """
+    Localiza a rota de uma requisição: caminhos fixos por dicionário e,
+    em seguida, os caminhos com parâmetros na ordem em que foram definidos
+    """
+    def __init__(self, routes: List[MockRoute]):
+        self.routes = routes
+        self._exact: Dict[Tuple[str, str], MockRoute] = {}
+        self._templates: List[MockRoute] = []
+        for route in routes:
+            if route.is_template:
+                self._templates.append(route)
+            else:
+                # A primeira requisição salva com o mesmo método e caminho prevalece
+                self._exact.setdefault((route.method, route.path), route)
+
+    def match(self, method: str, path: str) -> Optional[MockRoute]:
+        """
+        Args:
+            method (str): Método HTTP
+            path (str): Caminho requisitado (sem a query string)
+
+        Returns:
+            Optional[MockRoute]: A rota correspondente (HEAD usa as rotas GET), ou None
+        """
+        if len(path) > 1 and path.endswith("/"):
+            path = path.rstrip("/") or "/"
+
+        route = self._exact.get((method, path))
+        if route is not None:
+            return route
+        for route in self._templates:
+            if route.method == method and route.pattern.match(path):
+                return route
+        if method == "HEAD":
+            return self.match("GET", path)
+        return None
+
+
+_NOT_FOUND = MockRoute("GET", "/", MockResponse(404, body={"error": "Nenhuma requisição salva para este método e caminho"}))
+_BAD_REQUEST = MockRoute("GET", "/", MockResponse(400, body={"error": "Requisição inválida"}))
+_HEAD_TOO_LARGE = MockRoute("GET", "/", MockResponse(431, body={"error": "Cabeçalhos muito grandes"}))
+
+
+def _chunked_end(buffer: bytearray, start: int) -> Optional[int]:
+    """Retorna a posição seguinte ao fim de um corpo em chunks (None se ainda incompleto)"""
+    position = start
+    while True:
+        line_end = buffer.find(b"\r\n", position)
+        if line_end < 0:
+            return None
+        size = int(bytes(buffer[position:line_end]).split(b";", 1)[0].strip() or b"0", 16)
+        position = line_end + 2
+        if size == 0:
+            # Sem trailers: linha em branco logo após o último chunk
+            if buffer[position:position + 2] == b"\r\n":
+                return position + 2
+            trailers_end = buffer.find(b"\r\n\r\n", position)
+            return trailers_end + 4 if trailers_end >= 0 else None
+        position += size + 2
+        if position > len(buffer):
+            return None
+
+
+class _MockProtocol(asyncio.Protocol):
+    """Conexão com um cliente; aceita requisições em sequência (keep-alive e pipelining)"""
+    def __init__(self, server: 'MockServer'):
+        self.server = server
+        self.transport: Optional[asyncio.Transport] = None
+        self.buffer = bytearray()
+        # Resposta com atraso pendente: as seguintes aguardam para manter a ordem
+        self.waiting = False
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport
+        self.server._connections.add(self)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.server._connections.discard(self)
+        self.transport = None
+
+    def data_received(self, data: bytes) -> None:
+        self.buffer += data
+        if not self.waiting:
+            self._process()
+
+    def _process(self) -> None:
+        buffer = self.buffer
+        while buffer and self.transport is not None:
+            head_end = buffer.find(b"\r\n\r\n")
+            if head_end < 0:
+                if len(buffer) > MAX_HEAD_SIZE:
+                    self._respond(_HEAD_TOO_LARGE.payload, False)
+                return
+
+            head = bytes(buffer[:head_end])
+            line_end = head.find(b"\r\n")
+            request_line = head if line_end < 0 else head[:line_end]
+            header_block = b"" if line_end < 0 else head[line_end + 2:].lower()
+
+            parts = request_line.split(b" ")
+            if len(parts) != 3:
+                self._respond(_BAD_REQUEST.payload, False)
+                return
+            method, target, version = parts
+
+            body_start = head_end + 4
+            if _TRANSFER_CHUNKED.search(header_block):
+                try:
+                    request_end = _chunked_end(buffer, body_start)
+                except ValueError:
+                    self._respond(_BAD_REQUEST.payload, False)
+                    return
+                if request_end is None:
+                    return
+            else:
+                length = _CONTENT_LENGTH.search(header_block)
+                request_end = body_start + (int(length.group(1)) if length else 0)
+                if len(buffer) < request_end:
+                    return
+            del buffer[:request_end]
+
+            if version == b"HTTP/1.1":
+                keep_alive = b"connection: close" not in header_block
+            else:
+                keep_alive = b"connection: keep-alive" in header_block
+
+            route = self.server.router.match(method.decode("latin-1"), self._path(target))
+            self.server.requests_served += 1
+            if route is None:
+                route = _NOT_FOUND
+            else:
+                self.server.requests_matched += 1
+
+            if method == b"HEAD":
+                payload = route.head + b"\r\n"
+            else:
+                payload = route.payload
+            if keep_alive and version != b"HTTP/1.1":
+                # Clientes HTTP/1.0 só mantêm a conexão se a resposta confirmar
+                payload = payload.replace(b"\r\n\r\n", b"\r\nConnection: keep-alive\r\n\r\n", 1)
+
+            if route.delay > 0:
+                self.waiting = True
+                self.transport.pause_reading()
+                asyncio.get_running_loop().call_later(route.delay, self._respond_delayed, payload, keep_alive)
+                return
+
+            self._respond(payload, keep_alive)
+
+    @staticmethod
+    def _path(target: bytes) -> str:
+        """Extrai o caminho do alvo da requisição (origem ou URL absoluta)"""
+        target = target.split(b"?", 1)[0].split(b"#", 1)[0]
+        if not target.startswith(b"/"):
+            target = urlsplit(target.decode("latin-1")).path.encode("latin-1") or b"/"
+        return target.decode("latin-1")
+
+    def _respond(self, payload: bytes, keep_alive: bool) -> None:
+        if self.transport is None:
+            return
+        self.transport.write(payload)
+        if not keep_alive:
+            self.transport.close()
+            self.transport = None
+
+    def _respond_delayed(self, payload: bytes, keep_alive: bool) -> None:
+        self.waiting = False
+        self._respond(payload, keep_alive)
+        if self.transport is not None:
+            self.transport.resume_reading()
+            self._process()
+
+
+class MockServer:
+    """
+    Servidor HTTP/1.1 local que serve a resposta simulada (Request.mock_response)
+    de cada requisição salva, escolhida pelo método e pelo caminho
+
+    As respostas são serializadas na inicialização e cada conexão é tratada
+    diretamente por um asyncio.Protocol (com uvloop, se instalado), o que
+    permite usá-lo como alvo de benchmarks do próprio cliente.
+    """
+    def __init__(self, routes: List[MockRoute], host: str = "127.0.0.1", port: int = 0, backlog: int = 1024):
+        """
+        Args:
+            routes (List[MockRoute]): Rotas servidas
+            host (str): Endereço em que o servidor escuta
+            port (int): Porta (0 escolhe uma livre)
+            backlog (int): Conexões pendentes aceitas pelo socket
+        """
+        self.router = MockRouter(routes)
+        self.host = host
+        self.port = port
+        self.backlog = backlog
+        self.requests_served = 0
+        self.requests_matched = 0
+        self._connections = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_requests(cls, requests: List[Request], variables: Optional[Dict[str, str]] = None, **kwargs) -> 'MockServer':
+        """
+        Cria um servidor com uma rota por requisição
+
+        Args:
+            requests (List[Request]): Requisições salvas
+            variables (Optional[Dict[str, str]]): Variáveis substituídas nos caminhos
+                (as não substituídas viram parâmetros)
+
+        Returns:
+            MockServer: O servidor (ainda não iniciado)
+        """
+        return cls([MockRoute.from_request(request, variables) for request in requests], **kwargs)
+
+    @classmethod
+    def from_collection(
+        cls,
+        storage: Storage,
+        node: Union[Collection, Folder],
+        variables: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> 'MockServer':
+        """
+        Cria um servidor com as requisições de uma coleção ou pasta (incluindo subpastas)
+
+        Args:
+            storage (Storage): Armazenamento de onde as requisições são carregadas
+            node (Union[Collection, Folder]): Coleção ou pasta de origem
+            variables (Optional[Dict[str, str]]): Variáveis substituídas nos caminhos
+
+        Returns:
+            MockServer: O servidor (ainda não iniciado)
+        """
+        requests = []
+        pending = [node]
+        while pending:
+            current = pending.pop(0)
+            for request_id in current.requests:
+                request = storage.get_request(request_id)
+                if request is not None:
+                    requests.append(request)
+            pending.extend(current.folders if isinstance(current, Collection) else current.subfolders)
+
+        return cls.from_requests(requests, variables, **kwargs)
+
+    @property
+    def url(self) -> str:
+        """URL base do servidor (ex: http://127.0.0.1:8080)"""
+        return f"http://{self.host}:{self.port}"
+
+    async def serve(self) -> None:
+        """Abre o socket no loop de eventos atual"""
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._server = await loop.create_server(
+            lambda: _MockProtocol(self), self.host, self.port, backlog=self.backlog, reuse_address=True
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    def start(self) -> str:
+        """
+        Inicia o servidor em uma thread própria
+
+        Returns:
+            str: URL base do servidor
+        """
+        if self._thread is not None:
+            return self.url
+
+        ready = threading.Event()
+        errors: List[BaseException] = []
+
+        def run() -> None:
+            loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(self.serve())
+            except BaseException as e:
+                errors.append(e)
+                ready.set()
+                loop.close()
+                return
+            ready.set()
+            try:
+                loop.run_forever()
+            finally:
+                loop.close()
+
+        self._thread = threading.Thread(target=run, name="mock-server", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if errors:
+            self._thread = None
+            raise errors[0]
+        return self.url
+
+    def serve_forever(self) -> None:
+        """Executa o servidor na thread atual até ser interrompido"""
+        async def main() -> None:
+            await self.serve()
+            print(f"Servidor de mocks em {self.url} ({len(self.router.routes)} rotas)")
+            await self._server.serve_forever()
+
+        if uvloop is not None:
+            uvloop.install()
+        try:
+            asyncio.run(main())
+        except KeyboardInterrupt:
+            pass
+
+    def stop(self) -> None:
+        """Encerra o servidor iniciado por start() e fecha as conexões abertas"""
+        loop, thread = self._loop, self._thread
+        if loop is None or thread is None:
+            return
+
+        def shutdown() -> None:
+            if self._server is not None:
+                self._server.close()
+            for connection in list(self._connections):
+                if connection.transport is not None:
+                    connection.transport.close()
+            loop.stop()
+
+        loop.call_soon_threadsafe(shutdown)
+        thread.join()
+        self._thread = None
+        self._loop = None
+        self._server = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna as requisições atendidas pelo servidor
+
+        Returns:
+            Dict[str, Any]: Requisições atendidas, com rota correspondente, e conexões abertas
+        """
+        return {
+            "routes": len(self.router.routes),
+            "requests": self.requests_served,
+            "matched": self.requests_matched,
+            "connections": len(self._connections),
+        }
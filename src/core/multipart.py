@@ -0,0 +1,207 @@
+"""
+Corpos enviados em blocos a partir do disco: arquivos e formulários multipart/form-data
+"""
+
+import mimetypes
+import os
+import uuid
+from typing import Dict, List, Optional, Any, Callable, Iterator, Union
+
+from src.core.response_body import DEFAULT_CHUNK_SIZE
+
+
+# Chamado durante o envio com (bytes enviados, total de bytes)
+ProgressCallback = Callable[[int, int], None]
+
+
+def is_file_part(value: Any) -> bool:
+    """Indica se um campo de formulário é um arquivo ({"file": caminho, ...})"""
+    return isinstance(value, dict) and bool(value.get("file"))
+
+
+def parse_form_field(value: str) -> Union[str, Dict[str, str]]:
+    """
+    Converte o valor de um campo de formulário no formato do cURL (-F), em que arquivos
+    são indicados por "@caminho;type=tipo;filename=nome"
+
+    Args:
+        value (str): Valor do campo
+
+    Returns:
+        Union[str, Dict[str, str]]: Texto ou parte de arquivo {"file": caminho, ...}
+    """
+    if not value.startswith("@"):
+        return value
+
+    path, *options = value[1:].split(";")
+    file_part = {"file": path}
+    for option in options:
+        option_name, _, option_value = option.partition("=")
+        if option_name.strip() == "type":
+            file_part["content_type"] = option_value.strip()
+        elif option_name.strip() == "filename":
+            file_part["filename"] = option_value.strip().strip('"')
+    return file_part
+
+
+def format_form_field(value: Any) -> str:
+    """
+    Formata o valor de um campo de formulário no formato do cURL (-F)
+
+    Args:
+        value (Any): Texto ou parte de arquivo {"file": caminho, ...}
+
+    Returns:
+        str: Valor no formato do cURL
+    """
+    if not is_file_part(value):
+        return str(value)
+
+    formatted = f"@{value['file']}"
+    if value.get("content_type"):
+        formatted += f";type={value['content_type']}"
+    if value.get("filename"):
+        formatted += f";filename={value['filename']}"
+    return formatted
+
+
+def _quote(value: str) -> str:
+    """Escapa aspas e quebras de linha em nomes de campos e arquivos"""
+    return value.replace("\r", "%0D").replace("\n", "%0A").replace('"', "%22")
+
+
+class FileBody:
+    """
+    Conteúdo de um arquivo lido em blocos durante o envio
+
+    Pode ser percorrido mais de uma vez (novas tentativas abrem o arquivo de novo)
+    e informa o tamanho total, permitindo enviar Content-Length.
+    """
+    def __init__(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Args:
+            path (str): Caminho do arquivo
+            chunk_size (int): Tamanho dos blocos lidos
+        """
+        self.path = path
+        self.chunk_size = chunk_size
+        self.size = os.path.getsize(path)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[bytes]:
+        with open(self.path, "rb") as body_file:
+            while True:
+                chunk = body_file.read(self.chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+
+class MultipartEncoder:
+    """
+    Monta um corpo multipart/form-data cujas partes de arquivo são lidas do disco
+    em blocos, sem carregar os arquivos em memória
+
+    O tamanho total é calculado antes do envio a partir do tamanho dos arquivos.
+    """
+    def __init__(
+        self,
+        fields: Dict[str, Union[str, Dict[str, Any]]],
+        boundary: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        """
+        Args:
+            fields (Dict[str, Union[str, Dict[str, Any]]]): Campos do formulário; arquivos são
+                dicionários {"file": caminho, "filename": nome opcional, "content_type": tipo opcional}
+            boundary (Optional[str]): Delimitador das partes (gerado se omitido)
+            chunk_size (int): Tamanho dos blocos lidos dos arquivos
+        """
+        self.boundary = boundary or uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        # Cada parte é uma sequência de bytes ou um FileBody
+        self._parts: List[Union[bytes, FileBody]] = []
+
+        delimiter = f"--{self.boundary}\r\n".encode("ascii")
+        for name, value in fields.items():
+            if is_file_part(value):
+                path = value["file"]
+                filename = value.get("filename") or os.path.basename(path)
+                content_type = (
+                    value.get("content_type")
+                    or mimetypes.guess_type(filename)[0]
+                    or "application/octet-stream"
+                )
+                header = (
+                    f'Content-Disposition: form-data; name="{_quote(name)}"; filename="{_quote(filename)}"\r\n'
+                    f"Content-Type: {content_type}\r\n\r\n"
+                )
+                self._parts.append(delimiter + header.encode("utf-8"))
+                self._parts.append(FileBody(path, chunk_size))
+                self._parts.append(b"\r\n")
+            else:
+                header = f'Content-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'
+                self._parts.append(delimiter + header.encode("utf-8") + str(value).encode("utf-8") + b"\r\n")
+
+        self._parts.append(f"--{self.boundary}--\r\n".encode("ascii"))
+        self.size = sum(len(part) for part in self._parts)
+
+    @property
+    def content_type(self) -> str:
+        """Valor do cabeçalho Content-Type, com o delimitador"""
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def paths(self) -> List[str]:
+        """Arquivos lidos durante o envio"""
+        return [part.path for part in self._parts if isinstance(part, FileBody)]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[bytes]:
+        for part in self._parts:
+            if isinstance(part, FileBody):
+                yield from part
+            else:
+                yield part
+
+
+class ProgressBody:
+    """
+    Envolve um corpo (bytes ou iterável) informando o progresso do envio
+    """
+    def __init__(self, body: Union[bytes, FileBody, MultipartEncoder], on_progress: ProgressCallback,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Args:
+            body (Union[bytes, FileBody, MultipartEncoder]): Corpo a enviar
+            on_progress (ProgressCallback): Chamado a cada bloco com (enviados, total); total é 0
+                se o tamanho do corpo não for conhecido
+            chunk_size (int): Tamanho dos blocos em que corpos em memória são divididos
+        """
+        self.body = body
+        self.on_progress = on_progress
+        self.chunk_size = chunk_size
+
+    def __len__(self) -> int:
+        return len(self.body)
+
+    def __iter__(self) -> Iterator[bytes]:
+        # Corpos comprimidos durante o envio não têm tamanho conhecido (total 0)
+        total = len(self.body) if hasattr(self.body, "__len__") else 0
+        sent = 0
+        self.on_progress(sent, total)
+
+        if isinstance(self.body, (bytes, bytearray)):
+            view = memoryview(self.body)
+            chunks = (bytes(view[start:start + self.chunk_size]) for start in range(0, total, self.chunk_size))
+        else:
+            chunks = iter(self.body)
+
+        for chunk in chunks:
+            yield chunk
+            sent += len(chunk)
+            self.on_progress(sent, total)
@@ -0,0 +1,219 @@
+"""
+Cache de requisições preparadas (variáveis substituídas e corpo serializado)
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Callable, Hashable, Tuple
+
+from src.models.request import Request
+from src.core.multipart import FileBody, MultipartEncoder
+from src.core.variable_scope import ScopeChain
+from src.utils.compression import CompressedStream
+
+
+class PreparedSend:
+    """
+    Forma final de uma requisição, pronta para o envio
+
+    As instâncias ficam no cache e são compartilhadas entre envios e threads;
+    não devem ser alteradas.
+    """
+    __slots__ = ("request", "url", "headers", "body", "file_state")
+
+    def __init__(self, request: Request, url: str, headers: Dict[str, str], body: Optional[Any]):
+        """
+        Args:
+            request (Request): Requisição com as variáveis substituídas
+            url (str): URL final, com os parâmetros de consulta já codificados
+            headers (Dict[str, str]): Cabeçalhos finais
+            body (Optional[Any]): Corpo serializado (e comprimido, se for o caso), ou
+                um FileBody/MultipartEncoder que lê os arquivos do disco durante o envio
+        """
+        self.request = request
+        self.url = url
+        self.headers = headers
+        self.body = body
+        # Data de modificação e tamanho dos arquivos do corpo (caminhos já resolvidos) no preparo
+        self.file_state = _files_state(_body_paths(body))
+
+    def files_changed(self) -> bool:
+        """Verifica se algum arquivo do corpo mudou desde o preparo (o tamanho enviado ficaria errado)"""
+        if not self.file_state:
+            return False
+        return _files_state(_body_paths(self.body)) != self.file_state
+
+
+def _body_paths(body: Any) -> List[str]:
+    """Arquivos lidos por um corpo durante o envio"""
+    if isinstance(body, CompressedStream):
+        return _body_paths(body.source)
+    if isinstance(body, FileBody):
+        return [body.path]
+    if isinstance(body, MultipartEncoder):
+        return body.paths
+    return []
+
+
+def _files_state(paths: List[str]) -> Tuple[Optional[Hashable], ...]:
+    """Data de modificação e tamanho de cada arquivo"""
+    return tuple(_file_state(path) for path in paths)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Converte dicionários e listas em tuplas, para compor chaves de cache"""
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return ("__list__",) + tuple(_freeze(item) for item in value)
+    if isinstance(value, (bool, float)):
+        # 1, 1.0 e True são iguais como chave, mas serializados de formas diferentes
+        return (type(value), value)
+    return value
+
+
+def request_fingerprint(request: Request) -> Hashable:
+    """
+    Identifica o conteúdo de uma requisição que influencia o envio
+
+    Args:
+        request (Request): Requisição original
+
+    Returns:
+        Hashable: Chave que muda sempre que algum campo relevante muda
+    """
+    # Arquivos do corpo são verificados pelo caminho resolvido (ver PreparedSend.files_changed)
+    return (
+        request.method,
+        request.url,
+        request.name,
+        _freeze(request.headers),
+        _freeze(request.params),
+        _freeze(request.body),
+        request.body_mode,
+        request.body_encoding,
+    )
+
+
+def _file_state(path: Any) -> Optional[Hashable]:
+    """Retorna a data de modificação e o tamanho do arquivo, se existir"""
+    try:
+        stat = os.stat(path)
+        return (stat.st_mtime_ns, stat.st_size)
+    except (OSError, TypeError, ValueError):
+        return None
+
+
+def _body_size(prepared: PreparedSend) -> int:
+    """Bytes mantidos em memória pelo corpo (arquivos lidos do disco não contam)"""
+    return len(prepared.body) if isinstance(prepared.body, bytes) else 0
+
+
+def variables_fingerprint(variables: Optional[Dict[str, str]]) -> Hashable:
+    """
+    Identifica o conjunto de variáveis usado na substituição
+
+    Args:
+        variables (Optional[Dict[str, str]]): Variáveis do ambiente
+
+    Returns:
+        Hashable: Chave que muda sempre que alguma variável muda
+    """
+    if not variables:
+        return None
+    if isinstance(variables, ScopeChain):
+        # As versões das camadas identificam o conteúdo sem percorrer os valores
+        return variables.version
+    return frozenset(variables.items())
+
+
+class PreparedRequestCache:
+    """
+    Guarda as requisições já preparadas, indexadas pelo conteúdo da requisição e
+    pelas variáveis, para que envios repetidos não refaçam a cópia, a substituição
+    de variáveis e a serialização do corpo
+    """
+    def __init__(self, max_entries: int = 256, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Args:
+            max_entries (int): Quantidade máxima de requisições preparadas mantidas
+            max_bytes (int): Tamanho total máximo dos corpos mantidos, em bytes
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, PreparedSend]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_prepare(
+        self,
+        request: Request,
+        variables: Optional[Dict[str, str]],
+        prepare: Callable[[], PreparedSend]
+    ) -> PreparedSend:
+        """
+        Retorna a forma preparada da requisição, preparando-a se necessário
+
+        Args:
+            request (Request): Requisição original
+            variables (Optional[Dict[str, str]]): Variáveis para substituição
+            prepare (Callable[[], PreparedSend]): Prepara a requisição em caso de ausência no cache
+
+        Returns:
+            PreparedSend: Requisição pronta para o envio
+        """
+        try:
+            key = (request_fingerprint(request), variables_fingerprint(variables))
+            hash(key)
+        except TypeError:
+            # Conteúdo não hashable (ex: objetos arbitrários no corpo): não usar o cache
+            return prepare()
+
+        with self._lock:
+            prepared = self._entries.get(key)
+            if prepared is not None:
+                self._entries.move_to_end(key)
+
+        # Um arquivo alterado no disco (mesmo caminho) invalida o tamanho preparado
+        if prepared is not None and not prepared.files_changed():
+            with self._lock:
+                self.hits += 1
+            return prepared
+        with self._lock:
+            self.misses += 1
+
+        prepared = prepare()
+        size = _body_size(prepared)
+        if size > self.max_bytes:
+            return prepared
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= _body_size(previous)
+            self._entries[key] = prepared
+            self.total_bytes += size
+            while len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.total_bytes -= _body_size(evicted)
+
+        return prepared
+
+    def clear(self) -> None:
+        """Descarta todas as requisições preparadas"""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna os acertos e as ausências do cache"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self.total_bytes,
+            }
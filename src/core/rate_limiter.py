@@ -0,0 +1,187 @@
+"""
+Limitação da taxa de envios por host ou endpoint (token bucket)
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Any, Tuple
+from urllib.parse import urlsplit
+
+from src.models.rate_limit import RateLimitPolicy
+from src.models.retry_policy import parse_retry_after
+from src.core.cancellation import CancellationToken
+
+
+class TokenBucket:
+    """
+    Balde de fichas: acumula até `burst` fichas, repostas a `rate` por segundo
+
+    As fichas são reservadas sob o lock e a espera acontece fora dele, de
+    forma que envios concorrentes recebem horários sucessivos em vez de
+    disputarem a próxima ficha.
+    """
+    def __init__(self, rate: float, burst: int):
+        """
+        Args:
+            rate (float): Fichas repostas por segundo
+            burst (int): Capacidade do balde
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        # Instante da última reposição; no futuro enquanto o balde estiver pausado
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def reserve(self) -> float:
+        """
+        Consome uma ficha
+
+        Returns:
+            float: Segundos a aguardar até a ficha estar disponível (0 se já está)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            ready_at = self._updated + max(0.0, -self._tokens) / self.rate
+            return max(0.0, ready_at - now)
+
+    def refund(self) -> None:
+        """Devolve uma ficha reservada e não usada (ex: envio cancelado durante a espera)"""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + 1)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Suspende a reposição de fichas e esvazia o balde
+
+        Args:
+            seconds (float): Duração da pausa
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, now + seconds)
+
+
+class RateLimiter:
+    """
+    Conjunto de baldes por host (ou endpoint) compartilhado por todos os
+    workers de uma execução
+
+    O tempo aguardado é devolvido a quem envia para ser informado separadamente
+    da latência da requisição (Response.rate_limit_wait).
+    """
+    def __init__(self, policy: RateLimitPolicy):
+        """
+        Args:
+            policy (RateLimitPolicy): Limites aplicados
+        """
+        self.policy = policy
+        self._buckets: Dict[Tuple[str, ...], TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._acquired = 0
+        self._delayed = 0
+        self._waited = 0.0
+        self._pauses = 0
+
+    def _key(self, method: str, url: str) -> Tuple[Tuple[str, ...], float]:
+        """Retorna a chave do balde de uma requisição e a taxa aplicada a ela"""
+        parts = urlsplit(url)
+        host = (parts.hostname or "").lower()
+        try:
+            port = parts.port
+        except ValueError:
+            port = None
+        if port is None:
+            port = 443 if parts.scheme == "https" else 80
+
+        rate = self.policy.rate_for(host, port)
+        if self.policy.per_endpoint:
+            return (host, str(port), method.upper(), parts.path or "/"), rate
+        return (host, str(port)), rate
+
+    def _bucket(self, method: str, url: str) -> TokenBucket:
+        key, rate = self._key(method, url)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(rate, self.policy.burst)
+                self._buckets[key] = bucket
+            return bucket
+
+    def acquire(self, method: str, url: str, cancel_token: Optional[CancellationToken] = None) -> float:
+        """
+        Aguarda a vez de enviar uma requisição
+
+        Args:
+            method (str): Método HTTP
+            url (str): URL da requisição
+            cancel_token (Optional[CancellationToken]): Token que interrompe a espera
+
+        Returns:
+            float: Segundos aguardados
+
+        Raises:
+            RequestCancelled: Se o token foi cancelado durante a espera
+            DeadlineExceeded: Se o prazo do token se esgotou durante a espera
+        """
+        bucket = self._bucket(method, url)
+        wait = bucket.reserve()
+
+        if wait > 0:
+            if cancel_token is None:
+                time.sleep(wait)
+            elif cancel_token.wait(wait):
+                bucket.refund()
+                cancel_token.raise_if_cancelled()
+
+        with self._lock:
+            self._acquired += 1
+            if wait > 0:
+                self._delayed += 1
+                self._waited += wait
+        return wait
+
+    def observe(self, method: str, url: str, status_code: int, headers: Dict[str, str]) -> None:
+        """
+        Registra a resposta de um envio; um 429 pausa o balde do host para
+        que os demais workers também recuem
+
+        Args:
+            method (str): Método HTTP
+            url (str): URL da requisição
+            status_code (int): Status recebido
+            headers (Dict[str, str]): Cabeçalhos da resposta
+        """
+        if status_code != 429 or not self.policy.pause_on_429:
+            return
+
+        bucket = self._bucket(method, url)
+        delay = parse_retry_after(headers)
+        bucket.pause(delay if delay is not None else 1.0 / bucket.rate)
+        with self._lock:
+            self._pauses += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna os envios liberados e o tempo aguardado
+
+        Returns:
+            Dict[str, Any]: Envios liberados, quantos aguardaram, espera total e pausas por 429
+        """
+        with self._lock:
+            return {
+                "acquired": self._acquired,
+                "delayed": self._delayed,
+                "waited": self._waited,
+                "pauses": self._pauses,
+                "buckets": len(self._buckets),
+            }
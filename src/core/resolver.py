@@ -0,0 +1,232 @@
+"""
+Resolução de nomes com cache e substituições de host → IP (como o --resolve do curl)
+"""
+
+import ipaddress
+import socket
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple, Iterator, Union, Any
+
+
+_local = threading.local()
+
+
+class _CacheEntry:
+    """Resposta de uma resolução (endereços ou erro) e o instante em que expira"""
+    __slots__ = ("addresses", "error", "expires_at")
+
+    def __init__(self, addresses: List[str], error: Optional[OSError], expires_at: float):
+        self.addresses = addresses
+        self.error = error
+        self.expires_at = expires_at
+
+
+class HostResolver:
+    """
+    Resolve nomes de host guardando as respostas por um tempo de vida (TTL)
+
+    Consultas simultâneas ao mesmo nome aguardam uma única resolução, evitando
+    que o resolvedor do sistema vire gargalo em execuções com muitos envios.
+    As substituições ativas na thread atual têm precedência sobre o DNS.
+    """
+    def __init__(self, ttl: float = 60.0, negative_ttl: float = 5.0, max_entries: int = 1024):
+        """
+        Args:
+            ttl (float): Segundos durante os quais uma resposta é reutilizada
+                (o getaddrinfo não informa o TTL do registro DNS)
+            negative_ttl (float): Segundos durante os quais uma falha de resolução é reutilizada
+            max_entries (int): Quantidade máxima de nomes mantidos no cache
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[Tuple[str, int], _CacheEntry]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, int], threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, host: str, port: int, family: int = socket.AF_UNSPEC) -> List[str]:
+        """
+        Resolve um host, retornando os endereços na ordem de preferência
+
+        Args:
+            host (str): Nome do host
+            port (int): Porta de destino (usada nas substituições)
+            family (int): Família de endereços (socket.AF_UNSPEC, AF_INET ou AF_INET6)
+
+        Returns:
+            List[str]: Endereços IP
+
+        Raises:
+            OSError: Se o nome não puder ser resolvido
+        """
+        override = self.lookup_override(host, port)
+        if override:
+            return override
+
+        if _is_ip_address(host):
+            return [host.strip("[]")]
+
+        key = (host.lower(), family)
+        while True:
+            with self._lock:
+                entry = self._cache.get(key)
+                if entry is not None and entry.expires_at > time.monotonic():
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    if entry.error is not None:
+                        raise entry.error
+                    return list(entry.addresses)
+
+                pending = self._inflight.get(key)
+                if pending is None:
+                    # Esta thread fará a resolução
+                    pending = self._inflight[key] = threading.Event()
+                    self.misses += 1
+                    break
+
+            # Outra thread está resolvendo o mesmo nome
+            pending.wait()
+
+        try:
+            entry = self._lookup(host, port, family)
+            with self._lock:
+                self._cache[key] = entry
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            pending.set()
+
+        if entry.error is not None:
+            raise entry.error
+        return list(entry.addresses)
+
+    def _lookup(self, host: str, port: int, family: int) -> _CacheEntry:
+        """Consulta o resolvedor do sistema"""
+        try:
+            infos = socket.getaddrinfo(host, port, family, socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            return _CacheEntry([], e, time.monotonic() + self.negative_ttl)
+
+        addresses = []
+        for _, _, _, _, sockaddr in infos:
+            if sockaddr[0] not in addresses:
+                addresses.append(sockaddr[0])
+        return _CacheEntry(addresses, None, time.monotonic() + self.ttl)
+
+    def clear(self) -> None:
+        """Descarta todas as respostas guardadas"""
+        with self._lock:
+            self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna a quantidade de consultas atendidas pelo cache e pelo resolvedor"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._cache)}
+
+    @staticmethod
+    def lookup_override(host: str, port: int) -> Optional[List[str]]:
+        """
+        Procura uma substituição ativa para o host
+
+        Args:
+            host (str): Nome do host
+            port (int): Porta de destino
+
+        Returns:
+            Optional[List[str]]: Endereços definidos para "host:porta" ou, na falta, para "host"
+        """
+        overrides = getattr(_local, "overrides", None)
+        if not overrides:
+            return None
+
+        host = host.lower()
+        return overrides.get(f"{host}:{port}") or overrides.get(host)
+
+    @staticmethod
+    @contextmanager
+    def overrides(mapping: Optional[Dict[str, Union[str, List[str]]]]) -> Iterator[None]:
+        """
+        Ativa substituições de host → IP na thread atual durante o bloco
+
+        Args:
+            mapping (Optional[Dict[str, Union[str, List[str]]]]): Chaves "host" ou "host:porta"
+                e valores com um ou mais IPs (lista ou separados por vírgula)
+        """
+        previous = getattr(_local, "overrides", None)
+        _local.overrides = normalize_overrides(mapping)
+        try:
+            yield
+        finally:
+            _local.overrides = previous
+
+
+def normalize_overrides(mapping: Optional[Dict[str, Union[str, List[str]]]]) -> Dict[str, List[str]]:
+    """
+    Normaliza as substituições: chaves em minúsculas e valores como listas de IPs
+
+    Args:
+        mapping (Optional[Dict[str, Union[str, List[str]]]]): Substituições informadas
+
+    Returns:
+        Dict[str, List[str]]: Substituições normalizadas
+    """
+    normalized = {}
+    for key, value in (mapping or {}).items():
+        if isinstance(value, str):
+            value = value.split(",")
+        addresses = [address.strip().strip("[]") for address in value if address.strip()]
+        if key.strip() and addresses:
+            normalized[key.strip().lower()] = addresses
+    return normalized
+
+
+def parse_curl_resolve(entry: str) -> Tuple[str, List[str]]:
+    """
+    Converte uma entrada no formato do curl ("host:porta:ip[,ip...]"; porta "*" vale para todas)
+
+    Args:
+        entry (str): Valor da opção --resolve
+
+    Returns:
+        Tuple[str, List[str]]: Chave "host:porta" (ou "host") e endereços
+
+    Raises:
+        ValueError: Se a entrada não estiver no formato esperado
+    """
+    host, port, addresses = entry.strip().split(":", 2)
+    if not host or not addresses or not (port == "*" or port.isdigit()):
+        raise ValueError(f"Entrada --resolve inválida: {entry}")
+
+    key = host.lower() if port == "*" else f"{host.lower()}:{port}"
+    return key, [address.strip().strip("[]") for address in addresses.split(",") if address.strip()]
+
+
+def _is_ip_address(host: str) -> bool:
+    """Indica se o host já é um endereço IP"""
+    try:
+        ipaddress.ip_address(host.strip("[]"))
+        return True
+    except ValueError:
+        return False
+
+
+_default_resolver = HostResolver()
+
+
+def get_resolver() -> HostResolver:
+    """Retorna o resolvedor usado pelas conexões do HttpClient"""
+    return _default_resolver
+
+
+def set_resolver(resolver: HostResolver) -> None:
+    """Substitui o resolvedor usado pelas conexões do HttpClient"""
+    global _default_resolver
+    _default_resolver = resolver
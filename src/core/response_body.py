@@ -0,0 +1,91 @@
+"""
+Leitura de corpos de resposta em blocos, com transbordo para disco
+"""
+
+import os
+import tempfile
+from typing import Optional, Iterable, Tuple, List
+
+
+# Corpos maiores que este limite (em bytes) são gravados em arquivo temporário
+DEFAULT_SPILL_THRESHOLD = 8 * 1024 * 1024
+
+# Tamanho dos blocos lidos da conexão
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class SpooledBody:
+    """
+    Acumula o corpo de uma resposta em memória até o limite configurado e,
+    a partir dele, continua a gravação em um arquivo temporário
+    """
+    def __init__(self, spill_threshold: int = DEFAULT_SPILL_THRESHOLD, temp_dir: Optional[str] = None):
+        """
+        Args:
+            spill_threshold (int): Tamanho máximo, em bytes, mantido em memória
+            temp_dir (Optional[str]): Diretório dos arquivos temporários (padrão do sistema)
+        """
+        self.spill_threshold = spill_threshold
+        self.temp_dir = temp_dir
+        self.size = 0
+        self._chunks: List[bytes] = []
+        self._file = None
+        self._path: Optional[str] = None
+
+    @property
+    def spilled(self) -> bool:
+        """Indica se o corpo passou a ser gravado em disco"""
+        return self._file is not None
+
+    def write(self, chunk: bytes) -> None:
+        """Acrescenta um bloco ao corpo"""
+        if not chunk:
+            return
+
+        self.size += len(chunk)
+
+        if self._file is None and self.size > self.spill_threshold:
+            fd, self._path = tempfile.mkstemp(prefix="pyrequestman-body-", dir=self.temp_dir)
+            self._file = os.fdopen(fd, "wb")
+            for pending in self._chunks:
+                self._file.write(pending)
+            self._chunks = []
+
+        if self._file is not None:
+            self._file.write(chunk)
+        else:
+            self._chunks.append(chunk)
+
+    def consume(self, chunks: Iterable[bytes]) -> 'SpooledBody':
+        """Acrescenta todos os blocos de um iterável"""
+        for chunk in chunks:
+            self.write(chunk)
+        return self
+
+    def finish(self) -> Tuple[bytes, Optional[str]]:
+        """
+        Conclui a leitura
+
+        Returns:
+            Tuple[bytes, Optional[str]]: Corpo em memória e caminho do arquivo
+            temporário (apenas um dos dois é relevante)
+        """
+        if self._file is not None:
+            self._file.close()
+            return b"", self._path
+
+        content = b"".join(self._chunks)
+        self._chunks = []
+        return content, None
+
+    def discard(self) -> None:
+        """Descarta o corpo parcial, removendo o arquivo temporário"""
+        self._chunks = []
+        if self._file is not None:
+            self._file.close()
+            try:
+                os.remove(self._path)
+            except OSError:
+                pass
+            self._file = None
+            self._path = None
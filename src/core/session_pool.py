@@ -0,0 +1,363 @@
+"""
+Gerenciamento de sessões HTTP com pools de conexões persistentes (keep-alive)
+"""
+
+import functools
+import socket
+import threading
+import time
+from collections import namedtuple
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, Any, Tuple, List
+
+import requests
+from requests.adapters import HTTPAdapter, DEFAULT_POOLBLOCK
+from urllib.parse import urlsplit
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError, ConnectTimeoutError
+from urllib3.poolmanager import PoolManager, PoolKey, _default_key_normalizer
+from urllib3.util.connection import allowed_gai_family
+
+from src.core.timing import PhaseTimer
+from src.core.cancellation import CancellationToken
+from src.core.resolver import HostResolver, get_resolver
+
+
+# Chave que identifica o pool de um host: (esquema, host, porta)
+HostKey = Tuple[str, str, int]
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Chave dos pools do urllib3 acrescida dos endereços substitutos (--resolve) do host
+OverridePoolKey = namedtuple("OverridePoolKey", PoolKey._fields + ("key_resolve_override",))
+
+
+def _host_key_from_url(url: str) -> HostKey:
+    """Obtém a chave (esquema, host, porta) de uma URL"""
+    parts = urlsplit(url)
+    scheme = (parts.scheme or "http").lower()
+    host = (parts.hostname or "").lower()
+    port = parts.port or DEFAULT_PORTS.get(scheme, 80)
+    return scheme, host, port
+
+
+def _network_time(timer: PhaseTimer, include_tls: bool = True) -> float:
+    """Soma das fases de estabelecimento de conexão já registradas"""
+    total = timer.phases.get("dns", 0.0) + timer.phases.get("connect", 0.0)
+    if include_tls:
+        total += timer.phases.get("tls", 0.0)
+    return total
+
+
+class _TimedConnectionMixin:
+    """
+    Resolve o host pelo HostResolver compartilhado (com cache e substituições)
+    e registra no PhaseTimer ativo a resolução de DNS, a conexão TCP,
+    o envio da requisição e a espera pelo primeiro byte da resposta
+    """
+    def _resolve_addresses(self) -> List[str]:
+        """Resolve o host da conexão, retornando os endereços na ordem de preferência"""
+        return get_resolver().resolve(self._dns_host, self.port, allowed_gai_family())
+
+    def _new_conn(self):
+        timer = PhaseTimer.current()
+        if timer is not None:
+            timer.connection_reused = False
+
+        start = time.perf_counter()
+        try:
+            addresses = self._resolve_addresses()
+        except OSError:
+            # Deixar o urllib3 refazer a resolução e gerar o erro apropriado
+            return super()._new_conn()
+        finally:
+            if timer is not None:
+                timer.add("dns", time.perf_counter() - start)
+
+        if not addresses:
+            return super()._new_conn()
+
+        # Conectar ao endereço já resolvido, tentando os demais em caso de falha
+        original_dns_host = self._dns_host
+        start = time.perf_counter()
+        try:
+            last_error = None
+            for address in addresses:
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except (NewConnectionError, ConnectTimeoutError) as e:
+                    last_error = e
+            raise last_error
+        finally:
+            self._dns_host = original_dns_host
+            if timer is not None:
+                timer.add("connect", time.perf_counter() - start)
+
+    def request(self, *args, **kwargs):
+        self._watch_cancellation()
+
+        timer = PhaseTimer.current()
+        if timer is None:
+            return super().request(*args, **kwargs)
+
+        # A conexão pode ser aberta durante o envio; descontar essas fases
+        network_before = _network_time(timer)
+        start = time.perf_counter()
+        try:
+            return super().request(*args, **kwargs)
+        finally:
+            timer.add("send", time.perf_counter() - start - (_network_time(timer) - network_before))
+            timer.mark("request_sent")
+
+    def getresponse(self, *args, **kwargs):
+        timer = PhaseTimer.current()
+        response = super().getresponse(*args, **kwargs)
+        if timer is not None:
+            waited = timer.since("request_sent")
+            if waited is not None:
+                timer.add("ttfb", waited)
+        return response
+
+    def _watch_cancellation(self) -> None:
+        """
+        Associa a conexão ao token de cancelamento ativo: ao cancelar (ou esgotar
+        o prazo), o socket é fechado, interrompendo leituras e escritas bloqueadas
+        """
+        token = CancellationToken.current()
+        # A conexão pode ter sido usada antes por outro envio
+        self._cancel_owner = token
+        if token is None:
+            return
+
+        token.raise_if_cancelled()
+        token.register(lambda: self._abort(token))
+
+    def _abort(self, token: CancellationToken) -> None:
+        """Fecha o socket se a conexão ainda estiver a serviço do envio cancelado"""
+        sock = self.sock
+        if sock is None or getattr(self, "_cancel_owner", None) is not token:
+            return
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    """Conexão HTTP com medição de fases"""
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    """Conexão HTTPS com medição de fases, incluindo o handshake TLS"""
+    def connect(self):
+        timer = PhaseTimer.current()
+        if timer is None:
+            return super().connect()
+
+        network_before = _network_time(timer, include_tls=False)
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            network_after = _network_time(timer, include_tls=False)
+            timer.add("tls", time.perf_counter() - start - (network_after - network_before))
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    """Pool de conexões HTTP com medição de fases"""
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    """Pool de conexões HTTPS com medição de fases"""
+    ConnectionCls = TimedHTTPSConnection
+
+
+class OverridePoolManager(PoolManager):
+    """
+    Gerenciador de pools que separa as conexões de um host por conjunto de
+    endereços substitutos
+
+    As substituições valem por thread (HostResolver.overrides): envios
+    simultâneos ao mesmo host com substituições diferentes usam pools
+    diferentes, sem que um feche as conexões do outro nem reaproveite uma
+    conexão aberta para o endereço do outro.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.key_fn_by_scheme = {
+            scheme: functools.partial(_default_key_normalizer, OverridePoolKey)
+            for scheme in self.key_fn_by_scheme
+        }
+
+    def connection_from_context(self, request_context: Dict[str, Any]) -> HTTPConnectionPool:
+        scheme = (request_context.get("scheme") or "").lower()
+        pool_key_constructor = self.key_fn_by_scheme.get(scheme)
+        if pool_key_constructor is None:
+            return super().connection_from_context(request_context)
+
+        host = (request_context.get("host") or "").lower()
+        port = request_context.get("port") or DEFAULT_PORTS.get(scheme, 80)
+        override = tuple(HostResolver.lookup_override(host, port) or ())
+        # O contexto também é usado para criar o pool: a substituição entra só na chave
+        pool_key = pool_key_constructor({**request_context, "resolve_override": override})
+        return self.connection_from_pool_key(pool_key, request_context=request_context)
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    Adaptador HTTP que mantém um pool de conexões por host, encerra pools
+    ociosos após um tempo limite e contabiliza conexões abertas e reutilizadas
+    """
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, idle_timeout: float = 60.0):
+        self.idle_timeout = idle_timeout
+        self._last_used: Dict[HostKey, float] = {}
+        self._retired: Dict[HostKey, Dict[str, int]] = {}
+        self._stats_lock = threading.Lock()
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+
+    def init_poolmanager(self, connections, maxsize, block=DEFAULT_POOLBLOCK, **pool_kwargs) -> None:
+        """Cria o gerenciador de pools registrando o descarte dos pools"""
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = OverridePoolManager(
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs
+        )
+        self.poolmanager.pools.dispose_func = self._dispose_pool
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+    def _dispose_pool(self, pool) -> None:
+        """Guarda as estatísticas de um pool antes de fechá-lo"""
+        key = (pool.scheme, (pool.host or "").lower(), pool.port or DEFAULT_PORTS.get(pool.scheme, 80))
+        with self._stats_lock:
+            retired = self._retired.setdefault(key, {"opened": 0, "requests": 0})
+            retired["opened"] += pool.num_connections
+            retired["requests"] += pool.num_requests
+        pool.close()
+
+    def send(self, request, **kwargs):
+        """Envia a requisição usando o pool do host, descartando pools ociosos antes"""
+        self._close_idle_pools()
+
+        host_key = _host_key_from_url(request.url)
+        try:
+            return super().send(request, **kwargs)
+        finally:
+            self._last_used[host_key] = time.monotonic()
+
+    def _close_idle_pools(self) -> None:
+        """Fecha os pools que ficaram ociosos por mais tempo que o limite"""
+        if not self.idle_timeout or self.idle_timeout <= 0:
+            return
+
+        now = time.monotonic()
+        expired = {
+            key for key, last_used in list(self._last_used.items())
+            if now - last_used > self.idle_timeout
+        }
+        if not expired:
+            return
+
+        self._close_pools(expired)
+        for host_key in expired:
+            self._last_used.pop(host_key, None)
+
+    def _close_pools(self, host_keys) -> None:
+        """Fecha os pools dos hosts informados"""
+        for pool_key in self.poolmanager.pools.keys():
+            host_key = (pool_key.key_scheme, pool_key.key_host, pool_key.key_port)
+            if host_key in host_keys:
+                # Remover do container chama _dispose_pool
+                self.poolmanager.pools.pop(pool_key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna as estatísticas de uso dos pools
+
+        Returns:
+            Dict[str, Any]: Totais de conexões abertas, reutilizadas e requisições,
+            além dos mesmos números separados por host
+        """
+        hosts: Dict[str, Dict[str, int]] = {}
+
+        def _accumulate(host_key: HostKey, opened: int, requests_count: int, active: bool) -> None:
+            name = f"{host_key[0]}://{host_key[1]}:{host_key[2]}"
+            entry = hosts.setdefault(name, {"opened": 0, "reused": 0, "requests": 0, "active": False})
+            entry["opened"] += opened
+            entry["requests"] += requests_count
+            entry["reused"] = max(entry["requests"] - entry["opened"], 0)
+            entry["active"] = entry["active"] or active
+
+        with self._stats_lock:
+            for host_key, retired in self._retired.items():
+                _accumulate(host_key, retired["opened"], retired["requests"], False)
+
+        for pool_key in self.poolmanager.pools.keys():
+            pool = self.poolmanager.pools.get(pool_key)
+            if pool is None:
+                continue
+            host_key = (pool_key.key_scheme, pool_key.key_host, pool_key.key_port)
+            _accumulate(host_key, pool.num_connections, pool.num_requests, True)
+
+        opened = sum(entry["opened"] for entry in hosts.values())
+        total_requests = sum(entry["requests"] for entry in hosts.values())
+
+        return {
+            "connections_opened": opened,
+            "connections_reused": max(total_requests - opened, 0),
+            "requests": total_requests,
+            "active_pools": sum(1 for entry in hosts.values() if entry["active"]),
+            "hosts": hosts,
+        }
+
+
+class SessionPool:
+    """
+    Sessão HTTP compartilhada com conexões persistentes por host
+
+    Todas as guias, o histórico e as execuções de coleções usam a mesma
+    instância, evitando refazer o handshake TCP/TLS a cada envio.
+    """
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, idle_timeout: float = 60.0):
+        """
+        Args:
+            pool_connections (int): Quantidade de hosts com pool mantido simultaneamente
+            pool_maxsize (int): Máximo de conexões ociosas mantidas por host
+            idle_timeout (float): Segundos sem uso após os quais o pool de um host é fechado
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.idle_timeout = idle_timeout
+
+        self.adapter = PooledHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            idle_timeout=idle_timeout
+        )
+
+        self.session = requests.Session()
+        # Não guardar cookies entre envios, mantendo o comportamento de requisições isoladas
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Realiza uma requisição usando as conexões do pool"""
+        return self.session.request(method=method, url=url, **kwargs)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna as estatísticas de conexões abertas e reutilizadas"""
+        return self.adapter.get_stats()
+
+    def close(self) -> None:
+        """Fecha todas as conexões mantidas pela sessão"""
+        self.session.close()
@@ -10,6 +10,7 @@ from pathlib import Path
 from src.models.request import Request
 from src.models.collection import Collection, Folder
 from src.models.environment import Environment
+from src.core.variable_index import VariableIndex, rename_in_request
 
 
 class Storage:
@@ -22,8 +23,12 @@ class Storage:
         self.requests_dir = self.base_dir / "requests"
         self.history_dir = self.base_dir / "history"
         self.environments_dir = self.base_dir / "environments"
+        self.cache_dir = self.base_dir / "cache"
         self.settings_file = self.base_dir / "settings.json"
         
+        # Índice reverso das variáveis usadas nas requisições (montado na primeira consulta)
+        self._variable_index: Optional[VariableIndex] = None
+        
         # Criar diretórios se não existirem
         self._ensure_directories()
     
@@ -34,6 +39,7 @@ class Storage:
         self.requests_dir.mkdir(exist_ok=True)
         self.history_dir.mkdir(exist_ok=True)
         self.environments_dir.mkdir(exist_ok=True)
+        self.cache_dir.mkdir(exist_ok=True)
     
     def _write_json(self, path: Path, data: Dict[str, Any]) -> None:
         """Escreve dados em formato JSON em um arquivo"""
@@ -91,6 +97,9 @@ class Storage:
         """Salva uma requisição no armazenamento local"""
         request_path = self.requests_dir / f"{request.id}.json"
         self._write_json(request_path, request.to_dict())
+        
+        if self._variable_index is not None:
+            self._variable_index.update(request)
     
     def get_request(self, request_id: str) -> Optional[Request]:
         """Recupera uma requisição do armazenamento local"""
@@ -110,8 +119,51 @@ class Storage:
             return False
         
         request_path.unlink()
+        
+        if self._variable_index is not None:
+            self._variable_index.remove(request_id)
         return True
     
+    @property
+    def variable_index(self) -> VariableIndex:
+        """
+        Índice das variáveis usadas nas requisições salvas
+        
+        Na primeira consulta todas as requisições são lidas uma vez; depois o índice
+        é atualizado a cada save_request e delete_request.
+        """
+        if self._variable_index is None:
+            index = VariableIndex()
+            for file_path in self.requests_dir.glob("*.json"):
+                data = self._read_json(file_path)
+                if data:
+                    index.update(Request.from_dict(data))
+            self._variable_index = index
+        return self._variable_index
+    
+    def rename_variable(self, old_name: str, new_name: str) -> List[str]:
+        """
+        Renomeia as referências a uma variável em todas as requisições salvas
+        
+        Args:
+            old_name (str): Nome atual
+            new_name (str): Novo nome
+            
+        Returns:
+            List[str]: IDs das requisições alteradas
+        """
+        changed = []
+        # Somente as requisições que usam a variável são lidas e gravadas
+        for request_id in self.variable_index.requests_using(old_name):
+            request = self.get_request(request_id)
+            if request is None:
+                self._variable_index.remove(request_id)
+                continue
+            if rename_in_request(request, old_name, new_name):
+                self.save_request(request)
+                changed.append(request_id)
+        return changed
+    
     # === AMBIENTES ===
     
     def save_environment(self, environment: Environment) -> None:
@@ -0,0 +1,167 @@
+"""
+Templates compilados para a substituição de variáveis no formato {{variavel}}
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Any, Callable, Tuple
+
+
+# Padrão para identificar variáveis no formato {{variavel}}
+VARIABLE_PATTERN = r"{{([^{}]+)}}"
+
+_VARIABLE_REGEX = re.compile(VARIABLE_PATTERN)
+
+
+class CompiledTemplate:
+    """
+    String dividida em trechos literais e referências a variáveis
+
+    Para n referências há n + 1 literais (possivelmente vazios): o texto é
+    literals[0] + valor(names[0]) + literals[1] + ... + literals[n].
+    """
+    __slots__ = ("source", "literals", "names", "placeholders")
+
+    def __init__(self, source: str, literals: Tuple[str, ...], names: Tuple[str, ...],
+                 placeholders: Tuple[str, ...]):
+        """
+        Args:
+            source (str): String original
+            literals (Tuple[str, ...]): Trechos literais entre as referências
+            names (Tuple[str, ...]): Nome de cada referência, na ordem em que aparecem
+            placeholders (Tuple[str, ...]): Texto original de cada referência, mantido
+                quando a variável não está definida
+        """
+        self.source = source
+        self.literals = literals
+        self.names = names
+        self.placeholders = placeholders
+
+    def render(self, variables: Dict[str, Any]) -> str:
+        """
+        Substitui as referências pelos valores das variáveis
+
+        Args:
+            variables (Dict[str, Any]): Variáveis disponíveis
+
+        Returns:
+            str: Texto com as variáveis substituídas (as não definidas permanecem como estão)
+        """
+        if not self.names:
+            return self.source
+
+        literals = self.literals
+        parts = [literals[0]]
+        for index, name in enumerate(self.names):
+            parts.append(variables.get(name, self.placeholders[index]))
+            parts.append(literals[index + 1])
+        return "".join(parts)
+
+
+def compile_template(source: str, normalize_name: Optional[Callable[[str], str]] = None) -> CompiledTemplate:
+    """
+    Divide uma string em literais e referências a variáveis
+
+    Args:
+        source (str): String com referências no formato {{variavel}}
+        normalize_name (Optional[Callable[[str], str]]): Ajusta o nome de cada referência
+            (já sem espaços nas pontas) antes da busca nas variáveis
+
+    Returns:
+        CompiledTemplate: Template compilado
+    """
+    literals = []
+    names = []
+    placeholders = []
+    position = 0
+    for match in _VARIABLE_REGEX.finditer(source):
+        literals.append(source[position:match.start()])
+        name = match.group(1).strip()
+        names.append(normalize_name(name) if normalize_name else name)
+        placeholders.append(match.group(0))
+        position = match.end()
+    literals.append(source[position:])
+    return CompiledTemplate(source, tuple(literals), tuple(names), tuple(placeholders))
+
+
+class TemplateCache:
+    """
+    Cache LRU de templates compilados, indexado pela string original
+
+    Strings sem "{{" não são compiladas nem guardadas, e strings muito longas
+    (ex: corpos grandes) são compiladas a cada uso para não ficarem retidas.
+    """
+    def __init__(self, max_entries: int = 4096, max_length: int = 64 * 1024,
+                 normalize_name: Optional[Callable[[str], str]] = None):
+        """
+        Args:
+            max_entries (int): Quantidade máxima de templates mantidos
+            max_length (int): Tamanho máximo, em caracteres, das strings guardadas
+            normalize_name (Optional[Callable[[str], str]]): Ajuste dos nomes das referências
+                (ver compile_template)
+        """
+        self.max_entries = max_entries
+        self.max_length = max_length
+        self.normalize_name = normalize_name
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, CompiledTemplate]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, source: str) -> CompiledTemplate:
+        """
+        Retorna o template compilado da string, compilando-o se necessário
+
+        Args:
+            source (str): String com referências a variáveis
+
+        Returns:
+            CompiledTemplate: Template compilado
+        """
+        with self._lock:
+            template = self._entries.get(source)
+            if template is not None:
+                self._entries.move_to_end(source)
+                self.hits += 1
+                return template
+            self.misses += 1
+
+        template = compile_template(source, self.normalize_name)
+        if len(source) > self.max_length:
+            return template
+
+        with self._lock:
+            self._entries[source] = template
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return template
+
+    def render(self, source: str, variables: Dict[str, Any]) -> str:
+        """
+        Substitui as referências a variáveis de uma string
+
+        Args:
+            source (str): String com referências no formato {{variavel}}
+            variables (Dict[str, Any]): Variáveis disponíveis
+
+        Returns:
+            str: Texto com as variáveis substituídas
+        """
+        if "{{" not in source:
+            return source
+        return self.get(source).render(variables)
+
+    def clear(self) -> None:
+        """Descarta todos os templates compilados"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna os acertos e as ausências do cache"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes do cliente HTTP assíncrono contra um servidor asyncio local
+"""
+
+import sys
+import os
+import asyncio
+import gzip
+import json
+import time
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.async_http_client import AsyncHttpClient
+from src.core.multipart import FileBody
+from src.models.request import Request, BodyMode
+
+
+async def _read_chunked(reader):
+    """Lê um corpo enviado com Transfer-Encoding: chunked"""
+    chunks = []
+    while True:
+        size = int((await reader.readline()).split(b";")[0].strip(), 16)
+        if size == 0:
+            await reader.readline()
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
+
+
+async def _handle_connection(reader, writer):
+    """Servidor HTTP/1.1 mínimo que devolve o método, o alvo e o corpo recebidos"""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            if "chunked" in headers.get("transfer-encoding", ""):
+                body = await _read_chunked(reader)
+            else:
+                body = await reader.readexactly(int(headers.get("content-length", "0")))
+            if headers.get("content-encoding") == "gzip":
+                body = gzip.decompress(body)
+            method, target, _ = request_line.decode("latin-1").split(" ", 2)
+
+            if target.startswith("/chunked"):
+                payload = b'{"chunked": true}'
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nTransfer-Encoding: chunked\r\n\r\n"
+                    + f"{len(payload):x}\r\n".encode() + payload + b"\r\n0\r\n\r\n"
+                )
+            else:
+                payload = json.dumps({
+                    "method": method,
+                    "target": target,
+                    "body": body.decode("utf-8"),
+                    "content_type": headers.get("content-type"),
+                    "token": headers.get("authorization"),
+                }).encode("utf-8")
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload
+                )
+            await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _with_server(scenario):
+    server = await asyncio.start_server(_handle_connection, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        return await scenario(f"http://127.0.0.1:{port}")
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+def test_send_request_substitutes_variables():
+    async def scenario(base_url):
+        request = Request(
+            name="Criar",
+            url="{{base}}/items",
+            method="POST",
+            headers={"Authorization": "Bearer {{token}}"},
+            params={"page": "{{page}}"},
+            body='{"name": "{{item}}"}'
+        )
+        variables = {"base": base_url, "token": "abc", "page": "2", "item": "x"}
+        async with AsyncHttpClient() as client:
+            return await client.send_request(request, variables)
+
+    response, error = asyncio.run(_with_server(scenario))
+    assert error is None
+    assert response.status_code == 200
+    echoed = response.get_content_as_json()
+    assert echoed["method"] == "POST"
+    assert echoed["target"] == "/items?page=2"
+    assert json.loads(echoed["body"]) == {"name": "x"}
+    assert echoed["content_type"] == "application/json"
+    assert echoed["token"] == "Bearer abc"
+
+
+def test_chunked_response_is_decoded():
+    async def scenario(base_url):
+        async with AsyncHttpClient() as client:
+            return await client.send_request(Request(name="chunked", url=f"{base_url}/chunked"))
+
+    response, error = asyncio.run(_with_server(scenario))
+    assert error is None
+    assert response.get_content_as_json() == {"chunked": True}
+
+
+def test_thousands_of_concurrent_requests():
+    async def scenario(base_url):
+        requests = [Request(name=f"r{i}", url=f"{base_url}/item/{i}") for i in range(3000)]
+        async with AsyncHttpClient(max_concurrency=3000, max_connections_per_host=200) as client:
+            return await client.send_many(requests)
+
+    results = asyncio.run(_with_server(scenario))
+    assert len(results) == 3000
+    assert all(error is None for _, error in results)
+    assert results[1234][0].get_content_as_json()["target"] == "/item/1234"
+
+
+def test_connection_error_returns_error_message():
+    async def scenario():
+        async with AsyncHttpClient(timeout=5) as client:
+            return await client.send_request(Request(name="fail", url="http://127.0.0.1:1/"))
+
+    response, error = asyncio.run(scenario())
+    assert response.status_code == 0
+    assert error.startswith("Erro ao realizar requisição")
+
+
+def test_file_upload_does_not_block_the_event_loop(tmp_path, monkeypatch):
+    path = tmp_path / "upload.txt"
+    path.write_text("linha\n" * 20000)
+    original_iter = FileBody.__iter__
+
+    def slow_iter(self):
+        # Simula um disco lento: cada bloco demora a ser lido
+        for chunk in original_iter(self):
+            time.sleep(0.02)
+            yield chunk
+
+    monkeypatch.setattr(FileBody, "__iter__", slow_iter)
+
+    async def scenario(base_url):
+        ticks = 0
+        done = asyncio.Event()
+
+        async def tick():
+            nonlocal ticks
+            while not done.is_set():
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticker = asyncio.ensure_future(tick())
+        request = Request(
+            name="upload", url=f"{base_url}/upload", method="POST",
+            body=str(path), body_mode=BodyMode.BINARY, body_encoding="gzip"
+        )
+        async with AsyncHttpClient() as client:
+            result = await client.send_request(request)
+        done.set()
+        await ticker
+        return result, ticks
+
+    (response, error), ticks = asyncio.run(_with_server(scenario))
+    assert error is None
+    assert response.get_content_as_json()["body"] == path.read_text()
+    # Com a leitura fora do loop, as outras tarefas continuam rodando durante o envio
+    assert ticks >= 5
+
+
+def test_reused_connection_failures_only_resend_when_safe():
+    received = []
+
+    async def handle(reader, writer):
+        """Responde a primeira requisição de cada conexão; na segunda, falha conforme o caminho"""
+        try:
+            served = 0
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                length = 0
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b""):
+                        break
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                await reader.readexactly(length)
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                received.append((method, target))
+                served += 1
+                if served == 1:
+                    writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+                elif target == "/cut":
+                    # Resposta interrompida: a requisição já foi processada
+                    writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\nabc")
+                    await writer.drain()
+                    break
+                else:
+                    # Conexão velha: fechada sem nenhum byte de resposta
+                    break
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def scenario(method, target):
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        base_url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+        try:
+            async with AsyncHttpClient(max_connections_per_host=1) as client:
+                await client.send_request(Request(name="warm", url=f"{base_url}/warm"))
+                return await client.send_request(Request(name="r", url=f"{base_url}{target}", method=method, body="x"))
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    response, error = asyncio.run(scenario("POST", "/cut"))
+    assert error is not None and received.count(("POST", "/cut")) == 1
+
+    received.clear()
+    response, error = asyncio.run(scenario("PUT", "/cut"))
+    assert error is None and received.count(("PUT", "/cut")) == 2
+
+    received.clear()
+    response, error = asyncio.run(scenario("POST", "/stale"))
+    assert error is None and received.count(("POST", "/stale")) == 2
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes dos modos de corpo: o que foi escrito é exatamente o que é enviado
+"""
+
+import sys
+import os
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.http_client import HttpClient
+from src.core.multipart import FileBody, MultipartEncoder
+from src.models.request import Request, BodyMode
+from src.utils.curl_converter import curl_to_request
+
+
+def _prepare(body, body_mode=None, headers=None):
+    request = Request(name="r", url="http://api/", method="POST", headers=headers or {},
+                      body=body, body_mode=body_mode)
+    return HttpClient.prepare_request(request, {"name": "Ana"})
+
+
+def test_json_text_is_sent_as_written():
+    text = '{ "b": 1,\n  "a": "{{name}}" }'
+    prepared = _prepare(text, BodyMode.JSON)
+    assert prepared.body == b'{ "b": 1,\n  "a": "Ana" }'
+    assert prepared.headers["Content-Type"] == "application/json"
+
+    # Texto que não é JSON válido também é enviado sem alterações
+    assert _prepare("{ invalido", BodyMode.JSON).body == b"{ invalido"
+
+
+def test_raw_text_keeps_user_content_type():
+    prepared = _prepare("<a>{{name}}</a>", BodyMode.RAW, {"content-type": "application/xml"})
+    assert prepared.body == b"<a>Ana</a>"
+    assert [key for key in prepared.headers if key.lower() == "content-type"] == ["content-type"]
+
+    # Sem modo (requisições antigas), textos com cara de JSON mantêm o Content-Type
+    legacy = _prepare('[1,2]')
+    assert legacy.body == b"[1,2]" and legacy.headers["Content-Type"] == "application/json"
+
+
+def test_objects_and_forms_are_serialized():
+    assert _prepare({"a": "{{name}}"}, BodyMode.JSON).body == b'{"a": "Ana"}'
+    form = _prepare({"q": "a b", "n": "{{name}}"}, BodyMode.FORM)
+    assert form.body == b"q=a+b&n=Ana"
+    assert form.headers["Content-Type"] == "application/x-www-form-urlencoded"
+
+
+def test_empty_and_none_modes_send_no_body():
+    assert _prepare("texto", BodyMode.NONE).body is None
+    assert _prepare("", BodyMode.RAW).body is None
+
+
+def test_binary_and_multipart_bodies_are_read_from_disk(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"\x00\x01")
+
+    binary = _prepare(str(path), BodyMode.BINARY)
+    assert isinstance(binary.body, FileBody)
+    assert binary.headers["Content-Type"] == "application/octet-stream"
+
+    multipart = _prepare({"file": {"file": str(path)}, "name": "{{name}}"}, BodyMode.MULTIPART)
+    assert isinstance(multipart.body, MultipartEncoder)
+    assert multipart.headers["Content-Type"] == multipart.body.content_type
+    assert b'name="name"\r\n\r\nAna\r\n' in b"".join(multipart.body)
+
+
+def test_curl_bodies_keep_their_mode():
+    json_request = curl_to_request("""curl -X POST -d '{"a":  1}' https://api.example.com""")
+    assert json_request.body == '{"a":  1}' and json_request.body_mode == BodyMode.JSON
+
+    raw_request = curl_to_request("curl -X POST -d 'a=1&b=2' https://api.example.com")
+    assert raw_request.body == "a=1&b=2" and raw_request.body_mode == BodyMode.RAW
+
+    file_request = curl_to_request("curl -X POST --data-binary @/tmp/data.bin https://api.example.com")
+    assert file_request.body == "/tmp/data.bin" and file_request.body_mode == BodyMode.BINARY
+
+    form_request = curl_to_request("curl -F 'photo=@/tmp/a.png;type=image/png' https://api.example.com")
+    assert form_request.body_mode == BodyMode.MULTIPART
+    assert form_request.body == {"photo": {"file": "/tmp/a.png", "content_type": "image/png"}}
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes dos tokens de cancelamento e dos tempos limite
+"""
+
+import sys
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.cancellation import (
+    CancellationToken, RequestCancelled, DeadlineExceeded, REASON_CANCELLED, REASON_DEADLINE
+)
+from src.core.http_client import HttpClient
+from src.models.request import Request
+from src.models.timeouts import Timeouts
+
+
+class _StallingHandler(BaseHTTPRequestHandler):
+    """Servidor de teste que envia os cabeçalhos e demora a enviar o corpo"""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "10")
+        self.end_headers()
+        self.wfile.write(b"12345")
+        self.wfile.flush()
+        time.sleep(2)
+        self.wfile.write(b"67890")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def request_to_stalling_server(http_server):
+    return Request(name="slow", url=f"{http_server(_StallingHandler).url}/")
+
+
+def test_cancel_runs_callbacks_once_and_reaches_children():
+    parent = CancellationToken()
+    child = CancellationToken(parent=parent)
+    calls = []
+    handle = child.register(lambda: calls.append("a"))
+    child.register(lambda: calls.append("b"))
+    child.unregister(handle)
+
+    parent.cancel()
+    parent.cancel()
+    assert child.cancelled and child.reason == REASON_CANCELLED
+    assert calls == ["b"]
+    with pytest.raises(RequestCancelled):
+        child.raise_if_cancelled()
+
+    # Registros após o cancelamento são executados na hora
+    assert child.register(lambda: calls.append("c")) is None
+    assert calls == ["b", "c"]
+
+
+def test_deadline_cancels_and_closing_unschedules_it():
+    token = CancellationToken(timeout=0.05)
+    assert token.wait(1)
+    assert token.reason == REASON_DEADLINE
+    with pytest.raises(DeadlineExceeded):
+        token.raise_if_cancelled()
+
+    closed = CancellationToken(timeout=0.05)
+    closed.close()
+    assert not closed.wait(0.15)
+
+    # Um filho fechado deixa de acompanhar o pai
+    parent = CancellationToken()
+    child = CancellationToken(parent=parent)
+    child.close()
+    parent.cancel()
+    assert not child.cancelled
+
+
+def test_remaining_uses_the_nearest_deadline():
+    parent = CancellationToken(timeout=10)
+    child = CancellationToken(parent=parent, timeout=60)
+    assert 9 < child.remaining() <= 10
+    assert CancellationToken().remaining() is None
+    child.close()
+    parent.close()
+
+
+def test_attempt_timeouts_never_exceed_the_remaining_time():
+    timeouts = Timeouts(connect=5, read=None, total=2)
+    assert timeouts.for_attempt(None) == (5, None)
+    assert timeouts.for_attempt(1.5) == (1.5, 1.5)
+    assert timeouts.for_attempt(-1) == (0.001, 0.001)
+    assert Timeouts.from_dict(timeouts.to_dict()).to_dict() == timeouts.to_dict()
+
+
+def test_total_timeout_interrupts_a_stalled_body(request_to_stalling_server):
+    started = time.monotonic()
+    response, error = HttpClient.send_request(request_to_stalling_server, timeouts=Timeouts(total=0.3))
+    assert time.monotonic() - started < 1.5
+    assert response.status_code == 0
+    assert error == "Requisição interrompida: tempo total esgotado"
+
+
+def test_cancel_token_interrupts_a_send(request_to_stalling_server):
+    token = CancellationToken()
+    threading.Timer(0.2, token.cancel).start()
+    started = time.monotonic()
+    response, error = HttpClient.send_request(request_to_stalling_server, cancel_token=token)
+    assert time.monotonic() - started < 1.5
+    assert error == "Requisição cancelada"
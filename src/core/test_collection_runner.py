@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes da execução de coleções
+"""
+
+import sys
+import os
+import threading
+import time
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.collection_runner import CollectionRunner, RunOrder
+from src.core.storage import Storage
+from src.core.variable_processor import VariableProcessor
+from src.models.collection import Collection, Folder
+from src.models.request import Request, Response
+
+
+def _echo_send(request, variables, **options):
+    """Envio simulado que responde com a URL resolvida"""
+    url = VariableProcessor.process_string(request.url, variables)
+    return Response(status_code=200, headers={}, content=url.encode(), elapsed_time=0.0), None
+
+
+def _collection(tmp_path, count=3):
+    storage = Storage(str(tmp_path))
+    collection = Collection("api")
+    folder = Folder("users")
+    for index in range(count):
+        request = Request(name=f"r{index}", url=f"http://{{{{host}}}}/{index}")
+        storage.save_request(request)
+        (collection if index == 0 else folder).add_request(request.id)
+    collection.add_folder(folder)
+    return storage, collection
+
+
+def test_results_follow_tree_order(tmp_path):
+    storage, collection = _collection(tmp_path)
+    for order in RunOrder.ALL:
+        runner = CollectionRunner(storage, concurrency=3, order=order, send_function=_echo_send)
+        results = runner.run_all(collection, {"host": "api"})
+        assert [result.response.content for result in results] == [
+            b"http://api/0", b"http://api/1", b"http://api/2"
+        ]
+        assert [result.folder_path for result in results] == [[], ["users"], ["users"]]
+        assert all(result.success for result in results)
+
+
+def test_sequential_order_sends_one_at_a_time(tmp_path):
+    storage, collection = _collection(tmp_path, count=4)
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def send(request, variables, **options):
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.01)
+        with lock:
+            active.pop()
+        return _echo_send(request, variables)
+
+    CollectionRunner(storage, concurrency=4, order=RunOrder.SEQUENTIAL, send_function=send).run_all(collection, {})
+    assert max(peak) == 1
+
+
+def test_missing_request_is_reported(tmp_path):
+    storage, collection = _collection(tmp_path, count=1)
+    collection.add_request("nao-existe")
+    results = CollectionRunner(storage, send_function=_echo_send).run_all(collection, {})
+    assert results[1].error == "Requisição não encontrada: nao-existe"
+    assert not results[1].success
+
+
+def test_empty_collection_does_not_schedule_a_deadline(tmp_path):
+    runner = CollectionRunner(Storage(str(tmp_path)), run_timeout=30, send_function=_echo_send)
+    token = runner._cancel_token
+    assert runner.run_all(Collection("vazia")) == []
+    assert runner._cancel_token is token
+
+
+def test_run_timeout_cancels_pending_requests(tmp_path):
+    storage, collection = _collection(tmp_path, count=3)
+
+    def send(request, variables, cancel_token=None, **options):
+        cancel_token.wait(5)
+        return Response(status_code=0, headers={}, content=b"", elapsed_time=0.0), "Tempo esgotado"
+
+    started = time.monotonic()
+    runner = CollectionRunner(storage, order=RunOrder.SEQUENTIAL, run_timeout=0.1, send_function=send)
+    results = runner.run_all(collection, {})
+    assert time.monotonic() - started < 2
+    # A requisição em andamento é interrompida e as seguintes, descartadas
+    assert len(results) == 1 and results[0].error == "Tempo esgotado"
+
+
+def test_closing_the_iterator_stops_the_run(tmp_path):
+    storage, collection = _collection(tmp_path, count=3)
+    runner = CollectionRunner(storage, concurrency=1, order=RunOrder.SEQUENTIAL, send_function=_echo_send)
+    results = runner.run(collection, {"host": "api"})
+    next(results)
+    results.close()
+    assert runner._stop_event.is_set()
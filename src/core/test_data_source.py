@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes dos arquivos de dados lidos em fluxo e da divisão em partes
+"""
+
+import sys
+import os
+import json
+
+import pytest
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core import data_source
+from src.core.collection_runner import CollectionRunner
+from src.core.data_source import DataSource, DataSourceError, detect_format, CSV, JSON, JSONL
+from src.core.storage import Storage
+from src.core.variable_processor import VariableProcessor
+from src.models.collection import Collection
+from src.models.request import Request, Response
+
+
+def _write(tmp_path, name, content):
+    path = tmp_path / name
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_format_is_detected_by_extension(tmp_path):
+    assert detect_format("dados.CSV") == CSV
+    assert detect_format("dados.json") == JSON
+    assert detect_format("dados.ndjson") == detect_format("dados.jsonl") == JSONL
+    with pytest.raises(DataSourceError):
+        detect_format("dados.txt")
+    with pytest.raises(DataSourceError):
+        DataSource("dados.csv", data_format="xml")
+    with pytest.raises(DataSourceError):
+        DataSource("dados.csv", shard_index=2, shard_count=2)
+
+
+def test_csv_rows_fill_missing_columns(tmp_path):
+    path = _write(tmp_path, "dados.csv", 'id,name\n1,"Ana, Maria"\n2\n3,c,extra\n')
+    assert list(DataSource(path)) == [
+        {"id": "1", "name": "Ana, Maria"}, {"id": "2", "name": ""}, {"id": "3", "name": "c"}
+    ]
+    assert list(DataSource(path).shard(1, 2)) == [{"id": "2", "name": ""}]
+
+
+def test_json_array_is_decoded_across_chunks(tmp_path, monkeypatch):
+    rows = [{"id": index, "name": "ç" * index, "tags": ["a", None]} for index in range(50)]
+    path = _write(tmp_path, "dados.json", json.dumps(rows, ensure_ascii=False, indent=2))
+    expected = [
+        {"id": str(index), "name": "ç" * index, "tags": '["a", null]'} for index in range(50)
+    ]
+    assert list(DataSource(path)) == expected
+
+    # Blocos pequenos dividem números, textos e objetos entre leituras
+    for chunk_size in (1, 3, 7):
+        monkeypatch.setattr(data_source, "_CHUNK_SIZE", chunk_size)
+        assert list(DataSource(path)) == expected
+        assert list(DataSource(path).shard(2, 3)) == expected[2::3]
+
+    assert list(DataSource(_write(tmp_path, "vazio.json", " [ ] "))) == []
+
+
+@pytest.mark.parametrize("content", [
+    '{"id": 1}',
+    '[{"id": 1}',
+    '[{"id": 1} {"id": 2}]',
+    '[{"id": 1}, [2]]',
+    '[{"id": }]',
+])
+def test_invalid_json_raises(tmp_path, monkeypatch, content):
+    monkeypatch.setattr(data_source, "_CHUNK_SIZE", 4)
+    path = _write(tmp_path, "dados.json", content)
+    with pytest.raises(DataSourceError):
+        list(DataSource(path))
+
+
+def test_jsonl_skips_blank_lines_and_reads_the_last_line_without_newline(tmp_path):
+    path = _write(tmp_path, "dados.jsonl", '{"id": 1}\r\n\n   \n{"id": 2, "ok": true}\n{"id": 3}')
+    assert list(DataSource(path)) == [{"id": "1"}, {"id": "2", "ok": "true"}, {"id": "3"}]
+
+    bad = _write(tmp_path, "ruim.jsonl", '{"id": 1}\n{"id": \n')
+    with pytest.raises(DataSourceError, match="Linha 2"):
+        list(DataSource(bad))
+    with pytest.raises(DataSourceError, match="Linha 1"):
+        list(DataSource(_write(tmp_path, "lista.jsonl", "[1, 2]\n")))
+
+
+@pytest.mark.parametrize("trailing_newline", [True, False])
+def test_jsonl_shards_cover_every_line_once(tmp_path, trailing_newline):
+    # Linhas de tamanhos variados (com texto multibyte e linhas em branco) fazem as
+    # faixas de bytes cair no meio das linhas, nos separadores e no fim do arquivo
+    lines = []
+    for index in range(40):
+        lines.append(json.dumps({"id": index, "pad": "é" * (index % 7)}, ensure_ascii=False))
+        if index % 9 == 0:
+            lines.append("")
+    content = "\n".join(lines) + ("\n" if trailing_newline else "")
+    path = _write(tmp_path, "dados.jsonl", content)
+    expected = [str(index) for index in range(40)]
+    size = os.path.getsize(path)
+
+    for count in (1, 2, 3, 7, 16, size, size + 5):
+        parts = [[row["id"] for row in DataSource(path).shard(index, count)] for index in range(count)]
+        assert [row_id for part in parts for row_id in part] == expected, count
+
+
+def test_jsonl_shard_starting_at_a_line_start_keeps_that_line(tmp_path):
+    # 11 bytes por linha: com 2 partes, a segunda começa exatamente no início da linha 3
+    path = _write(tmp_path, "dados.jsonl", '{"i":"01"}\n{"i":"02"}\n{"i":"03"}\n{"i":"04"}\n')
+    assert [row["i"] for row in DataSource(path).shard(0, 2)] == ["01", "02"]
+    assert [row["i"] for row in DataSource(path).shard(1, 2)] == ["03", "04"]
+
+
+def test_runner_runs_one_iteration_per_row(tmp_path):
+    storage = Storage(str(tmp_path / "storage"))
+    collection = Collection("api")
+    for name in ("a", "b"):
+        request = Request(name=name, url=f"http://api.test/{name}/{{{{id}}}}?host={{{{host}}}}")
+        storage.save_request(request)
+        collection.add_request(request.id)
+
+    def send(request, variables, **options):
+        url = VariableProcessor.process_string(request.url, variables)
+        return Response(status_code=200, headers={}, content=url.encode(), elapsed_time=0.0), None
+
+    path = _write(tmp_path, "dados.jsonl", '{"id": 1}\n\n{"id": 2, "host": "linha"}\n{"id": 3}')
+    runner = CollectionRunner(storage, send_function=send)
+    results = runner.run_all(collection, {"host": "env"}, data=DataSource(path))
+    assert [(result.iteration, result.response.content) for result in results] == [
+        (0, b"http://api.test/a/1?host=env"), (0, b"http://api.test/b/1?host=env"),
+        (1, b"http://api.test/a/2?host=linha"), (1, b"http://api.test/b/2?host=linha"),
+        (2, b"http://api.test/a/3?host=env"), (2, b"http://api.test/b/3?host=env"),
+    ]
+
+    limited = runner.run_all(collection, {"host": "env"}, data=DataSource(path), iterations=1)
+    assert {result.iteration for result in limited} == {0}
+
+
+def test_requests_are_read_once_per_run(tmp_path, monkeypatch):
+    storage = Storage(str(tmp_path / "storage"))
+    collection = Collection("api")
+    request = Request(name="r", url="http://api.test/{{id}}")
+    storage.save_request(request)
+    collection.add_request(request.id)
+
+    reads = []
+    get_request = storage.get_request
+    monkeypatch.setattr(storage, "get_request", lambda request_id: reads.append(request_id) or get_request(request_id))
+
+    def send(request, variables, **options):
+        return Response(status_code=200, headers={}, content=b"", elapsed_time=0.0), None
+
+    path = _write(tmp_path, "dados.jsonl", "".join(f'{{"id": {index}}}\n' for index in range(50)))
+    results = CollectionRunner(storage, concurrency=4, send_function=send).run_all(collection, data=DataSource(path))
+    assert len(results) == 50 and reads == [request.id]
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes do download de respostas para arquivo (segmentos e retomada)
+"""
+
+import sys
+import os
+import re
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.downloader import FileDownloader, DownloadError, _DownloadState, _Segment
+from src.core.prepared_cache import PreparedSend
+from src.core.session_pool import SessionPool
+from src.models.request import Request
+
+DATA = bytes(range(256)) * 400
+ETAG = '"v1"'
+
+
+class _FileHandler(BaseHTTPRequestHandler):
+    """Servidor de teste que serve DATA, com ou sem suporte a intervalos"""
+    protocol_version = "HTTP/1.1"
+    accept_ranges = True
+    # Respostas cortadas ao meio (uma por pedido) antes de o servidor servir normalmente
+    cut_responses = 0
+    ranges = []
+
+    def do_GET(self):
+        byte_range = self.headers.get("Range")
+        type(self).ranges.append(byte_range)
+        match = re.match(r"bytes=(\d+)-(\d*)", byte_range or "")
+
+        if not self.accept_ranges or match is None:
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(DATA)))
+            self.send_header("ETag", ETAG)
+            self.end_headers()
+            if type(self).cut_responses:
+                type(self).cut_responses -= 1
+                self.wfile.write(DATA[:len(DATA) // 3])
+                self.close_connection = True
+                return
+            self.wfile.write(DATA)
+            return
+
+        start = int(match.group(1))
+        end = int(match.group(2)) if match.group(2) else len(DATA) - 1
+        self.send_response(206)
+        self.send_header("Content-Range", f"bytes {start}-{end}/{len(DATA)}")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("ETag", ETAG)
+        self.end_headers()
+        self.wfile.write(DATA[start:end + 1])
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server(http_server):
+    return http_server(type("Handler", (_FileHandler,), {"ranges": []}))
+
+
+def _prepared(server, body=b""):
+    url = f"{server.url}/file.bin"
+    return PreparedSend(Request(name="file", url=url), url, {}, body)
+
+
+def test_download_is_split_in_segments(server, tmp_path):
+    target = str(tmp_path / "file.bin")
+    downloader = FileDownloader(SessionPool(), segments=4, min_segment_size=len(DATA) // 4)
+
+    response = downloader.download(_prepared(server), target)
+    assert response.status_code == 200 and response.body_path == target
+    with open(target, "rb") as downloaded:
+        assert downloaded.read() == DATA
+    assert len(server.RequestHandlerClass.ranges) == 4
+    assert not os.path.exists(f"{target}.part.json")
+
+
+def _interrupted(target, written):
+    """Simula um download interrompido depois de `written` bytes"""
+    with open(f"{target}.part", "wb") as part_file:
+        part_file.write(DATA[:written])
+        part_file.truncate(len(DATA))
+    return _DownloadState(None, len(DATA), ETAG, [_Segment(0, len(DATA) - 1, written)])
+
+
+def test_resume_requests_only_the_missing_bytes(server, tmp_path):
+    target = str(tmp_path / "file.bin")
+    prepared = _prepared(server)
+    state = _interrupted(target, 1000)
+    state.url = prepared.url
+    state.save(f"{target}.part.json")
+
+    response = FileDownloader(SessionPool()).download(prepared, target)
+    assert server.RequestHandlerClass.ranges == [f"bytes=1000-{len(DATA) - 1}"]
+    assert response.wire_size == len(DATA) - 1000
+    with open(target, "rb") as downloaded:
+        assert downloaded.read() == DATA
+
+
+def test_resume_restarts_when_range_is_answered_with_200(server, tmp_path):
+    server.RequestHandlerClass.accept_ranges = False
+    target = str(tmp_path / "file.bin")
+    prepared = _prepared(server)
+    state = _interrupted(target, 1000)
+    state.url = prepared.url
+    state.save(f"{target}.part.json")
+
+    response = FileDownloader(SessionPool(), max_retries=3).download(prepared, target)
+    # O corpo inteiro recebido no lugar do intervalo é gravado desde o início, sem novo pedido
+    assert server.RequestHandlerClass.ranges == [f"bytes=1000-{len(DATA) - 1}"]
+    assert response.wire_size == len(DATA)
+    with open(target, "rb") as downloaded:
+        assert downloaded.read() == DATA
+
+
+def test_download_without_range_support_restarts_after_a_dropped_connection(server, tmp_path):
+    handler = server.RequestHandlerClass
+    handler.accept_ranges = False
+    handler.cut_responses = 1
+    target = str(tmp_path / "file.bin")
+
+    response = FileDownloader(SessionPool(), max_retries=2).download(_prepared(server), target)
+    # A nova tentativa pede o restante, recebe o corpo inteiro e o grava desde o início
+    assert handler.ranges[0] == "bytes=0-" and handler.ranges[1].startswith("bytes=")
+    assert len(handler.ranges) == 2
+    assert response.status_code == 200
+    with open(target, "rb") as downloaded:
+        assert downloaded.read() == DATA
+
+
+def test_body_that_can_only_be_read_once_is_rejected(server, tmp_path):
+    with pytest.raises(DownloadError):
+        FileDownloader(SessionPool()).download(_prepared(server, iter([b"x"])), str(tmp_path / "file.bin"))
+    assert server.RequestHandlerClass.ranges == []
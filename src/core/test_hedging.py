@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes das requisições duplicadas (hedging)
+"""
+
+import sys
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.cancellation import CancellationToken
+from src.core.hedging import LatencyTracker, send_hedged
+from src.models.request import Response
+from src.models.retry_policy import HedgePolicy
+
+
+def _ok(label):
+    return Response(status_code=200, headers={}, content=label.encode(), elapsed_time=0.0), None, False
+
+
+def test_slow_original_is_cancelled_when_hedge_wins():
+    original_token = []
+    calls = []
+    lock = threading.Lock()
+
+    def send(token):
+        with lock:
+            calls.append(token)
+            first = len(calls) == 1
+        if first:
+            original_token.append(token)
+            # O envio original só termina quando cancelado
+            assert token.wait(5)
+            raise RuntimeError("conexão fechada")
+        return _ok("hedge")
+
+    acquired = []
+    executor = ThreadPoolExecutor(max_workers=4)
+    try:
+        response, error, _ = send_hedged(
+            send, HedgePolicy(max_hedges=1, min_delay=0.01), 0.01, executor,
+            before_hedge=acquired.append
+        )
+        assert error is None
+        assert response.content == b"hedge" and response.hedged
+        assert len(acquired) == 1
+    finally:
+        executor.shutdown(wait=True)
+    # O perdedor foi cancelado e terminou com exceção sem quebrar o callback de descarte
+    assert original_token[0].cancelled
+
+
+def test_parent_cancellation_reaches_every_send():
+    parent = CancellationToken()
+    started = threading.Barrier(3)
+
+    def send(token):
+        started.wait(5)
+        token.wait(5)
+        return Response(status_code=0, headers={}, content=b"", elapsed_time=0.0), "cancelada", False
+
+    executor = ThreadPoolExecutor(max_workers=4)
+    try:
+        threading.Timer(0.2, parent.cancel).start()
+        response, error, _ = send_hedged(send, HedgePolicy(max_hedges=2, min_delay=0.01), 0.01, executor, parent)
+        assert response.status_code == 0 and error == "cancelada"
+    finally:
+        executor.shutdown(wait=True)
+
+
+def test_hedge_is_skipped_when_rate_limiter_refuses():
+    release = threading.Event()
+
+    def send(token):
+        release.wait(5)
+        return _ok("original")
+
+    def before_hedge(token):
+        raise RuntimeError("limite de taxa")
+
+    executor = ThreadPoolExecutor(max_workers=4)
+    try:
+        threading.Timer(0.1, release.set).start()
+        response, error, _ = send_hedged(send, HedgePolicy(max_hedges=1, min_delay=0.01), 0.01, executor,
+                                         before_hedge=before_hedge)
+        assert response.content == b"original" and not response.hedged
+    finally:
+        executor.shutdown(wait=True)
+
+
+def test_latency_tracker_percentile_needs_samples():
+    tracker = LatencyTracker(window=10)
+    assert tracker.percentile("GET /", 95) is None
+    for value in range(1, 21):
+        tracker.record("GET /", value / 1000)
+    assert tracker.percentile("GET /", 95, min_samples=50) is None
+    p95 = tracker.percentile("GET /", 95)
+    assert 0.017 <= p95 <= 0.021
+
+
+def test_original_runs_on_the_caller_thread_when_the_executor_is_busy():
+    executor = ThreadPoolExecutor(max_workers=1)
+    busy = threading.Event()
+    executor.submit(busy.wait, 5)
+    threads = []
+
+    def send(token):
+        threads.append(threading.current_thread())
+        return _ok("original")
+
+    try:
+        response, error, _ = send_hedged(send, HedgePolicy(max_hedges=2, min_delay=0.01), 0.01, executor)
+        assert error is None and response.content == b"original" and not response.hedged
+        assert threads == [threading.current_thread()]
+    finally:
+        busy.set()
+        executor.shutdown(wait=True)
+
+
+def test_failed_original_waits_for_a_running_hedge():
+    calls = []
+    lock = threading.Lock()
+
+    def send(token):
+        with lock:
+            calls.append(token)
+            first = len(calls) == 1
+        if first:
+            # Falha depois que a cópia já foi enviada
+            while len(calls) < 2:
+                token.wait(0.01)
+            return Response(status_code=0, headers={}, content=b"", elapsed_time=0.0), "recusada", False
+        return _ok("hedge")
+
+    executor = ThreadPoolExecutor(max_workers=2)
+    try:
+        response, error, _ = send_hedged(send, HedgePolicy(max_hedges=1, min_delay=0.01), 0.01, executor)
+        assert error is None and response.content == b"hedge" and response.hedged
+    finally:
+        executor.shutdown(wait=True)
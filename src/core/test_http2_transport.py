@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes da seleção do transporte e do protocolo negociado
+"""
+
+import sys
+import os
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.http_client import HttpClient, TRANSPORT_HTTP1, TRANSPORT_HTTP2
+from src.core.http2_transport import Http2ConnectError, is_http2_available
+from src.core.resolver import HostResolver
+from src.models.request import Request
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    """Servidor de teste HTTP/1.1 que devolve o cabeçalho Host"""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = self.headers.get("Host", "").encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server(http_server):
+    try:
+        yield http_server(_OkHandler)
+    finally:
+        HttpClient.configure_transport(TRANSPORT_HTTP1)
+
+
+def test_unknown_transport_is_rejected():
+    with pytest.raises(ValueError):
+        HttpClient.configure_transport("spdy")
+    assert HttpClient.get_transport() == TRANSPORT_HTTP1
+
+
+@pytest.mark.skipif(is_http2_available(), reason="httpx[http2] instalado")
+def test_http2_requires_the_optional_dependency():
+    with pytest.raises(RuntimeError):
+        HttpClient.configure_transport(TRANSPORT_HTTP2)
+    assert HttpClient.get_transport() == TRANSPORT_HTTP1
+
+
+def test_http1_send_records_the_protocol(server):
+    request = Request(name="ok", url=f"http://127.0.0.1:{server.server_address[1]}/")
+    response, error = HttpClient.send_request(request)
+    assert error is None
+    assert response.http_version == "HTTP/1.1"
+
+
+@pytest.mark.skipif(not is_http2_available(), reason="httpx[http2] não instalado")
+def test_http2_transport_falls_back_to_http1_and_honours_overrides(server):
+    HttpClient.configure_transport(TRANSPORT_HTTP2)
+    port = server.server_address[1]
+
+    # Sem TLS (ALPN) a origem continua em HTTP/1.1
+    response, error = HttpClient.send_request(Request(name="ok", url=f"http://127.0.0.1:{port}/"))
+    assert error is None and response.http_version == "HTTP/1.1"
+
+    with HostResolver.overrides({f"api.test:{port}": "127.0.0.1"}):
+        response, error = HttpClient.send_request(Request(name="ok", url=f"http://api.test:{port}/"))
+    assert error is None
+    assert response.content == f"api.test:{port}".encode()
+
+    with pytest.raises(Http2ConnectError):
+        HttpClient._http2_transport.request("GET", "http://127.0.0.1:1/", timeout=1)
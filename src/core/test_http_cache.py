@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes do cache HTTP em disco
+"""
+
+import sys
+import os
+from http.server import BaseHTTPRequestHandler
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.http_cache import HttpCache
+from src.core.http_client import HttpClient
+from src.models.request import Request
+
+
+class _ETagHandler(BaseHTTPRequestHandler):
+    """Servidor de teste que responde 304 quando o ETag enviado confere"""
+    protocol_version = "HTTP/1.1"
+    etag = '"v1"'
+    requests = []
+
+    def do_GET(self):
+        _ETagHandler.requests.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = b'{"version": 1}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Cache-Control", "max-age=60")
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Storage:
+    """Armazenamento mínimo para HttpClient.configure_cache"""
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+
+def _store(cache, headers, request_headers=None, content=b"body"):
+    return cache.store("GET", "http://api/items", 200, headers, content=content, request_headers=request_headers)
+
+
+def test_fresh_entry_is_served_and_stale_entry_revalidated(tmp_path):
+    cache = HttpCache(tmp_path)
+    entry = _store(cache, {"Cache-Control": "max-age=60", "ETag": '"a"'})
+    assert entry is not None and entry.is_fresh()
+
+    found = cache.lookup("GET", "http://api/items", {})
+    assert found is not None and found.read_content() == b"body"
+    assert found.conditional_headers() == {"If-None-Match": '"a"'}
+
+    found.stored_at -= 120
+    assert not found.is_fresh()
+    refreshed = cache.refresh(found, {"Cache-Control": "max-age=60", "Content-Length": "0"})
+    assert refreshed.is_fresh()
+    assert "Content-Length" not in refreshed.headers
+
+
+def test_vary_selects_the_stored_variant(tmp_path):
+    cache = HttpCache(tmp_path)
+    _store(cache, {"Cache-Control": "max-age=60", "Vary": "Accept"}, {"Accept": "application/json"})
+
+    assert cache.lookup("GET", "http://api/items", {"Accept": "application/json"}) is not None
+    assert cache.lookup("GET", "http://api/items", {"Accept": "text/xml"}) is None
+    assert _store(cache, {"Cache-Control": "max-age=60", "Vary": "*"}) is None
+
+
+def test_credentials_are_never_shared(tmp_path):
+    cache = HttpCache(tmp_path)
+    # Respostas a requisições com Authorization só são armazenadas se forem públicas
+    assert _store(cache, {"Cache-Control": "max-age=60"}, {"Authorization": "Bearer dev"}) is None
+
+    _store(cache, {"Cache-Control": "public, max-age=60"}, {"Authorization": "Bearer dev"})
+    assert cache.lookup("GET", "http://api/items", {"Authorization": "Bearer dev"}) is not None
+    assert cache.lookup("GET", "http://api/items", {"Authorization": "Bearer prod"}) is None
+
+    # Entradas sem credenciais não são servidas a requisições com Authorization
+    _store(cache, {"Cache-Control": "max-age=60"}, {"Cookie": "session=1"})
+    assert cache.lookup("GET", "http://api/items", {"Cookie": "session=2"}) is None
+    assert cache.lookup("GET", "http://api/items", {"Cookie": "session=1", "Authorization": "x"}) is None
+
+    # Os valores das credenciais não são gravados em disco
+    for path in tmp_path.glob("*.json"):
+        assert "session=1" not in path.read_text()
+
+
+def test_body_headers_are_not_stored(tmp_path):
+    cache = HttpCache(tmp_path)
+    entry = _store(cache, {"Cache-Control": "max-age=60", "Content-Encoding": "gzip", "Content-Length": "20"})
+    assert set(entry.headers) == {"Cache-Control"}
+
+
+def test_request_directives():
+    assert HttpCache.requires_revalidation({"Cache-Control": "no-cache"})
+    assert HttpCache.requires_revalidation({"cache-control": "max-age=0"})
+    assert HttpCache.requires_revalidation({"Pragma": "no-cache"})
+    assert not HttpCache.requires_revalidation({"Cache-Control": "max-age=10"})
+    assert not HttpCache.is_request_cacheable("GET", {"Cache-Control": "no-store"})
+    assert not HttpCache.is_request_cacheable("GET", {"If-None-Match": '"a"'})
+    assert not HttpCache.is_request_cacheable("POST", {})
+
+
+def test_lookup_does_not_rewrite_metadata(tmp_path):
+    cache = HttpCache(tmp_path)
+    entry = _store(cache, {"Cache-Control": "max-age=60"})
+    meta_path = tmp_path / f"{entry.key}.json"
+    before = meta_path.stat().st_mtime_ns
+
+    for _ in range(3):
+        assert cache.lookup("GET", "http://api/items", {}) is not None
+    assert meta_path.stat().st_mtime_ns == before
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = HttpCache(tmp_path, max_size=10)
+    first = cache.store("GET", "http://api/a", 200, {"Cache-Control": "max-age=60"}, content=b"aaaa")
+    cache.store("GET", "http://api/b", 200, {"Cache-Control": "max-age=60"}, content=b"bbbb")
+    assert cache.lookup("GET", "http://api/a", {}) is not None
+
+    cache.store("GET", "http://api/c", 200, {"Cache-Control": "max-age=60"}, content=b"cccc")
+    assert cache.lookup("GET", "http://api/a", {}) is not None
+    assert cache.lookup("GET", "http://api/b", {}) is None
+    assert cache.total_size <= 10
+    assert first.key != cache.make_key("GET", "http://api/b")
+
+
+def test_client_revalidates_with_304(tmp_path, http_server):
+    _ETagHandler.requests = []
+    server = http_server(_ETagHandler)
+    HttpClient.configure_cache(_Storage(tmp_path))
+    try:
+        url = f"{server.url}/items"
+
+        response, error = HttpClient.send_request(Request(name="items", url=url))
+        assert error is None and response.status_code == 200
+
+        response, error = HttpClient.send_request(Request(name="items", url=url))
+        assert response.cache_status == "hit"
+        assert len(_ETagHandler.requests) == 1
+
+        # no-cache força a revalidação, que o servidor confirma com 304
+        response, error = HttpClient.send_request(
+            Request(name="items", url=url, headers={"Cache-Control": "no-cache"})
+        )
+        assert error is None
+        assert response.cache_status == "revalidated"
+        assert response.status_code == 200 and response.content == b'{"version": 1}'
+        assert _ETagHandler.requests[-1]["If-None-Match"] == '"v1"'
+
+        # Com o validador do próprio usuário, o 304 é entregue como veio
+        response, error = HttpClient.send_request(
+            Request(name="items", url=url, headers={"If-None-Match": '"v1"'})
+        )
+        assert response.status_code == 304
+        assert response.cache_status is None
+    finally:
+        HttpClient.disable_cache()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes do teste de carga e do histograma de latências
+"""
+
+import sys
+import os
+import threading
+
+import pytest
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.latency_histogram import LatencyHistogram
+from src.core.load_tester import LoadTester, LoadStage
+from src.models.request import Request, Response
+
+
+def _ok(request, variables):
+    return Response(status_code=200, headers={}, content=b"", elapsed_time=0.0), None
+
+
+def test_histogram_percentiles_keep_relative_precision():
+    histogram = LatencyHistogram(significant_digits=3)
+    for millis in range(1, 1001):
+        histogram.record(millis / 1000)
+
+    assert histogram.count == 1000
+    assert histogram.min == 0.001 and histogram.max == 1.0
+    for percentile, expected in ((50, 0.5), (90, 0.9), (99, 0.99), (100, 1.0)):
+        assert histogram.percentile(percentile) == pytest.approx(expected, rel=1e-3)
+    assert histogram.cumulative_counts([0.0005, 0.101, 2.0]) == [0, 100, 1000]
+
+
+def test_histogram_merge_and_empty_values():
+    empty = LatencyHistogram()
+    assert empty.percentile(99) == 0.0 and empty.mean == 0.0
+
+    first, second = LatencyHistogram(), LatencyHistogram()
+    first.record(0.010, count=3)
+    second.record(0.030)
+    first.merge(second)
+    assert first.count == 4
+    assert first.mean == pytest.approx(0.015)
+    with pytest.raises(ValueError):
+        first.merge(LatencyHistogram(significant_digits=2))
+
+
+def test_schedule_follows_constant_and_ramped_rates():
+    request = Request(name="r", url="http://api/")
+    constant = LoadTester([request], [LoadStage(duration=1, target_rps=10)])
+    assert len(list(constant._schedule())) == 10
+
+    # Rampa de 0 a 20 req/s em 1 s: metade dos envios de uma taxa constante de 20 req/s
+    ramped = LoadTester([request], [LoadStage(duration=1, target_rps=20, ramp=True)])
+    offsets = list(ramped._schedule())
+    assert len(offsets) == 9
+    assert offsets == sorted(offsets) and offsets[0] > 0
+
+    # Estágio com taxa zero não gera envios
+    idle = LoadTester([request], [LoadStage(duration=1, target_rps=0)])
+    assert list(idle._schedule()) == []
+
+
+def test_run_counts_failures_and_rotates_requests():
+    requests = [Request(name="a", url="http://api/a"), Request(name="b", url="http://api/b")]
+    sent = []
+    lock = threading.Lock()
+
+    def send(request, variables):
+        with lock:
+            sent.append(request.name)
+        if request.name == "b":
+            return Response(status_code=500, headers={}, content=b"", elapsed_time=0.0), None
+        return _ok(request, variables)
+
+    result = LoadTester(requests, [LoadStage(duration=0.2, target_rps=50)], send_function=send).run()
+    assert result.total == len(sent) == 10
+    assert sent.count("a") == sent.count("b")
+    assert result.status_counts == {200: 5, 500: 5}
+    assert result.error_rate == 0.5 and result.transport_errors == 0
+
+
+def test_samples_beyond_the_queue_are_dropped():
+    release = threading.Event()
+
+    def slow(request, variables):
+        release.wait(5)
+        return _ok(request, variables)
+
+    tester = LoadTester(
+        [Request(name="r", url="http://api/")], [LoadStage(duration=0.2, target_rps=100)],
+        max_workers=1, max_queue=1, send_function=slow
+    )
+    threading.Timer(0.3, release.set).start()
+    result = tester.run()
+    assert result.total == 2
+    assert result.dropped == 18
+
+
+def test_invalid_configuration_is_rejected():
+    with pytest.raises(ValueError):
+        LoadStage(duration=0, target_rps=1)
+    with pytest.raises(ValueError):
+        LoadTester([], [LoadStage(duration=1, target_rps=1)])
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes dos ganchos de envio e da exportação de métricas (OpenMetrics)
+"""
+
+import sys
+import os
+import socket
+import urllib.request
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.hooks import HookRegistry, HookEvent, BEFORE_RESOLVE, BEFORE_SEND, AFTER_RESPONSE, ON_ERROR
+from src.core.http_client import HttpClient
+from src.core.metrics import MetricsSink, MetricsServer, error_kind, CONTENT_TYPE
+from src.models.request import Request, Response
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    """Servidor de teste que responde 200 ou 404 conforme o caminho"""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(404 if self.path == "/missing" else 200)
+        self.send_header("Content-Length", "5")
+        self.end_headers()
+        self.wfile.write(b"hello")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def base_url(http_server):
+    return http_server(_OkHandler).url
+
+
+def _closed_port():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def test_registry_emits_lazily_and_isolates_hook_errors():
+    registry = HookRegistry()
+    created = []
+
+    def factory():
+        created.append(1)
+        return HookEvent(AFTER_RESPONSE, Request(name="r", url="http://API.test/x"))
+
+    registry.emit(AFTER_RESPONSE, factory)
+    assert created == []
+
+    received = []
+    registry.register(AFTER_RESPONSE, lambda event: 1 / 0)
+    handle = registry.register(AFTER_RESPONSE, received.append)
+    registry.emit(AFTER_RESPONSE, factory)
+    assert len(created) == 1 and received[0].host == "api.test" and received[0].status_code == 0
+
+    assert registry.unregister(handle) and not registry.unregister(handle)
+    with pytest.raises(ValueError):
+        registry.register("after_everything", received.append)
+
+
+def test_send_emits_each_stage_with_resolved_values(base_url):
+    events = []
+    handles = [HttpClient.add_hook(stage, events.append)
+               for stage in (BEFORE_RESOLVE, BEFORE_SEND, AFTER_RESPONSE, ON_ERROR)]
+    try:
+        request = Request(name="r", url="{{base}}/items", headers={"X-Id": "{{id}}"})
+        HttpClient.send_request(request, {"base": base_url, "id": "7"})
+        assert [event.stage for event in events] == [BEFORE_RESOLVE, BEFORE_SEND, AFTER_RESPONSE]
+        assert events[0].url == "{{base}}/items"
+        assert events[1].url == f"{base_url}/items" and events[1].headers["X-Id"] == "7"
+        assert events[2].status_code == 200 and events[2].elapsed > 0
+
+        events.clear()
+        HttpClient.send_request(Request(name="down", url=f"http://127.0.0.1:{_closed_port()}/"))
+        assert events[-1].stage == ON_ERROR and events[-1].error
+    finally:
+        for handle in handles:
+            HttpClient.remove_hook(handle)
+
+
+def test_error_kinds_have_fixed_cardinality():
+    assert error_kind("Requisição interrompida: tempo total esgotado") == "deadline"
+    assert error_kind("Requisição cancelada") == "cancelled"
+    assert error_kind("Erro ao realizar requisição: Read timed out.") == "timeout"
+    assert error_kind("Erro ao realizar requisição: Connection refused") == "transport"
+    assert error_kind("Erro inesperado: boom") == "other"
+
+
+def test_sink_renders_openmetrics(base_url):
+    sink = MetricsSink(buckets=(0.5, 0.01)).install()
+    try:
+        HttpClient.send_request(Request(name="ok", url=f"{base_url}/"))
+        HttpClient.send_request(Request(name="missing", url=f"{base_url}/missing"))
+        HttpClient.send_request(Request(name="down", url=f"http://127.0.0.1:{_closed_port()}/"))
+    finally:
+        sink.uninstall()
+
+    retried = Response(status_code=200, headers={}, content=b"", elapsed_time=0.02)
+    retried.attempts = 3
+    sink.record(HookEvent(AFTER_RESPONSE, Request(name="r", url="http://api.test/"), response=retried))
+
+    text = sink.render()
+    assert text.endswith("# EOF\n")
+    assert 'pyrequestman_requests_total{method="GET",host="127.0.0.1",code="200"} 1' in text
+    assert 'pyrequestman_requests_total{method="GET",host="127.0.0.1",code="404"} 1' in text
+    assert 'pyrequestman_request_errors_total{method="GET",host="127.0.0.1",kind="transport"} 1' in text
+    assert 'pyrequestman_request_retries_total{method="GET",host="api.test"} 2' in text
+    assert 'pyrequestman_response_bytes_total{method="GET",host="127.0.0.1"} 10' in text
+    # Baldes ordenados e acumulados
+    assert text.index('le="0.01"') < text.index('le="0.5"')
+    assert 'pyrequestman_request_duration_seconds_bucket{method="GET",host="127.0.0.1",le="+Inf"} 2' in text
+    assert "pyrequestman_requests_in_flight 0" in text
+
+    sink.reset()
+    assert "pyrequestman_requests_total{" not in sink.render()
+
+
+def test_metrics_server_and_file_export(tmp_path):
+    sink = MetricsSink(prefix="app")
+    server = MetricsServer(sink, port=0)
+    url = server.start()
+    try:
+        with urllib.request.urlopen(url) as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            assert response.read().decode().endswith("# EOF\n")
+    finally:
+        server.stop()
+
+    path = str(tmp_path / "metrics.prom")
+    sink.write(path)
+    with open(path, "r", encoding="utf-8") as f:
+        assert "app_requests_in_flight 0" in f.read()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes do servidor de mocks das requisições salvas
+"""
+
+import sys
+import os
+import json
+import socket
+
+import pytest
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.http_client import HttpClient
+from src.core.mock_server import MockServer, MockRoute, MockRouter, path_template
+from src.core.storage import Storage
+from src.models.collection import Collection, Folder
+from src.models.mock_response import MockResponse
+from src.models.request import Request
+
+
+def test_path_template_keeps_unresolved_variables():
+    assert path_template("{{base_url}}/users/{{id}}?x=1") == "/users/{{id}}"
+    assert path_template("{{base_url}}/users/{{id}}", {"id": "7"}) == "/users/7"
+    assert path_template("https://api.test/v1/items/#frag") == "/v1/items"
+    assert path_template("api.test/v1") == "/v1"
+    assert path_template("{{base_url}}") == "/"
+
+
+def test_router_prefers_exact_paths_and_falls_back_from_head():
+    exact = MockRoute("GET", "/users/me", name="me")
+    template = MockRoute("GET", "/users/:id", name="user")
+    braces = MockRoute("DELETE", "/users/{id}", name="delete")
+    router = MockRouter([template, exact, braces, MockRoute("GET", "/users/me", name="duplicate")])
+
+    assert router.match("GET", "/users/me") is exact
+    assert router.match("GET", "/users/42/") is template
+    assert router.match("HEAD", "/users/42") is template
+    assert router.match("DELETE", "/users/42") is braces
+    assert router.match("POST", "/users/42") is None
+    assert router.match("GET", "/users/42/posts") is None
+
+
+@pytest.fixture
+def server(tmp_path):
+    storage = Storage(str(tmp_path))
+    collection = Collection("api")
+    folder = Folder("users")
+    requests = [
+        Request(name="list", url="{{base_url}}/users",
+                mock_response=MockResponse(200, {"X-Total": "2"}, [{"id": 1}, {"id": 2}])),
+        Request(name="create", method="POST", url="{{base_url}}/users", mock_response=MockResponse(201, body="criado")),
+        Request(name="get", url="{{base_url}}/users/{{id}}", mock_response=MockResponse(200, body={"id": "?"})),
+    ]
+    for request in requests:
+        storage.save_request(request)
+    collection.add_request(requests[0].id)
+    for request in requests[1:]:
+        folder.add_request(request.id)
+    collection.add_folder(folder)
+
+    server = MockServer.from_collection(storage, collection)
+    server.start()
+    try:
+        yield server
+    finally:
+        server.stop()
+
+
+def test_saved_responses_are_served_over_keep_alive(server):
+    HttpClient.configure_pool()
+    try:
+        response, error = HttpClient.send_request(Request(name="list", url=f"{server.url}/users"))
+        assert error is None and response.status_code == 200
+        assert json.loads(response.content) == [{"id": 1}, {"id": 2}]
+        assert response.headers["X-Total"] == "2"
+        assert response.headers["Content-Type"] == "application/json"
+
+        response, _ = HttpClient.send_request(Request(name="get", url=f"{server.url}/users/9?full=1"))
+        assert response.content == b'{"id": "?"}'
+
+        response, _ = HttpClient.send_request(
+            Request(name="create", method="POST", url=f"{server.url}/users", body="x" * 1000)
+        )
+        assert response.status_code == 201 and response.content == b"criado"
+
+        response, _ = HttpClient.send_request(Request(name="missing", url=f"{server.url}/nada"))
+        assert response.status_code == 404
+
+        stats = server.get_stats()
+        assert stats["routes"] == 3 and stats["requests"] == 4 and stats["matched"] == 3
+        assert HttpClient.get_pool_stats()["connections_reused"] == 3
+    finally:
+        HttpClient.configure_pool()
+
+
+def test_pipelined_and_chunked_requests_are_answered_in_order(server):
+    with socket.create_connection(("127.0.0.1", server.port), timeout=5) as connection:
+        connection.sendall(
+            b"POST /users HTTP/1.1\r\nHost: x\r\nTransfer-Encoding: chunked\r\n\r\n"
+            b"3\r\nabc\r\n0\r\n\r\n"
+            b"GET /users/1 HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n"
+        )
+        received = b""
+        while True:
+            chunk = connection.recv(65536)
+            if not chunk:
+                break
+            received += chunk
+
+    assert received.startswith(b"HTTP/1.1 201 Created\r\n")
+    assert received.count(b"HTTP/1.1 ") == 2
+    assert received.endswith(b'{"id": "?"}')
+
+
+def test_malformed_request_line_is_rejected(server):
+    with socket.create_connection(("127.0.0.1", server.port), timeout=5) as connection:
+        connection.sendall(b"nonsense\r\n\r\n")
+        assert connection.recv(65536).startswith(b"HTTP/1.1 400 ")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes dos corpos enviados do disco em blocos (arquivos, multipart e compressão)
+"""
+
+import sys
+import os
+import gzip
+import hashlib
+import json
+from http.server import BaseHTTPRequestHandler
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.http_client import HttpClient
+from src.core.multipart import FileBody, MultipartEncoder, ProgressBody
+from src.models.request import Request, BodyMode
+from src.utils.compression import CompressedStream
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    """Servidor de teste que descreve o corpo recebido (com ou sem chunks)"""
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        if "chunked" in self.headers.get("Transfer-Encoding", ""):
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0].strip(), 16)
+                if size == 0:
+                    self.rfile.readline()
+                    break
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+            body = b"".join(chunks)
+        else:
+            body = self.rfile.read(int(self.headers.get("Content-Length", "0")))
+
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+
+        payload = json.dumps({
+            "size": len(body),
+            "sha256": hashlib.sha256(body).hexdigest(),
+            "chunked": "chunked" in self.headers.get("Transfer-Encoding", ""),
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_file_body_is_read_again_on_each_pass(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"x" * 100)
+    body = FileBody(str(path), chunk_size=30)
+
+    assert len(body) == 100
+    assert [len(chunk) for chunk in body] == [30, 30, 30, 10]
+    assert b"".join(body) == b"x" * 100
+
+
+def test_multipart_size_matches_encoded_body(tmp_path):
+    path = tmp_path / "photo.png"
+    path.write_bytes(b"\x89PNG" * 10)
+    encoder = MultipartEncoder({"title": "férias", "photo": {"file": str(path)}}, boundary="b")
+
+    encoded = b"".join(encoder)
+    assert len(encoder) == len(encoded)
+    assert b'filename="photo.png"' in encoded
+    assert b"Content-Type: image/png" in encoded
+    assert encoded.endswith(b"--b--\r\n")
+
+
+def test_compressed_stream_does_not_need_the_whole_body(tmp_path):
+    path = tmp_path / "log.txt"
+    path.write_bytes(b"linha de log\n" * 50000)
+    stream = CompressedStream(FileBody(str(path), chunk_size=4096), "gzip")
+
+    assert not hasattr(stream, "__len__")
+    compressed = b"".join(stream)
+    assert gzip.decompress(compressed) == path.read_bytes()
+    # Pode ser percorrido de novo (novas tentativas)
+    assert b"".join(stream) == compressed
+
+    progress = []
+    assert b"".join(ProgressBody(stream, lambda sent, total: progress.append(total))) == compressed
+    assert set(progress) == {0}
+
+
+def test_compressed_file_upload_is_sent_in_chunks(tmp_path, http_server):
+    server = http_server(_EchoHandler)
+    path = tmp_path / "upload.bin"
+    path.write_bytes(os.urandom(1024) * 300)
+    request = Request(
+        name="upload",
+        method="POST",
+        url=f"{server.url}/upload",
+        body=str(path),
+        body_mode=BodyMode.BINARY,
+        body_encoding="gzip"
+    )
+
+    progress = []
+    response, error = HttpClient.send_request(request, on_upload_progress=lambda *args: progress.append(args))
+    assert error is None and response.status_code == 200
+
+    received = json.loads(response.content)
+    assert received["chunked"]
+    assert received["size"] == path.stat().st_size
+    assert received["sha256"] == hashlib.sha256(path.read_bytes()).hexdigest()
+    assert progress and progress[-1][0] > 0
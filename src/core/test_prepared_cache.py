@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes do cache de requisições preparadas
+"""
+
+import sys
+import os
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.http_client import HttpClient
+from src.core.prepared_cache import PreparedRequestCache, PreparedSend
+from src.core.variable_scope import ScopeChain, ENVIRONMENT
+from src.models.request import Request, BodyMode
+
+
+def test_repeated_sends_reuse_the_prepared_request():
+    cache = PreparedRequestCache()
+    request = Request(name="r", url="http://{{host}}/items", headers={"X-Id": "{{id}}"})
+    calls = []
+
+    def prepare():
+        calls.append(1)
+        return PreparedSend(request, "http://api/items", {}, b"")
+
+    first = cache.get_or_prepare(request, {"host": "api", "id": "1"}, prepare)
+    assert cache.get_or_prepare(request, {"host": "api", "id": "1"}, prepare) is first
+    cache.get_or_prepare(request, {"host": "api", "id": "2"}, prepare)
+    assert len(calls) == 2
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_scope_chain_is_keyed_by_version():
+    cache = PreparedRequestCache()
+    request = Request(name="r", url="http://{{host}}/")
+    chain = ScopeChain.from_values({ENVIRONMENT: {"host": "a"}})
+    prepare = lambda: PreparedSend(request, "http://a/", {}, b"")
+
+    cache.get_or_prepare(request, chain, prepare)
+    cache.get_or_prepare(request, chain, prepare)
+    chain.scope(ENVIRONMENT).set("host", "b")
+    cache.get_or_prepare(request, chain, prepare)
+    assert cache.get_stats()["misses"] == 2
+
+
+def test_entries_are_limited_by_body_size():
+    cache = PreparedRequestCache(max_entries=10, max_bytes=100)
+    for index in range(5):
+        request = Request(name=f"r{index}", url="http://api/")
+        cache.get_or_prepare(request, None, lambda: PreparedSend(request, "http://api/", {}, b"x" * 40))
+    stats = cache.get_stats()
+    assert stats["bytes"] <= 100 and stats["entries"] == 2
+
+
+def test_templated_file_path_is_checked_after_resolution(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"a" * 10)
+    request = Request(
+        name="upload", url="http://api/upload", method="POST",
+        body="{{dir}}/file.bin", body_mode=BodyMode.BINARY
+    )
+    variables = {"dir": str(tmp_path)}
+
+    first = HttpClient.prepare_request(request, variables)
+    assert HttpClient.prepare_request(request, variables) is first
+    assert first.headers["Content-Length"] == "10"
+
+    # O mesmo caminho com outro conteúdo não pode reaproveitar o tamanho preparado
+    path.write_bytes(b"b" * 25)
+    os.utime(path, ns=(0, 1))
+    second = HttpClient.prepare_request(request, variables)
+    assert second is not first
+    assert second.headers["Content-Length"] == "25"
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes da limitação de taxa por host (token bucket)
+"""
+
+import sys
+import os
+import threading
+import time
+
+import pytest
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.cancellation import CancellationToken, RequestCancelled, DeadlineExceeded
+from src.core.rate_limiter import RateLimiter, TokenBucket
+from src.models.rate_limit import RateLimitPolicy
+
+
+def test_bucket_allows_a_burst_then_spaces_reservations():
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0 and bucket.reserve() == 0
+    # Reservas seguintes recebem horários sucessivos
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+    bucket.refund()
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_concurrent_acquires_respect_the_rate():
+    limiter = RateLimiter(RateLimitPolicy(rate=20, burst=1))
+    threads = [
+        threading.Thread(target=limiter.acquire, args=("GET", "http://api.test/items"))
+        for _ in range(5)
+    ]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - started >= 0.19
+    stats = limiter.get_stats()
+    assert stats["acquired"] == 5 and stats["delayed"] == 4
+
+
+def test_buckets_are_per_host_or_per_endpoint():
+    policy = RateLimitPolicy(rate=1, host_rates={"slow.test:8080": 0.5})
+    limiter = RateLimiter(policy)
+    assert limiter._key("GET", "https://API.test/a") == (("api.test", "443"), 1)
+    assert limiter._key("GET", "http://slow.test:8080/")[1] == 0.5
+
+    limiter.acquire("GET", "http://a.test/")
+    limiter.acquire("GET", "http://b.test/")
+    assert limiter.get_stats()["delayed"] == 0
+
+    per_endpoint = RateLimiter(RateLimitPolicy(rate=1, per_endpoint=True))
+    per_endpoint.acquire("GET", "http://a.test/x")
+    per_endpoint.acquire("POST", "http://a.test/x")
+    assert per_endpoint.get_stats() == {"acquired": 2, "delayed": 0, "waited": 0.0, "pauses": 0, "buckets": 2}
+
+
+def test_429_pauses_the_host_for_retry_after():
+    limiter = RateLimiter(RateLimitPolicy(rate=100, burst=5))
+    limiter.acquire("GET", "http://api.test/")
+    limiter.observe("GET", "http://api.test/", 429, {"Retry-After": "1"})
+    limiter.observe("GET", "http://api.test/", 200, {"Retry-After": "1"})
+
+    bucket = limiter._bucket("GET", "http://api.test/")
+    assert 0.9 <= bucket.reserve() <= 1.01
+    assert limiter.get_stats()["pauses"] == 1
+
+
+def test_cancelled_wait_refunds_the_token():
+    limiter = RateLimiter(RateLimitPolicy(rate=1, burst=1))
+    limiter.acquire("GET", "http://api.test/")
+    token = CancellationToken(timeout=0.05)
+    with pytest.raises(DeadlineExceeded):
+        limiter.acquire("GET", "http://api.test/", token)
+
+    cancelled = CancellationToken()
+    cancelled.cancel()
+    with pytest.raises(RequestCancelled):
+        limiter.acquire("GET", "http://api.test/", cancelled)
+    # As fichas das esperas interrompidas foram devolvidas
+    assert limiter._bucket("GET", "http://api.test/").reserve() <= 1.0
+    assert limiter.get_stats()["acquired"] == 1
+
+
+def test_policy_validation_and_round_trip():
+    with pytest.raises(ValueError):
+        RateLimitPolicy(rate=0)
+    policy = RateLimitPolicy(rate=2.5, per_endpoint=True, host_rates={"a.test": 1})
+    assert policy.burst == 2
+    assert RateLimitPolicy.from_dict(policy.to_dict()).to_dict() == policy.to_dict()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes do cache de resolução de nomes e das substituições de host
+"""
+
+import sys
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.resolver import HostResolver, normalize_overrides, parse_curl_resolve
+
+
+def _fake_getaddrinfo(calls, addresses=("10.0.0.1",), delay=0.0):
+    def getaddrinfo(host, port, family, type):
+        calls.append(host)
+        time.sleep(delay)
+        if host == "missing.test":
+            raise socket.gaierror("nome desconhecido")
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (address, port)) for address in addresses]
+    return getaddrinfo
+
+
+def test_answers_are_cached_until_the_ttl(monkeypatch):
+    calls = []
+    monkeypatch.setattr(socket, "getaddrinfo", _fake_getaddrinfo(calls, ("10.0.0.1", "10.0.0.1", "10.0.0.2")))
+    resolver = HostResolver(ttl=0.1)
+
+    assert resolver.resolve("API.test", 443) == ["10.0.0.1", "10.0.0.2"]
+    assert resolver.resolve("api.test", 80) == ["10.0.0.1", "10.0.0.2"]
+    assert calls == ["API.test"]
+    assert resolver.get_stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+    time.sleep(0.15)
+    resolver.resolve("api.test", 443)
+    assert len(calls) == 2
+
+
+def test_failures_are_cached_with_the_negative_ttl(monkeypatch):
+    calls = []
+    monkeypatch.setattr(socket, "getaddrinfo", _fake_getaddrinfo(calls))
+    resolver = HostResolver(negative_ttl=60)
+    for _ in range(2):
+        with pytest.raises(socket.gaierror):
+            resolver.resolve("missing.test", 80)
+    assert calls == ["missing.test"]
+
+
+def test_concurrent_lookups_share_one_resolution(monkeypatch):
+    calls = []
+    monkeypatch.setattr(socket, "getaddrinfo", _fake_getaddrinfo(calls, delay=0.1))
+    resolver = HostResolver()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(resolver.resolve("api.test", 80))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert calls == ["api.test"]
+    assert results == [["10.0.0.1"]] * 5
+
+
+def test_cache_is_limited_to_max_entries(monkeypatch):
+    monkeypatch.setattr(socket, "getaddrinfo", _fake_getaddrinfo([]))
+    resolver = HostResolver(max_entries=2)
+    for host in ("a.test", "b.test", "c.test"):
+        resolver.resolve(host, 80)
+    assert resolver.get_stats()["entries"] == 2
+
+
+def test_overrides_take_precedence_per_thread(monkeypatch):
+    calls = []
+    monkeypatch.setattr(socket, "getaddrinfo", _fake_getaddrinfo(calls))
+    resolver = HostResolver()
+
+    with HostResolver.overrides({"API.test:443": "127.0.0.2, 127.0.0.3", "api.test": ["[::1]"]}):
+        assert resolver.resolve("api.test", 443) == ["127.0.0.2", "127.0.0.3"]
+        assert resolver.resolve("api.test", 80) == ["::1"]
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(HostResolver.lookup_override("api.test", 443)))
+        thread.start()
+        thread.join()
+        assert other == [None]
+
+    assert HostResolver.lookup_override("api.test", 443) is None
+    assert resolver.resolve("127.0.0.9", 80) == ["127.0.0.9"]
+    assert calls == []
+
+
+def test_curl_resolve_entries():
+    assert parse_curl_resolve("API.test:443:10.0.0.1,[::1]") == ("api.test:443", ["10.0.0.1", "::1"])
+    assert parse_curl_resolve("api.test:*:10.0.0.1") == ("api.test", ["10.0.0.1"])
+    for invalid in ("api.test:443", "api.test:abc:10.0.0.1", ":443:10.0.0.1"):
+        with pytest.raises(ValueError):
+            parse_curl_resolve(invalid)
+    assert normalize_overrides({" ": "10.0.0.1", "empty": ""}) == {}
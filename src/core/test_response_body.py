@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes da leitura de corpos de resposta em blocos e do transbordo para disco
+"""
+
+import sys
+import os
+from http.server import BaseHTTPRequestHandler
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.http_client import HttpClient
+from src.core.response_body import SpooledBody
+from src.models.request import Request, Response
+
+BODY = b"0123456789" * 1000
+
+
+class _BodyHandler(BaseHTTPRequestHandler):
+    """Servidor de teste que responde com BODY"""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_small_body_stays_in_memory():
+    body = SpooledBody(spill_threshold=100).consume([b"abc", b"", b"def"])
+    assert not body.spilled
+    assert body.finish() == (b"abcdef", None)
+
+
+def test_large_body_is_spilled_to_a_file(tmp_path):
+    body = SpooledBody(spill_threshold=4, temp_dir=str(tmp_path)).consume([b"abc", b"defg", b"h"])
+    assert body.spilled and body.size == 8
+    content, path = body.finish()
+    assert content == b""
+    with open(path, "rb") as spilled:
+        assert spilled.read() == b"abcdefgh"
+
+    partial = SpooledBody(spill_threshold=1, temp_dir=str(tmp_path)).consume([b"abc"])
+    partial_path = partial._path
+    partial.discard()
+    assert not os.path.exists(partial_path)
+
+
+def test_file_backed_response_reads_slices_and_removes_its_file(tmp_path):
+    path = tmp_path / "body.bin"
+    path.write_bytes(BODY)
+    response = Response(status_code=200, headers={}, content=b"", elapsed_time=0.0, body_path=str(path))
+
+    assert response.is_file_backed and response.size == len(BODY)
+    assert response.read_slice(10, 15) == BODY[10:15]
+    assert b"".join(response.iter_content(chunk_size=3000)) == BODY
+    response.close()
+    assert not path.exists()
+
+    # Arquivos que não pertencem à resposta são mantidos
+    path.write_bytes(b"")
+    kept = Response(status_code=200, headers={}, content=b"", elapsed_time=0.0,
+                    body_path=str(path), owns_body_file=False)
+    assert kept.content == b""
+    kept.close()
+    assert path.exists()
+
+
+def test_streamed_send_spills_bodies_over_the_threshold(http_server):
+    server = http_server(_BodyHandler)
+    request = Request(name="body", url=f"{server.url}/")
+
+    response, error = HttpClient.send_request(request, stream=True, spill_threshold=1024)
+    assert error is None and response.is_file_backed
+    path = response.body_path
+    assert response.content == BODY
+    response.close()
+    assert not os.path.exists(path)
+
+    response, error = HttpClient.send_request(request, stream=True, spill_threshold=len(BODY))
+    assert error is None and not response.is_file_backed
+    assert response.content == BODY
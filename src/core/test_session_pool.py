@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes do pool de conexões persistentes usado pelo HttpClient
+"""
+
+import sys
+import os
+import threading
+from http.server import BaseHTTPRequestHandler
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.http_client import HttpClient
+from src.core.session_pool import SessionPool
+from src.models.request import Request
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """Servidor de teste que mantém as conexões abertas"""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_repeated_requests_reuse_connection(http_server):
+    server = http_server(_KeepAliveHandler)
+    pool = HttpClient.configure_pool(pool_connections=4, pool_maxsize=2, idle_timeout=60)
+    url = f"{server.url}/ping"
+
+    for _ in range(5):
+        response, error = HttpClient.send_request(Request(name="ping", url=url))
+        assert error is None
+        assert response.status_code == 200
+
+    stats = pool.get_stats()
+    assert stats["requests"] == 5
+    assert stats["connections_opened"] == 1
+    assert stats["connections_reused"] == 4
+
+
+def test_idle_pools_are_closed_and_counted(http_server):
+    server = http_server(_KeepAliveHandler)
+    pool = SessionPool(idle_timeout=0.01)
+    url = f"{server.url}/ping"
+
+    pool.request("GET", url).close()
+    threading.Event().wait(0.05)
+    pool.request("GET", url).close()
+
+    stats = pool.get_stats()
+    assert stats["connections_opened"] == 2
+    assert stats["connections_reused"] == 0
+    assert stats["active_pools"] == 1
+    pool.close()
+
+
+class _AddressHandler(BaseHTTPRequestHandler):
+    """Servidor de teste que responde com o endereço local usado pela conexão"""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = self.connection.getsockname()[0].encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_concurrent_overrides_use_separate_pools(http_server):
+    server = http_server(_AddressHandler, host="0.0.0.0")
+    pool = HttpClient.configure_pool(pool_connections=8, pool_maxsize=4, idle_timeout=60)
+    url = f"http://api.test:{server.server_address[1]}/"
+    errors = []
+
+    def send(address):
+        for _ in range(10):
+            response, error = HttpClient.send_request(
+                Request(name="override", url=url), resolve_overrides={"api.test": address}
+            )
+            if error is not None or response.content != address.encode():
+                errors.append((address, error, response.content))
+
+    threads = [threading.Thread(target=send, args=(address,)) for address in ("127.0.0.1", "127.0.0.2")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    # Cada conjunto de substituições mantém a sua conexão, sem fechar a do outro
+    stats = pool.get_stats()
+    assert stats["requests"] == 20
+    assert stats["connections_opened"] == 2
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes dos templates compilados de variáveis
+"""
+
+import sys
+import os
+import re
+
+import pytest
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.template import TemplateCache, compile_template, VARIABLE_PATTERN
+from src.core.variable_processor import VariableProcessor
+
+VARIABLES = {"host": "api.test", "id": "42", "empty": "", "name with space": "ok"}
+
+
+def _regex_render(source, variables):
+    """Substituição original, por expressão regular, usada como referência"""
+    return re.sub(VARIABLE_PATTERN, lambda match: variables.get(match.group(1).strip(), match.group(0)), source)
+
+
+@pytest.mark.parametrize("source", [
+    "https://{{host}}/users/{{id}}",
+    "{{ host }}{{id}}{{missing}}",
+    "{{id}} at start and end {{id}}",
+    "sem variáveis",
+    "",
+    "{{}} {{ {{id}} }} {{{id}}} {{name with space}}",
+    "{{empty}}|{{missing}}|{{",
+])
+def test_render_matches_the_regex_substitution(source):
+    assert compile_template(source).render(VARIABLES) == _regex_render(source, VARIABLES)
+    assert VariableProcessor.process_string(source, VARIABLES) == _regex_render(source, VARIABLES)
+
+
+def test_compiled_parts():
+    template = compile_template("a{{ x }}b{{y}}")
+    assert template.literals == ("a", "b", "")
+    assert template.names == ("x", "y")
+    assert template.placeholders == ("{{ x }}", "{{y}}")
+    assert compile_template("{{Host}}", normalize_name=str.lower).render({"host": "h"}) == "h"
+
+
+def test_cache_is_lru_and_skips_long_and_plain_strings():
+    cache = TemplateCache(max_entries=2, max_length=20)
+    assert cache.render("plain", {}) == "plain"
+
+    first = cache.get("{{a}}")
+    assert cache.get("{{a}}") is first
+    cache.get("{{b}}")
+    cache.get("{{a}}")
+    cache.get("{{c}}")
+    # "{{b}}" era o menos usado recentemente
+    assert cache.get_stats() == {"hits": 2, "misses": 3, "entries": 2}
+    cache.get("{{b}}")
+    assert cache.get_stats()["misses"] == 4
+
+    long_source = "{{a}}" + "x" * 30
+    assert cache.render(long_source, {"a": "1"}) == "1" + "x" * 30
+    assert long_source not in cache._entries
+
+    cache.clear()
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_nested_structures_are_processed():
+    body = {"user": "{{id}}", "tags": ["{{host}}", 1, {"deep": "{{missing}}"}], "n": None}
+    assert VariableProcessor.process_dict(body, VARIABLES) == {
+        "user": "42", "tags": ["api.test", 1, {"deep": "{{missing}}"}], "n": None
+    }
+    assert VariableProcessor.extract_variables("{{ a }} e {{b}}") == ["a", "b"]
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes da medição das fases de uma requisição
+"""
+
+import sys
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.http_client import HttpClient
+from src.core.timing import PhaseTimer
+from src.models.request import Request
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    """Servidor de teste que demora a responder"""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        time.sleep(0.05)
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_phase_timer_accumulates_and_is_thread_local():
+    timer = PhaseTimer()
+    timer.add("send", 0.1)
+    timer.add("send", 0.2)
+    timer.add("ttfb", -1.0)
+    assert timer.since("missing") is None
+
+    with timer.activate():
+        assert PhaseTimer.current() is timer
+        other = []
+        thread = threading.Thread(target=lambda: other.append(PhaseTimer.current()))
+        thread.start()
+        thread.join()
+        assert other == [None]
+    assert PhaseTimer.current() is None
+
+    timings = timer.to_timings(1.0)
+    assert abs(timings.send - 0.3) < 1e-9 and timings.ttfb == 0.0
+    assert abs(timings.client_overhead - 0.7) < 1e-9
+
+
+def test_sends_record_connection_and_server_phases(http_server):
+    server = http_server(_SlowHandler)
+    HttpClient.configure_pool()
+    try:
+        request = Request(name="slow", url=f"{server.url}/")
+
+        first, error = HttpClient.send_request(request)
+        assert error is None
+        assert not first.timings.connection_reused
+        assert first.timings.connect > 0
+        assert first.timings.ttfb >= 0.04
+        assert first.timings.total >= first.timings.network + first.timings.ttfb
+
+        # A segunda requisição reaproveita a conexão do pool
+        second, error = HttpClient.send_request(request)
+        assert error is None
+        assert second.timings.connection_reused
+        assert second.timings.network == 0.0
+    finally:
+        HttpClient.configure_pool()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes do índice reverso de uso de variáveis
+"""
+
+import sys
+import os
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.collection_runner import CollectionRunner
+from src.core.storage import Storage
+from src.core.variable_index import (
+    VariableIndex, extract_usages, request_variables, rename_in_request, URL, HEADERS, PARAMS, BODY
+)
+from src.core.variable_scope import ScopeChain, GLOBAL, ENVIRONMENT
+from src.models.collection import Collection, Folder
+from src.models.request import Request
+
+
+def _request(**fields):
+    fields.setdefault("name", "r")
+    fields.setdefault("url", "http://api.test")
+    return Request(**fields)
+
+
+def test_usages_record_field_key_and_position():
+    request = _request(
+        url="{{host}}/users/{{ id }}",
+        headers={"Authorization": "Bearer {{token}}"},
+        params={"page": "{{id}}"},
+        body={"items": [{"label": "{{label}}"}], "n": 1},
+    )
+    usages = extract_usages(request)
+
+    assert list(usages) == ["host", "id", "token", "label"]
+    host, = usages["host"]
+    assert (host.field, host.key, host.start, host.end) == (URL, "", 0, 8)
+    assert [(usage.field, usage.key) for usage in usages["id"]] == [(URL, ""), (PARAMS, "page")]
+    assert request.url[usages["id"][0].start:usages["id"][0].end] == "{{ id }}"
+    assert (usages["token"][0].field, usages["token"][0].key) == (HEADERS, "Authorization")
+    assert (usages["label"][0].field, usages["label"][0].key) == (BODY, "items[0].label")
+
+    assert request_variables(request) == {"host", "id", "token", "label"}
+    assert extract_usages(_request(url="http://api.test", body=b"{{nao_indexado}}")) == {}
+
+
+def test_index_updates_and_removes_entries():
+    index = VariableIndex()
+    first = _request(url="{{host}}/a", headers={"X": "{{token}}"})
+    second = _request(url="{{host}}/b")
+    index.update(first)
+    index.update(second)
+
+    assert sorted(index.requests_using("host")) == sorted([first.id, second.id])
+    assert index.variables_of(first.id) == ("host", "token")
+    assert len(index.usages("host")) == 2 and len(index.usages("host", second.id)) == 1
+    assert index.variable_names() == ["host", "token"]
+
+    # Reindexar substitui as entradas antigas
+    first.headers = {}
+    index.update(first)
+    assert index.requests_using("token") == [] and index.variable_names() == ["host"]
+
+    index.remove(second.id)
+    index.remove("inexistente")
+    assert index.requests_using("host") == [first.id]
+    assert index.get_stats() == {"variables": 1, "requests": 1}
+
+    index.clear()
+    assert index.get_stats() == {"variables": 0, "requests": 0}
+
+
+def test_missing_variables_accepts_dict_and_scope_chain():
+    index = VariableIndex()
+    request = _request(url="{{host}}/{{path}}", headers={"X": "{{token}}"})
+    other = _request(url="{{host}}/{{token}}")
+    index.update(request)
+    index.update(other)
+
+    assert index.missing_variables([request.id, other.id], {"host": "h"}) == {
+        "path": [request.id], "token": [request.id, other.id]
+    }
+    chain = ScopeChain.from_values({GLOBAL: {"path": "p"}, ENVIRONMENT: {"host": "h", "token": "t"}})
+    assert index.missing_variables([request.id, other.id], chain) == {}
+    assert index.missing_variables(["inexistente"], {}) == {}
+
+
+def test_rename_replaces_every_reference():
+    request = _request(
+        name="{{old}} {{keep}}",
+        url="{{ old }}/{{old}}",
+        headers={"X": "{{old}}", "N": 1},
+        params={"q": "{{keep}}"},
+        body={"list": ["{{old}}", 2], "nested": {"v": "{{old}}x"}},
+    )
+    assert rename_in_request(request, "old", "new") == 6
+    assert request.name == "{{new}} {{keep}}"
+    assert request.url == "{{new}}/{{new}}"
+    assert request.headers == {"X": "{{new}}", "N": 1}
+    assert request.params == {"q": "{{keep}}"}
+    assert request.body == {"list": ["{{new}}", 2], "nested": {"v": "{{new}}x"}}
+    assert rename_in_request(request, "old", "new") == 0
+
+
+def test_storage_keeps_the_index_in_sync(tmp_path):
+    storage = Storage(str(tmp_path))
+    saved = _request(url="{{host}}/a")
+    storage.save_request(saved)
+
+    # Índice construído a partir dos arquivos na primeira consulta
+    reopened = Storage(str(tmp_path))
+    assert reopened.variable_index.requests_using("host") == [saved.id]
+
+    saved.url = "{{base}}/a"
+    reopened.save_request(saved)
+    assert reopened.variable_index.requests_using("host") == []
+    assert reopened.variable_index.requests_using("base") == [saved.id]
+
+    other = _request(url="{{base}}/b")
+    reopened.save_request(other)
+    assert sorted(reopened.rename_variable("base", "root")) == sorted([saved.id, other.id])
+    assert reopened.get_request(other.id).url == "{{root}}/b"
+    assert reopened.variable_index.requests_using("base") == []
+
+    reopened.delete_request(saved.id)
+    assert reopened.variable_index.requests_using("root") == [other.id]
+
+
+def test_runner_reports_missing_variables_before_the_run(tmp_path):
+    storage = Storage(str(tmp_path))
+    collection = Collection("api", variables={"host": "h"})
+    folder = Folder("users", variables={"path": "p"})
+    collection.add_folder(folder)
+
+    top = _request(url="{{host}}/{{path}}/{{token}}")
+    nested = _request(url="{{host}}/{{path}}/{{id}}")
+    storage.save_request(top)
+    storage.save_request(nested)
+    collection.add_request(top.id)
+    folder.add_request(nested.id)
+
+    runner = CollectionRunner(storage, send_function=lambda request, variables, **options: None)
+    assert runner.missing_variables(collection, {"token": "t"}) == {"path": [top.id], "id": [nested.id]}
+    assert runner.missing_variables(collection, {"token": "t"}, data=[{"id": "1"}]) == {"path": [top.id]}
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes da resolução de variáveis que referenciam outras variáveis
+"""
+
+import sys
+import os
+
+import pytest
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.http_client import HttpClient
+from src.core.variable_resolver import VariableResolver, VariableCycleError, find_cycles, resolve_variables
+from src.models.request import Request
+
+
+def test_nested_references_are_resolved_in_dependency_order():
+    variables = {
+        "url": "{{base_url}}/v{{version}}",
+        "base_url": "{{scheme}}://{{host}}",
+        "scheme": "https",
+        "host": "api.{{domain}}",
+        "domain": "test",
+        "version": "2",
+        "unknown": "{{nao_definida}}",
+    }
+    resolved = resolve_variables(variables)
+    assert resolved["url"] == "https://api.test/v2"
+    assert resolved["base_url"] == "https://api.test"
+    assert resolved["unknown"] == "{{nao_definida}}"
+    # O dicionário original não é alterado
+    assert variables["host"] == "api.{{domain}}"
+
+    plain = {"a": "1"}
+    assert resolve_variables(plain) is plain
+
+
+def test_long_chains_do_not_hit_the_recursion_limit():
+    variables = {f"v{index}": f"{{{{v{index + 1}}}}}" for index in range(5000)}
+    variables["v5000"] = "fim"
+    assert resolve_variables(variables)["v0"] == "fim"
+
+
+def test_cycles_are_reported_and_keep_their_values():
+    variables = {
+        "a": "{{b}}-a",
+        "b": "{{c}}-b",
+        "c": "{{a}}-c",
+        "self": "x{{self}}",
+        "uses_cycle": "[{{a}}]",
+        "ok": "{{plain}}",
+        "plain": "p",
+    }
+    cycles = find_cycles(variables)
+    assert sorted(tuple(cycle) for cycle in cycles) == [("a", "b", "c", "a"), ("self", "self")]
+
+    resolved = resolve_variables(variables)
+    assert resolved["a"] == "{{b}}-a" and resolved["self"] == "x{{self}}"
+    assert resolved["uses_cycle"] == "[{{b}}-a]"
+    assert resolved["ok"] == "p"
+
+    with pytest.raises(VariableCycleError) as raised:
+        resolve_variables(variables, strict=True)
+    assert raised.value.cycle[0] == raised.value.cycle[-1]
+    assert "->" in str(raised.value)
+
+
+def test_resolver_caches_by_content(capsys):
+    resolver = VariableResolver(max_entries=2)
+    variables = {"base": "{{host}}/x", "host": "h"}
+
+    first = resolver.resolve(variables)
+    assert resolver.resolve(dict(variables)) is first
+    variables["host"] = "outro"
+    assert resolver.resolve(variables)["base"] == "outro/x"
+    assert resolver.get_stats() == {"hits": 1, "misses": 2, "entries": 2}
+
+    # Conjuntos sem referências são copiados: alterar o original não afeta o cache
+    plain = {"a": "1"}
+    cached = resolver.resolve(plain)
+    plain["a"] = "2"
+    assert cached == {"a": "1"}
+
+    # Ciclos não são impressos no envio: ficam com o valor original (ver find_cycles)
+    assert resolver.resolve({"a": "{{b}}", "b": "{{a}}"})["a"] == "{{b}}"
+    assert capsys.readouterr().out == ""
+
+    assert resolver.resolve(None) == {}
+    assert resolver.resolve({"list": ["{{x}}"], "x": "1"})["x"] == "1"
+
+
+def test_send_uses_resolved_variables():
+    request = Request(name="r", url="{{base_url}}/items")
+    prepared = HttpClient.prepare_request(request, {"base_url": "{{scheme}}://api.test", "scheme": "https"})
+    assert prepared.url == "https://api.test/items"
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes das camadas de variáveis com versão
+"""
+
+import sys
+import os
+
+import pytest
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.collection_runner import CollectionRunner
+from src.core.storage import Storage
+from src.core.variable_processor import VariableProcessor
+from src.core.variable_resolver import VariableResolver, resolve_variables
+from src.core.variable_scope import (
+    VariableScope, ScopeChain, GLOBAL, COLLECTION, FOLDER, ENVIRONMENT, RUN, ITERATION, RESOLVED
+)
+from src.models.collection import Collection, Folder
+from src.models.request import Request, Response
+
+
+def test_lookups_follow_layer_precedence():
+    chain = ScopeChain.from_values({
+        ITERATION: {"user": "linha"},
+        GLOBAL: {"host": "global", "user": "global", "only_global": "g"},
+        ENVIRONMENT: {"host": "env"},
+    })
+    assert chain.layers == [GLOBAL, ENVIRONMENT, ITERATION]
+    assert chain["host"] == "env" and chain["user"] == "linha" and chain["only_global"] == "g"
+    assert chain.get("missing", "x") == "x" and "missing" not in chain
+    assert sorted(chain) == ["host", "only_global", "user"] and len(chain) == 3
+    assert chain.to_dict() == {"host": "env", "user": "linha", "only_global": "g"}
+    with pytest.raises(KeyError):
+        chain["missing"]
+
+    with pytest.raises(ValueError):
+        ScopeChain([VariableScope("sessao")])
+    assert not ScopeChain.from_values({GLOBAL: {}})
+
+
+def test_versions_change_on_every_mutation():
+    scope = VariableScope(ENVIRONMENT, {"a": "1"})
+    versions = [scope.version]
+    for mutate in (lambda: scope.set("b", "2"), lambda: scope.update({"c": "3"}),
+                   lambda: scope.remove("a"), lambda: scope.replace({"d": "4"}), scope.clear):
+        mutate()
+        versions.append(scope.version)
+    assert len(set(versions)) == len(versions)
+
+    version = scope.version
+    assert not scope.remove("missing")
+    assert scope.version == version
+
+
+def test_derived_chains_share_layers():
+    environment = VariableScope(ENVIRONMENT, {"host": "a"})
+    base = ScopeChain([environment])
+    derived = base.with_values(ITERATION, {"id": "1"})
+    replaced = derived.with_values(ITERATION, {"id": "2"})
+
+    assert derived["id"] == "1" and replaced["id"] == "2"
+    before = derived.version
+    environment.set("host", "b")
+    assert derived["host"] == replaced["host"] == "b"
+    assert derived.version != before
+    assert derived.scope(ENVIRONMENT) is environment and derived.scope(FOLDER) is None
+
+
+def test_templated_names_track_the_effective_value():
+    chain = ScopeChain.from_values({
+        GLOBAL: {"url": "{{host}}/x", "host": "h"},
+        ENVIRONMENT: {"url": "fixo", "token": "{{secret}}"},
+    })
+    assert chain.templated_names() == ["token"]
+    chain.scope(ENVIRONMENT).remove("url")
+    assert sorted(chain.templated_names()) == ["token", "url"]
+
+
+def test_non_string_override_of_a_templated_name():
+    chain = ScopeChain.from_values({ENVIRONMENT: {"a": "{{b}}", "b": "x"}, RUN: {"a": 5}})
+    assert chain.templated_names() == []
+    resolved = VariableResolver().resolve(chain)
+    assert resolved["a"] == 5 and resolved["b"] == "x"
+
+
+def test_resolution_adds_a_layer_instead_of_merging():
+    environment = VariableScope(ENVIRONMENT, {"base": "{{scheme}}://api", "scheme": "https"})
+    chain = ScopeChain([environment])
+    resolved = resolve_variables(chain)
+    assert isinstance(resolved, ScopeChain)
+    assert resolved.layers == [ENVIRONMENT, RESOLVED]
+    assert resolved["base"] == "https://api"
+    assert chain["base"] == "{{scheme}}://api"
+
+    resolver = VariableResolver()
+    assert resolver.resolve(chain) is resolver.resolve(chain)
+    environment.set("scheme", "http")
+    assert resolver.resolve(chain)["base"] == "http://api"
+
+
+def test_runner_layers_collection_folder_and_environment(tmp_path):
+    storage = Storage(str(tmp_path))
+    collection = Collection("api", variables={"host": "colecao", "path": "c", "who": "c"})
+    folder = Folder("users", variables={"path": "pasta", "who": "f"})
+    sub = Folder("admins", variables={"who": "sub"})
+    folder.add_subfolder(sub)
+    collection.add_folder(folder)
+
+    urls = ["http://{{host}}/{{path}}/{{who}}"] * 3
+    nodes = [collection, folder, sub]
+    for node, url in zip(nodes, urls):
+        request = Request(name="r", url=url)
+        storage.save_request(request)
+        node.add_request(request.id)
+
+    def send(request, variables, **options):
+        url = VariableProcessor.process_string(request.url, variables)
+        return Response(status_code=200, headers={}, content=url.encode(), elapsed_time=0.0), None
+
+    runner = CollectionRunner(storage, send_function=send)
+    results = runner.run_all(collection, {"host": "ambiente"})
+    assert [result.response.content for result in results] == [
+        b"http://ambiente/c/c", b"http://ambiente/pasta/f", b"http://ambiente/pasta/sub"
+    ]
+    assert runner.run_scope is not None and runner.run_scope.name == RUN
+
+
+def test_sibling_folders_with_the_same_name_keep_their_variables(tmp_path):
+    storage = Storage(str(tmp_path))
+    collection = Collection("api")
+    for token in ("A", "B"):
+        folder = Folder("Auth", variables={"token": token})
+        request = Request(name="r", url="http://api.test/{{token}}")
+        storage.save_request(request)
+        folder.add_request(request.id)
+        collection.add_folder(folder)
+
+    _, folder_chains = CollectionRunner.build_scopes(collection)
+    assert len(folder_chains) == 2
+
+    def send(request, variables, **options):
+        url = VariableProcessor.process_string(request.url, variables)
+        return Response(status_code=200, headers={}, content=url.encode(), elapsed_time=0.0), None
+
+    results = CollectionRunner(storage, send_function=send).run_all(collection)
+    assert [result.response.content for result in results] == [b"http://api.test/A", b"http://api.test/B"]
+    assert [result.folder_path for result in results] == [["Auth"], ["Auth"]]
@@ -0,0 +1,77 @@
+"""
+Medição das fases de uma requisição HTTP (DNS, conexão, TLS, espera e download)
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional, Iterator
+
+from src.models.request import ResponseTimings
+
+
+_local = threading.local()
+
+
+class PhaseTimer:
+    """
+    Acumula a duração de cada fase de um envio usando time.perf_counter
+
+    O temporizador ativo fica associado à thread atual, permitindo que as
+    conexões do pool registrem as fases de rede sem alterar a API do requests.
+    """
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.connection_reused = True
+        self._marks: Dict[str, float] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Soma a duração de uma fase"""
+        self.phases[phase] = self.phases.get(phase, 0.0) + max(seconds, 0.0)
+
+    def mark(self, name: str) -> None:
+        """Registra o instante atual com um nome"""
+        self._marks[name] = time.perf_counter()
+
+    def since(self, name: str) -> Optional[float]:
+        """Segundos decorridos desde a marca informada (None se ela não existir)"""
+        start = self._marks.get(name)
+        if start is None:
+            return None
+        return time.perf_counter() - start
+
+    def to_timings(self, total: float) -> ResponseTimings:
+        """
+        Converte as fases medidas em ResponseTimings
+
+        Args:
+            total (float): Duração total do envio, em segundos
+
+        Returns:
+            ResponseTimings: Tempos por fase
+        """
+        return ResponseTimings(
+            dns=self.phases.get("dns", 0.0),
+            connect=self.phases.get("connect", 0.0),
+            tls=self.phases.get("tls", 0.0),
+            send=self.phases.get("send", 0.0),
+            ttfb=self.phases.get("ttfb", 0.0),
+            download=self.phases.get("download", 0.0),
+            total=total,
+            connection_reused=self.connection_reused
+        )
+
+    @staticmethod
+    def current() -> Optional['PhaseTimer']:
+        """Retorna o temporizador ativo na thread atual"""
+        return getattr(_local, "timer", None)
+
+    @contextmanager
+    def activate(self) -> Iterator['PhaseTimer']:
+        """Torna este temporizador o ativo na thread atual durante o bloco"""
+        previous = getattr(_local, "timer", None)
+        _local.timer = self
+        try:
+            yield self
+        finally:
+            _local.timer = previous
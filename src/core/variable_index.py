@@ -0,0 +1,303 @@
+"""
+Índice reverso do uso de variáveis nas requisições salvas
+"""
+
+import re
+import threading
+from typing import Dict, List, Optional, Any, Iterator, Set, Tuple
+
+from src.models.request import Request
+from src.core.template import VARIABLE_PATTERN
+
+
+_VARIABLE_REGEX = re.compile(VARIABLE_PATTERN)
+
+# Campos da requisição em que as variáveis são substituídas no envio
+URL = "url"
+NAME = "name"
+HEADERS = "headers"
+PARAMS = "params"
+BODY = "body"
+
+
+class VariableUsage:
+    """
+    Ocorrência de uma variável em uma requisição
+    """
+    __slots__ = ("request_id", "field", "key", "start", "end")
+
+    def __init__(self, request_id: str, field: str, key: str, start: int, end: int):
+        """
+        Args:
+            request_id (str): ID da requisição
+            field (str): Campo (URL, NAME, HEADERS, PARAMS ou BODY)
+            key (str): Cabeçalho ou parâmetro, ou caminho no corpo (ex: "items[0].label");
+                vazio para a URL, o nome e corpos de texto
+            start (int): Posição inicial da referência {{...}} no valor
+            end (int): Posição final (exclusiva) da referência no valor
+        """
+        self.request_id = request_id
+        self.field = field
+        self.key = key
+        self.start = start
+        self.end = end
+
+    def __repr__(self) -> str:
+        return f"VariableUsage({self.request_id!r}, {self.field!r}, {self.key!r}, {self.start}, {self.end})"
+
+
+def _body_strings(value: Any, path: str) -> Iterator[Tuple[str, str]]:
+    """Percorre os textos de um corpo estruturado com o caminho de cada um"""
+    if isinstance(value, str):
+        yield path, value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield from _body_strings(item, f"{path}.{key}" if path else str(key))
+    elif isinstance(value, list):
+        for position, item in enumerate(value):
+            yield from _body_strings(item, f"{path}[{position}]")
+
+
+def request_strings(request: Request) -> Iterator[Tuple[str, str, str]]:
+    """
+    Percorre os textos da requisição em que há substituição de variáveis
+
+    Args:
+        request (Request): Requisição
+
+    Yields:
+        Tuple[str, str, str]: Campo, chave (ver VariableUsage) e texto
+    """
+    if request.url:
+        yield URL, "", request.url
+    if request.name:
+        yield NAME, "", request.name
+    for key, value in (request.headers or {}).items():
+        if isinstance(value, str):
+            yield HEADERS, key, value
+    for key, value in (request.params or {}).items():
+        if isinstance(value, str):
+            yield PARAMS, key, value
+    if isinstance(request.body, (str, dict, list)):
+        for key, value in _body_strings(request.body, ""):
+            yield BODY, key, value
+
+
+def _scan(request: Request) -> Iterator[Tuple[str, VariableUsage]]:
+    """Percorre as referências da requisição com o nome da variável de cada uma"""
+    for field, key, text in request_strings(request):
+        if "{{" not in text:
+            continue
+        for match in _VARIABLE_REGEX.finditer(text):
+            yield match.group(1).strip(), VariableUsage(request.id, field, key, match.start(), match.end())
+
+
+def extract_usages(request: Request) -> Dict[str, List[VariableUsage]]:
+    """
+    Localiza as referências a variáveis de uma requisição
+
+    Args:
+        request (Request): Requisição
+
+    Returns:
+        Dict[str, List[VariableUsage]]: Ocorrências de cada variável, na ordem dos campos
+    """
+    usages: Dict[str, List[VariableUsage]] = {}
+    for name, usage in _scan(request):
+        usages.setdefault(name, []).append(usage)
+    return usages
+
+
+def request_variables(request: Request) -> Set[str]:
+    """
+    Variáveis usadas por uma requisição ainda não salva (ex: a editada em uma guia)
+
+    Args:
+        request (Request): Requisição
+
+    Returns:
+        Set[str]: Nomes das variáveis
+    """
+    return {name for name, _ in _scan(request)}
+
+
+def rename_in_request(request: Request, old_name: str, new_name: str) -> int:
+    """
+    Renomeia as referências a uma variável em todos os campos da requisição
+
+    Args:
+        request (Request): Requisição (alterada no lugar)
+        old_name (str): Nome atual
+        new_name (str): Novo nome
+
+    Returns:
+        int: Quantidade de referências substituídas
+    """
+    replaced = 0
+
+    def rename(text: str) -> str:
+        if "{{" not in text:
+            return text
+
+        def replace(match: re.Match) -> str:
+            nonlocal replaced
+            if match.group(1).strip() != old_name:
+                return match.group(0)
+            replaced += 1
+            return f"{{{{{new_name}}}}}"
+
+        return _VARIABLE_REGEX.sub(replace, text)
+
+    def rename_body(value: Any) -> Any:
+        if isinstance(value, str):
+            return rename(value)
+        if isinstance(value, dict):
+            return {key: rename_body(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [rename_body(item) for item in value]
+        return value
+
+    request.url = rename(request.url) if request.url else request.url
+    request.name = rename(request.name) if request.name else request.name
+    request.headers = {
+        key: rename(value) if isinstance(value, str) else value
+        for key, value in (request.headers or {}).items()
+    }
+    request.params = {
+        key: rename(value) if isinstance(value, str) else value
+        for key, value in (request.params or {}).items()
+    }
+    request.body = rename_body(request.body)
+    return replaced
+
+
+class VariableIndex:
+    """
+    Índice das variáveis usadas em cada requisição e das requisições que usam cada variável
+
+    Mantido pelo Storage a cada requisição salva ou removida; consultas não leem
+    os arquivos das requisições.
+    """
+    def __init__(self):
+        # variável -> requisição -> ocorrências
+        self._usages: Dict[str, Dict[str, List[VariableUsage]]] = {}
+        # requisição -> variáveis usadas (para remover as entradas antigas)
+        self._variables: Dict[str, Tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+
+    def update(self, request: Request) -> None:
+        """
+        Indexa (ou reindexa) uma requisição
+
+        Args:
+            request (Request): Requisição salva
+        """
+        grouped = extract_usages(request)
+
+        with self._lock:
+            self._remove(request.id)
+            for name, usages in grouped.items():
+                self._usages.setdefault(name, {})[request.id] = usages
+            if grouped:
+                self._variables[request.id] = tuple(grouped)
+
+    def remove(self, request_id: str) -> None:
+        """
+        Remove uma requisição do índice
+
+        Args:
+            request_id (str): ID da requisição
+        """
+        with self._lock:
+            self._remove(request_id)
+
+    def _remove(self, request_id: str) -> None:
+        for name in self._variables.pop(request_id, ()):
+            by_request = self._usages.get(name)
+            if by_request is None:
+                continue
+            by_request.pop(request_id, None)
+            if not by_request:
+                del self._usages[name]
+
+    def clear(self) -> None:
+        """Esvazia o índice"""
+        with self._lock:
+            self._usages.clear()
+            self._variables.clear()
+
+    def requests_using(self, name: str) -> List[str]:
+        """
+        Requisições que usam uma variável
+
+        Args:
+            name (str): Nome da variável
+
+        Returns:
+            List[str]: IDs das requisições
+        """
+        with self._lock:
+            return list(self._usages.get(name, ()))
+
+    def usages(self, name: str, request_id: Optional[str] = None) -> List[VariableUsage]:
+        """
+        Ocorrências de uma variável
+
+        Args:
+            name (str): Nome da variável
+            request_id (Optional[str]): Restringe a uma requisição
+
+        Returns:
+            List[VariableUsage]: Campos e posições em que a variável aparece
+        """
+        with self._lock:
+            by_request = self._usages.get(name, {})
+            if request_id is not None:
+                return list(by_request.get(request_id, ()))
+            return [usage for usages in by_request.values() for usage in usages]
+
+    def variables_of(self, request_id: str) -> Tuple[str, ...]:
+        """
+        Variáveis usadas por uma requisição
+
+        Args:
+            request_id (str): ID da requisição
+
+        Returns:
+            Tuple[str, ...]: Nomes, na ordem em que aparecem
+        """
+        with self._lock:
+            return self._variables.get(request_id, ())
+
+    def variable_names(self) -> List[str]:
+        """Todas as variáveis usadas em alguma requisição"""
+        with self._lock:
+            return sorted(self._usages)
+
+    def missing_variables(self, request_ids: List[str], variables: Any) -> Dict[str, List[str]]:
+        """
+        Variáveis usadas pelas requisições e ausentes de um conjunto de variáveis
+
+        Args:
+            request_ids (List[str]): Requisições verificadas
+            variables (Any): Variáveis disponíveis (dicionário ou ScopeChain)
+
+        Returns:
+            Dict[str, List[str]]: IDs das requisições que usam cada variável ausente
+        """
+        missing: Dict[str, List[str]] = {}
+        with self._lock:
+            for request_id in request_ids:
+                for name in self._variables.get(request_id, ()):
+                    if name not in variables:
+                        missing.setdefault(name, []).append(request_id)
+        return missing
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna o tamanho do índice"""
+        with self._lock:
+            return {
+                "variables": len(self._usages),
+                "requests": len(self._variables),
+            }
+
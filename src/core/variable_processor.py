@@ -3,7 +3,9 @@ Utilitário para processamento de variáveis de ambiente
 """
 
 import re
-from typing import Dict, Optional, Any, List, Match, Tuple
+from typing import Dict, Optional, Any, List, Tuple
+
+from src.core.template import TemplateCache, VARIABLE_PATTERN
 
 
 class VariableProcessor:
@@ -11,7 +13,10 @@ class VariableProcessor:
     Processa variáveis de ambiente em strings
     """
     # Padrão para identificar variáveis no formato {{variavel}}
-    VARIABLE_PATTERN = r"{{([^{}]+)}}"
+    VARIABLE_PATTERN = VARIABLE_PATTERN
+    
+    # Templates compilados das strings processadas (URLs, cabeçalhos, corpos...)
+    _templates = TemplateCache()
     
     @classmethod
     def process_string(cls, input_string: str, variables: Dict[str, str]) -> str:
@@ -25,15 +30,11 @@ class VariableProcessor:
         Returns:
             String com as variáveis substituídas
         """
-        if not input_string:
+        if not input_string or "{{" not in input_string:
             return input_string
         
-        def replace_var(match: Match) -> str:
-            var_name = match.group(1).strip()
-            return variables.get(var_name, match.group(0))
-        
         # Substitui todas as ocorrências de variáveis
-        return re.sub(cls.VARIABLE_PATTERN, replace_var, input_string)
+        return cls._templates.get(input_string).render(variables)
     
     @classmethod
     def process_dict(cls, data: Dict[str, Any], variables: Dict[str, str]) -> Dict[str, Any]:
@@ -0,0 +1,226 @@
+"""
+Resolução de variáveis que referenciam outras variáveis (ex: base_url = {{scheme}}://{{host}})
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Dict, List, Optional, Any, Hashable, Tuple
+
+from src.core.template import TemplateCache, CompiledTemplate
+from src.core.variable_scope import VariableScope, ScopeChain, RESOLVED
+
+
+class VariableCycleError(ValueError):
+    """Variáveis que dependem umas das outras em ciclo"""
+    def __init__(self, cycle: List[str]):
+        self.cycle = cycle
+        super().__init__(f"Referência circular entre variáveis: {' -> '.join(cycle)}")
+
+
+# Templates dos valores das variáveis (compartilhados entre ambientes e resoluções)
+_TEMPLATES = TemplateCache(max_entries=1024)
+
+
+def _plan(variables: Mapping) -> Tuple[List[str], Dict[str, CompiledTemplate], List[List[str]]]:
+    """
+    Monta o grafo de dependências e a ordem de resolução
+
+    Args:
+        variables (Mapping): Variáveis com seus valores originais (dicionário ou ScopeChain)
+
+    Returns:
+        Tuple[List[str], Dict[str, CompiledTemplate], List[List[str]]]: Variáveis com
+            referências em ordem topológica (dependências primeiro), o template de cada
+            uma e os ciclos encontrados (ex: ["a", "b", "a"])
+    """
+    if isinstance(variables, ScopeChain):
+        # As camadas guardam, por versão, quais valores têm referências
+        candidates = [(name, variables[name]) for name in variables.templated_names()]
+    else:
+        candidates = [
+            (name, value) for name, value in variables.items()
+            if isinstance(value, str) and "{{" in value
+        ]
+
+    templates: Dict[str, CompiledTemplate] = {}
+    for name, value in candidates:
+        template = _TEMPLATES.get(value)
+        if template.names:
+            templates[name] = template
+
+    # Só as referências a variáveis com referências são arestas: as demais já estão resolvidas
+    edges = {
+        name: tuple(dict.fromkeys(dependency for dependency in template.names if dependency in templates))
+        for name, template in templates.items()
+    }
+
+    order: List[str] = []
+    cycles: List[List[str]] = []
+    # 1 = em visita (no caminho atual), 2 = concluída
+    state: Dict[str, int] = {}
+    for root in edges:
+        if root in state:
+            continue
+        state[root] = 1
+        path = [root]
+        stack = [iter(edges[root])]
+        while stack:
+            for dependency in stack[-1]:
+                dependency_state = state.get(dependency)
+                if dependency_state is None:
+                    state[dependency] = 1
+                    path.append(dependency)
+                    stack.append(iter(edges[dependency]))
+                    break
+                if dependency_state == 1:
+                    cycles.append(path[path.index(dependency):] + [dependency])
+            else:
+                stack.pop()
+                node = path.pop()
+                state[node] = 2
+                order.append(node)
+
+    return order, templates, cycles
+
+
+def _resolve(variables: Mapping) -> Tuple[Mapping, List[List[str]]]:
+    """
+    Renderiza os valores na ordem de resolução; retorna as variáveis e os ciclos
+
+    Uma ScopeChain não é mesclada: os valores resolvidos ficam em uma camada
+    RESOLVED acima das demais, em uma cadeia derivada.
+    """
+    order, templates, cycles = _plan(variables)
+    if not templates:
+        return variables, cycles
+
+    cyclic = {name for cycle in cycles for name in cycle}
+    if isinstance(variables, ScopeChain):
+        overrides = VariableScope(RESOLVED)
+        resolved = variables.with_scope(overrides)
+        for name in order:
+            if name not in cyclic:
+                overrides.set(name, templates[name].render(resolved))
+        return resolved, cycles
+
+    resolved = dict(variables)
+    for name in order:
+        if name not in cyclic:
+            resolved[name] = templates[name].render(resolved)
+    return resolved, cycles
+
+
+def find_cycles(variables: Mapping) -> List[List[str]]:
+    """
+    Encontra as referências circulares entre variáveis
+
+    Args:
+        variables (Mapping): Variáveis com seus valores originais (dicionário ou ScopeChain)
+
+    Returns:
+        List[List[str]]: Ciclos encontrados, cada um começando e terminando na mesma variável
+    """
+    return _plan(variables)[2]
+
+
+def resolve_variables(variables: Mapping, strict: bool = False) -> Mapping:
+    """
+    Substitui as referências entre variáveis, em qualquer profundidade
+
+    Cada valor é renderizado uma única vez, depois dos valores de que depende.
+    Variáveis em ciclo mantêm o valor original (as referências entre elas não
+    são substituídas), a menos que `strict` seja verdadeiro.
+
+    Args:
+        variables (Mapping): Variáveis com seus valores originais (dicionário ou ScopeChain)
+        strict (bool): Lança VariableCycleError se houver referência circular
+
+    Returns:
+        Mapping: Variáveis resolvidas (as próprias variáveis recebidas, se nenhum valor
+            tiver referências; para uma ScopeChain, uma cadeia derivada)
+    """
+    resolved, cycles = _resolve(variables)
+    if cycles and strict:
+        raise VariableCycleError(cycles[0])
+    return resolved
+
+
+class VariableResolver:
+    """
+    Resolve conjuntos de variáveis guardando o resultado até que algum valor mude
+
+    Os conjuntos são identificados pelo conteúdo (nomes e valores), de forma que
+    envios repetidos com o mesmo ambiente não refazem a resolução.
+    """
+    def __init__(self, max_entries: int = 32):
+        """
+        Args:
+            max_entries (int): Quantidade máxima de conjuntos resolvidos mantidos
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Mapping]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def resolve(self, variables: Optional[Mapping]) -> Mapping:
+        """
+        Retorna as variáveis resolvidas, reaproveitando resoluções anteriores
+
+        As variáveis em ciclo mantêm o valor original; os ciclos são informados por
+        find_cycles (ex: ao editar o ambiente), não a cada envio.
+
+        Args:
+            variables (Optional[Mapping]): Variáveis com seus valores originais (dicionário
+                ou ScopeChain, identificada pelas versões das camadas)
+
+        Returns:
+            Mapping: Variáveis resolvidas (compartilhadas; não devem ser alteradas)
+        """
+        if not variables:
+            return {}
+
+        try:
+            if isinstance(variables, ScopeChain):
+                # As versões das camadas identificam o conteúdo sem percorrer os valores
+                key = variables.version
+            else:
+                key = frozenset(variables.items())
+        except TypeError:
+            # Valores não hashable: resolver sem guardar
+            return _resolve(variables)[0]
+
+        with self._lock:
+            resolved = self._entries.get(key)
+            if resolved is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return resolved
+            self.misses += 1
+
+        resolved = _resolve(variables)[0]
+        if resolved is variables and not isinstance(variables, ScopeChain):
+            # O dicionário recebido pode ser alterado depois pelo chamador (uma cadeia
+            # alterada muda de versão e deixa de corresponder a esta entrada)
+            resolved = dict(variables)
+
+        with self._lock:
+            self._entries[key] = resolved
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return resolved
+
+    def clear(self) -> None:
+        """Descarta as resoluções guardadas"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna os acertos e as ausências do cache"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
@@ -0,0 +1,260 @@
+"""
+Escopos de variáveis em camadas (global, coleção, pasta, ambiente, execução e iteração)
+"""
+
+import itertools
+import threading
+from collections.abc import Mapping
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Tuple
+
+
+# Camadas, da menor para a maior precedência
+GLOBAL = "global"
+COLLECTION = "collection"
+FOLDER = "folder"
+ENVIRONMENT = "environment"
+RUN = "run"
+ITERATION = "iteration"
+
+LAYERS = (GLOBAL, COLLECTION, FOLDER, ENVIRONMENT, RUN, ITERATION)
+
+# Camada acima de todas com os valores que referenciam outras variáveis já resolvidos
+# (criada pelo VariableResolver)
+RESOLVED = "resolved"
+
+_ORDER = LAYERS + (RESOLVED,)
+
+# Versões são únicas entre todas as camadas: uma tupla de versões identifica o conteúdo
+# de uma cadeia sem que os valores precisem ser comparados
+_versions = itertools.count(1)
+_versions_lock = threading.Lock()
+
+
+def _next_version() -> int:
+    with _versions_lock:
+        return next(_versions)
+
+
+class VariableScope:
+    """
+    Camada de variáveis com versão
+
+    A versão muda a cada alteração feita pelos métodos da camada, o que permite
+    a caches (requisições preparadas, resolução de variáveis) identificar o
+    conteúdo sem percorrê-lo.
+    """
+    __slots__ = ("name", "version", "_values", "_templated")
+
+    def __init__(self, name: str, values: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            name (str): Camada (ver LAYERS)
+            values (Optional[Dict[str, Any]]): Valores iniciais (copiados)
+        """
+        self.name = name
+        self._values: Dict[str, Any] = dict(values) if values else {}
+        self.version = _next_version()
+        # (versão, nomes) das variáveis cujo valor referencia outras variáveis
+        self._templated: Optional[Tuple[int, Tuple[str, ...]]] = None
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._values.get(key, default)
+
+    def items(self):
+        return self._values.items()
+
+    def templated_names(self) -> Tuple[str, ...]:
+        """Variáveis cujo valor contém referências ({{...}}), calculadas uma vez por versão"""
+        templated = self._templated
+        if templated is None or templated[0] != self.version:
+            names = tuple(
+                name for name, value in self._values.items()
+                if isinstance(value, str) and "{{" in value
+            )
+            templated = self._templated = (self.version, names)
+        return templated[1]
+
+    def set(self, key: str, value: Any) -> None:
+        """Define o valor de uma variável"""
+        self._values[key] = value
+        self.version = _next_version()
+
+    def update(self, values: Dict[str, Any]) -> None:
+        """Define várias variáveis de uma vez"""
+        self._values.update(values)
+        self.version = _next_version()
+
+    def replace(self, values: Optional[Dict[str, Any]]) -> None:
+        """Substitui todo o conteúdo da camada (ex: a linha de dados de uma nova iteração)"""
+        self._values.clear()
+        if values:
+            self._values.update(values)
+        self.version = _next_version()
+
+    def remove(self, key: str) -> bool:
+        """
+        Remove uma variável
+
+        Returns:
+            bool: True se a variável existia
+        """
+        if key not in self._values:
+            return False
+        del self._values[key]
+        self.version = _next_version()
+        return True
+
+    def clear(self) -> None:
+        """Remove todas as variáveis"""
+        self.replace(None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Cópia dos valores da camada"""
+        return dict(self._values)
+
+
+class ScopeChain(Mapping):
+    """
+    Visão somente leitura de várias camadas de variáveis
+
+    Cada busca percorre as camadas da maior para a menor precedência (no máximo
+    uma por tipo), sem copiar nem mesclar dicionários. Cadeias derivadas com
+    with_scope compartilham as demais camadas: uma alteração em uma camada
+    compartilhada é vista por todas as cadeias que a contêm.
+    """
+    __slots__ = ("_scopes", "_lookup")
+
+    def __init__(self, scopes: Optional[Iterable[VariableScope]] = None):
+        """
+        Args:
+            scopes (Optional[Iterable[VariableScope]]): Camadas (compartilhadas, não copiadas);
+                no máximo uma de cada tipo
+        """
+        layers: Dict[str, VariableScope] = {}
+        for scope in scopes or ():
+            layers[scope.name] = scope
+
+        unknown = set(layers) - set(_ORDER)
+        if unknown:
+            raise ValueError(f"Camada desconhecida: {', '.join(sorted(unknown))}")
+
+        # Camadas em ordem de precedência e, para as buscas, da maior para a menor
+        self._scopes: Tuple[VariableScope, ...] = tuple(layers[name] for name in _ORDER if name in layers)
+        self._lookup: Tuple[Dict[str, Any], ...] = tuple(scope._values for scope in reversed(self._scopes))
+
+    def __getitem__(self, key: str) -> Any:
+        for values in self._lookup:
+            if key in values:
+                return values[key]
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        for values in self._lookup:
+            if key in values:
+                return values[key]
+        return default
+
+    def __contains__(self, key: object) -> bool:
+        return any(key in values for values in self._lookup)
+
+    def __iter__(self) -> Iterator[str]:
+        seen = set()
+        for values in self._lookup:
+            for key in values:
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __bool__(self) -> bool:
+        return any(self._lookup)
+
+    def __repr__(self) -> str:
+        return f"ScopeChain({', '.join(scope.name for scope in self._scopes)})"
+
+    @classmethod
+    def from_values(cls, layers: Dict[str, Optional[Dict[str, Any]]]) -> 'ScopeChain':
+        """
+        Cria uma cadeia com camadas novas
+
+        Args:
+            layers (Dict[str, Optional[Dict[str, Any]]]): Valores de cada camada, por tipo
+                (ex: {ENVIRONMENT: {"host": "api.exemplo.com"}})
+
+        Returns:
+            ScopeChain: Nova cadeia
+        """
+        return cls(VariableScope(name, values) for name, values in layers.items())
+
+    @property
+    def version(self) -> Tuple[int, ...]:
+        """Identifica o conteúdo atual da cadeia (muda a cada alteração de qualquer camada)"""
+        return tuple(scope.version for scope in self._scopes)
+
+    def templated_names(self) -> List[str]:
+        """Variáveis cujo valor efetivo contém referências ({{...}})"""
+        names = dict.fromkeys(name for scope in self._scopes for name in scope.templated_names())
+        return [name for name in names if isinstance(self[name], str) and "{{" in self[name]]
+
+    @property
+    def layers(self) -> List[str]:
+        """Camadas presentes, da menor para a maior precedência"""
+        return [scope.name for scope in self._scopes]
+
+    def scope(self, name: str) -> Optional[VariableScope]:
+        """
+        Retorna uma camada da cadeia
+
+        Args:
+            name (str): Camada (ver LAYERS)
+
+        Returns:
+            Optional[VariableScope]: A camada, ou None se a cadeia não a tiver
+        """
+        for scope in self._scopes:
+            if scope.name == name:
+                return scope
+        return None
+
+    def with_scope(self, scope: VariableScope) -> 'ScopeChain':
+        """
+        Deriva uma cadeia com a camada acrescentada (ou substituída, se já houver uma do mesmo tipo)
+
+        Args:
+            scope (VariableScope): Nova camada
+
+        Returns:
+            ScopeChain: Nova cadeia; as demais camadas são compartilhadas
+        """
+        return ScopeChain([existing for existing in self._scopes if existing.name != scope.name] + [scope])
+
+    def with_values(self, name: str, values: Optional[Dict[str, Any]]) -> 'ScopeChain':
+        """
+        Deriva uma cadeia com uma nova camada criada a partir de valores (ex: uma iteração)
+
+        Args:
+            name (str): Camada (ver LAYERS)
+            values (Optional[Dict[str, Any]]): Valores da camada
+
+        Returns:
+            ScopeChain: Nova cadeia; as demais camadas são compartilhadas
+        """
+        return self.with_scope(VariableScope(name, values))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Valores efetivos de todas as camadas mesclados em um dicionário"""
+        merged: Dict[str, Any] = {}
+        for scope in self._scopes:
+            merged.update(scope._values)
+        return merged
@@ -6,6 +6,10 @@ from typing import Dict, List, Optional, Any
 import uuid
 from datetime import datetime
 
+from src.models.retry_policy import RetryPolicy, HedgePolicy
+from src.models.timeouts import Timeouts
+from src.models.rate_limit import RateLimitPolicy
+
 
 class Collection:
     """
@@ -16,13 +20,26 @@ class Collection:
         name: str,
         description: str = "",
         requests: Optional[List[str]] = None,
-        folders: Optional[List['Folder']] = None
+        folders: Optional[List['Folder']] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        timeouts: Optional[Timeouts] = None,
+        rate_limit: Optional[RateLimitPolicy] = None,
+        variables: Optional[Dict[str, str]] = None
     ):
         self.id = str(uuid.uuid4())
         self.name = name
         self.description = description
         self.requests = requests or []  # Lista de IDs de requisições
         self.folders = folders or []
+        # Variáveis da coleção (precedência menor que a das pastas e do ambiente)
+        self.variables = variables or {}
+        # Políticas e tempos limite padrão para as requisições que não definem os seus
+        self.retry_policy = retry_policy
+        self.hedge_policy = hedge_policy
+        self.timeouts = timeouts
+        # Limites de taxa aplicados quando a coleção é executada
+        self.rate_limit = rate_limit
         self.created_at = datetime.now()
         self.updated_at = datetime.now()
     
@@ -56,6 +73,11 @@ class Collection:
             "description": self.description,
             "requests": self.requests,
             "folders": [folder.to_dict() for folder in self.folders],
+            "variables": self.variables,
+            "retry_policy": self.retry_policy.to_dict() if self.retry_policy else None,
+            "hedge_policy": self.hedge_policy.to_dict() if self.hedge_policy else None,
+            "timeouts": self.timeouts.to_dict() if self.timeouts else None,
+            "rate_limit": self.rate_limit.to_dict() if self.rate_limit else None,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
         }
@@ -67,12 +89,22 @@ class Collection:
             name=data["name"],
             description=data.get("description", ""),
             requests=data.get("requests", []),
+            variables=data.get("variables", {}),
         )
         
         collection.id = data["id"]
         collection.created_at = datetime.fromisoformat(data["created_at"])
         collection.updated_at = datetime.fromisoformat(data["updated_at"])
         
+        if data.get("retry_policy"):
+            collection.retry_policy = RetryPolicy.from_dict(data["retry_policy"])
+        if data.get("hedge_policy"):
+            collection.hedge_policy = HedgePolicy.from_dict(data["hedge_policy"])
+        if data.get("timeouts"):
+            collection.timeouts = Timeouts.from_dict(data["timeouts"])
+        if data.get("rate_limit"):
+            collection.rate_limit = RateLimitPolicy.from_dict(data["rate_limit"])
+        
         # Adiciona as pastas
         for folder_data in data.get("folders", []):
             collection.folders.append(Folder.from_dict(folder_data))
@@ -89,13 +121,16 @@ class Folder:
         name: str,
         description: str = "",
         requests: Optional[List[str]] = None,
-        subfolders: Optional[List['Folder']] = None
+        subfolders: Optional[List['Folder']] = None,
+        variables: Optional[Dict[str, str]] = None
     ):
         self.id = str(uuid.uuid4())
         self.name = name
         self.description = description
         self.requests = requests or []  # Lista de IDs de requisições
         self.subfolders = subfolders or []
+        # Variáveis da pasta (as de subpastas prevalecem sobre as das pastas acima)
+        self.variables = variables or {}
         self.created_at = datetime.now()
         self.updated_at = datetime.now()
     
@@ -129,6 +164,7 @@ class Folder:
             "description": self.description,
             "requests": self.requests,
             "subfolders": [subfolder.to_dict() for subfolder in self.subfolders],
+            "variables": self.variables,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
         }
@@ -140,6 +176,7 @@ class Folder:
             name=data["name"],
             description=data.get("description", ""),
             requests=data.get("requests", []),
+            variables=data.get("variables", {}),
         )
         
         folder.id = data["id"]
@@ -6,6 +6,8 @@ from typing import Dict, List, Optional, Any
 import uuid
 from datetime import datetime
 
+from src.models.rate_limit import RateLimitPolicy
+
 
 class Environment:
     """
@@ -16,11 +18,18 @@ class Environment:
         name: str,
         variables: Optional[Dict[str, str]] = None,
         description: str = "",
+        resolve_overrides: Optional[Dict[str, str]] = None,
+        rate_limit: Optional[RateLimitPolicy] = None,
     ):
         self.id = str(uuid.uuid4())
         self.name = name
         self.variables = variables or {}
         self.description = description
+        # Endereços fixos por "host" ou "host:porta" (ex: {"api.exemplo.com:443": "10.0.0.5"}),
+        # como o --resolve do curl
+        self.resolve_overrides = resolve_overrides or {}
+        # Limites de taxa aplicados às execuções feitas com este ambiente
+        self.rate_limit = rate_limit
         self.created_at = datetime.now()
         self.updated_at = datetime.now()
     
@@ -31,6 +40,8 @@ class Environment:
             "name": self.name,
             "variables": self.variables,
             "description": self.description,
+            "resolve_overrides": self.resolve_overrides,
+            "rate_limit": self.rate_limit.to_dict() if self.rate_limit else None,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
         }
@@ -41,9 +52,13 @@ class Environment:
         environment = cls(
             name=data["name"],
             variables=data.get("variables", {}),
-            description=data.get("description", "")
+            description=data.get("description", ""),
+            resolve_overrides=data.get("resolve_overrides", {})
         )
         
+        if data.get("rate_limit"):
+            environment.rate_limit = RateLimitPolicy.from_dict(data["rate_limit"])
+        
         environment.id = data["id"]
         environment.created_at = datetime.fromisoformat(data["created_at"])
         environment.updated_at = datetime.fromisoformat(data["updated_at"])
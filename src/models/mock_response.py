@@ -0,0 +1,65 @@
+"""
+Modelo de dados para respostas simuladas pelo servidor de mocks
+"""
+
+import json
+from typing import Dict, Optional, Any, Tuple
+
+
+class MockResponse:
+    """
+    Classe que representa a resposta servida pelo servidor de mocks para uma requisição salva
+    """
+    def __init__(
+        self,
+        status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[Any] = None,
+        delay: float = 0.0
+    ):
+        """
+        Args:
+            status_code (int): Status da resposta
+            headers (Optional[Dict[str, str]]): Cabeçalhos da resposta
+            body (Optional[Any]): Corpo; textos são enviados como estão e dicionários
+                e listas, serializados como JSON
+            delay (float): Segundos de espera antes de responder (simula latência do servidor)
+        """
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.body = body
+        self.delay = max(0.0, delay)
+
+    def encode_body(self) -> Tuple[bytes, Optional[str]]:
+        """
+        Serializa o corpo
+
+        Returns:
+            Tuple[bytes, Optional[str]]: Corpo e Content-Type sugerido (None se não houver)
+        """
+        if self.body is None:
+            return b"", None
+        if isinstance(self.body, bytes):
+            return self.body, "application/octet-stream"
+        if isinstance(self.body, (dict, list)):
+            return json.dumps(self.body).encode("utf-8"), "application/json"
+        return str(self.body).encode("utf-8"), "text/plain; charset=utf-8"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte o objeto para um dicionário"""
+        return {
+            "status_code": self.status_code,
+            "headers": self.headers,
+            "body": self.body if not isinstance(self.body, bytes) else self.body.decode("utf-8", "replace"),
+            "delay": self.delay,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'MockResponse':
+        """Cria um objeto a partir de um dicionário"""
+        return cls(
+            status_code=data.get("status_code", 200),
+            headers=data.get("headers", {}),
+            body=data.get("body"),
+            delay=data.get("delay", 0.0)
+        )
@@ -0,0 +1,77 @@
+"""
+Modelo de dados para os limites de taxa de envio por host
+"""
+
+from typing import Dict, Optional, Any
+
+
+class RateLimitPolicy:
+    """
+    Classe que representa os limites de taxa aplicados aos envios (token bucket)
+
+    Cada host (ou, com per_endpoint, cada método e caminho) tem seu próprio
+    balde: ele acumula até `burst` fichas, repostas a `rate` por segundo, e
+    cada envio consome uma ficha, aguardando quando não houver nenhuma.
+    """
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: Optional[int] = None,
+        per_endpoint: bool = False,
+        host_rates: Optional[Dict[str, float]] = None,
+        pause_on_429: bool = True
+    ):
+        """
+        Args:
+            rate (float): Envios por segundo permitidos para cada host (ou endpoint)
+            burst (Optional[int]): Envios permitidos de uma vez após um período ocioso
+                (padrão: o maior entre 1 e a taxa)
+            per_endpoint (bool): Limita cada método e caminho separadamente, em vez do host inteiro
+            host_rates (Optional[Dict[str, float]]): Taxas específicas por "host" ou "host:porta"
+            pause_on_429 (bool): Ao receber 429, pausa o balde pelo tempo do Retry-After
+                (ou por uma reposição de ficha), segurando também os demais workers
+        """
+        if rate <= 0:
+            raise ValueError("A taxa deve ser positiva")
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self.per_endpoint = per_endpoint
+        self.host_rates = host_rates or {}
+        self.pause_on_429 = pause_on_429
+
+    def rate_for(self, host: str, port: Optional[int] = None) -> float:
+        """
+        Retorna a taxa aplicada a um host
+
+        Args:
+            host (str): Nome do host
+            port (Optional[int]): Porta (usada para procurar "host:porta" antes de "host")
+
+        Returns:
+            float: Envios por segundo
+        """
+        if port is not None and f"{host}:{port}" in self.host_rates:
+            return self.host_rates[f"{host}:{port}"]
+        return self.host_rates.get(host, self.rate)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte o objeto para um dicionário"""
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "per_endpoint": self.per_endpoint,
+            "host_rates": self.host_rates,
+            "pause_on_429": self.pause_on_429,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RateLimitPolicy':
+        """Cria um objeto a partir de um dicionário"""
+        return cls(
+            rate=data.get("rate", 10.0),
+            burst=data.get("burst"),
+            per_endpoint=data.get("per_endpoint", False),
+            host_rates=data.get("host_rates", {}),
+            pause_on_429=data.get("pause_on_429", True)
+        )
@@ -2,11 +2,39 @@
 Modelo de dados para requisições HTTP
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator
 import json
+import mmap
+import os
 import uuid
+import weakref
 from datetime import datetime
 
+from src.models.retry_policy import RetryPolicy, HedgePolicy
+from src.models.timeouts import Timeouts
+from src.models.mock_response import MockResponse
+
+
+class BodyMode:
+    """
+    Modos de envio do corpo de uma requisição
+    """
+    # Sem corpo
+    NONE = "none"
+    # Texto ou bytes enviados exatamente como estão
+    RAW = "raw"
+    # JSON: textos são enviados como estão; dicionários e listas são serializados
+    JSON = "json"
+    # Formulário application/x-www-form-urlencoded a partir de um dicionário
+    FORM = "form"
+    # Conteúdo de um arquivo (o corpo é o caminho do arquivo)
+    BINARY = "binary"
+    # Formulário multipart/form-data a partir de um dicionário; arquivos são
+    # dicionários {"file": caminho, "filename": nome, "content_type": tipo}
+    MULTIPART = "multipart"
+
+    ALL = (NONE, RAW, JSON, FORM, BINARY, MULTIPART)
+
 
 class Request:
     """
@@ -21,6 +49,12 @@ class Request:
         params: Optional[Dict[str, str]] = None,
         body: Optional[Any] = None,
         description: str = "",
+        body_encoding: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        body_mode: Optional[str] = None,
+        timeouts: Optional[Timeouts] = None,
+        mock_response: Optional[MockResponse] = None,
     ):
         self.id = str(uuid.uuid4())
         self.name = name
@@ -29,7 +63,18 @@ class Request:
         self.headers = headers or {}
         self.params = params or {}
         self.body = body
+        # Modo de envio do corpo (ver BodyMode); None mantém a detecção pelo tipo do corpo
+        self.body_mode = body_mode
         self.description = description
+        # Compressão aplicada ao corpo no envio (gzip, deflate, br, zstd ou None)
+        self.body_encoding = body_encoding
+        # Políticas de novas tentativas e de duplicação (None usa as da coleção)
+        self.retry_policy = retry_policy
+        self.hedge_policy = hedge_policy
+        # Tempos limite de conexão, leitura e total (None usa os da coleção)
+        self.timeouts = timeouts
+        # Resposta servida pelo servidor de mocks (None serve 200 sem corpo)
+        self.mock_response = mock_response
         self.created_at = datetime.now()
         self.updated_at = datetime.now()
     
@@ -43,7 +88,13 @@ class Request:
             "headers": self.headers,
             "params": self.params,
             "body": self.body,
+            "body_mode": self.body_mode,
             "description": self.description,
+            "body_encoding": self.body_encoding,
+            "retry_policy": self.retry_policy.to_dict() if self.retry_policy else None,
+            "hedge_policy": self.hedge_policy.to_dict() if self.hedge_policy else None,
+            "timeouts": self.timeouts.to_dict() if self.timeouts else None,
+            "mock_response": self.mock_response.to_dict() if self.mock_response else None,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
         }
@@ -58,9 +109,20 @@ class Request:
             headers=data.get("headers", {}),
             params=data.get("params", {}),
             body=data.get("body"),
-            description=data.get("description", "")
+            body_mode=data.get("body_mode"),
+            description=data.get("description", ""),
+            body_encoding=data.get("body_encoding")
         )
         
+        if data.get("retry_policy"):
+            request.retry_policy = RetryPolicy.from_dict(data["retry_policy"])
+        if data.get("hedge_policy"):
+            request.hedge_policy = HedgePolicy.from_dict(data["hedge_policy"])
+        if data.get("timeouts"):
+            request.timeouts = Timeouts.from_dict(data["timeouts"])
+        if data.get("mock_response"):
+            request.mock_response = MockResponse.from_dict(data["mock_response"])
+        
         request.id = data["id"]
         request.created_at = datetime.fromisoformat(data["created_at"])
         request.updated_at = datetime.fromisoformat(data["updated_at"])
@@ -68,22 +130,191 @@ class Request:
         return request
 
 
+class ResponseTimings:
+    """
+    Tempos, em segundos, de cada fase de uma requisição HTTP
+    
+    As fases de DNS, conexão e TLS ficam zeradas quando uma conexão
+    persistente já aberta é reaproveitada.
+    """
+    def __init__(
+        self,
+        dns: float = 0.0,
+        connect: float = 0.0,
+        tls: float = 0.0,
+        send: float = 0.0,
+        ttfb: float = 0.0,
+        download: float = 0.0,
+        total: float = 0.0,
+        connection_reused: bool = False
+    ):
+        self.dns = dns
+        self.connect = connect
+        self.tls = tls
+        self.send = send
+        self.ttfb = ttfb
+        self.download = download
+        self.total = total
+        self.connection_reused = connection_reused
+    
+    @property
+    def network(self) -> float:
+        """Tempo gasto estabelecendo a conexão (DNS, TCP e TLS)"""
+        return self.dns + self.connect + self.tls
+    
+    @property
+    def client_overhead(self) -> float:
+        """Tempo total não atribuído a nenhuma fase de rede ou do servidor"""
+        return max(self.total - self.network - self.send - self.ttfb - self.download, 0.0)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte o objeto para um dicionário"""
+        return {
+            "dns": self.dns,
+            "connect": self.connect,
+            "tls": self.tls,
+            "send": self.send,
+            "ttfb": self.ttfb,
+            "download": self.download,
+            "total": self.total,
+            "connection_reused": self.connection_reused,
+        }
+
+
+class _BodyFile:
+    """
+    Arquivo que guarda o corpo de uma resposta, mapeado em memória sob demanda
+    """
+    def __init__(self, path: str, owned: bool):
+        self.path = path
+        self.owned = owned
+        self._file = None
+        self._map = None
+    
+    def get_map(self) -> Optional[mmap.mmap]:
+        """Mapeia o arquivo em memória na primeira leitura (None para arquivos vazios)"""
+        if self._map is None and os.path.getsize(self.path) > 0:
+            self._file = open(self.path, "rb")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+    
+    def release(self) -> None:
+        """Desfaz o mapeamento e remove o arquivo se ele for temporário"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self.owned:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+
 class Response:
     """
     Classe que representa uma resposta HTTP
+    
+    O corpo fica em memória (`content`) ou, para respostas grandes, em um
+    arquivo (`body_path`) lido sob demanda por mmap, sem copiar o corpo inteiro.
     """
     def __init__(
         self,
         status_code: int,
         headers: Dict[str, str],
         content: bytes,
-        elapsed_time: float
+        elapsed_time: float,
+        body_path: Optional[str] = None,
+        owns_body_file: bool = True,
+        timings: Optional[ResponseTimings] = None
     ):
         self.status_code = status_code
         self.headers = headers
-        self.content = content
+        self._content = content
         self.elapsed_time = elapsed_time
+        self.timings = timings or ResponseTimings(total=elapsed_time)
+        # Bytes do corpo recebidos pela rede, antes da descompressão (None se desconhecido)
+        self.wire_size: Optional[int] = None
+        # Versão do protocolo negociada (ex: "HTTP/1.1" ou "HTTP/2")
+        self.http_version: Optional[str] = None
+        # Quantidade de tentativas realizadas e se a resposta veio de uma cópia (hedging)
+        self.attempts = 1
+        self.hedged = False
+        # Segundos aguardados no limitador de taxa antes do envio (fora de elapsed_time)
+        self.rate_limit_wait = 0.0
+        # Origem no cache HTTP: None (rede), "hit" ou "revalidated"
+        self.cache_status: Optional[str] = None
         self.timestamp = datetime.now()
+        self._body_file = None
+        self._finalizer = None
+        
+        if body_path:
+            self._body_file = _BodyFile(body_path, owns_body_file)
+            # Liberar o mapeamento (e o arquivo temporário) quando a resposta deixar de ser usada
+            self._finalizer = weakref.finalize(self, self._body_file.release)
+    
+    @property
+    def body_path(self) -> Optional[str]:
+        """Caminho do arquivo com o corpo, quando ele não está em memória"""
+        return self._body_file.path if self._body_file else None
+    
+    @property
+    def is_file_backed(self) -> bool:
+        """Verifica se o corpo está armazenado em arquivo"""
+        return self._body_file is not None
+    
+    @property
+    def size(self) -> int:
+        """Tamanho do corpo em bytes"""
+        if self._body_file is not None:
+            return os.path.getsize(self._body_file.path)
+        return len(self._content)
+    
+    @property
+    def content(self) -> bytes:
+        """Corpo completo da resposta (para corpos em arquivo, lê tudo para a memória)"""
+        if self._body_file is not None:
+            return self.read_slice(0)
+        return self._content
+    
+    @content.setter
+    def content(self, value: bytes) -> None:
+        self.close()
+        self._content = value
+    
+    def read_slice(self, start: int = 0, end: Optional[int] = None) -> bytes:
+        """
+        Lê um trecho do corpo sem carregar o restante
+        
+        Args:
+            start (int): Posição inicial (inclusiva)
+            end (Optional[int]): Posição final (exclusiva); None lê até o fim
+            
+        Returns:
+            bytes: O trecho solicitado
+        """
+        if self._body_file is None:
+            return self._content[start:end]
+        
+        body_map = self._body_file.get_map()
+        if body_map is None:
+            return b""
+        return body_map[start:end]
+    
+    def iter_content(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        """Percorre o corpo em blocos"""
+        for start in range(0, self.size, chunk_size):
+            yield self.read_slice(start, start + chunk_size)
+    
+    def close(self) -> None:
+        """Libera o corpo em arquivo, removendo-o se for temporário"""
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._body_file = None
+        self._content = b""
     
     @property
     def is_json(self) -> bool:
@@ -0,0 +1,209 @@
+"""
+Modelo de dados para políticas de novas tentativas e de requisições duplicadas (hedging)
+"""
+
+import random
+import time
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Any
+
+
+# Métodos idempotentes (RFC 9110): podem ser repetidos ou duplicados sem efeitos adicionais
+IDEMPOTENT_METHODS = ["GET", "HEAD", "OPTIONS", "TRACE", "PUT", "DELETE"]
+
+
+class RetryPolicy:
+    """
+    Classe que representa a política de novas tentativas de uma requisição
+    """
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        retry_on_status: Optional[List[int]] = None,
+        retry_on_connect_errors: bool = True,
+        respect_retry_after: bool = True,
+        methods: Optional[List[str]] = None
+    ):
+        """
+        Args:
+            max_retries (int): Quantidade máxima de novas tentativas (além da primeira)
+            backoff_factor (float): Espera base, em segundos; dobra a cada tentativa
+            max_backoff (float): Espera máxima entre tentativas, em segundos
+            jitter (bool): Sorteia a espera entre zero e o valor exponencial
+            retry_on_status (Optional[List[int]]): Status que disparam nova tentativa
+            retry_on_connect_errors (bool): Tenta novamente em falhas de conexão
+            respect_retry_after (bool): Usa o cabeçalho Retry-After quando presente
+            methods (Optional[List[str]]): Métodos que podem ser repetidos (padrão: idempotentes)
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_on_status = retry_on_status if retry_on_status is not None else [429, 502, 503, 504]
+        self.retry_on_connect_errors = retry_on_connect_errors
+        self.respect_retry_after = respect_retry_after
+        self.methods = [method.upper() for method in methods] if methods is not None else list(IDEMPOTENT_METHODS)
+
+    def allows_method(self, method: str) -> bool:
+        """Indica se requisições com o método podem ser repetidas"""
+        return method.upper() in self.methods
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Calcula a espera antes de uma nova tentativa
+
+        Args:
+            attempt (int): Número da tentativa que falhou (0 para a primeira)
+
+        Returns:
+            float: Espera em segundos
+        """
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        if self.jitter:
+            # "Full jitter": espalha as novas tentativas de vários clientes
+            delay = random.uniform(0, delay)
+        return delay
+
+    def retry_delay(self, attempt: int, status_code: int, headers: Dict[str, str], connect_error: bool) -> Optional[float]:
+        """
+        Decide se uma tentativa deve ser repetida e quanto esperar
+
+        Args:
+            attempt (int): Número da tentativa que terminou (0 para a primeira)
+            status_code (int): Status recebido (0 se não houve resposta)
+            headers (Dict[str, str]): Cabeçalhos da resposta
+            connect_error (bool): Indica se a tentativa falhou ao conectar
+
+        Returns:
+            Optional[float]: Espera em segundos, ou None se não deve haver nova tentativa
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        if connect_error:
+            return self.backoff(attempt) if self.retry_on_connect_errors else None
+
+        if status_code not in self.retry_on_status:
+            return None
+
+        if self.respect_retry_after:
+            retry_after = parse_retry_after(headers)
+            if retry_after is not None:
+                # Esperas maiores que o limite configurado encerram as tentativas
+                return retry_after if retry_after <= self.max_backoff else None
+
+        return self.backoff(attempt)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte o objeto para um dicionário"""
+        return {
+            "max_retries": self.max_retries,
+            "backoff_factor": self.backoff_factor,
+            "max_backoff": self.max_backoff,
+            "jitter": self.jitter,
+            "retry_on_status": self.retry_on_status,
+            "retry_on_connect_errors": self.retry_on_connect_errors,
+            "respect_retry_after": self.respect_retry_after,
+            "methods": self.methods,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RetryPolicy':
+        """Cria um objeto a partir de um dicionário"""
+        return cls(
+            max_retries=data.get("max_retries", 3),
+            backoff_factor=data.get("backoff_factor", 0.5),
+            max_backoff=data.get("max_backoff", 30.0),
+            jitter=data.get("jitter", True),
+            retry_on_status=data.get("retry_on_status"),
+            retry_on_connect_errors=data.get("retry_on_connect_errors", True),
+            respect_retry_after=data.get("respect_retry_after", True),
+            methods=data.get("methods")
+        )
+
+
+class HedgePolicy:
+    """
+    Classe que representa a política de requisições duplicadas (hedging)
+
+    Quando a resposta demora mais que o percentil configurado das latências
+    recentes do mesmo endpoint, uma cópia da requisição é enviada e a primeira
+    resposta recebida é usada. Vale apenas para métodos idempotentes.
+    """
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        max_hedges: int = 1,
+        min_samples: int = 20,
+        min_delay: float = 0.0
+    ):
+        """
+        Args:
+            percentile (float): Percentil das latências recentes após o qual a cópia é enviada
+            max_hedges (int): Quantidade máxima de cópias por requisição
+            min_samples (int): Amostras necessárias antes de duplicar requisições
+            min_delay (float): Espera mínima, em segundos, antes de enviar uma cópia
+        """
+        self.percentile = percentile
+        self.max_hedges = max_hedges
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+
+    def allows_method(self, method: str) -> bool:
+        """Indica se requisições com o método podem ser duplicadas"""
+        return method.upper() in IDEMPOTENT_METHODS
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte o objeto para um dicionário"""
+        return {
+            "percentile": self.percentile,
+            "max_hedges": self.max_hedges,
+            "min_samples": self.min_samples,
+            "min_delay": self.min_delay,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'HedgePolicy':
+        """Cria um objeto a partir de um dicionário"""
+        return cls(
+            percentile=data.get("percentile", 95.0),
+            max_hedges=data.get("max_hedges", 1),
+            min_samples=data.get("min_samples", 20),
+            min_delay=data.get("min_delay", 0.0)
+        )
+
+
+def parse_retry_after(headers: Dict[str, str]) -> Optional[float]:
+    """
+    Lê o cabeçalho Retry-After (segundos ou data HTTP)
+
+    Args:
+        headers (Dict[str, str]): Cabeçalhos da resposta
+
+    Returns:
+        Optional[float]: Espera em segundos, ou None se o cabeçalho não existir ou for inválido
+    """
+    value = None
+    for key, header_value in (headers or {}).items():
+        if key.lower() == "retry-after":
+            value = header_value.strip()
+            break
+
+    if not value:
+        return None
+
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max(0.0, retry_at.timestamp() - time.time())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes das políticas de novas tentativas
+"""
+
+import sys
+import os
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.http_client import HttpClient
+from src.models.request import Request
+from src.models.retry_policy import RetryPolicy, HedgePolicy, parse_retry_after
+
+
+class _FlakyHandler(BaseHTTPRequestHandler):
+    """Servidor de teste que responde 503 com Retry-After antes de responder 200"""
+    protocol_version = "HTTP/1.1"
+    failures = 1
+    retry_after = "0"
+    calls = []
+
+    def do_GET(self):
+        type(self).calls.append(time.monotonic())
+        if len(self.calls) <= self.failures:
+            self.send_response(503)
+            self.send_header("Retry-After", self.retry_after)
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_retry_after_accepts_seconds_and_http_dates():
+    assert parse_retry_after({"retry-after": " 7 "}) == 7.0
+    assert parse_retry_after({}) is None
+    assert parse_retry_after({"Retry-After": "amanhã"}) is None
+
+    in_ten_seconds = formatdate(time.time() + 10, usegmt=True)
+    assert 8 <= parse_retry_after({"Retry-After": in_ten_seconds}) <= 10
+
+    # Datas no passado não geram espera negativa
+    assert parse_retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0.0
+
+
+def test_retry_delay_follows_status_method_and_limits():
+    policy = RetryPolicy(max_retries=2, backoff_factor=0.5, max_backoff=5, jitter=False)
+
+    assert policy.retry_delay(0, 503, {}, False) == 0.5
+    assert policy.retry_delay(1, 503, {}, False) == 1.0
+    assert policy.retry_delay(2, 503, {}, False) is None
+    assert policy.retry_delay(0, 500, {}, False) is None
+    assert policy.retry_delay(0, 0, {}, True) == 0.5
+
+    assert policy.retry_delay(0, 429, {"Retry-After": "3"}, False) == 3.0
+    # Uma espera acima do limite encerra as tentativas
+    assert policy.retry_delay(0, 429, {"Retry-After": formatdate(time.time() + 60, usegmt=True)}, False) is None
+
+    assert not policy.allows_method("POST") and policy.allows_method("put")
+    assert RetryPolicy.from_dict(policy.to_dict()).to_dict() == policy.to_dict()
+    assert HedgePolicy.from_dict(HedgePolicy(max_hedges=2).to_dict()).max_hedges == 2
+
+
+def test_jittered_backoff_stays_within_the_exponential_bound():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=3)
+    for attempt in range(5):
+        assert 0 <= policy.backoff(attempt) <= min(3, 2 ** attempt)
+
+
+@pytest.mark.parametrize("delay", ["1", "date"])
+def test_send_waits_for_retry_after(delay, http_server):
+    handler = type("Handler", (_FlakyHandler,), {"calls": []})
+    # Datas HTTP têm precisão de segundos: pedir 2 s garante ao menos ~1 s de espera
+    handler.retry_after = delay if delay != "date" else formatdate(time.time() + 2, usegmt=True)
+    server = http_server(handler)
+    request = Request(name="flaky", url=f"{server.url}/")
+    response, error = HttpClient.send_request(request, retry_policy=RetryPolicy(max_retries=2, jitter=False))
+    assert error is None and response.status_code == 200
+    assert response.attempts == 2
+    assert handler.calls[1] - handler.calls[0] >= 0.9
@@ -0,0 +1,69 @@
+"""
+Modelo de dados para os tempos limite de uma requisição
+"""
+
+from typing import Dict, Optional, Any, Tuple
+
+
+class Timeouts:
+    """
+    Classe que representa os tempos limite de uma requisição
+
+    O tempo total vale para o envio inteiro, incluindo novas tentativas e as
+    esperas entre elas; quando se esgota, o envio em andamento é interrompido.
+    """
+    def __init__(
+        self,
+        connect: Optional[float] = 10.0,
+        read: Optional[float] = 30.0,
+        total: Optional[float] = None
+    ):
+        """
+        Args:
+            connect (Optional[float]): Segundos para estabelecer a conexão (None para sem limite)
+            read (Optional[float]): Segundos sem receber dados antes de desistir (None para sem limite)
+            total (Optional[float]): Segundos para o envio completo (None para sem limite)
+        """
+        self.connect = connect
+        self.read = read
+        self.total = total
+
+    def for_attempt(self, remaining: Optional[float]) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Calcula os tempos limite de conexão e de leitura de uma tentativa
+
+        Args:
+            remaining (Optional[float]): Segundos restantes até o prazo total (None se não houver)
+
+        Returns:
+            Tuple[Optional[float], Optional[float]]: Tempos limite de conexão e de leitura,
+            nunca maiores que o tempo restante
+        """
+        if remaining is None:
+            return self.connect, self.read
+
+        remaining = max(remaining, 0.001)
+        connect = remaining if self.connect is None else min(self.connect, remaining)
+        read = remaining if self.read is None else min(self.read, remaining)
+        return connect, read
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte o objeto para um dicionário"""
+        return {
+            "connect": self.connect,
+            "read": self.read,
+            "total": self.total,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Timeouts':
+        """Cria um objeto a partir de um dicionário"""
+        return cls(
+            connect=data.get("connect", 10.0),
+            read=data.get("read", 30.0),
+            total=data.get("total")
+        )
+
+
+# Tempos limite usados quando nem a requisição nem o envio definem os seus
+DEFAULT_TIMEOUTS = Timeouts()
@@ -13,6 +13,8 @@ from PyQt5.QtCore import Qt, QSize, pyqtSignal
 
 from src.models.environment import Environment
 from src.core.storage import Storage
+from src.core.resolver import parse_curl_resolve
+from src.core.variable_resolver import find_cycles
 
 
 class EnvironmentDialog(QDialog):
@@ -119,6 +121,19 @@ class EnvironmentDialog(QDialog):
         
         right_layout.addWidget(variable_toolbar)
         
+        # Endereços fixos por host, no formato do --resolve do curl
+        resolve_layout = QFormLayout()
+        self.resolve_edit = QLineEdit()
+        self.resolve_edit.setPlaceholderText("api.exemplo.com:443:10.0.0.5 outro.exemplo.com:80:10.0.0.6")
+        self.resolve_edit.setToolTip(
+            "Substituições de host → IP no formato host:porta:ip, separadas por espaço "
+            "(como o --resolve do curl)"
+        )
+        self.resolve_edit.setEnabled(False)
+        self.resolve_edit.editingFinished.connect(self._on_resolve_overrides_changed)
+        resolve_layout.addRow("Resolver:", self.resolve_edit)
+        right_layout.addLayout(resolve_layout)
+        
         # Adicionar os painéis ao splitter
         splitter.addWidget(left_panel)
         splitter.addWidget(right_panel)
@@ -155,6 +170,8 @@ class EnvironmentDialog(QDialog):
             self.add_var_action.setEnabled(False)
             self.import_vars_action.setEnabled(False)
             self.export_vars_action.setEnabled(False)
+            self.resolve_edit.clear()
+            self.resolve_edit.setEnabled(False)
             return
         
         env_id = current.data(Qt.UserRole)
@@ -168,6 +185,13 @@ class EnvironmentDialog(QDialog):
         # Carregar variáveis
         for name, value in self.current_environment.variables.items():
             self._add_variable_row(name, value)
+        
+        # Carregar substituições de endereço
+        self.resolve_edit.setEnabled(True)
+        self.resolve_edit.setText(" ".join(
+            f"{key}:{address}" if ":" in key else f"{key}:*:{address}"
+            for key, address in self.current_environment.resolve_overrides.items()
+        ))
     
     def _add_environment(self):
         """Adiciona um novo ambiente"""
@@ -317,6 +341,32 @@ class EnvironmentDialog(QDialog):
         # Reconectar o evento
         self.variables_table.itemChanged.connect(self._on_variable_changed)
     
+    def _on_resolve_overrides_changed(self):
+        """Salva as substituições de endereço informadas no formato do curl"""
+        if not self.current_environment:
+            return
+        
+        overrides = {}
+        for entry in self.resolve_edit.text().split():
+            try:
+                key, addresses = parse_curl_resolve(entry)
+            except ValueError:
+                QMessageBox.warning(
+                    self,
+                    "Entrada inválida",
+                    f"Use o formato host:porta:ip — entrada ignorada: {entry}"
+                )
+                continue
+            overrides[key] = ",".join(addresses)
+        
+        if overrides == self.current_environment.resolve_overrides:
+            return
+        
+        self.current_environment.resolve_overrides = overrides
+        self.storage.save_environment(self.current_environment)
+        
+        self.environment_updated.emit()
+    
     def _on_variable_changed(self, item):
         """Manipula a alteração de uma variável na tabela"""
         if not self.current_environment:
@@ -344,6 +394,17 @@ class EnvironmentDialog(QDialog):
         self.current_environment.variables[name] = value
         self.storage.save_environment(self.current_environment)
         
+        # Avisar sobre referências circulares criadas pela alteração
+        cycles = [cycle for cycle in find_cycles(self.current_environment.variables) if name in cycle]
+        if cycles:
+            QMessageBox.warning(
+                self,
+                "Referência Circular",
+                f"A variável '{name}' faz parte de uma referência circular ({' -> '.join(cycles[0])}) "
+                "e não terá as referências substituídas.",
+                QMessageBox.Ok
+            )
+        
         self.environment_updated.emit()
     
     def _delete_variable(self, row):
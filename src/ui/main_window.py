@@ -14,6 +14,9 @@ from PyQt5.QtCore import Qt, QSize, QUrl
 from PyQt5.QtGui import QIcon, QPixmap
 
 from src.core.storage import Storage
+from src.core.http_client import HttpClient
+from src.core.http2_transport import is_http2_available
+from src.core.variable_scope import ScopeChain, GLOBAL, ENVIRONMENT
 from src.ui.request_tab import RequestTab
 from src.ui.collection_tree_model import CollectionTreeModel, CollectionTreeItem
 from src.ui.environment_dialog import EnvironmentDialog
@@ -193,16 +196,21 @@ class MainWindow(QMainWindow):
         # Inicializar o armazenamento
         self.storage = Storage()
         
-        # Ambiente selecionado
+        # Ambiente selecionado e variáveis em camadas (as do ambiente ficam na camada ENVIRONMENT);
+        # as guias recebem a cadeia em vez de cópias do dicionário a cada envio
         self.current_environment = None
-        self.current_variables = {}
+        self.current_variables = ScopeChain.from_values({GLOBAL: None, ENVIRONMENT: None})
         
         # Configurações de tema
         self.is_dark_theme = False
+        # Aviso das configurações carregadas, exibido na barra de status quando ela existir
+        self.settings_warning = None
         self._load_settings()
         
         # Criar os componentes da interface
         self._create_ui()
+        if self.settings_warning:
+            self.status_bar.showMessage(self.settings_warning)
         
         # Carregar dados
         self._load_data()
@@ -457,10 +465,9 @@ class MainWindow(QMainWindow):
         
         if env_id:
             self.current_environment = self.storage.get_environment(env_id)
-            self.current_variables = self.current_environment.variables.copy() if self.current_environment else {}
         else:
             self.current_environment = None
-            self.current_variables = {}
+        self._update_environment_scope()
         
         # Atualizar as variáveis disponíveis em todas as guias abertas
         for i in range(self.request_tabs.count()):
@@ -470,6 +477,11 @@ class MainWindow(QMainWindow):
         
         self.status_bar.showMessage(f"Ambiente atual: {self.environment_combo.currentText()}")
     
+    def _update_environment_scope(self):
+        """Substitui as variáveis da camada de ambiente pelas do ambiente selecionado"""
+        environment_scope = self.current_variables.scope(ENVIRONMENT)
+        environment_scope.replace(self.current_environment.variables if self.current_environment else None)
+    
     def _show_environments_dialog(self):
         """Mostra o diálogo de gerenciamento de ambientes"""
         dialog = EnvironmentDialog(self.storage, self)
@@ -481,7 +493,7 @@ class MainWindow(QMainWindow):
             env_id = self.environment_combo.currentData()
             if env_id:
                 self.current_environment = self.storage.get_environment(env_id)
-                self.current_variables = self.current_environment.variables.copy() if self.current_environment else {}
+                self._update_environment_scope()
                 
                 # Atualizar as variáveis disponíveis em todas as guias abertas
                 for i in range(self.request_tabs.count()):
@@ -1185,6 +1197,22 @@ class MainWindow(QMainWindow):
         
         if 'theme' in settings:
             self.is_dark_theme = settings['theme'] == 'dark'
+        
+        # Cache HTTP opcional
+        cache_settings = settings.get('http_cache', {})
+        if cache_settings.get('enabled'):
+            HttpClient.configure_cache(
+                self.storage,
+                max_size=cache_settings.get('max_size', 256 * 1024 * 1024),
+                max_age=cache_settings.get('max_age', 7 * 24 * 3600)
+            )
+        
+        # Transporte HTTP/2 opcional (multiplexa os envios para a mesma origem)
+        if settings.get('transport') == 'http2':
+            if is_http2_available():
+                HttpClient.configure_transport('http2')
+            else:
+                self.settings_warning = "Transporte HTTP/2 indisponível: instale o pacote 'httpx[http2]'"
     
     def _save_settings(self):
         """Salva as configurações no armazenamento"""
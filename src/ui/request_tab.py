@@ -3,25 +3,33 @@ Componente para a guia de requisição
 """
 
 import json
+import threading
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, 
     QLineEdit, QComboBox, QTabWidget, QTextEdit, 
     QPushButton, QLabel, QSplitter, QToolBar,
     QAction, QGroupBox, QTableWidget, QTableWidgetItem,
     QHeaderView, QMessageBox, QPlainTextEdit, QMenu,
-    QApplication, QStyledItemDelegate, QCompleter, QStackedWidget
+    QApplication, QStyledItemDelegate, QCompleter, QStackedWidget, QFileDialog
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QSize, QStringListModel
+from PyQt5.QtCore import Qt, pyqtSignal, QSize, QStringListModel, QEventLoop
 from PyQt5.QtGui import QColor, QSyntaxHighlighter, QTextCharFormat, QFont
 
-from src.models.request import Request, Response
+from src.models.request import Request, Response, BodyMode
+from src.core.multipart import parse_form_field, format_form_field
 from src.core.http_client import HttpClient
+from src.core.cancellation import CancellationToken
 from src.core.storage import Storage
+from src.core.variable_index import request_variables
 from src.ui.variable_completer import VariableCompleter
 from src.utils.curl_converter import request_to_curl, curl_to_request
+from src.utils.compression import available_encodings
 import uuid
 
 
+# Tamanho máximo, em bytes, do corpo de resposta exibido no visualizador
+RESPONSE_PREVIEW_LIMIT = 2 * 1024 * 1024
+
 # Lista de cabeçalhos HTTP comuns
 COMMON_HEADERS = [
     "Accept", "Accept-Charset", "Accept-Encoding", "Accept-Language", "Accept-Ranges",
@@ -251,6 +259,10 @@ class RequestTab(QWidget):
     request_saved = pyqtSignal(Request)
     # Sinal para solicitar salvar na coleção
     save_to_collection = pyqtSignal()
+    # Progresso do envio do corpo (enviados, total) e fim do envio, emitidos pela thread de envio
+    upload_progress = pyqtSignal(int, int)
+    download_progress = pyqtSignal(int, int)
+    send_finished = pyqtSignal()
     
     # Lista compartilhada de cabeçalhos personalizados entre todas as instâncias
     custom_headers = set()
@@ -291,6 +303,22 @@ class RequestTab(QWidget):
         self.send_button.setToolTip("Enviar a requisição para o servidor")
         toolbar.addWidget(self.send_button)
         
+        # Botão para cancelar o envio em andamento
+        self.cancel_button = QPushButton("Cancelar")
+        self.cancel_button.clicked.connect(self._cancel_send)
+        self.cancel_button.setToolTip("Interromper o envio em andamento")
+        self.cancel_button.setEnabled(False)
+        toolbar.addWidget(self.cancel_button)
+        
+        # Botão para baixar a resposta diretamente para um arquivo
+        self.download_button = QPushButton("Baixar")
+        self.download_button.clicked.connect(self._on_download_clicked)
+        self.download_button.setToolTip("Enviar a requisição gravando a resposta em um arquivo")
+        toolbar.addWidget(self.download_button)
+        
+        self.upload_progress.connect(self._on_upload_progress)
+        self.download_progress.connect(self._on_download_progress)
+        
         # Botão para salvar a requisição
         self.save_button = QPushButton("Salvar")
         self.save_button.clicked.connect(self.save_request)
@@ -418,7 +446,7 @@ class RequestTab(QWidget):
         body_type_layout.addWidget(QLabel("Tipo:"))
         
         self.body_type_combo = QComboBox()
-        self.body_type_combo.addItems(["none", "raw", "form-data", "x-www-form-urlencoded"])
+        self.body_type_combo.addItems(["none", "raw", "form-data", "x-www-form-urlencoded", "binary"])
         self.body_type_combo.setToolTip("Tipo de dados do corpo da requisição")
         self.body_type_combo.currentTextChanged.connect(self._on_body_type_changed)
         
@@ -434,6 +462,15 @@ class RequestTab(QWidget):
         body_type_layout.addWidget(QLabel("Content-Type:"))
         body_type_layout.addWidget(self.content_type_combo)
         
+        # Compressão opcional do corpo no envio
+        self.body_encoding_combo = QComboBox()
+        self.body_encoding_combo.addItems(["none"] + available_encodings())
+        self.body_encoding_combo.setToolTip("Comprime o corpo da requisição e define o Content-Encoding")
+        self.body_encoding_combo.currentTextChanged.connect(self._on_field_changed)
+        
+        body_type_layout.addWidget(QLabel("Compressão:"))
+        body_type_layout.addWidget(self.body_encoding_combo)
+        
         body_layout.addLayout(body_type_layout)
         
         # Editor de corpo
@@ -464,7 +501,22 @@ class RequestTab(QWidget):
         editor_layout.addWidget(self.body_editor)
         body_layout.addLayout(editor_layout)
         
-        # Tabela para form-data/url-encoded
+        # Arquivo enviado como corpo (binary)
+        self.binary_widget = QWidget()
+        binary_layout = QHBoxLayout(self.binary_widget)
+        binary_layout.setContentsMargins(0, 0, 0, 0)
+        self.binary_path_edit = QLineEdit()
+        self.binary_path_edit.setPlaceholderText("Caminho do arquivo enviado como corpo")
+        self.binary_path_edit.textChanged.connect(self._on_field_changed)
+        binary_layout.addWidget(self.binary_path_edit)
+        self.binary_browse_button = QPushButton("Selecionar Arquivo")
+        self.binary_browse_button.clicked.connect(self._select_binary_file)
+        binary_layout.addWidget(self.binary_browse_button)
+        self.binary_widget.setVisible(False)
+        
+        body_layout.addWidget(self.binary_widget)
+        
+        # Tabela para form-data/url-encoded (em form-data, valores "@caminho" enviam arquivos)
         self.body_table = QTableWidget(0, 3)
         self.body_table.setHorizontalHeaderLabels(["Chave", "Valor", ""])
         self.body_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
@@ -590,7 +642,19 @@ class RequestTab(QWidget):
             self.headers_table.item(row, 1).setText(value)
         
         # Corpo
-        if self.request.body:
+        if self.request.body_mode == BodyMode.BINARY:
+            self.body_type_combo.setCurrentText("binary")
+            self.binary_path_edit.setText(self.request.body or "")
+        elif self.request.body_mode in (BodyMode.FORM, BodyMode.MULTIPART) and isinstance(self.request.body, dict):
+            multipart = self.request.body_mode == BodyMode.MULTIPART
+            self.body_type_combo.setCurrentText("form-data" if multipart else "x-www-form-urlencoded")
+            for key, value in self.request.body.items():
+                row = self.body_table.rowCount()
+                self._add_table_row(self.body_table)
+                self.body_table.item(row, 0).setText(key)
+                # Arquivos aparecem como no cURL: @caminho;type=tipo
+                self.body_table.item(row, 1).setText(format_form_field(value) if multipart else str(value))
+        elif self.request.body:
             if isinstance(self.request.body, dict):
                 # Se for um dicionário, exibir como JSON
                 self.body_type_combo.setCurrentText("raw")
@@ -613,6 +677,9 @@ class RequestTab(QWidget):
                     # Não é JSON, manter como texto plano
                     pass
         
+        # Compressão do corpo
+        self.body_encoding_combo.setCurrentText(self.request.body_encoding or "none")
+        
         # Atualizar visualização cURL se existir
         if hasattr(self, 'curl_editor'):
             self._update_curl_preview()
@@ -654,6 +721,7 @@ class RequestTab(QWidget):
         self.add_form_button.setVisible(False)
         self.content_type_combo.setVisible(False)
         self.format_json_button.setVisible(False)
+        self.binary_widget.setVisible(False)
         
         if body_type == "none":
             # Nenhum corpo
@@ -673,8 +741,18 @@ class RequestTab(QWidget):
             self.body_table.setVisible(True)
             self.add_form_button.setVisible(True)
         
+        elif body_type == "binary":
+            # Corpo lido de um arquivo
+            self.binary_widget.setVisible(True)
+        
         self._on_field_changed()
     
+    def _select_binary_file(self):
+        """Seleciona o arquivo enviado como corpo"""
+        file_path, _ = QFileDialog.getOpenFileName(self, "Selecionar Arquivo", "", "Todos os arquivos (*)")
+        if file_path:
+            self.binary_path_edit.setText(file_path)
+    
     def _on_field_changed(self):
         """Chamado quando um campo é alterado"""
         self._has_unsaved_changes = True
@@ -726,8 +804,12 @@ class RequestTab(QWidget):
         # Atualizar corpo
         body_type = self.body_type_combo.currentText()
         
+        body_encoding = self.body_encoding_combo.currentText()
+        self.request.body_encoding = None if body_encoding == "none" else body_encoding
+        
         if body_type == "none":
             self.request.body = None
+            self.request.body_mode = BodyMode.NONE
         
         elif body_type == "raw":
             # Adicionar o cabeçalho Content-Type
@@ -735,17 +817,13 @@ class RequestTab(QWidget):
             if content_type:
                 self.request.headers["Content-Type"] = content_type
             
-            # Se for JSON, tentar converter para objeto
-            body_text = self.body_editor.toPlainText()
-            
-            if content_type == "application/json" and body_text:
-                try:
-                    self.request.body = json.loads(body_text)
-                except json.JSONDecodeError:
-                    # Se falhar, manter como texto
-                    self.request.body = body_text
-            else:
-                self.request.body = body_text
+            # O texto é enviado exatamente como foi escrito, mesmo quando é JSON
+            self.request.body = self.body_editor.toPlainText()
+            self.request.body_mode = BodyMode.JSON if content_type == "application/json" else BodyMode.RAW
+        
+        elif body_type == "binary":
+            self.request.body = self.binary_path_edit.text().strip() or None
+            self.request.body_mode = BodyMode.BINARY
         
         elif body_type == "form-data" or body_type == "x-www-form-urlencoded":
             # Criar um dicionário com os dados do formulário
@@ -756,15 +834,24 @@ class RequestTab(QWidget):
                 value_item = self.body_table.item(row, 1)
                 
                 if key_item and key_item.text() and value_item:
-                    form_data[key_item.text()] = value_item.text()
+                    value = value_item.text()
+                    if body_type == "form-data":
+                        # Valores iniciados por @ são arquivos enviados do disco
+                        value = parse_form_field(value)
+                    form_data[key_item.text()] = value
             
             self.request.body = form_data
             
             # Definir o cabeçalho adequado
             if body_type == "form-data":
-                self.request.headers["Content-Type"] = "multipart/form-data"
+                # O Content-Type é gerado no envio, com o delimitador das partes
+                self.request.headers = {
+                    key: value for key, value in self.request.headers.items() if key.lower() != "content-type"
+                }
+                self.request.body_mode = BodyMode.MULTIPART
             else:
                 self.request.headers["Content-Type"] = "application/x-www-form-urlencoded"
+                self.request.body_mode = BodyMode.FORM
     
     def save_request(self):
         """Salva a requisição"""
@@ -794,7 +881,7 @@ class RequestTab(QWidget):
         """
         # Buscar a janela principal para verificar se há um ambiente selecionado
         main_window = self.window()
-        if hasattr(main_window, 'current_variables') and main_window.current_variables:
+        if getattr(main_window, 'current_variables', None) or getattr(main_window, 'current_environment', None):
             self._send_request_with_environment(main_window.current_variables)
         else:
             self._send_request()
@@ -805,7 +892,7 @@ class RequestTab(QWidget):
         self._update_request_from_fields()
         
         # Enviar a requisição
-        response, error = HttpClient.send_request(self.request)
+        response, error = self._run_send()
         self.response = response
         
         # Adicionar ao histórico
@@ -814,6 +901,123 @@ class RequestTab(QWidget):
         # Exibir a resposta
         self._display_response(response, error)
     
+    def _run_send(self, variables=None, resolve_overrides=None, target_path=None):
+        """
+        Envia a requisição em uma thread separada, mantendo a interface responsiva
+        para que o envio possa ser cancelado
+        
+        Args:
+            variables (dict): Variáveis para substituição
+            resolve_overrides (dict): Endereços fixos por host
+            target_path (str): Arquivo em que a resposta é gravada (modo download)
+            
+        Returns:
+            tuple: Resposta e mensagem de erro (se houver)
+        """
+        self._cancel_token = CancellationToken()
+        self.send_button.setEnabled(False)
+        self.download_button.setEnabled(False)
+        self.cancel_button.setEnabled(True)
+        
+        result = {}
+        loop = QEventLoop()
+        self.send_finished.connect(loop.quit)
+        
+        def send():
+            try:
+                if target_path:
+                    result["value"] = HttpClient.download(
+                        self.request, target_path, variables, resolve_overrides=resolve_overrides,
+                        on_progress=self.download_progress.emit, cancel_token=self._cancel_token
+                    )
+                else:
+                    result["value"] = HttpClient.send_request(
+                        self.request, variables, stream=True, resolve_overrides=resolve_overrides,
+                        on_upload_progress=self.upload_progress.emit, cancel_token=self._cancel_token
+                    )
+            finally:
+                self.send_finished.emit()
+        
+        thread = threading.Thread(target=send, name="request-send", daemon=True)
+        thread.start()
+        loop.exec_()
+        thread.join()
+        
+        self.send_finished.disconnect(loop.quit)
+        self.send_button.setEnabled(True)
+        self.download_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
+        
+        if "value" not in result:
+            return Response(status_code=0, headers={}, content=b"", elapsed_time=0.0), "Erro inesperado no envio"
+        return result["value"]
+    
+    def _cancel_send(self):
+        """Cancela o envio em andamento"""
+        token = getattr(self, '_cancel_token', None)
+        if token is not None:
+            token.cancel()
+            self.response_info.setText("Cancelando...")
+    
+    def _on_upload_progress(self, sent, total):
+        """
+        Exibe o progresso do envio do corpo
+        
+        Args:
+            sent (int): Bytes enviados
+            total (int): Total de bytes do corpo
+        """
+        if total <= 0:
+            return
+        
+        percent = sent * 100 // total
+        if sent > 0 and sent < total and percent == getattr(self, '_upload_percent', None):
+            # Atualizar a tela apenas quando a porcentagem muda
+            return
+        self._upload_percent = percent
+        
+        self.response_info.setText(f"Enviando: {sent} de {total} bytes ({percent}%)")
+    
+    def _on_download_progress(self, received, total):
+        """
+        Exibe o progresso do download para arquivo
+        
+        Args:
+            received (int): Bytes gravados
+            total (int): Total de bytes da resposta (0 se desconhecido)
+        """
+        if total <= 0:
+            self.response_info.setText(f"Baixando: {received} bytes")
+            return
+        
+        percent = received * 100 // total
+        if received < total and percent == getattr(self, '_download_percent', None):
+            return
+        self._download_percent = percent
+        
+        self.response_info.setText(f"Baixando: {received} de {total} bytes ({percent}%)")
+    
+    def _on_download_clicked(self):
+        """Envia a requisição gravando a resposta em um arquivo escolhido pelo usuário"""
+        target_path, _ = QFileDialog.getSaveFileName(self, "Salvar resposta em")
+        if not target_path:
+            return
+        
+        self._update_request_from_fields()
+        
+        main_window = self.window()
+        variables = getattr(main_window, 'current_variables', None) or {}
+        environment = getattr(main_window, 'current_environment', None)
+        resolve_overrides = environment.resolve_overrides if environment else None
+        
+        # Downloads interrompidos são retomados ao baixar novamente para o mesmo arquivo
+        response, error = self._run_send(variables, resolve_overrides, target_path)
+        self.response = response
+        
+        self.storage.add_to_history(self.request)
+        
+        self._display_response(response, error)
+    
     def _send_request_with_environment(self, variables=None):
         """Envia a requisição usando variáveis de ambiente"""
         if variables is None:
@@ -825,8 +1029,12 @@ class RequestTab(QWidget):
         # Mostrar informações sobre as variáveis que serão substituídas
         self._show_variable_substitutions(variables)
         
+        # Substituições de endereço do ambiente selecionado
+        environment = getattr(self.window(), 'current_environment', None)
+        resolve_overrides = environment.resolve_overrides if environment else None
+        
         # Enviar a requisição com as variáveis de ambiente
-        response, error = HttpClient.send_request(self.request, variables)
+        response, error = self._run_send(variables, resolve_overrides)
         self.response = response
         
         # Adicionar ao histórico
@@ -846,30 +1054,8 @@ class RequestTab(QWidget):
             # Se não há variáveis, não há o que mostrar
             return
             
-        # Encontrar todas as variáveis usadas na requisição
-        used_variables = set()
-        
-        # Verificar URL
-        used_in_url = self.variable_completer.find_variables_in_text(self.url_edit.text())
-        used_variables.update(used_in_url)
-        
-        # Verificar nome da requisição
-        used_in_name = self.variable_completer.find_variables_in_text(self.name_edit.text())
-        used_variables.update(used_in_name)
-        
-        # Verificar corpo
-        if self.body_type_combo.currentText() == "raw":
-            used_in_body = self.variable_completer.find_variables_in_text(self.body_editor.toPlainText())
-            used_variables.update(used_in_body)
-        
-        # Verificar parâmetros e cabeçalhos
-        for table in [self.params_table, self.headers_table]:
-            for row in range(table.rowCount()):
-                for col in range(2):  # Chave e valor
-                    item = table.item(row, col)
-                    if item and item.text():
-                        used_in_table = self.variable_completer.find_variables_in_text(item.text())
-                        used_variables.update(used_in_table)
+        # Encontrar todas as variáveis usadas na requisição (já atualizada a partir dos campos)
+        used_variables = request_variables(self.request)
         
         # Filtrar apenas as variáveis que existem no ambiente
         valid_variables = {var for var in used_variables if var in variables}
@@ -912,13 +1098,45 @@ class RequestTab(QWidget):
             return
         
         # Exibir informações da resposta
+        timings = response.timings
+        if timings.connection_reused:
+            connection_info = "Conexão reutilizada"
+        else:
+            connection_info = (
+                f"DNS {timings.dns * 1000:.0f}ms · Conexão {timings.connect * 1000:.0f}ms · "
+                f"TLS {timings.tls * 1000:.0f}ms"
+            )
+        size_info = f"{response.size} bytes"
+        if response.wire_size is not None and response.wire_size != response.size:
+            size_info += f" ({response.wire_size} bytes transferidos)"
+        
+        cache_info = ""
+        if response.cache_status == "hit":
+            cache_info = " | Cache: resposta armazenada"
+        elif response.cache_status == "revalidated":
+            cache_info = " | Cache: revalidada (304)"
+        if response.attempts > 1:
+            cache_info += f" | Tentativas: {response.attempts}"
+        if response.hedged:
+            cache_info += " | Resposta da requisição duplicada"
+        if response.rate_limit_wait > 0:
+            cache_info += f" | Limite de taxa: {response.rate_limit_wait:.2f}s de espera"
+        protocol_info = f"{response.http_version} " if response.http_version else ""
         self.response_info.setText(
-            f"Status: {response.status_code} | Tempo: {response.elapsed_time:.2f}s | Tamanho: {len(response.content)} bytes"
+            f"{protocol_info}Status: {response.status_code} | Tempo: {response.elapsed_time:.2f}s "
+            f"({connection_info} · Espera {timings.ttfb * 1000:.0f}ms · "
+            f"Download {timings.download * 1000:.0f}ms) | Tamanho: {size_info}{cache_info}"
         )
         
         # Exibir o conteúdo da resposta
         try:
-            if response.is_json:
+            if response.size > RESPONSE_PREVIEW_LIMIT:
+                # Corpos grandes: exibir apenas o início, lido diretamente do arquivo
+                preview = response.read_slice(0, RESPONSE_PREVIEW_LIMIT).decode("utf-8", errors="replace")
+                self.response_text.setPlainText(
+                    f"{preview}\n\n[Exibindo os primeiros {RESPONSE_PREVIEW_LIMIT} de {response.size} bytes]"
+                )
+            elif response.is_json:
                 # Formatar o JSON
                 json_data = response.get_content_as_json()
                 self.response_text.setPlainText(json.dumps(json_data, indent=2))
@@ -927,7 +1145,7 @@ class RequestTab(QWidget):
                 self.response_text.setPlainText(response.get_content_as_text())
         except Exception as e:
             # Em caso de erro, exibir o conteúdo bruto
-            self.response_text.setPlainText(f"Erro ao exibir resposta: {str(e)}\n\nConteúdo bruto:\n{response.content}")
+            self.response_text.setPlainText(f"Erro ao exibir resposta: {str(e)}\n\nConteúdo bruto:\n{response.read_slice(0, RESPONSE_PREVIEW_LIMIT)}")
         
         # Exibir os cabeçalhos da resposta
         self.response_headers.setRowCount(0)
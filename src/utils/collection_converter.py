@@ -9,8 +9,9 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 
 from src.models.collection import Collection, Folder
-from src.models.request import Request
+from src.models.request import Request, BodyMode
 from src.core.storage import Storage
+from src.core.multipart import is_file_part
 
 
 def import_collection(file_path: str, storage: Storage) -> Tuple[bool, str, Optional[Collection]]:
@@ -182,30 +183,40 @@ def _process_postman_request(item: Dict[str, Any], collection: Collection, paren
         
         # Processar corpo da requisição
         body = None
+        body_mode = None
         if "body" in request_data:
             body_data = request_data["body"]
-            body_mode = body_data.get("mode", "")
+            postman_mode = body_data.get("mode", "")
             
-            if body_mode == "raw" and "raw" in body_data:
-                # Tentar interpretar como JSON
-                try:
-                    if "options" in body_data and "raw" in body_data["options"]:
-                        if body_data["options"]["raw"].get("language", "") == "json":
-                            body = json.loads(body_data["raw"])
-                    else:
-                        body = body_data["raw"]
-                except:
-                    body = body_data["raw"]
-            elif body_mode == "formdata" and "formdata" in body_data:
+            if postman_mode == "raw" and "raw" in body_data:
+                # O texto é mantido exatamente como foi escrito
+                body = body_data["raw"]
+                language = body_data.get("options", {}).get("raw", {}).get("language", "")
+                body_mode = BodyMode.JSON if language == "json" else BodyMode.RAW
+            elif postman_mode == "formdata" and "formdata" in body_data:
                 body = {}
                 for item in body_data["formdata"]:
-                    if not item.get("disabled", False):
-                        body[item["key"]] = item["value"]
-            elif body_mode == "urlencoded" and "urlencoded" in body_data:
+                    if item.get("disabled", False):
+                        continue
+                    src = item.get("src")
+                    if item.get("type") == "file" and src:
+                        # O Postman aceita uma lista de arquivos por campo; usar o primeiro
+                        file_part = {"file": src[0] if isinstance(src, list) else src}
+                        if item.get("contentType"):
+                            file_part["content_type"] = item["contentType"]
+                        body[item["key"]] = file_part
+                    else:
+                        body[item["key"]] = item.get("value", "")
+                body_mode = BodyMode.MULTIPART
+            elif postman_mode == "urlencoded" and "urlencoded" in body_data:
                 body = {}
                 for item in body_data["urlencoded"]:
                     if not item.get("disabled", False):
                         body[item["key"]] = item["value"]
+                body_mode = BodyMode.FORM
+            elif postman_mode == "file" and body_data.get("file", {}).get("src"):
+                body = body_data["file"]["src"]
+                body_mode = BodyMode.BINARY
     
     # Formato antigo
     else:
@@ -233,6 +244,7 @@ def _process_postman_request(item: Dict[str, Any], collection: Collection, paren
         
         # Corpo da requisição
         body = request_json
+        body_mode = None
     
     # Criar a requisição
     request = Request(
@@ -242,6 +254,7 @@ def _process_postman_request(item: Dict[str, Any], collection: Collection, paren
         headers=headers,
         params=params,
         body=body,
+        body_mode=body_mode,
         description=item.get("description", "")
     )
     
@@ -346,20 +359,26 @@ def _import_insomnia_collection(data: Dict[str, Any], storage: Storage) -> Tuple
                 
                 # Processar corpo da requisição
                 body = None
+                body_mode = None
                 if "body" in resource:
                     body_data = resource["body"]
                     
                     if resource.get("body", {}).get("mimeType", "") == "application/json":
-                        try:
-                            body = json.loads(body_data.get("text", "{}"))
-                        except:
-                            body = body_data.get("text", "")
+                        # O texto é mantido exatamente como foi escrito
+                        body = body_data.get("text", "")
+                        body_mode = BodyMode.JSON
                     elif "params" in body_data:
                         body = {}
+                        multipart = body_data.get("mimeType", "") == "multipart/form-data"
                         for param in body_data["params"]:
-                            body[param["name"]] = param["value"]
+                            if multipart and param.get("type") == "file":
+                                body[param["name"]] = {"file": param.get("fileName", "")}
+                            else:
+                                body[param["name"]] = param.get("value", "")
+                        body_mode = BodyMode.MULTIPART if multipart else BodyMode.FORM
                     else:
                         body = body_data.get("text", "")
+                        body_mode = BodyMode.RAW if body else None
                 
                 # Criar a requisição
                 request = Request(
@@ -369,6 +388,7 @@ def _import_insomnia_collection(data: Dict[str, Any], storage: Storage) -> Tuple
                     headers=headers,
                     params=params,
                     body=body,
+                    body_mode=body_mode,
                     description=resource.get("description", "")
                 )
                 
@@ -621,12 +641,39 @@ def _convert_request_to_postman(request: Request) -> Dict[str, Any]:
         })
     
     # Adicionar corpo da requisição, se houver
-    if request.body is not None:
+    if request.body is not None and request.body_mode == BodyMode.FORM and isinstance(request.body, dict):
+        postman_request["request"]["body"] = {
+            "mode": "urlencoded",
+            "urlencoded": [
+                {"key": key, "value": value, "type": "text"}
+                for key, value in request.body.items()
+            ]
+        }
+    elif request.body is not None and request.body_mode == BodyMode.MULTIPART and isinstance(request.body, dict):
+        formdata = []
+        for key, value in request.body.items():
+            if is_file_part(value):
+                item = {"key": key, "src": value["file"], "type": "file"}
+                if value.get("content_type"):
+                    item["contentType"] = value["content_type"]
+            else:
+                item = {"key": key, "value": value, "type": "text"}
+            formdata.append(item)
+        postman_request["request"]["body"] = {
+            "mode": "formdata",
+            "formdata": formdata
+        }
+    elif request.body is not None and request.body_mode == BodyMode.BINARY:
+        postman_request["request"]["body"] = {
+            "mode": "file",
+            "file": {"src": request.body}
+        }
+    elif request.body is not None and request.body_mode != BodyMode.NONE:
         body = {
             "mode": "raw",
             "options": {
                 "raw": {
-                    "language": "json"
+                    "language": "text" if request.body_mode == BodyMode.RAW else "json"
                 }
             }
         }
@@ -764,10 +811,27 @@ def _convert_request_to_insomnia(request: Request, parent_id: str) -> Dict[str,
             })
     
     # Adicionar corpo da requisição, se houver
-    if request.body is not None:
+    if request.body is not None and request.body_mode == BodyMode.FORM and isinstance(request.body, dict):
+        insomnia_request["body"] = {
+            "mimeType": "application/x-www-form-urlencoded",
+            "params": [{"name": key, "value": value} for key, value in request.body.items()]
+        }
+    elif request.body is not None and request.body_mode == BodyMode.MULTIPART and isinstance(request.body, dict):
+        insomnia_request["body"] = {
+            "mimeType": "multipart/form-data",
+            "params": [
+                {"name": key, "type": "file", "fileName": value["file"]} if is_file_part(value)
+                else {"name": key, "value": value}
+                for key, value in request.body.items()
+            ]
+        }
+    elif request.body is not None and request.body_mode != BodyMode.NONE:
         body = {}
         
-        if isinstance(request.body, dict):
+        if request.body_mode == BodyMode.JSON:
+            body["mimeType"] = "application/json"
+            body["text"] = request.body if isinstance(request.body, str) else json.dumps(request.body)
+        elif isinstance(request.body, dict):
             body["mimeType"] = "application/json"
             body["text"] = json.dumps(request.body)
         elif isinstance(request.body, str):
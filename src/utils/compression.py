@@ -0,0 +1,192 @@
+"""
+Compressão e descompressão de corpos HTTP (gzip, deflate, brotli e zstd)
+"""
+
+import gzip
+import zlib
+from typing import Iterable, Iterator, List
+
+try:
+    import brotli
+except ImportError:  # Dependência opcional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # Dependência opcional
+    zstandard = None
+
+
+# Codificações aceitas em Content-Encoding
+SUPPORTED_ENCODINGS = ["gzip", "deflate", "br", "zstd"]
+
+
+def available_encodings() -> List[str]:
+    """
+    Lista as codificações disponíveis no ambiente atual
+
+    Returns:
+        List[str]: Codificações cujas bibliotecas estão instaladas
+    """
+    encodings = ["gzip", "deflate"]
+    if brotli is not None:
+        encodings.append("br")
+    if zstandard is not None:
+        encodings.append("zstd")
+    return encodings
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """
+    Comprime dados com a codificação informada
+
+    Args:
+        data (bytes): Dados originais
+        encoding (str): Codificação (gzip, deflate, br ou zstd)
+
+    Returns:
+        bytes: Dados comprimidos
+    """
+    encoding = encoding.lower()
+
+    if encoding == "gzip":
+        return gzip.compress(data)
+    if encoding == "deflate":
+        return zlib.compress(data)
+    if encoding == "br":
+        if brotli is None:
+            raise ValueError("Compressão brotli requer o pacote 'brotli'")
+        return brotli.compress(data)
+    if encoding == "zstd":
+        if zstandard is None:
+            raise ValueError("Compressão zstd requer o pacote 'zstandard'")
+        return zstandard.ZstdCompressor().compress(data)
+
+    raise ValueError(f"Codificação não suportada: {encoding}")
+
+
+class _BrotliCompressor:
+    """Compressor brotli incremental com a mesma interface dos compressores do zlib"""
+    def __init__(self):
+        self._compressor = brotli.Compressor()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+def _compressor(encoding: str):
+    """Cria um compressor incremental com os métodos compress(dados) e flush()"""
+    if encoding == "gzip":
+        return zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        return zlib.compressobj()
+    if encoding == "br":
+        if brotli is None:
+            raise ValueError("Compressão brotli requer o pacote 'brotli'")
+        return _BrotliCompressor()
+    if encoding == "zstd":
+        if zstandard is None:
+            raise ValueError("Compressão zstd requer o pacote 'zstandard'")
+        return zstandard.ZstdCompressor().compressobj()
+
+    raise ValueError(f"Codificação não suportada: {encoding}")
+
+
+def compress_stream(chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+    """
+    Comprime dados bloco a bloco, sem reuni-los em memória
+
+    Args:
+        chunks (Iterable[bytes]): Blocos dos dados originais
+        encoding (str): Codificação (gzip, deflate, br ou zstd)
+
+    Yields:
+        bytes: Blocos dos dados comprimidos (blocos vazios são omitidos)
+    """
+    compressor = _compressor(encoding.lower())
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    tail = compressor.flush()
+    if tail:
+        yield tail
+
+
+class CompressedStream:
+    """
+    Corpo comprimido durante o envio a partir de outro corpo lido em blocos
+
+    O tamanho comprimido só é conhecido ao final: o corpo não tem len() e é
+    enviado com Transfer-Encoding: chunked. Pode ser percorrido mais de uma vez
+    (novas tentativas comprimem a origem de novo).
+    """
+    def __init__(self, source: Iterable[bytes], encoding: str):
+        """
+        Args:
+            source (Iterable[bytes]): Corpo original (ex: FileBody), percorrido a cada envio
+            encoding (str): Codificação (gzip, deflate, br ou zstd)
+        """
+        # Validar a codificação antes do envio
+        _compressor(encoding.lower())
+        self.source = source
+        self.encoding = encoding
+
+    def __iter__(self) -> Iterator[bytes]:
+        return compress_stream(self.source, self.encoding)
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    """
+    Descomprime dados com a codificação informada
+
+    Args:
+        data (bytes): Dados comprimidos
+        encoding (str): Codificação (gzip, deflate, br ou zstd)
+
+    Returns:
+        bytes: Dados originais
+    """
+    encoding = encoding.lower()
+
+    if encoding in ("gzip", "x-gzip"):
+        return zlib.decompress(data, 16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(data)
+        except zlib.error:
+            # Alguns servidores enviam deflate sem o cabeçalho zlib
+            return zlib.decompress(data, -zlib.MAX_WBITS)
+    if encoding == "br":
+        if brotli is None:
+            raise ValueError("Descompressão brotli requer o pacote 'brotli'")
+        return brotli.decompress(data)
+    if encoding == "zstd":
+        if zstandard is None:
+            raise ValueError("Descompressão zstd requer o pacote 'zstandard'")
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    if encoding == "identity":
+        return data
+
+    raise ValueError(f"Codificação não suportada: {encoding}")
+
+
+def decode_content(data: bytes, content_encoding: str) -> bytes:
+    """
+    Desfaz todas as codificações listadas em um cabeçalho Content-Encoding
+
+    Args:
+        data (bytes): Corpo recebido
+        content_encoding (str): Valor do cabeçalho (ex: "gzip" ou "gzip, br")
+
+    Returns:
+        bytes: Corpo decodificado
+    """
+    encodings = [value.strip() for value in content_encoding.split(",") if value.strip()]
+    # As codificações são aplicadas na ordem listada; desfazer em ordem inversa
+    for encoding in reversed(encodings):
+        data = decompress(data, encoding)
+    return data
@@ -8,7 +8,9 @@ import shlex
 import urllib.parse
 from typing import Dict, Any, List, Optional
 
-from src.models.request import Request
+from src.models.request import Request, BodyMode
+from src.core.multipart import parse_form_field, format_form_field
+from src.core.template import TemplateCache
 
 
 def request_to_curl(request: Request, variables: Optional[Dict[str, str]] = None) -> str:
@@ -74,7 +76,18 @@ def request_to_curl(request: Request, variables: Optional[Dict[str, str]] = None
         elif variables and isinstance(body, dict):
             body = _replace_variables_in_dict(body, variables)
         
-        if isinstance(body, dict):
+        if request.body_mode == BodyMode.BINARY and isinstance(body, str):
+            # Conteúdo de arquivo
+            command_parts.extend(["--data-binary", f"'@{body}'"])
+        elif request.body_mode == BodyMode.MULTIPART and isinstance(body, dict):
+            # Formulário multipart; arquivos são referenciados com @
+            for key, value in body.items():
+                command_parts.extend(["-F", f"'{key}={format_form_field(value)}'"])
+        elif request.body_mode == BodyMode.FORM and isinstance(body, dict):
+            # Formulário codificado na URL
+            for key, value in body.items():
+                command_parts.extend(["--data-urlencode", f"'{key}={value}'"])
+        elif isinstance(body, dict):
             # Se for um dicionário, serializar como JSON
             data = json.dumps(body)
             command_parts.extend(["-d", f"'{data}'"])
@@ -91,6 +104,15 @@ def request_to_curl(request: Request, variables: Optional[Dict[str, str]] = None
     return curl_command
 
 
+def _strip_at(name: str) -> str:
+    """Remove o @ do início do nome da variável, se estiver presente"""
+    return name[1:] if name.startswith('@') else name
+
+
+# Templates compilados dos textos exportados; referências como {{@nome_var}} usam a variável nome_var
+_TEMPLATES = TemplateCache(normalize_name=_strip_at)
+
+
 def _replace_variables(text: str, variables: Dict[str, str]) -> str:
     """
     Substitui placeholders de variáveis no formato {{nome_var}} pelo seu valor correspondente.
@@ -102,17 +124,7 @@ def _replace_variables(text: str, variables: Dict[str, str]) -> str:
     Returns:
         str: O texto com os placeholders substituídos
     """
-    # Padrão para encontrar variáveis no formato {{nome_var}}
-    pattern = r"{{([^{}]+)}}"
-    
-    def replace_match(match):
-        var_name = match.group(1).strip()
-        # Remover @ se estiver presente
-        if var_name.startswith('@'):
-            var_name = var_name[1:]
-        return variables.get(var_name, match.group(0))
-    
-    return re.sub(pattern, replace_match, text)
+    return _TEMPLATES.render(text, variables)
 
 
 def _replace_variables_in_dict(data: Dict[str, Any], variables: Dict[str, str]) -> Dict[str, Any]:
@@ -162,6 +174,7 @@ def curl_to_request(curl_command: str) -> Request:
     headers = {}
     params = {}
     body = None
+    body_mode = None
     
     # Remover 'curl' do início do comando
     if curl_command.lower().startswith("curl "):
@@ -245,18 +258,40 @@ def curl_to_request(curl_command: str) -> Request:
             if i + 1 < len(args):
                 body_data = args[i + 1]
                 
-                # Tentar interpretar como JSON
-                try:
-                    # Remover aspas simples/duplas que possam envolver o JSON string
-                    if (body_data.startswith("'") and body_data.endswith("'")) or \
-                       (body_data.startswith('"') and body_data.endswith('"')):
-                        body_data = body_data[1:-1]
-                    body = json.loads(body_data)
-                except (ValueError, TypeError):
+                # Remover aspas simples/duplas que possam envolver o corpo
+                if (body_data.startswith("'") and body_data.endswith("'")) or \
+                   (body_data.startswith('"') and body_data.endswith('"')):
+                    body_data = body_data[1:-1]
+                
+                if arg in ["-d", "--data", "--data-binary"] and body_data.startswith("@"):
+                    # Corpo lido de um arquivo
+                    body = body_data[1:]
+                    body_mode = BodyMode.BINARY
+                else:
+                    # O texto é mantido exatamente como foi escrito; o JSON só é validado
                     body = body_data
+                    try:
+                        json.loads(body_data)
+                        body_mode = BodyMode.JSON
+                    except (ValueError, TypeError):
+                        body_mode = BodyMode.RAW
                     
                 i += 2
                 continue
+        
+        # Dados de formulário codificados na URL
+        if arg == "--data-urlencode":
+            if i + 1 < len(args):
+                if not isinstance(body, dict):
+                    body = {}
+                
+                form_item = args[i + 1].strip("\"'")
+                form_key, _, form_value = form_item.partition("=")
+                body[form_key] = form_value
+                body_mode = BodyMode.FORM
+                
+                i += 2
+                continue
                 
         # Dados de formulário (multipart)
         if arg in ["-F", "--form"]:
@@ -268,7 +303,8 @@ def curl_to_request(curl_command: str) -> Request:
                 form_item = args[i + 1]
                 if "=" in form_item:
                     form_key, form_value = form_item.split("=", 1)
-                    body[form_key] = form_value
+                    body[form_key] = parse_form_field(form_value)
+                    body_mode = BodyMode.MULTIPART
                     
                 i += 2
                 continue
@@ -301,7 +337,8 @@ def curl_to_request(curl_command: str) -> Request:
         method=method,
         headers=headers,
         params=params,
-        body=body
+        body=body,
+        body_mode=body_mode
     )
     
     return request 
\ No newline at end of file
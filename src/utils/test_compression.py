@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Testes da compressão de corpos e do tamanho transmitido das respostas
+"""
+
+import sys
+import os
+import gzip
+import zlib
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+# Adicionar o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.http_client import HttpClient
+from src.models.request import Request
+from src.utils.compression import (
+    available_encodings, compress, compress_stream, decompress, decode_content
+)
+
+TEXT = b'{"message": "ola"}' * 500
+GZIPPED = gzip.compress(TEXT)
+
+
+class _GzipHandler(BaseHTTPRequestHandler):
+    """Servidor de teste que responde com um corpo comprimido"""
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        received = self.rfile.read(int(self.headers["Content-Length"]))
+        assert decompress(received, self.headers["Content-Encoding"]) == TEXT
+        self.send_response(200)
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(GZIPPED)))
+        self.end_headers()
+        self.wfile.write(GZIPPED)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.mark.parametrize("encoding", available_encodings())
+def test_round_trip_for_available_encodings(encoding):
+    compressed = compress(TEXT, encoding)
+    assert len(compressed) < len(TEXT)
+    assert decompress(compressed, encoding) == TEXT
+    assert decompress(b"".join(compress_stream([TEXT[:100], b"", TEXT[100:]], encoding)), encoding) == TEXT
+
+
+def test_stacked_and_raw_encodings_are_decoded():
+    stacked = compress(compress(TEXT, "deflate"), "gzip")
+    assert decode_content(stacked, "deflate, gzip") == TEXT
+    assert decode_content(TEXT, "") == TEXT
+
+    # deflate sem o cabeçalho zlib
+    raw = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    assert decompress(raw.compress(TEXT) + raw.flush(), "deflate") == TEXT
+
+
+def test_unknown_encoding_is_rejected():
+    with pytest.raises(ValueError):
+        compress(TEXT, "lzma")
+    with pytest.raises(ValueError):
+        decompress(TEXT, "lzma")
+
+
+def test_compressed_exchange_records_wire_size(http_server):
+    server = http_server(_GzipHandler)
+    request = Request(
+        name="gzip", method="POST", url=f"{server.url}/",
+        body=TEXT.decode(), body_encoding="gzip"
+    )
+    response, error = HttpClient.send_request(request)
+    assert error is None and response.status_code == 200
+    assert response.content == TEXT
+    assert response.wire_size == len(GZIPPED)